@@ -41,6 +41,15 @@ def create_app(config_name='default'):
     # Jinja2 템플릿에서 사용할 전역 함수 등록
     app.jinja_env.globals.update(max=max, min=min)
     
+    # 헤더 알림 배지: 로그인 사용자의 읽지 않은 알림 수 (색인의 카운터 조회)
+    @app.context_processor
+    def inject_unread_notification_count():
+        from flask_login import current_user
+        from .repositories import notification_repository
+        if not current_user.is_authenticated:
+            return {}
+        return {'unread_notification_count': notification_repository.get_unread_count(current_user.id)}
+    
     # 업로드 폴더 생성
     if not os.path.exists(app.config['UPLOAD_FOLDER']):
         os.makedirs(app.config['UPLOAD_FOLDER'])
@@ -65,4 +74,11 @@ def create_app(config_name='default'):
             app.logger.info('모든 계정의 비밀번호는 "password"입니다.')
             g._startup_message_shown = True
     
+    # 기한 스케줄러는 요청을 처리하는 프로세스에서만 시작
+    # (debug 모드 reloader의 감시용 부모 프로세스는 요청을 받지 않으므로 상태 파일을 함께 쓰지 않음)
+    @app.before_request
+    def start_deadline_scheduler():
+        from .services.operations.deadline_scheduler import deadline_scheduler
+        deadline_scheduler.start()
+    
     return app 
\ No newline at end of file
@@ -22,6 +22,9 @@ from .category.category_repository import category_repository
 from .preset.preset_repository import preset_repository
 from .notification.notification_repository import notification_repository
 
+# Repository 레지스트리 (공유 인스턴스 주입)
+from .registry import RepositoryRegistry, RepositoryProvider, repository_registry
+
 __all__ = [
     'AssetRepository',
     'ContractRepository', 
@@ -36,5 +39,8 @@ __all__ = [
     'operations_repository',
     'category_repository',
     'preset_repository',
-    'notification_repository'
+    'notification_repository',
+    'RepositoryRegistry',
+    'RepositoryProvider',
+    'repository_registry'
 ]
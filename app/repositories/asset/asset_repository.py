@@ -6,13 +6,15 @@ Classes:
     - AssetRepository: 자산 데이터 관리를 위한 Repository 클래스
 """
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from ..base_repository import BaseRepository
 from .data.asset_core_data import AssetCoreData
 from .data.asset_reference_data import AssetReferenceData
 from .data.asset_details_data import AssetDetailsData
 from .data.asset_search_data import AssetSearchData
 from ..partners.partner_repository import PartnerRepository
+from ...utils.constants import DOMAIN_EVENTS
+from ...utils.events import domain_events
 
 
 class AssetRepository(BaseRepository):
@@ -117,8 +119,11 @@ class AssetRepository(BaseRepository):
         # 새 ID 생성 (현재는 간단히 max ID + 1)
         new_id = max([asset['id'] for asset in self._data], default=0) + 1
         asset_data['id'] = new_id
+        asset_data['updated_at'] = datetime.now()
         
         self._data.append(asset_data)
+        self._bump_data_version()
+        domain_events.publish(DOMAIN_EVENTS['ASSET_CREATED'], asset_data)
         return asset_data
     
     def update_asset(self, asset_id: int, asset_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -127,7 +132,10 @@ class AssetRepository(BaseRepository):
             if asset['id'] == asset_id:
                 # 기존 데이터에 새 데이터를 병합
                 updated_asset = {**asset, **asset_data}
+                updated_asset['updated_at'] = datetime.now()
                 self._data[i] = updated_asset
+                self._bump_data_version()
+                domain_events.publish(DOMAIN_EVENTS['ASSET_UPDATED'], updated_asset, asset)
                 return updated_asset
         return None
     
@@ -136,6 +144,8 @@ class AssetRepository(BaseRepository):
         for i, asset in enumerate(self._data):
             if asset['id'] == asset_id:
                 del self._data[i]
+                self._bump_data_version()
+                domain_events.publish(DOMAIN_EVENTS['ASSET_DELETED'], asset)
                 return True
         return False
     
@@ -343,6 +353,11 @@ class AssetRepository(BaseRepository):
         partner = next((p for p in self._partners if p['id'] == partner_id), None)
         return partner.copy() if partner else None
 
+    def get_partners_by_ids(self, partner_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """여러 협력사 정보를 한 번의 순회로 조회 (ID→협력사, 없는 ID는 제외)"""
+        wanted = set(partner_ids)
+        return {p['id']: p.copy() for p in self._partners if p['id'] in wanted}
+
     def add_partner(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """신규 협력사 추가"""
         new_id = max(p['id'] for p in self._partners) + 1 if self._partners else 1
@@ -388,10 +403,63 @@ class AssetRepository(BaseRepository):
             'recipient_email': email_data.get('recipient_email'),
             'subject': email_data.get('subject'),
             'attachment_path': email_data.get('attachment_path'),
-            'sent_at': datetime.now()
+            'attachment_name': email_data.get('attachment_name'),
+            'sent_at': datetime.now(),
+            'status': email_data.get('status', 'sent'),
+            'outbox_id': email_data.get('outbox_id'),
+            'attempts': email_data.get('attempts', 0),
+            'last_error': None
         }
         self._sent_emails.append(new_email_log)
         return new_email_log
+
+    def log_sent_emails(self, entries: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """여러 메일 발송 정보를 한 번에 기록 ((협력사 ID, 메일 정보) 목록, ID는 연속 블록으로 할당)"""
+        next_id = max(e['id'] for e in self._sent_emails) + 1 if self._sent_emails else 1
+        now = datetime.now()
+        new_logs = []
+        for offset, (partner_id, email_data) in enumerate(entries):
+            new_logs.append({
+                'id': next_id + offset,
+                'partner_id': partner_id,
+                'recipient_email': email_data.get('recipient_email'),
+                'subject': email_data.get('subject'),
+                'attachment_path': email_data.get('attachment_path'),
+                'attachment_name': email_data.get('attachment_name'),
+                'sent_at': now,
+                'status': email_data.get('status', 'sent'),
+                'outbox_id': email_data.get('outbox_id'),
+                'outbox_token': email_data.get('outbox_token'),
+                'attempts': email_data.get('attempts', 0),
+                'last_error': None
+            })
+        self._sent_emails.extend(new_logs)
+        return [log.copy() for log in new_logs]
+
+    def update_sent_email(
+        self,
+        email_id: int,
+        update_data: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """메일 발송 이력 갱신 (발송 대기열 상태 반영, expected 필드 값이 모두 같을 때만 갱신)"""
+        for email_log in self._sent_emails:
+            if email_log['id'] == email_id:
+                if expected and any(email_log.get(key) != value for key, value in expected.items()):
+                    return None
+                email_log.update(update_data)
+                return email_log.copy()
+        return None
+
+    def update_sent_emails(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        """여러 메일 발송 이력을 한 번의 순회로 갱신 (이력 ID→갱신 데이터), 갱신된 건수 반환"""
+        updated = 0
+        for email_log in self._sent_emails:
+            update_data = updates.get(email_log['id'])
+            if update_data:
+                email_log.update(update_data)
+                updated += 1
+        return updated
         
     def get_contracts_by_partner_id(self, partner_id: int) -> List[Dict[str, Any]]:
         """특정 협력사와 관련된 모든 계약 목록 반환"""
@@ -464,6 +532,20 @@ class AssetRepository(BaseRepository):
         self._quotation_requests.append(new_request)
         return new_request.copy()
     
+    def create_quotation_requests(self, requests_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 견적서 요청을 한 번에 생성 (ID는 연속 블록으로 할당)"""
+        next_id = len(self._quotation_requests) + 1
+        new_requests = [dict(request_data, id=next_id + offset) for offset, request_data in enumerate(requests_data)]
+        self._quotation_requests.extend(new_requests)
+        return [new_request.copy() for new_request in new_requests]
+    
+    def get_quotation_request_counts_by_partner(self) -> Dict[int, int]:
+        """협력사별 견적서 요청 수 (요청 번호 일괄 생성용)"""
+        counts: Dict[int, int] = {}
+        for request in self._quotation_requests:
+            counts[request['partner_id']] = counts.get(request['partner_id'], 0) + 1
+        return counts
+    
     def update_quotation_request(self, request_id: int, request_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """견적서 요청을 업데이트"""
         for i, request in enumerate(self._quotation_requests):
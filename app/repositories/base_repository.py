@@ -22,6 +22,7 @@ class BaseRepository(ABC):
         """Base Repository 초기화"""
         self._data: List[Dict[str, Any]] = []
         self._next_id = 1
+        self._data_version = 0
     
     # ==================== 추상 메서드 (하위 클래스에서 구현 필수) ====================
     
@@ -99,6 +100,7 @@ class BaseRepository(ABC):
         
         # 데이터 추가
         self._data.append(data)
+        self._bump_data_version()
         
         return data.copy()
     
@@ -128,6 +130,7 @@ class BaseRepository(ABC):
                 updated_item['updated_at'] = datetime.now().isoformat()
                 
                 self._data[i] = updated_item
+                self._bump_data_version()
                 return updated_item.copy()
         
         return None
@@ -145,9 +148,26 @@ class BaseRepository(ABC):
         for i, item in enumerate(self._data):
             if item['id'] == item_id:
                 del self._data[i]
+                self._bump_data_version()
                 return True
         return False
     
+    def get_data_version(self) -> int:
+        """
+        데이터 버전 조회
+        
+        생성/수정/삭제 시마다 증가하므로, 내보내기 캐시 등에서
+        데이터 변경 여부를 판단하는 키로 사용합니다.
+        
+        Returns:
+            현재 데이터 버전
+        """
+        return self._data_version
+    
+    def _bump_data_version(self) -> None:
+        """데이터 변경 시 버전 증가"""
+        self._data_version += 1
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         통계 정보 조회 (기본 구현)
@@ -34,6 +34,7 @@ class ContractData:
     
     def _initialize_data(self):
         """초기 데이터 설정"""
+        self._data_version = 0
         self._contracts = [
             {
                 'id': 1,
@@ -151,6 +152,7 @@ class ContractData:
         contract_data['created_at'] = datetime.now().isoformat()
         contract_data['updated_at'] = datetime.now().isoformat()
         self._contracts.append(contract_data)
+        self.bump_data_version()
         return contract_data
     
     def update_contract(self, contract_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -170,6 +172,7 @@ class ContractData:
                 updated_contract.update(update_data)
                 updated_contract['updated_at'] = datetime.now().isoformat()
                 self._contracts[i] = updated_contract
+                self.bump_data_version()
                 return updated_contract
         return None
     
@@ -186,9 +189,23 @@ class ContractData:
         for i, contract in enumerate(self._contracts):
             if contract['id'] == contract_id:
                 del self._contracts[i]
+                self.bump_data_version()
                 return True
         return False
     
+    def get_data_version(self) -> int:
+        """
+        데이터 버전 조회
+        
+        Returns:
+            계약 데이터가 변경될 때마다 증가하는 버전 번호
+        """
+        return self._data_version
+    
+    def bump_data_version(self) -> None:
+        """계약 데이터 변경 시 버전 증가"""
+        self._data_version += 1
+    
     def get_count(self) -> int:
         """
         전체 계약 수 조회
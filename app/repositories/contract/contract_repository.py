@@ -11,6 +11,8 @@ from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from ..base_repository import BaseRepository
 from .contract_data import ContractData
+from ...utils.constants import DOMAIN_EVENTS
+from ...utils.events import domain_events
 
 
 class ContractRepository(BaseRepository):
@@ -94,19 +96,37 @@ class ContractRepository(BaseRepository):
         return self.data_source.get_contract_by_id(contract_id)
     
     def create_contract(self, contract_data: Dict[str, Any]) -> Dict[str, Any]:
-        """새 계약 생성 (기존 인터페이스 호환)"""
+        """새 계약 생성 (기존 인터페이스 호환, contract.created 이벤트 발행)"""
         # BaseRepository의 create 메서드 활용
-        return self.create(contract_data)
+        contract = self.create(contract_data)
+        domain_events.publish(DOMAIN_EVENTS['CONTRACT_CREATED'], contract)
+        return contract
     
     def update_contract(self, contract_id: int, contract_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """계약 정보 수정 (기존 인터페이스 호환)"""
+        """계약 정보 수정 (기존 인터페이스 호환, contract.updated 이벤트 발행)"""
+        previous = self.get_by_id(contract_id)
         # BaseRepository의 update 메서드 활용
-        return self.update(contract_id, contract_data)
+        contract = self.update(contract_id, contract_data)
+        if contract is not None:
+            domain_events.publish(DOMAIN_EVENTS['CONTRACT_UPDATED'], contract, previous)
+        return contract
     
     def delete_contract(self, contract_id: int) -> bool:
-        """계약 삭제 (기존 인터페이스 호환)"""
+        """계약 삭제 (기존 인터페이스 호환, contract.deleted 이벤트 발행)"""
+        previous = self.get_by_id(contract_id)
         # BaseRepository의 delete 메서드 활용
-        return self.delete(contract_id)
+        deleted = self.delete(contract_id)
+        if deleted and previous is not None:
+            domain_events.publish(DOMAIN_EVENTS['CONTRACT_DELETED'], previous)
+        return deleted
+    
+    def get_data_version(self) -> int:
+        """데이터 버전 조회 (Repository 인스턴스 간 공유되는 데이터 소스 기준)"""
+        return self.data_source.get_data_version()
+    
+    def _bump_data_version(self) -> None:
+        """데이터 변경 시 공유 데이터 소스의 버전 증가"""
+        self.data_source.bump_data_version()
     
     # ==================== 비즈니스 로직 메서드 (contract_data에서 이관) ====================
     
@@ -103,6 +103,28 @@ class NotificationRulesData:
                 'is_active': True,
                 'created_at': '2024-01-01T00:00:00Z',
                 'updated_at': '2024-01-01T00:00:00Z'
+            },
+            {
+                'id': 7,
+                'name': '반납 장기 연체 알림',
+                'description': '반납 예정일이 7일 이상 지난 경우 관리자에게 다시 알림',
+                'trigger_condition': 'overdue_escalation',
+                'notification_type': 'email_and_system',
+                'recipients': ['manager'],
+                'is_active': True,
+                'created_at': '2024-01-01T00:00:00Z',
+                'updated_at': '2024-01-01T00:00:00Z'
+            },
+            {
+                'id': 8,
+                'name': '계약 만료 알림',
+                'description': '계약 만료 90일 전 관리자에게 알림',
+                'trigger_condition': 'contract_expiry',
+                'notification_type': 'system',
+                'recipients': ['admin'],
+                'is_active': True,
+                'created_at': '2024-01-01T00:00:00Z',
+                'updated_at': '2024-01-01T00:00:00Z'
             }
         ]
     
@@ -0,0 +1,194 @@
+"""
+NotificationInboxIndex - 수신자별 알림함 색인
+알림 ID 색인, 수신자별 시간순 알림함, 읽지 않은 알림 카운터를 쓰기 시점에 갱신합니다.
+
+Classes:
+    - NotificationInboxIndex: 수신자별 시간순 알림함 및 미확인 카운터 색인
+"""
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+InboxKey = Tuple[str, int]
+
+
+class NotificationInboxIndex:
+    """
+    수신자별 알림함 색인 클래스
+    
+    - 알림 ID → 알림 dict (저장소 목록과 같은 객체를 가리킴)
+    - 수신자 ID → (생성 일시, 알림 ID) 정렬 목록 (전체 / 읽지 않은 알림)
+    - 수신자 ID → 읽지 않은 알림 수, 전체 읽지 않은 알림 수
+    
+    배지 표시는 카운터 조회(O(1)), 알림함 페이지는 정렬 목록 슬라이스(O(페이지 크기))로 처리합니다.
+    알림은 대부분 시간순으로 추가되므로 정렬 목록 삽입은 끝에 붙는 경우가 대부분입니다.
+    """
+    
+    def __init__(self):
+        """빈 색인 생성"""
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._inboxes: Dict[int, List[InboxKey]] = {}
+        self._unread_inboxes: Dict[int, List[InboxKey]] = {}
+        self._unread_ids: List[int] = []
+        self._unread_total = 0
+    
+    # ==================== 색인 갱신 ====================
+    
+    def rebuild(self, notifications: List[Dict[str, Any]]) -> None:
+        """
+        전체 알림으로 색인 재구성
+        
+        Args:
+            notifications: 저장소의 알림 목록
+        """
+        self._by_id.clear()
+        self._inboxes.clear()
+        self._unread_inboxes.clear()
+        self._unread_ids.clear()
+        self._unread_total = 0
+        for notification in notifications:
+            self.add(notification)
+    
+    def add(self, notification: Dict[str, Any]) -> None:
+        """
+        알림 추가
+        
+        Args:
+            notification: 저장소에 추가된 알림 (같은 객체를 보관)
+        """
+        notification_id = notification['id']
+        self._by_id[notification_id] = notification
+        key = self._key(notification)
+        recipient_id = notification.get('recipient_id')
+        insort(self._inboxes.setdefault(recipient_id, []), key)
+        if not notification.get('is_read'):
+            insort(self._unread_inboxes.setdefault(recipient_id, []), key)
+            insort(self._unread_ids, notification_id)
+            self._unread_total += 1
+    
+    def remove(self, notification_id: int) -> Optional[Dict[str, Any]]:
+        """
+        알림 제거
+        
+        Args:
+            notification_id: 알림 ID
+        
+        Returns:
+            Optional[Dict[str, Any]]: 제거된 알림 또는 None
+        """
+        notification = self._by_id.pop(notification_id, None)
+        if notification is None:
+            return None
+        key = self._key(notification)
+        recipient_id = notification.get('recipient_id')
+        self._discard(self._inboxes, recipient_id, key)
+        if not notification.get('is_read'):
+            self._discard(self._unread_inboxes, recipient_id, key)
+            self._discard_id(notification_id)
+            self._unread_total -= 1
+        return notification
+    
+    def mark_read(self, notification_id: int) -> bool:
+        """
+        알림을 읽음 상태로 색인 갱신 (알림 dict의 is_read는 호출 측에서 변경)
+        
+        Args:
+            notification_id: 알림 ID
+        
+        Returns:
+            bool: 읽지 않은 상태였다가 읽음으로 바뀌었는지 여부
+        """
+        notification = self._by_id.get(notification_id)
+        if notification is None:
+            return False
+        recipient_id = notification.get('recipient_id')
+        if not self._discard(self._unread_inboxes, recipient_id, self._key(notification)):
+            return False
+        self._discard_id(notification_id)
+        self._unread_total -= 1
+        return True
+    
+    def pop_unread(self, recipient_id: int) -> List[Dict[str, Any]]:
+        """
+        수신자의 읽지 않은 알림을 모두 색인에서 꺼냄 (일괄 읽음 처리용)
+        
+        Args:
+            recipient_id: 수신자 ID
+        
+        Returns:
+            List[Dict[str, Any]]: 읽지 않았던 알림 목록 (오래된 순)
+        """
+        keys = self._unread_inboxes.pop(recipient_id, [])
+        notifications = [self._by_id[notification_id] for _, notification_id in keys]
+        for _, notification_id in keys:
+            self._discard_id(notification_id)
+        self._unread_total -= len(keys)
+        return notifications
+    
+    # ==================== 조회 ====================
+    
+    def get(self, notification_id: int) -> Optional[Dict[str, Any]]:
+        """ID로 알림 조회 (O(1))"""
+        return self._by_id.get(notification_id)
+    
+    def unread_count(self, recipient_id: Optional[int] = None) -> int:
+        """읽지 않은 알림 수 (수신자 미지정 시 전체, O(1))"""
+        if recipient_id is None:
+            return self._unread_total
+        return len(self._unread_inboxes.get(recipient_id, ()))
+    
+    def inbox_size(self, recipient_id: int) -> int:
+        """수신자의 전체 알림 수 (O(1))"""
+        return len(self._inboxes.get(recipient_id, ()))
+    
+    def page(self, recipient_id: int, offset: int, limit: int, unread_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        수신자 알림함 페이지 조회 (최신순)
+        
+        Args:
+            recipient_id: 수신자 ID
+            offset: 건너뛸 알림 수
+            limit: 조회할 알림 수
+            unread_only: 읽지 않은 알림만 조회할지 여부
+        
+        Returns:
+            List[Dict[str, Any]]: 최신순 알림 목록
+        """
+        keys = (self._unread_inboxes if unread_only else self._inboxes).get(recipient_id, [])
+        end = len(keys) - offset
+        if end <= 0 or limit <= 0:
+            return []
+        start = max(0, end - limit)
+        return [self._by_id[notification_id] for _, notification_id in reversed(keys[start:end])]
+    
+    def iter_unread(self) -> Iterator[Dict[str, Any]]:
+        """전체 읽지 않은 알림을 ID 순으로 순회"""
+        for notification_id in self._unread_ids:
+            yield self._by_id[notification_id]
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    @staticmethod
+    def _key(notification: Dict[str, Any]) -> InboxKey:
+        """알림함 정렬 키 (생성 일시, ID)"""
+        return str(notification.get('created_at') or ''), notification['id']
+    
+    @staticmethod
+    def _discard(lists: Dict[int, List[InboxKey]], recipient_id: int, key: InboxKey) -> bool:
+        """수신자 정렬 목록에서 키 제거 (이진 탐색)"""
+        keys = lists.get(recipient_id)
+        if not keys:
+            return False
+        position = bisect_left(keys, key)
+        if position >= len(keys) or keys[position] != key:
+            return False
+        del keys[position]
+        if not keys:
+            del lists[recipient_id]
+        return True
+    
+    def _discard_id(self, notification_id: int) -> None:
+        """전체 읽지 않은 ID 목록에서 제거 (이진 탐색)"""
+        position = bisect_left(self._unread_ids, notification_id)
+        if position < len(self._unread_ids) and self._unread_ids[position] == notification_id:
+            del self._unread_ids[position]
@@ -6,8 +6,12 @@ Classes:
     - NotificationRepository: 알림 데이터 관리를 위한 Repository 클래스
 """
 from datetime import datetime
+from itertools import islice
 from typing import List, Dict, Optional, Any
 from ..base_repository import BaseRepository
+from .notification_inbox import NotificationInboxIndex
+from ...utils.constants import DOMAIN_EVENTS
+from ...utils.events import domain_events
 from .data.notification_data import NotificationData
 from .data.notification_rules_data import NotificationRulesData
 from .data.notification_templates_data import NotificationTemplatesData
@@ -22,6 +26,8 @@ class NotificationRepository(BaseRepository):
         self._notification_data = NotificationData()
         self._rules_data = NotificationRulesData()
         self._templates_data = NotificationTemplatesData()
+        self._rules_version = 0
+        self._inbox = NotificationInboxIndex()
         self._load_data()
     
     def _load_sample_data(self) -> List[Dict[str, Any]]:
@@ -54,7 +60,7 @@ class NotificationRepository(BaseRepository):
         # 유효한 알림 타입 검증
         valid_types = [
             'return_overdue', 'approval_pending', 'return_reminder', 
-            'maintenance_required', 'asset_transfer', 'warranty_expiry'
+            'maintenance_required', 'asset_transfer', 'warranty_expiry', 'contract_expiry'
         ]
         if 'type' in data and data['type'] not in valid_types:
             raise ValueError(f"유효하지 않은 알림 타입입니다: {data['type']}")
@@ -81,6 +87,55 @@ class NotificationRepository(BaseRepository):
         # 기본 데이터 설정
         self._data = self._notifications
         self._next_id = max(item['id'] for item in self._notifications) + 1 if self._notifications else 1
+        
+        # 수신자별 알림함 색인 구성
+        self._inbox.rebuild(self._notifications)
+    
+    # ==================== BaseRepository 재정의 (알림함 색인 유지) ====================
+    
+    def get_by_id(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """ID로 알림 조회 (색인 사용)"""
+        return self._inbox.get(self._normalize_id(item_id))
+    
+    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """알림 생성 및 수신자 알림함 색인에 추가"""
+        created = super().create(data)
+        self._inbox.add(data)
+        domain_events.publish(DOMAIN_EVENTS['NOTIFICATION_CREATED'], created)
+        return created
+    
+    def update(self, item_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        알림 수정 (저장된 객체를 제자리에서 갱신하고 색인을 다시 등록)
+        
+        Args:
+            item_id: 알림 ID
+            data: 수정할 데이터
+            
+        Returns:
+            수정된 알림 또는 None
+        """
+        notification = self._inbox.get(self._normalize_id(item_id))
+        if notification is None:
+            return None
+        self._validate_data(data, is_update=True)
+        
+        self._inbox.remove(notification['id'])
+        notification.update(data)
+        notification['updated_at'] = datetime.now().isoformat()
+        self._inbox.add(notification)
+        self._bump_data_version()
+        return notification.copy()
+    
+    def delete(self, item_id: int) -> bool:
+        """알림 삭제 (색인에서 찾아 목록에서는 ID 이진 탐색으로 제거)"""
+        notification = self._inbox.remove(self._normalize_id(item_id))
+        if notification is None:
+            return False
+        del self._notifications[self._position_of(notification['id'])]
+        self._bump_data_version()
+        domain_events.publish(DOMAIN_EVENTS['NOTIFICATION_DELETED'], notification)
+        return True
     
     # ==================== 알림 관리 메서드 ====================
     
@@ -97,21 +152,15 @@ class NotificationRepository(BaseRepository):
             필터링된 알림 목록
         """
         try:
-            # Mock 알림 데이터 복사
-            filtered_notifications = self._notifications.copy()
-            
-            # 읽음 상태 필터 적용
-            if not include_read:
-                filtered_notifications = [n for n in filtered_notifications if not n['is_read']]
+            # 읽지 않은 알림만 필요하면 색인의 미확인 목록만 순회 (전체 복사 없이 limit건에서 중단)
+            notifications = self._notifications if include_read else self._inbox.iter_unread()
             
             # 승인 대기 필터 적용
             if not include_pending:
-                filtered_notifications = [n for n in filtered_notifications if n['type'] != 'approval_pending']
+                notifications = (n for n in notifications if n['type'] != 'approval_pending')
             
             # 제한 적용
-            filtered_notifications = filtered_notifications[:limit]
-            
-            return filtered_notifications
+            return list(islice(notifications, max(0, limit)))
             
         except Exception as e:
             print(f"반납 알림 목록 조회 오류: {e}")
@@ -136,7 +185,7 @@ class NotificationRepository(BaseRepository):
         Returns:
             알림 정보 또는 None
         """
-        return next((n for n in self._notifications if n['id'] == notification_id), None)
+        return self._inbox.get(self._normalize_id(notification_id))
     
     def mark_notification_read(self, notification_id):
         """
@@ -149,14 +198,17 @@ class NotificationRepository(BaseRepository):
             처리 결과
         """
         try:
-            for notification in self._notifications:
-                if notification['id'] == notification_id:
+            notification = self._inbox.get(self._normalize_id(notification_id))
+            if notification is not None:
+                if self._inbox.mark_read(notification['id']):
                     notification['is_read'] = True
                     notification['read_at'] = datetime.now().isoformat()
-                    return {
-                        'success': True,
-                        'message': '알림을 읽음으로 처리했습니다.'
-                    }
+                    domain_events.publish(DOMAIN_EVENTS['NOTIFICATION_READ'], notification,
+                                          recipient_id=notification['recipient_id'], notification_ids=[notification['id']])
+                return {
+                    'success': True,
+                    'message': '알림을 읽음으로 처리했습니다.'
+                }
             
             return {
                 'success': False,
@@ -181,13 +233,11 @@ class NotificationRepository(BaseRepository):
             삭제 결과
         """
         try:
-            for i, notification in enumerate(self._notifications):
-                if notification['id'] == notification_id:
-                    del self._notifications[i]
-                    return {
-                        'success': True,
-                        'message': '알림을 삭제했습니다.'
-                    }
+            if self.delete(notification_id):
+                return {
+                    'success': True,
+                    'message': '알림을 삭제했습니다.'
+                }
             
             return {
                 'success': False,
@@ -201,6 +251,98 @@ class NotificationRepository(BaseRepository):
                 'message': f'알림 삭제 중 오류가 발생했습니다: {str(e)}'
             }
     
+    # ==================== 수신자 알림함 메서드 ====================
+    
+    def get_inbox(self, recipient_id, page=1, per_page=20, unread_only=False):
+        """
+        수신자 알림함 페이지 조회 (최신순, 페이지 크기에 비례하는 비용)
+        
+        Args:
+            recipient_id: 수신자 ID
+            page: 페이지 번호 (1부터)
+            per_page: 페이지당 알림 수
+            unread_only: 읽지 않은 알림만 조회할지 여부
+            
+        Returns:
+            알림 목록, 전체 건수, 읽지 않은 건수
+        """
+        page = max(1, page)
+        per_page = max(1, per_page)
+        total = self._inbox.unread_count(recipient_id) if unread_only else self._inbox.inbox_size(recipient_id)
+        return {
+            'notifications': [n.copy() for n in self._inbox.page(recipient_id, (page - 1) * per_page, per_page, unread_only)],
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'total_pages': (total + per_page - 1) // per_page,
+            'unread_count': self._inbox.unread_count(recipient_id)
+        }
+    
+    def get_unread_count(self, recipient_id=None):
+        """
+        읽지 않은 알림 수 조회 (쓰기 시점에 유지되는 카운터, O(1))
+        
+        Args:
+            recipient_id: 수신자 ID (None이면 전체)
+            
+        Returns:
+            읽지 않은 알림 수
+        """
+        return self._inbox.unread_count(recipient_id)
+    
+    def mark_all_read(self, recipient_id):
+        """
+        수신자의 읽지 않은 알림 일괄 읽음 처리 (읽지 않은 알림 수에 비례하는 비용)
+        
+        Args:
+            recipient_id: 수신자 ID
+            
+        Returns:
+            처리 결과 (읽음 처리 건수 포함)
+        """
+        try:
+            read_at = datetime.now().isoformat()
+            notifications = self._inbox.pop_unread(recipient_id)
+            for notification in notifications:
+                notification['is_read'] = True
+                notification['read_at'] = read_at
+            if notifications:
+                domain_events.publish(DOMAIN_EVENTS['NOTIFICATION_READ'], {'recipient_id': recipient_id},
+                                      recipient_id=recipient_id, notification_ids=[n['id'] for n in notifications])
+            
+            return {
+                'success': True,
+                'updated_count': len(notifications),
+                'message': f'{len(notifications)}건의 알림을 읽음으로 처리했습니다.'
+            }
+            
+        except Exception as e:
+            print(f"알림 일괄 읽음 처리 오류: {e}")
+            return {
+                'success': False,
+                'message': f'일괄 읽음 처리 중 오류가 발생했습니다: {str(e)}'
+            }
+    
+    def _position_of(self, notification_id):
+        """알림 목록에서의 위치 (ID가 증가 순으로 추가되므로 이진 탐색)"""
+        low, high = 0, len(self._notifications)
+        while low < high:
+            middle = (low + high) // 2
+            if self._notifications[middle]['id'] < notification_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._notifications) and self._notifications[low]['id'] == notification_id:
+            return low
+        return next(i for i, n in enumerate(self._notifications) if n['id'] == notification_id)
+    
+    @staticmethod
+    def _normalize_id(notification_id):
+        """URL/JSON에서 문자열로 전달된 알림 ID를 정수로 변환"""
+        if isinstance(notification_id, str) and notification_id.isdigit():
+            return int(notification_id)
+        return notification_id
+    
     # ==================== 알림 규칙 관리 메서드 ====================
     
     def get_notification_rules(self):
@@ -216,6 +358,15 @@ class NotificationRepository(BaseRepository):
             print(f"알림 규칙 조회 오류: {e}")
             raise
     
+    def get_rules_version(self) -> int:
+        """
+        알림 규칙 버전 조회 (규칙 생성/수정 시 증가, 규칙 엔진 재컴파일 판단용)
+        
+        Returns:
+            규칙 버전
+        """
+        return self._rules_version
+    
     def get_notification_rule_by_id(self, rule_id):
         """
         ID로 특정 알림 규칙 조회
@@ -250,6 +401,7 @@ class NotificationRepository(BaseRepository):
             }
             
             self._notification_rules.append(new_rule)
+            self._rules_version += 1
             
             return {
                 'success': True,
@@ -284,6 +436,7 @@ class NotificationRepository(BaseRepository):
                         'updated_at': datetime.now().isoformat()
                     }
                     self._notification_rules[i] = updated_rule
+                    self._rules_version += 1
                     
                     return {
                         'success': True,
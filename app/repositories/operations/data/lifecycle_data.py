@@ -5,8 +5,13 @@
 Classes:
     - LifecycleData: 생명주기 이벤트 관련 Mock 데이터 관리 (싱글톤)
 """
+from bisect import bisect_left, insort
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+
+# 색인 정렬 키: (이벤트 일자, 이벤트 ID)
+EventKey = Tuple[date, int]
 
 
 class LifecycleData:
@@ -15,6 +20,9 @@ class LifecycleData:
     
     애플리케이션 생명주기 동안 일관된 생명주기 이벤트 데이터를 제공합니다.
     원본 operations_repository.py의 asset_lifecycle_events와 동일한 구조를 사용합니다.
+    
+    이벤트 ID 색인, 자산별 (일자, ID) 정렬 목록, 전체 (일자, ID) 정렬 목록을 유지하므로
+    자산 타임라인과 기간 조회는 이진 탐색 후 결과 범위만 읽습니다 (O(log N + k)).
     """
     
     _instance = None
@@ -217,6 +225,31 @@ class LifecycleData:
             {"value": "마케팅팀", "label": "마케팅팀"},
             {"value": "시설팀", "label": "시설팀"}
         ]
+        
+        self._rebuild_indexes()
+    
+    def _rebuild_indexes(self):
+        """이벤트 ID/자산별/일자별 색인 재구성"""
+        self._events_by_id: Dict[int, Dict[str, Any]] = {}
+        self._date_index: List[EventKey] = []
+        self._asset_index: Dict[Any, List[EventKey]] = {}
+        for event in self._asset_lifecycle_events:
+            self._index_event(event)
+    
+    def _index_event(self, event: Dict[str, Any]):
+        """이벤트 한 건을 색인에 추가 (정렬 위치에 삽입)"""
+        key = self._event_key(event)
+        self._events_by_id[event["id"]] = event
+        insort(self._date_index, key)
+        insort(self._asset_index.setdefault(event.get("asset_id"), []), key)
+    
+    @staticmethod
+    def _event_key(event: Dict[str, Any]) -> EventKey:
+        """색인 정렬 키 (일자가 없으면 가장 앞)"""
+        event_date = event.get("event_date")
+        if isinstance(event_date, datetime):
+            event_date = event_date.date()
+        return (event_date or date.min, event["id"])
     
     def reset_for_testing(self):
         """테스트용 데이터 리셋"""
@@ -234,11 +267,27 @@ class LifecycleData:
     
     def get_event_by_id(self, event_id: int) -> Optional[Dict[str, Any]]:
         """ID로 생명주기 이벤트 조회"""
-        return next((event for event in self._asset_lifecycle_events if event["id"] == event_id), None)
+        return self._events_by_id.get(event_id)
     
     def get_events_by_asset(self, asset_id: int) -> List[Dict[str, Any]]:
-        """자산별 생명주기 이벤트 조회"""
-        return [event for event in self._asset_lifecycle_events if event.get("asset_id") == asset_id]
+        """자산별 생명주기 이벤트 조회 (일자순)"""
+        return [self._events_by_id[event_id] for _, event_id in self._asset_index.get(asset_id, [])]
+    
+    def add_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        생명주기 이벤트 추가 (색인 함께 갱신)
+        
+        Args:
+            event: 생명주기 이벤트 (id 필수)
+            
+        Returns:
+            추가된 이벤트
+        """
+        if event["id"] in self._events_by_id:
+            raise ValueError(f"이미 존재하는 생명주기 이벤트 ID입니다: {event['id']}")
+        self._asset_lifecycle_events.append(event)
+        self._index_event(event)
+        return event
     
     def get_event_types(self) -> List[Dict[str, Any]]:
         """생명주기 이벤트 유형 마스터 데이터 조회"""
@@ -250,18 +299,33 @@ class LifecycleData:
     
     # ==================== 필터링 및 검색 메서드 ====================
     
+    def query_events(self, asset_id: int = None, event_type: str = None, department: str = None,
+                     start_date: date = None, end_date: date = None) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 생명주기 이벤트 조회 (일자순)
+        
+        Args:
+            asset_id: 자산 ID (자산별 색인 사용)
+            event_type: 이벤트 유형
+            department: 부서
+            start_date: 시작일 (포함, 일자 색인 범위 사용)
+            end_date: 종료일 (포함)
+            
+        Returns:
+            조건에 맞는 이벤트 목록
+        """
+        return [
+            self._events_by_id[event_id]
+            for event_id in self._matching_ids(asset_id, event_type, department, start_date, end_date)
+        ]
+    
     def get_events_with_pagination(self, page: int = 1, per_page: int = 10, 
                                  asset_id: int = None, event_type: str = None, 
-                                 department: str = None) -> Tuple[List[Dict], int, int, int]:
-        """페이지네이션된 생명주기 이벤트 목록 조회"""
-        # 필터링
-        all_events = self._asset_lifecycle_events.copy()
-        if asset_id:
-            all_events = [e for e in all_events if e.get('asset_id') == asset_id]
-        if event_type:
-            all_events = [e for e in all_events if e.get('event_type') == event_type]
-        if department:
-            all_events = [e for e in all_events if e.get('department') == department]
+                                 department: str = None, start_date: date = None,
+                                 end_date: date = None) -> Tuple[List[Dict], int, int, int]:
+        """페이지네이션된 생명주기 이벤트 목록 조회 (일자순, 색인 범위를 한 번만 훑음)"""
+        # 필터링 (조건에 맞는 이벤트 ID만 모은 뒤 현재 페이지 이벤트만 조회)
+        all_events = self._matching_ids(asset_id, event_type, department, start_date, end_date)
         
         # 페이지네이션 계산
         total_count = len(all_events)
@@ -276,10 +340,28 @@ class LifecycleData:
         # 현재 페이지 항목 선택
         start_idx = (page - 1) * per_page
         end_idx = min(start_idx + per_page, total_count)
-        current_page_items = all_events[start_idx:end_idx] if all_events else []
+        current_page_items = [self._events_by_id[event_id] for event_id in all_events[start_idx:end_idx]]
         
         return current_page_items, page, total_pages, total_count
     
+    def _matching_ids(self, asset_id: int = None, event_type: str = None, department: str = None,
+                      start_date: date = None, end_date: date = None) -> List[int]:
+        """자산 또는 일자 색인에서 기간 범위를 잘라 나머지 조건에 맞는 이벤트 ID 목록 반환 (일자순)"""
+        keys = self._asset_index.get(asset_id, []) if asset_id else self._date_index
+        low = bisect_left(keys, (start_date,)) if start_date else 0
+        high = bisect_left(keys, (end_date + timedelta(days=1),)) if end_date else len(keys)
+        
+        matched = []
+        for position in range(low, high):
+            event_id = keys[position][1]
+            event = self._events_by_id[event_id]
+            if event_type and event.get('event_type') != event_type:
+                continue
+            if department and event.get('department') != department:
+                continue
+            matched.append(event_id)
+        return matched
+    
     def get_events_by_type(self, event_type: str) -> List[Dict[str, Any]]:
         """이벤트 유형별 생명주기 이벤트 조회"""
         return [event for event in self._asset_lifecycle_events if event.get("event_type") == event_type]
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import random
 from ..base_repository import BaseRepository
+from .history_store import PartitionedHistoryStore, to_datetime
+from .history_rollup import HistoryRollup
 
 
 class OperationHistoryRepository(BaseRepository):
@@ -19,6 +21,14 @@ class OperationHistoryRepository(BaseRepository):
         """OperationHistoryRepository 초기화"""
         super().__init__()
         self._data = self._load_sample_data()
+        
+        # 작업 월별 파티션 저장소 (기간/자산/사용자/작업 유형 조회용 색인)
+        self._store = PartitionedHistoryStore()
+        self._store.rebuild(self._data)
+        
+        # 월 × 작업 유형 × 부서 × 상태 사전 집계 (전체 통계/월별 추이 조회용)
+        self._rollup = HistoryRollup()
+        self._rollup.rebuild(self._data)
     
     def _load_sample_data(self) -> List[Dict]:
         """
@@ -96,38 +106,93 @@ class OperationHistoryRepository(BaseRepository):
             end_date: 종료 날짜 필터
             
         Returns:
-            필터링된 운영 이력 목록
+            필터링된 운영 이력 목록 (최신순)
         """
-        history_data = self._data.copy()
-        
-        # 필터링 적용
+        # 기간은 해당 월 파티션만, 자산/사용자는 색인 값 목록에서 부분 일치로 조회
+        contains = {}
         if asset_id:
-            history_data = [h for h in history_data if asset_id.lower() in h['asset_id'].lower()]
-        
+            contains['asset_id'] = asset_id
         if user_name:
-            history_data = [h for h in history_data if user_name.lower() in h['user_name'].lower()]
+            contains['user_name'] = user_name
         
-        if operation_type:
-            history_data = [h for h in history_data if operation_type == h['operation_type']]
+        return self._store.query(
+            start=self._parse_date(start_date),
+            end=self._parse_date(end_date, next_day=True),
+            equals={'operation_type': operation_type} if operation_type else None,
+            contains=contains or None,
+            predicate=(lambda h: h['status'] == status) if status else None
+        )
+    
+    def add_history(self, history: Dict) -> Dict:
+        """
+        운영 이력 추가 (해당 월 파티션과 색인에 반영)
         
-        if status:
-            history_data = [h for h in history_data if status == h['status']]
+        Args:
+            history: 운영 이력 (id, operation_date 필수)
+            
+        Returns:
+            추가된 운영 이력
+        """
+        if not self._validate_data(history):
+            raise ValueError("운영 이력 필수 항목이 누락되었습니다.")
+        previous = self._store.get(str(history['id']))
+        if not self._store.add(history):
+            raise ValueError("운영 일시 형식이 올바르지 않습니다.")
         
-        if start_date:
-            try:
-                start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                history_data = [h for h in history_data if h['operation_date'].date() >= start_dt.date()]
-            except ValueError:
-                pass
+        # 같은 ID 이력은 교체
+        if previous is not None:
+            self._rollup.remove(previous)
+            self._data = [h for h in self._data if h is not previous]
+        self._rollup.add(history)
         
-        if end_date:
-            try:
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-                history_data = [h for h in history_data if h['operation_date'].date() <= end_dt.date()]
-            except ValueError:
-                pass
+        # 최신순 목록 유지 (대부분 가장 최근 이력이므로 맨 앞에 추가)
+        if not self._data or history['operation_date'] >= self._data[0]['operation_date']:
+            self._data.insert(0, history)
+        else:
+            self._data.append(history)
+            self._data.sort(key=lambda x: x['operation_date'], reverse=True)
+        self._bump_data_version()
+        return history
+    
+    def update_history(self, history_id: str, changes: Dict) -> Optional[Dict]:
+        """
+        운영 이력 변경 (상태 변경, 완료 처리 등 - 색인과 월별 집계를 함께 갱신)
         
-        return history_data
+        Args:
+            history_id: 이력 ID
+            changes: 변경할 필드
+            
+        Returns:
+            변경된 운영 이력 또는 None (이력 없음)
+        """
+        history = self._store.get(history_id)
+        if history is None:
+            return None
+        if to_datetime(changes.get('operation_date', history['operation_date'])) is None:
+            raise ValueError("운영 일시 형식이 올바르지 않습니다.")
+        
+        # 변경 전 내용을 빼고 변경 후 내용을 더함
+        self._rollup.remove(history)
+        self._store.remove(history_id)
+        history.update(changes)
+        self._store.add(history)
+        self._rollup.add(history)
+        
+        if 'operation_date' in changes:
+            self._data.sort(key=lambda x: x['operation_date'], reverse=True)
+        self._bump_data_version()
+        return history
+    
+    @staticmethod
+    def _parse_date(value: Optional[str], next_day: bool = False) -> Optional[datetime]:
+        """'YYYY-MM-DD' 날짜를 기간 경계 일시로 변환 (종료일은 다음날 0시, 형식 오류는 필터 미적용)"""
+        if not value:
+            return None
+        try:
+            parsed = datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            return None
+        return parsed + timedelta(days=1) if next_day else parsed
     
     def get_history_detail_by_id(self, history_id: str) -> Optional[Dict]:
         """
@@ -139,32 +204,32 @@ class OperationHistoryRepository(BaseRepository):
         Returns:
             이력 상세 정보 또는 None
         """
-        for history in self._data:
-            if history['id'] == history_id:
-                # 상세 정보 추가
-                detail = history.copy()
-                detail.update({
-                    'duration_hours': self._calculate_duration(history),
-                    'related_documents': self._get_related_documents(history_id),
-                    'approval_info': self._get_approval_info(history_id),
-                    'cost_info': self._get_cost_info(history_id)
-                })
-                return detail
+        history = self._store.get(history_id)
+        if history is None:
+            return None
         
-        return None
+        # 상세 정보 추가
+        detail = history.copy()
+        detail.update({
+            'duration_hours': self._calculate_duration(history),
+            'related_documents': self._get_related_documents(history_id),
+            'approval_info': self._get_approval_info(history_id),
+            'cost_info': self._get_cost_info(history_id)
+        })
+        return detail
     
     def get_history_statistics(self, history_records: List[Dict] = None) -> Dict:
         """
         운영 이력 통계 생성
         
         Args:
-            history_records: 통계 대상 이력 목록 (None시 전체 데이터 사용)
+            history_records: 통계 대상 이력 목록 (None시 전체 데이터의 월별 집계 사용)
             
         Returns:
             통계 정보
         """
         if history_records is None:
-            history_records = self._data
+            return self._get_rollup_statistics()
         
         # 기본 통계
         total_records = len(history_records)
@@ -233,6 +298,54 @@ class OperationHistoryRepository(BaseRepository):
             'total_cost': random.randint(30000, 180000)
         }
     
+    def get_monthly_rollup(self, months: List[str], operation_types: List[str] = None) -> List[Dict]:
+        """
+        월별 집계 조회 (집계 칸만 읽으므로 조회 개월 수에 비례)
+        
+        Args:
+            months: 대상 월 목록 ('YYYY-MM')
+            operation_types: 작업 유형 조건 (None시 전체)
+            
+        Returns:
+            월별 건수/처리 시간/비용과 작업 유형·부서·상태별 건수 목록
+        """
+        where = {'operation_type': operation_types} if operation_types else None
+        return self._rollup.monthly(months, where)
+    
+    def get_rollup_summary(self, months: List[str] = None, operation_types: List[str] = None) -> Dict:
+        """
+        기간 집계 합계 조회
+        
+        Args:
+            months: 대상 월 목록 (None시 전체 기간)
+            operation_types: 작업 유형 조건 (None시 전체)
+            
+        Returns:
+            건수/처리 시간/비용 합계와 작업 유형·부서·상태별 건수
+        """
+        where = {'operation_type': operation_types} if operation_types else None
+        return self._rollup.summarize(months, where)
+    
+    def _get_rollup_statistics(self) -> Dict:
+        """전체 이력 통계 (월별 집계 기반, get_history_statistics와 같은 구조)"""
+        summary = self._rollup.summarize()
+        total_records = summary['count']
+        recent_months = self._rollup.months()[-12:]
+        
+        return {
+            'total_records': total_records,
+            'by_operation_type': summary['by_operation_type'],
+            'by_status': summary['by_status'],
+            'by_department': summary['by_department'],
+            'monthly_data': [
+                {'month': row['month'], 'count': row['count']}
+                for row in self._rollup.monthly(recent_months)
+            ],
+            'average_duration_hours': summary['average_duration_hours'],
+            'total_cost': summary['cost'],
+            'completion_rate': round((summary['by_status'].get('완료', 0) / total_records * 100), 2) if total_records > 0 else 0
+        }
+    
     def _get_monthly_statistics(self, history_records: List[Dict]) -> List[Dict]:
         """월별 통계 데이터 생성"""
         monthly_data = {}
@@ -266,15 +379,15 @@ class OperationHistoryRepository(BaseRepository):
     
     def get_recent_operations(self, limit: int = 10) -> List[Dict]:
         """최근 운영 이력 조회"""
-        return self._data[:limit]
+        return self._store.query(limit=limit)
     
     def get_operations_by_asset(self, asset_id: str) -> List[Dict]:
-        """자산별 운영 이력 조회"""
-        return [h for h in self._data if h['asset_id'] == asset_id]
+        """자산별 운영 이력 조회 (자산 색인 사용)"""
+        return self._store.query(equals={'asset_id': asset_id})
     
     def get_operations_by_user(self, user_name: str) -> List[Dict]:
-        """사용자별 운영 이력 조회"""
-        return [h for h in self._data if h['user_name'] == user_name]
+        """사용자별 운영 이력 조회 (사용자 색인 사용)"""
+        return self._store.query(equals={'user_name': user_name})
     
     def get_pending_operations(self) -> List[Dict]:
         """대기중인 운영 작업 조회"""
@@ -0,0 +1,197 @@
+"""
+HistoryRollup - 운영 이력 월별 사전 집계 모듈
+운영 이력을 월 × 작업 유형 × 부서 × 상태 칸으로 미리 집계해 두고, 이력이 기록/변경될 때마다 해당 칸만 갱신합니다.
+
+Classes:
+    - HistoryRollup: 월별 집계 칸(건수, 처리 시간, 비용) 저장소
+"""
+from bisect import insort
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .history_store import month_key, to_datetime
+
+
+# 집계 칸 키: (작업 유형, 부서, 상태)
+RollupKey = Tuple[Any, Any, Any]
+
+
+def recent_month_keys(count: int, today: Optional[datetime] = None) -> List[str]:
+    """
+    이번 달을 포함한 최근 N개월 키 목록 (오래된 순, 'YYYY-MM')
+    
+    Args:
+        count: 개월 수
+        today: 기준 일시 (기본값: 현재)
+    """
+    today = today or datetime.now()
+    index = today.year * 12 + today.month - 1
+    return [f"{value // 12:04d}-{value % 12 + 1:02d}" for value in range(index - count + 1, index + 1)]
+
+
+class HistoryRollup:
+    """
+    운영 이력 월별 집계 클래스
+    
+    - 월('YYYY-MM') → (작업 유형, 부서, 상태) → {건수, 처리 시간 합계/건수, 비용 합계}
+    - 이력 추가/제거 시 해당 월의 한 칸만 더하거나 빼므로 갱신 비용은 O(1)
+    - 칸 수는 작업 유형 × 부서 × 상태 조합으로 제한되므로 조회 비용은 이력 수가 아니라 조회 개월 수에 비례
+    """
+    
+    DIMENSIONS = ('operation_type', 'department', 'status')
+    
+    def __init__(
+        self,
+        date_field: str = 'operation_date',
+        completion_field: str = 'completion_date',
+        cost_field: str = 'cost'
+    ):
+        """
+        빈 집계 생성
+        
+        Args:
+            date_field: 집계 월 기준 일시 필드
+            completion_field: 처리 시간 계산용 완료 일시 필드
+            cost_field: 비용 필드 (숫자가 아니면 0으로 집계)
+        """
+        self.date_field = date_field
+        self.completion_field = completion_field
+        self.cost_field = cost_field
+        self._cells: Dict[str, Dict[RollupKey, Dict[str, float]]] = {}
+        self._months: List[str] = []
+    
+    # ==================== 집계 갱신 ====================
+    
+    def rebuild(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        전체 이력으로 집계 재구성
+        
+        Args:
+            records: 운영 이력 목록
+        """
+        self._cells.clear()
+        self._months.clear()
+        for record in records:
+            self.add(record)
+    
+    def add(self, record: Dict[str, Any]) -> bool:
+        """
+        이력 한 건을 집계에 더함
+        
+        Args:
+            record: 운영 이력
+        
+        Returns:
+            bool: 반영 여부 (작업 일시를 해석할 수 없으면 False)
+        """
+        return self._apply(record, 1)
+    
+    def remove(self, record: Dict[str, Any]) -> bool:
+        """
+        이력 한 건을 집계에서 뺌 (add 때와 같은 내용이어야 함)
+        
+        Args:
+            record: 운영 이력
+        
+        Returns:
+            bool: 반영 여부
+        """
+        return self._apply(record, -1)
+    
+    # ==================== 조회 ====================
+    
+    def months(self) -> List[str]:
+        """집계가 있는 월 목록 (오래된 순)"""
+        return list(self._months)
+    
+    def summarize(self, months: Optional[Iterable[str]] = None, where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        여러 달의 집계 합계
+        
+        Args:
+            months: 대상 월 목록 (None시 전체 기간)
+            where: 차원 조건 {'operation_type'|'department'|'status': 값 또는 값 목록}
+        
+        Returns:
+            Dict[str, Any]: 건수, 처리 시간/비용 합계, 평균 처리 시간, 차원별 건수
+        """
+        allowed = {}
+        for field, value in (where or {}).items():
+            allowed[self.DIMENSIONS.index(field)] = set(value) if isinstance(value, (list, tuple, set, frozenset)) else {value}
+        
+        summary = {'count': 0, 'duration_hours': 0.0, 'duration_count': 0, 'cost': 0}
+        breakdown: Dict[str, Dict[Any, int]] = {field: {} for field in self.DIMENSIONS}
+        for month in (self._months if months is None else months):
+            for key, cell in self._cells.get(month, {}).items():
+                if any(key[position] not in values for position, values in allowed.items()):
+                    continue
+                for name in summary:
+                    summary[name] += cell[name]
+                for position, field in enumerate(self.DIMENSIONS):
+                    breakdown[field][key[position]] = breakdown[field].get(key[position], 0) + cell['count']
+        
+        summary['average_duration_hours'] = (
+            round(summary['duration_hours'] / summary['duration_count'], 2) if summary['duration_count'] else 0.0
+        )
+        summary['duration_hours'] = round(summary['duration_hours'], 2)
+        for field, counts in breakdown.items():
+            summary[f'by_{field}'] = counts
+        return summary
+    
+    def monthly(self, months: Iterable[str], where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        월별 집계 목록 (집계가 없는 달은 0건)
+        
+        Args:
+            months: 대상 월 목록
+            where: 차원 조건 (summarize와 같음)
+        
+        Returns:
+            List[Dict[str, Any]]: [{'month': 'YYYY-MM', 'count': ..., 'by_operation_type': {...}, ...}]
+        """
+        return [dict(self.summarize([month], where), month=month) for month in months]
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    def _apply(self, record: Dict[str, Any], sign: int) -> bool:
+        """이력 한 건을 해당 월/차원 칸에 더하거나 뺌 (빈 칸과 빈 달은 제거)"""
+        operated_at = to_datetime(record.get(self.date_field))
+        if operated_at is None:
+            return False
+        month = month_key(operated_at)
+        key = tuple(record.get(field) for field in self.DIMENSIONS)
+        
+        cells = self._cells.get(month)
+        if cells is None:
+            if sign < 0:
+                return False
+            cells = self._cells[month] = {}
+            insort(self._months, month)
+        cell = cells.get(key)
+        if cell is None:
+            if sign < 0:
+                return False
+            cell = cells[key] = {'count': 0, 'duration_hours': 0.0, 'duration_count': 0, 'cost': 0}
+        
+        cell['count'] += sign
+        duration = self._duration_hours(record, operated_at)
+        if duration is not None:
+            cell['duration_hours'] += sign * duration
+            cell['duration_count'] += sign
+        cost = record.get(self.cost_field)
+        if isinstance(cost, (int, float)) and not isinstance(cost, bool):
+            cell['cost'] += sign * cost
+        
+        if cell['count'] <= 0:
+            del cells[key]
+            if not cells:
+                del self._cells[month]
+                self._months.remove(month)
+        return True
+    
+    def _duration_hours(self, record: Dict[str, Any], operated_at: datetime) -> Optional[float]:
+        """작업 일시부터 완료 일시까지의 시간 (완료 전이면 None)"""
+        completed_at = to_datetime(record.get(self.completion_field))
+        if completed_at is None:
+            return None
+        return (completed_at - operated_at).total_seconds() / 3600
@@ -0,0 +1,288 @@
+"""
+PartitionedHistoryStore - 월별 파티션 운영 이력 저장소
+운영 이력을 작업 월별 파티션에 나누어 보관하고, 파티션마다 날짜순 색인과 자산/사용자/작업 유형 색인을 유지합니다.
+
+Classes:
+    - HistoryPartition: 한 달치 이력의 날짜순 키 목록 및 보조 색인
+    - PartitionedHistoryStore: 월별 파티션 기반 기간/조건 조회 저장소
+"""
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta
+from heapq import merge
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+
+# 파티션 내 정렬 키: (작업 일시, 이력 ID)
+HistoryKey = Tuple[datetime, str]
+
+
+def to_datetime(value: Any) -> Optional[datetime]:
+    """datetime/date/'YYYY-MM-DD[ HH:MM[:SS]]' 문자열을 datetime으로 변환 (변환 불가 시 None)"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str) and value:
+        for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d'):
+            try:
+                return datetime.strptime(value[:19], fmt)
+            except ValueError:
+                continue
+    return None
+
+
+def month_key(value: datetime) -> str:
+    """파티션 키 ('YYYY-MM')"""
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+class HistoryPartition:
+    """한 달치 운영 이력 파티션 (날짜순 키 목록 + 필드 값별 날짜순 키 목록)"""
+    
+    __slots__ = ('month', 'keys', 'indexes')
+    
+    def __init__(self, month: str, indexed_fields: Tuple[str, ...]):
+        self.month = month
+        self.keys: List[HistoryKey] = []
+        self.indexes: Dict[str, Dict[Any, List[HistoryKey]]] = {field: {} for field in indexed_fields}
+    
+    def add(self, key: HistoryKey, record: Dict[str, Any]) -> None:
+        """키를 날짜순 목록과 보조 색인에 추가"""
+        insort(self.keys, key)
+        for field, index in self.indexes.items():
+            insort(index.setdefault(record.get(field), []), key)
+    
+    def remove(self, key: HistoryKey, record: Dict[str, Any]) -> None:
+        """키를 날짜순 목록과 보조 색인에서 제거"""
+        self._discard(self.keys, key)
+        for field, index in self.indexes.items():
+            keys = index.get(record.get(field))
+            if keys is not None:
+                self._discard(keys, key)
+                if not keys:
+                    del index[record.get(field)]
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    @staticmethod
+    def _discard(keys: List[HistoryKey], key: HistoryKey) -> None:
+        """정렬 목록에서 키 제거 (이진 탐색)"""
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+
+
+class PartitionedHistoryStore:
+    """
+    월별 파티션 운영 이력 저장소 클래스
+    
+    - 이력 ID → 이력 dict (Repository 목록과 같은 객체)
+    - 월('YYYY-MM') → 파티션 (정렬된 월 목록으로 기간에 해당하는 파티션만 선택)
+    - 파티션별 (작업 일시, ID) 정렬 목록과 asset_id/user_name/operation_type 값별 정렬 목록
+    - 필드별 값 목록 (부분 일치 검색은 이력 전체가 아니라 서로 다른 값 목록에서만 수행)
+    
+    기간 조회는 해당 월 파티션에서 이진 탐색으로 범위를 자르고, 조건이 있으면 파티션마다
+    후보가 가장 적은 보조 색인을 골라 그 범위만 확인하므로 비용은 전체 이력 기간이 아니라
+    조회 범위와 결과 수에 비례합니다.
+    """
+    
+    INDEXED_FIELDS = ('asset_id', 'user_name', 'operation_type')
+    
+    def __init__(self, date_field: str = 'operation_date'):
+        """
+        빈 저장소 생성
+        
+        Args:
+            date_field: 파티션과 정렬 기준이 되는 일시 필드
+        """
+        self.date_field = date_field
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, HistoryKey] = {}
+        self._partitions: Dict[str, HistoryPartition] = {}
+        self._months: List[str] = []
+        self._values: Dict[str, Dict[Any, int]] = {field: {} for field in self.INDEXED_FIELDS}
+    
+    # ==================== 색인 갱신 ====================
+    
+    def rebuild(self, records: List[Dict[str, Any]]) -> None:
+        """
+        전체 이력으로 저장소 재구성
+        
+        Args:
+            records: 운영 이력 목록
+        """
+        self._records.clear()
+        self._keys.clear()
+        self._partitions.clear()
+        self._months.clear()
+        for values in self._values.values():
+            values.clear()
+        for record in records:
+            self.add(record)
+    
+    def add(self, record: Dict[str, Any]) -> bool:
+        """
+        이력 추가 (같은 ID가 있으면 교체)
+        
+        Args:
+            record: 운영 이력 (작업 일시를 해석할 수 없으면 추가하지 않음)
+        
+        Returns:
+            bool: 추가 여부
+        """
+        operated_at = to_datetime(record.get(self.date_field))
+        if operated_at is None:
+            return False
+        history_id = str(record['id'])
+        if history_id in self._records:
+            self.remove(history_id)
+        
+        key = (operated_at, history_id)
+        month = month_key(operated_at)
+        partition = self._partitions.get(month)
+        if partition is None:
+            partition = HistoryPartition(month, self.INDEXED_FIELDS)
+            self._partitions[month] = partition
+            insort(self._months, month)
+        partition.add(key, record)
+        
+        self._records[history_id] = record
+        self._keys[history_id] = key
+        for field, values in self._values.items():
+            value = record.get(field)
+            values[value] = values.get(value, 0) + 1
+        return True
+    
+    def remove(self, history_id: str) -> Optional[Dict[str, Any]]:
+        """
+        이력 제거
+        
+        Args:
+            history_id: 이력 ID
+        
+        Returns:
+            Optional[Dict[str, Any]]: 제거된 이력 또는 None
+        """
+        record = self._records.pop(history_id, None)
+        if record is None:
+            return None
+        key = self._keys.pop(history_id)
+        month = month_key(key[0])
+        partition = self._partitions[month]
+        partition.remove(key, record)
+        if not partition:
+            del self._partitions[month]
+            self._months.remove(month)
+        for field, values in self._values.items():
+            value = record.get(field)
+            values[value] -= 1
+            if not values[value]:
+                del values[value]
+        return record
+    
+    # ==================== 조회 ====================
+    
+    def get(self, history_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 이력 조회 (O(1))"""
+        return self._records.get(history_id)
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def months(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[str]:
+        """
+        기간에 걸친 파티션 월 목록 (오래된 순)
+        
+        Args:
+            start: 시작 일시 (포함)
+            end: 종료 일시 (미포함)
+        """
+        low = bisect_left(self._months, month_key(start)) if start else 0
+        # 종료 일시는 미포함이므로 그 직전 순간이 속한 달까지 선택
+        high = bisect_right(self._months, month_key(end - timedelta(microseconds=1))) if end else len(self._months)
+        return self._months[low:high]
+    
+    def partition_sizes(self) -> Dict[str, int]:
+        """파티션별 이력 수"""
+        return {month: len(self._partitions[month]) for month in self._months}
+    
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        equals: Optional[Dict[str, Any]] = None,
+        contains: Optional[Dict[str, str]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        기간/조건 이력 조회 (최신순)
+        
+        Args:
+            start: 시작 일시 (포함)
+            end: 종료 일시 (미포함)
+            equals: 색인 필드 값 일치 조건 {필드: 값}
+            contains: 색인 필드 부분 일치 조건 {필드: 검색어} (대소문자 무시)
+            predicate: 색인되지 않은 필드 조건 (후보 이력마다 호출)
+            limit: 최대 조회 수
+        
+        Returns:
+            List[Dict[str, Any]]: 조건에 맞는 이력 목록 (최신순)
+        """
+        # 필드별 허용 값 집합 (부분 일치는 서로 다른 값 목록에서만 확인)
+        allowed: Dict[str, Set[Any]] = {}
+        for field, value in (equals or {}).items():
+            allowed[field] = {value} if value in self._values[field] else set()
+        for field, term in (contains or {}).items():
+            term = term.lower()
+            matched = {value for value in self._values[field] if term in str(value).lower()}
+            allowed[field] = allowed[field] & matched if field in allowed else matched
+        if any(not values for values in allowed.values()):
+            return []
+        
+        results: List[Dict[str, Any]] = []
+        for month in reversed(self.months(start, end)):
+            for key in self._scan(self._partitions[month], allowed, start, end):
+                record = self._records[key[1]]
+                if any(record.get(field) not in values for field, values in allowed.items()):
+                    continue
+                if predicate is not None and not predicate(record):
+                    continue
+                results.append(record)
+                if limit is not None and len(results) >= limit:
+                    return results
+        return results
+    
+    def iter_partition(self, month: str) -> Iterator[Dict[str, Any]]:
+        """파티션의 이력을 날짜순으로 순회"""
+        partition = self._partitions.get(month)
+        for _, history_id in (partition.keys if partition else []):
+            yield self._records[history_id]
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    @staticmethod
+    def _scan(
+        partition: HistoryPartition,
+        allowed: Dict[str, Set[Any]],
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> Iterator[HistoryKey]:
+        """파티션에서 후보가 가장 적은 색인을 골라 기간 범위의 키를 최신순으로 반환"""
+        keys = partition.keys
+        best_size = len(keys)
+        for field, values in allowed.items():
+            index = partition.indexes[field]
+            lists = [index[value] for value in values if value in index]
+            size = sum(len(candidate) for candidate in lists)
+            if not size:
+                return
+            if size < best_size:
+                best_size = size
+                keys = lists[0] if len(lists) == 1 else list(merge(*lists))
+        
+        low = bisect_left(keys, (start,)) if start else 0
+        high = bisect_left(keys, (end,)) if end else len(keys)
+        for position in range(high - 1, low - 1, -1):
+            yield keys[position]
@@ -5,6 +5,7 @@
 Classes:
     - LifecycleRepository: 생명주기 이벤트 관련 데이터 처리 Repository
 """
+from datetime import date, datetime
 from typing import List, Dict, Optional, Tuple
 from .data.lifecycle_data import LifecycleData
 
@@ -26,8 +27,10 @@ class LifecycleRepository:
     def get_all_events(self, asset_id: int = None, event_type: str = None, 
                       department: str = None, start_date: str = None, 
                       end_date: str = None) -> List[Dict]:
-        """생명주기 이벤트 목록 조회 (필터링 포함)"""
-        return self.data_source.get_all_events()
+        """생명주기 이벤트 목록 조회 (필터링 포함, 일자순)"""
+        return self.data_source.query_events(
+            asset_id, event_type, department, self._parse_date(start_date), self._parse_date(end_date)
+        )
     
     def get_by_id(self, event_id: int) -> Optional[Dict]:
         """생명주기 이벤트 ID로 조회"""
@@ -41,9 +44,13 @@ class LifecycleRepository:
     
     def get_events_with_pagination(self, page: int = 1, per_page: int = 10, 
                                  asset_id: int = None, event_type: str = None, 
-                                 department: str = None) -> Tuple[List[Dict], int, int, int]:
+                                 department: str = None, start_date: str = None,
+                                 end_date: str = None) -> Tuple[List[Dict], int, int, int]:
         """페이지네이션된 생명주기 이벤트 목록 조회"""
-        return self.data_source.get_events_with_pagination(page, per_page, asset_id, event_type, department)
+        return self.data_source.get_events_with_pagination(
+            page, per_page, asset_id, event_type, department,
+            self._parse_date(start_date), self._parse_date(end_date)
+        )
     
     # ==================== 마스터 데이터 메서드 ====================
     
@@ -71,6 +78,18 @@ class LifecycleRepository:
         """부서별 생명주기 이벤트 조회"""
         return self.data_source.get_events_by_department(department)
     
+    # ==================== 내부 헬퍼 ====================
+    
+    @staticmethod
+    def _parse_date(value: Optional[str]) -> Optional[date]:
+        """'YYYY-MM-DD' 날짜 변환 (형식 오류는 필터 미적용)"""
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            return None
+    
     # ==================== 기존 호환성 메서드 (사용하지 않음) ====================
     
     def _load_sample_data(self) -> List[Dict]:
@@ -7,6 +7,8 @@ Classes:
 """
 from typing import List, Dict, Any, Optional, Tuple
 from .data.loan_data import LoanData
+from ...utils.constants import DOMAIN_EVENTS
+from ...utils.events import domain_events
 
 
 class LoanRepository:
@@ -84,16 +86,33 @@ class LoanRepository:
     # ==================== CRUD 메서드 ====================
     
     def create_loan(self, loan_data: Dict[str, Any]) -> Dict[str, Any]:
-        """새 대여 생성"""
-        return self.data_source.add_loan(loan_data)
+        """새 대여 생성 (loan.created 이벤트 발행)"""
+        loan = self.data_source.add_loan(loan_data)
+        domain_events.publish(DOMAIN_EVENTS['LOAN_CREATED'], loan)
+        return loan
     
     def update_loan(self, loan_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """대여 정보 업데이트"""
-        return self.data_source.update_loan(loan_id, update_data)
+        """대여 정보 업데이트 (loan.updated 이벤트, 반납 완료로 바뀌면 loan.returned 이벤트도 발행)"""
+        previous = self.data_source.get_loan_by_id(loan_id)
+        loan = self.data_source.update_loan(loan_id, update_data)
+        if loan is not None:
+            domain_events.publish(DOMAIN_EVENTS['LOAN_UPDATED'], loan, previous)
+            if self._is_returned(loan) and not self._is_returned(previous):
+                domain_events.publish(DOMAIN_EVENTS['LOAN_RETURNED'], loan, previous)
+        return loan
     
     def delete_loan(self, loan_id: int) -> bool:
-        """대여 삭제"""
-        return self.data_source.delete_loan(loan_id)
+        """대여 삭제 (loan.deleted 이벤트 발행)"""
+        previous = self.data_source.get_loan_by_id(loan_id)
+        deleted = self.data_source.delete_loan(loan_id)
+        if deleted and previous is not None:
+            domain_events.publish(DOMAIN_EVENTS['LOAN_DELETED'], previous)
+        return deleted
+    
+    @staticmethod
+    def _is_returned(loan: Optional[Dict[str, Any]]) -> bool:
+        """반납 완료 상태 여부"""
+        return bool(loan) and (loan.get('status_id') == 4 or loan.get('status') == '반납 완료')
     
     # ==================== 통계 메서드 ====================
     
@@ -16,6 +16,7 @@ from .lifecycle_repository import LifecycleRepository
 from .upgrade_repository import UpgradeRepository
 from .operations_data import OperationsData
 from .history_repository import OperationHistoryRepository
+from .history_rollup import recent_month_keys
 
 
 class OperationsRepository:
@@ -137,6 +138,26 @@ class OperationsRepository:
         """이력 상세 정보 조회 - HistoryRepository로 위임"""
         return self.history_repo.get_history_detail_by_id(history_id)
     
+    def get_recent_operations(self, limit: int = 10) -> List[Dict]:
+        """최근 운영 이력 조회 - HistoryRepository로 위임"""
+        return self.history_repo.get_recent_operations(limit)
+    
+    def add_operation_history(self, history: Dict) -> Dict:
+        """운영 이력 추가 - HistoryRepository로 위임"""
+        return self.history_repo.add_history(history)
+    
+    def update_operation_history(self, history_id: str, changes: Dict) -> Optional[Dict]:
+        """운영 이력 변경 - HistoryRepository로 위임"""
+        return self.history_repo.update_history(history_id, changes)
+    
+    def get_history_monthly_rollup(self, months: List[str], operation_types: List[str] = None) -> List[Dict]:
+        """이력 월별 집계 조회 - HistoryRepository로 위임"""
+        return self.history_repo.get_monthly_rollup(months, operation_types)
+    
+    def get_history_rollup_summary(self, months: List[str] = None, operation_types: List[str] = None) -> Dict:
+        """이력 기간 집계 합계 조회 - HistoryRepository로 위임"""
+        return self.history_repo.get_rollup_summary(months, operation_types)
+    
     def get_history_statistics(self, history_records: List[Dict] = None) -> Dict:
         """이력 통계 정보 조회 - HistoryRepository로 위임"""
         return self.history_repo.get_history_statistics(history_records)
@@ -146,43 +167,20 @@ class OperationsRepository:
         # 기본 운영 통계
         basic_stats = self.get_operations_statistics()
         
-        # 전체 이력 가져오기
-        all_history = self.get_operation_history()
-        history_stats = self.get_history_statistics(all_history)
-        
-        # 월별 통계 (최근 6개월)
-        monthly_stats = {}
-        current_date = datetime.now()
+        # 전체 이력 통계 (월별 집계 기반)
+        history_stats = self.get_history_statistics()
         
-        for i in range(6):
-            month_date = datetime(current_date.year, current_date.month - i, 1) if current_date.month - i > 0 else datetime(current_date.year - 1, 12 + current_date.month - i, 1)
-            month_key = month_date.strftime('%Y-%m')
-            monthly_stats[month_key] = {
-                'loans': 0,
-                'returns': 0,
-                'disposals': 0
+        # 월별 통계 (최근 6개월, 최신순) - 이력을 다시 훑지 않고 월별 집계에서 조회
+        monthly_rows = self.get_history_monthly_rollup(recent_month_keys(6))
+        monthly_stats = {
+            row['month']: {
+                'loans': row['by_operation_type'].get('대여', 0),
+                'returns': row['by_operation_type'].get('반납', 0),
+                'disposals': row['by_operation_type'].get('폐기', 0)
             }
-        
-        # 월별 데이터 집계
-        for record in all_history:
-            if record['operation_date']:
-                try:
-                    # operation_date가 이미 datetime 객체인지 확인
-                    if isinstance(record['operation_date'], datetime):
-                        record_date = record['operation_date']
-                    else:
-                        record_date = datetime.strptime(record['operation_date'], '%Y-%m-%d %H:%M')
-                    
-                    month_key = record_date.strftime('%Y-%m')
-                    if month_key in monthly_stats:
-                        if record['operation_type'] == '대여':
-                            monthly_stats[month_key]['loans'] += 1
-                        elif record['operation_type'] == '반납':
-                            monthly_stats[month_key]['returns'] += 1
-                        elif record['operation_type'] == '폐기':
-                            monthly_stats[month_key]['disposals'] += 1
-                except (ValueError, TypeError):
-                    continue
+            for row in reversed(monthly_rows)
+        }
+        this_month, last_month = monthly_rows[-1]['by_operation_type'], monthly_rows[-2]['by_operation_type']
         
         # 자산별 활용도 통계
         asset_usage = {}
@@ -233,10 +231,13 @@ class OperationsRepository:
             'asset_usage': asset_usage,
             'top_assets': dict(top_assets),
             'summary_stats': {
-                'monthly_loans': sum(stats['loans'] for stats in monthly_stats.values()),
-                'monthly_returns': sum(stats['returns'] for stats in monthly_stats.values()),
-                'overdue_returns': len([l for l in self.loans if l['status_id'] == 5]),
-                'total_operations': len(all_history),
+                'monthly_loans': this_month.get('대여', 0),
+                'monthly_returns': this_month.get('반납', 0),
+                'monthly_loan_growth': self._growth_rate(this_month.get('대여', 0), last_month.get('대여', 0)),
+                'monthly_return_growth': self._growth_rate(this_month.get('반납', 0), last_month.get('반납', 0)),
+                'overdue_returns': basic_stats['overdue_loans'],
+                'total_operations': history_stats['total_records'],
+                'average_processing_time': history_stats['average_duration_hours'],
                 'average_utilization_rate': sum(stats['utilization_rate'] for stats in asset_usage.values()) / len(asset_usage) if asset_usage else 0,
                 'active_assets': len([stats for stats in asset_usage.values() if stats['active_loans'] > 0])
             },
@@ -248,14 +249,30 @@ class OperationsRepository:
                 }
                 for asset_name, stats in top_assets
             ],
+            'monthly_trends': [
+                {
+                    'month': f"{int(row['month'][5:])}월",
+                    'loans': row['by_operation_type'].get('대여', 0),
+                    'returns': row['by_operation_type'].get('반납', 0),
+                    'disposals': row['by_operation_type'].get('폐기', 0)
+                }
+                for row in monthly_rows
+            ],
             'department_utilization': department_utilization,
             'summary': {
-                'total_operations': len(all_history),
+                'total_operations': history_stats['total_records'],
                 'most_active_department': max(history_stats['by_department'].items(), key=lambda x: x[1])[0] if history_stats['by_department'] else '없음',
                 'most_common_operation': max(history_stats['by_operation_type'].items(), key=lambda x: x[1])[0] if history_stats['by_operation_type'] else '없음'
             }
         }
     
+    @staticmethod
+    def _growth_rate(current: int, previous: int) -> float:
+        """전월 대비 증감률 (%) - 전월 실적이 없으면 0"""
+        if not previous:
+            return 0
+        return round((current - previous) / previous * 100, 1)
+    
     # ==================== 폐기 계획 관련 메서드 (DisposalRepository로 위임) ====================
     
     def get_all_disposal_plans(self, status: str = None) -> List[Dict]:
@@ -417,22 +434,25 @@ class OperationsRepository:
                                 department: str = None, start_date: str = None, 
                                 end_date: str = None) -> List[Dict]:
         """생명주기 이벤트 목록 조회 - LifecycleRepository로 위임"""
-        return self.lifecycle_repo._load_sample_data()
+        return self.lifecycle_repo.get_all_events(asset_id, event_type, department, start_date, end_date)
     
     def get_lifecycle_events_by_asset(self, asset_id: int) -> List[Dict]:
-        """자산별 생명주기 이벤트 조회 - LifecycleRepository로 위임"""
-        return self.lifecycle_repo.get_by_id(asset_id) or []
+        """자산별 생명주기 이벤트 조회 (일자순) - LifecycleRepository로 위임"""
+        return self.lifecycle_repo.get_events_by_asset(asset_id)
     
     def get_lifecycle_events_with_pagination(self, page: int = 1, per_page: int = 10, 
                                            asset_id: int = None, event_type: str = None, 
-                                           department: str = None) -> Tuple[List[Dict], int, int, int]:
+                                           department: str = None, start_date: str = None,
+                                           end_date: str = None) -> Tuple[List[Dict], int, int, int]:
         """
         페이지네이션된 생명주기 이벤트 목록 - LifecycleRepository 사용
             
         Returns:
             (생명주기이벤트목록, 현재페이지, 총페이지수, 총항목수)
         """
-        return self.lifecycle_repo.get_events_with_pagination(page, per_page, asset_id, event_type, department)
+        return self.lifecycle_repo.get_events_with_pagination(
+            page, per_page, asset_id, event_type, department, start_date, end_date
+        )
     
     def get_lifecycle_statistics(self) -> Dict:
         """
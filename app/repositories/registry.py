@@ -0,0 +1,178 @@
+"""
+Repository Registry
+서비스에 공유 Repository 인스턴스를 제공하는 의존성 주입 컨테이너
+
+Classes:
+    - RepositoryRegistry: 이름별 Repository 팩토리 등록, 공유 인스턴스 제공, 테스트용 교체
+    - RepositoryProvider: 서비스 클래스 속성으로 선언하는 Repository 주입 디스크립터
+"""
+import threading
+from contextlib import contextmanager
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class RepositoryRegistry:
+    """
+    Repository 레지스트리 클래스
+    
+    팩토리는 최초 조회 시 한 번만 호출되며, 이후에는 같은 인스턴스를 모든 서비스에 제공합니다.
+    테스트에서는 override()로 특정 Repository를 임시 교체할 수 있습니다.
+    """
+    
+    def __init__(self):
+        """레지스트리 초기화"""
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._overrides: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+    
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """
+        Repository 팩토리 등록
+        
+        Args:
+            name: Repository 이름 (예: 'inventory')
+            factory: 공유 인스턴스를 반환하는 함수
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+    
+    def get(self, name: str) -> Any:
+        """
+        공유 Repository 인스턴스 조회
+        
+        Args:
+            name: Repository 이름
+        
+        Returns:
+            Any: Repository 인스턴스 (교체된 경우 교체 인스턴스)
+        
+        Raises:
+            KeyError: 등록되지 않은 이름인 경우
+        """
+        # 조회 경로는 잠금 없이 처리 (dict 단일 조회는 원자적)
+        if name in self._overrides:
+            return self._overrides[name]
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        
+        with self._lock:
+            if name in self._instances:
+                return self._instances[name]
+            if name not in self._factories:
+                raise KeyError(f"등록되지 않은 Repository입니다: {name}")
+            instance = self._factories[name]()
+            self._instances[name] = instance
+            return instance
+    
+    def get_names(self) -> List[str]:
+        """등록된 Repository 이름 목록 조회"""
+        return sorted(self._factories.keys())
+    
+    # ==================== 테스트 지원 ====================
+    
+    def set_override(self, name: str, instance: Any) -> None:
+        """
+        Repository 인스턴스 교체 (테스트용)
+        
+        Args:
+            name: Repository 이름
+            instance: 대신 제공할 인스턴스
+        """
+        with self._lock:
+            self._overrides[name] = instance
+    
+    def clear_override(self, name: Optional[str] = None) -> None:
+        """
+        교체 해제
+        
+        Args:
+            name: Repository 이름 (None이면 전체 해제)
+        """
+        with self._lock:
+            if name is None:
+                self._overrides.clear()
+            else:
+                self._overrides.pop(name, None)
+    
+    @contextmanager
+    def override(self, name: str, instance: Any) -> Iterator[Any]:
+        """
+        블록 안에서만 Repository 인스턴스 교체 (테스트용)
+        
+        사용 예:
+            with repository_registry.override('inventory', FakeInventoryRepository()):
+                inventory_export_service.export_to_excel()
+        
+        Args:
+            name: Repository 이름
+            instance: 대신 제공할 인스턴스
+        
+        Yields:
+            Any: 교체 인스턴스
+        """
+        with self._lock:
+            had_previous = name in self._overrides
+            previous = self._overrides.get(name)
+            self._overrides[name] = instance
+        try:
+            yield instance
+        finally:
+            with self._lock:
+                if had_previous:
+                    self._overrides[name] = previous
+                else:
+                    self._overrides.pop(name, None)
+
+
+class RepositoryProvider:
+    """
+    Repository 주입 디스크립터
+    
+    서비스 클래스 속성으로 선언하면 접근할 때마다 레지스트리의 공유 인스턴스를 반환합니다.
+    인스턴스 속성으로 직접 대입하면 해당 서비스 인스턴스에서만 그 값을 사용합니다.
+    
+    사용 예:
+        class InventoryExportService:
+            repository = RepositoryProvider('inventory')
+    """
+    
+    def __init__(self, name: str, registry: Optional[RepositoryRegistry] = None):
+        """
+        Args:
+            name: Repository 이름
+            registry: 사용할 레지스트리 (기본값: repository_registry)
+        """
+        self.name = name
+        self.registry = registry
+    
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        return (self.registry or repository_registry).get(self.name)
+
+
+def _singleton_factory(module_path: str, attribute: str) -> Callable[[], Any]:
+    """모듈 싱글톤을 지연 import하는 팩토리 생성 (순환 import 방지)"""
+    def factory() -> Any:
+        return getattr(import_module(module_path, __package__), attribute)
+    return factory
+
+
+# 싱글톤 인스턴스 생성
+repository_registry = RepositoryRegistry()
+
+# 기본 Repository 등록 (각 모듈의 싱글톤 인스턴스를 그대로 공유)
+for _name, _module_path, _attribute in [
+    ('asset', '.asset.asset_repository', 'asset_repository'),
+    ('contract', '.contract.contract_repository', 'contract_repository'),
+    ('inventory', '.inventory.inventory_repository', 'inventory_repository'),
+    ('operations', '.operations.operations_repository', 'operations_repository'),
+    ('category', '.category.category_repository', 'category_repository'),
+    ('preset', '.preset.preset_repository', 'preset_repository'),
+    ('notification', '.notification.notification_repository', 'notification_repository')
+]:
+    repository_registry.register(_name, _singleton_factory(_module_path, _attribute))
@@ -1,10 +1,16 @@
 """
 API 라우트
 Software search and management API endpoints
+Background export job API endpoints
+Streaming (gzip CSV/NDJSON) export API endpoints
+Batch PDF document API endpoints
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, send_file, url_for
+from flask_login import login_required, current_user
 from ..models.software import SoftwareService
+from ..services.export import export_job_service, export_stream_service
+from ..services.document import document_batch_pdf_service, email_outbox_service
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
@@ -103,4 +109,238 @@ def get_software_categories():
             'success': False,
             'message': f'조회 중 오류가 발생했습니다: {str(e)}',
             'categories': []
-        }), 500 
\ No newline at end of file
+        }), 500 
+
+
+# ==================== 백그라운드 내보내기 작업 API ====================
+
+@api_bp.route('/exports', methods=['POST'])
+@login_required
+def create_export_job():
+    """
+    내보내기 작업 등록 API
+    
+    Request Body (JSON):
+        export_type (str): 내보내기 유형 (assets, contracts, contract_summary, inventory, operations_report)
+        params (dict): 내보내기 파라미터 (필터 조건 등)
+    
+    Returns:
+        JSON: 등록된 작업 정보 (202)
+    """
+    data = request.get_json(silent=True) or {}
+    export_type = data.get('export_type', '')
+    params = data.get('params') or {}
+    
+    try:
+        job = export_job_service.submit_job(export_type, params, owner_id=current_user.id)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e),
+            'export_types': export_job_service.get_export_types()
+        }), 400
+    
+    return jsonify({
+        'success': True,
+        'message': '내보내기 작업이 등록되었습니다.',
+        'job': job,
+        'status_url': url_for('api.get_export_job', job_id=job['job_id']),
+        'download_url': url_for('api.download_export_job', job_id=job['job_id'])
+    }), 202
+
+@api_bp.route('/exports')
+@login_required
+def get_export_jobs():
+    """
+    내 내보내기 작업 목록 API
+    
+    Returns:
+        JSON: 작업 목록
+    """
+    jobs = export_job_service.get_jobs(owner_id=current_user.id)
+    return jsonify({
+        'success': True,
+        'jobs': jobs
+    })
+
+@api_bp.route('/exports/<job_id>')
+@login_required
+def get_export_job(job_id):
+    """
+    내보내기 작업 상태/진행률 조회 API
+    
+    Returns:
+        JSON: 작업 정보
+    """
+    job = export_job_service.get_job(job_id, owner_id=current_user.id)
+    if not job:
+        return jsonify({
+            'success': False,
+            'message': '내보내기 작업을 찾을 수 없습니다.'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'job': job
+    })
+
+@api_bp.route('/exports/<job_id>/download')
+@login_required
+def download_export_job(job_id):
+    """
+    완료된 내보내기 작업 결과 다운로드 API
+    
+    Returns:
+        파일 다운로드 또는 JSON 오류 (404: 없음/만료, 409: 미완료)
+    """
+    artifact = export_job_service.get_job_artifact(job_id, owner_id=current_user.id)
+    if artifact:
+        file_path, filename = artifact
+        return send_file(file_path, as_attachment=True, download_name=filename)
+    
+    job = export_job_service.get_job(job_id, owner_id=current_user.id)
+    if job and job['status'] in ('pending', 'running'):
+        return jsonify({
+            'success': False,
+            'message': '내보내기 작업이 아직 완료되지 않았습니다.',
+            'job': job
+        }), 409
+    
+    return jsonify({
+        'success': False,
+        'message': '다운로드할 파일이 없거나 보관 기간이 만료되었습니다.',
+        'job': job
+    }), 404
+
+
+# ==================== 스트리밍 내보내기 API ====================
+
+@api_bp.route('/exports/stream/<dataset>')
+@login_required
+def stream_export(dataset):
+    """
+    연동용 스트리밍 내보내기 API
+    
+    Query Parameters:
+        format (str): csv 또는 ndjson (기본: csv)
+        gzip (str): 0이면 비압축 (기본: gzip 압축)
+        since (str): ISO 8601 날짜/일시, 이후 변경된 행만 내보내기
+    
+    Returns:
+        스트리밍 파일 다운로드 (X-Export-Watermark 헤더: 다음 since 값) 또는 JSON 오류 (400)
+    """
+    try:
+        since = export_stream_service.parse_since(request.args.get('since'))
+        return export_stream_service.create_stream_response(
+            dataset,
+            export_format=request.args.get('format', 'csv').lower(),
+            since=since,
+            compress=request.args.get('gzip', '1') != '0'
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e),
+            'datasets': export_stream_service.get_datasets()
+        }), 400
+
+
+# ==================== 문서 일괄 생성 API ====================
+
+@api_bp.route('/documents/batch-pdf', methods=['POST'])
+@login_required
+def generate_batch_pdf():
+    """
+    일괄 PDF 생성 API
+    
+    Request Body (JSON):
+        documents (list): 문서 명세 목록 (예: {"type": "purchase_order", "order_id": 1},
+                          {"type": "asset_label", "asset_id": 3})
+        output (str): manifest(생성 파일 목록 JSON) 또는 zip(zip 파일 다운로드) (기본: manifest)
+    
+    Returns:
+        zip 파일 다운로드 또는 JSON 매니페스트, 요청 오류 시 JSON (400)
+    """
+    payload = request.get_json(silent=True) or {}
+    output = payload.get('output', 'manifest')
+    
+    try:
+        manifest = document_batch_pdf_service.generate_batch(payload.get('documents'), output=output)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
+    if output == 'zip':
+        response = send_file(
+            document_batch_pdf_service.resolve_path(manifest['zip_path']),
+            as_attachment=True,
+            download_name=f"documents_{manifest['batch_id']}.zip",
+            mimetype='application/zip'
+        )
+        response.headers['X-Batch-Success-Count'] = str(manifest['success_count'])
+        response.headers['X-Batch-Failure-Count'] = str(manifest['failure_count'])
+        return response
+    
+    return jsonify({
+        'success': manifest['failure_count'] == 0,
+        'manifest': manifest
+    })
+
+
+# ==================== 메일 발송 대기열 API ====================
+
+@api_bp.route('/emails/outbox/<message_id>', methods=['GET'])
+@login_required
+def get_outbox_message(message_id):
+    """
+    발송 대기열 메시지 상태 조회 API
+    
+    Returns:
+        JSON: 메시지 상태 (queued, retrying, sent, dead), 시도 횟수, 마지막 오류
+    """
+    message = email_outbox_service.get_message(message_id)
+    if not message:
+        return jsonify({
+            'success': False,
+            'message': '메일을 찾을 수 없습니다.'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'message': message
+    })
+
+@api_bp.route('/emails/outbox', methods=['GET'])
+@login_required
+def get_outbox_messages():
+    """
+    발송 대기열 목록 조회 API
+    
+    Query Parameters:
+        status (str): 상태 필터 (예: dead)
+    
+    Returns:
+        JSON: 상태별 통계 및 메시지 목록
+    """
+    return jsonify({
+        'success': True,
+        'statistics': email_outbox_service.get_statistics(),
+        'messages': email_outbox_service.get_messages(request.args.get('status'))
+    })
+
+@api_bp.route('/emails/outbox/<message_id>/requeue', methods=['POST'])
+@login_required
+def requeue_outbox_message(message_id):
+    """dead letter 메시지 재발송 API"""
+    if not email_outbox_service.requeue_dead_letter(message_id):
+        return jsonify({
+            'success': False,
+            'message': '재발송할 수 있는 메일이 아닙니다.'
+        }), 400
+    
+    return jsonify({
+        'success': True,
+        'message': '메일이 발송 대기열에 다시 등록되었습니다.'
+    })
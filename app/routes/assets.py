@@ -13,6 +13,8 @@ import xlsxwriter
 # Service 임포트 - 상대 경로 사용
 from ..services.asset_core_service import AssetCoreService
 from ..services.asset_export_service import AssetExportService
+from ..services.export import export_job_service, export_cache_service
+from ..utils.constants import EXPORT_SETTINGS
 
 # Service 인스턴스 생성
 asset_core_service = AssetCoreService()
@@ -255,17 +257,24 @@ def export_excel():
         'sort_by': 'recent'
     }
     
-    assets = asset_core_service.get_filtered_assets(filters)
+    # 비동기 요청(async=1)이면 백그라운드 내보내기 작업으로 등록
+    if request.args.get('async') == '1':
+        try:
+            job = export_job_service.submit_job('assets', filters, owner_id=current_user.id)
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        return jsonify({'success': True, 'job': job}), 202
     
-    # Export Service를 통해 Excel 생성
+    # 동일 조건·데이터 버전의 결과가 캐시에 있으면 재생성 없이 파일만 전송 (ETag 지원)
     export_service = AssetExportService()
-    output, filename = export_service.export_to_excel(assets)
-    
-    return Response(
-        output,
-        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment;filename={filename}"}
+    entry = export_cache_service.get_or_create(
+        'assets',
+        filters,
+        asset_core_service.get_data_version(),
+        lambda: export_service.export_to_excel(asset_core_service.get_filtered_assets(filters))
     )
+    
+    return export_cache_service.create_cached_response(entry, EXPORT_SETTINGS['XLSX_MIMETYPE'])
 
 @assets_bp.route('/pc_management')
 @login_required
@@ -661,6 +670,33 @@ def create_quotation_request(partner_id):
     if not request.is_json:
         return redirect(url_for('assets.partner_detail', partner_id=partner_id))
 
+@assets_bp.route('/quotation-requests/bulk', methods=['POST'])
+@login_required
+def create_bulk_quotation_requests():
+    """
+    견적서 일괄 요청 API (하나의 요청을 여러 협력사에 발송)
+    
+    Request Body (JSON):
+        partner_ids (list): 협력사 ID 목록
+        title, description, deadline 등: 견적서 요청 데이터
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({
+            'success': False,
+            'message': '요청 본문은 JSON 객체여야 합니다.'
+        }), 400
+    
+    partner_ids = data.pop('partner_ids', None)
+    if not isinstance(partner_ids, list):
+        return jsonify({
+            'success': False,
+            'message': 'partner_ids 목록이 필요합니다.'
+        }), 400
+    
+    result = asset_core_service.create_bulk_quotation_requests(partner_ids, data)
+    return jsonify(result), (200 if result['success'] else 400)
+
 @assets_bp.route('/partners/<int:partner_id>/purchase-orders', methods=['GET'])
 @login_required
 def get_purchase_orders(partner_id):
@@ -734,16 +770,32 @@ def get_partner_quotation_requests(partner_id):
 @assets_bp.route('/api/purchase-orders/<int:order_id>/download', methods=['GET'])
 @login_required
 def download_purchase_order(order_id):
-    """발주서 PDF 다운로드"""
+    """
+    발주서 PDF 다운로드
+    
+    보관된 PDF가 있으면 그대로 전송하고, 없으면 메모리에서 렌더링하여 임시 파일 없이 스트리밍합니다.
+    
+    Query Parameters:
+        archive (str): 1이면 렌더링 결과를 파일로 보관
+    """
     try:
         pdf_path = asset_core_service.get_purchase_order_pdf_path(order_id)
         if pdf_path and os.path.exists(pdf_path):
             return send_file(pdf_path, as_attachment=True)
-        else:
+        
+        rendered = asset_core_service.render_purchase_order_pdf(order_id, archive=request.args.get('archive') == '1')
+        if not rendered:
             return jsonify({
                 'success': False,
                 'message': 'PDF 파일을 찾을 수 없습니다.'
             }), 404
+        
+        return send_file(
+            rendered['buffer'],
+            as_attachment=True,
+            download_name=rendered['filename'],
+            mimetype='application/pdf'
+        )
     except Exception as e:
         current_app.logger.error(f"발주서 PDF 다운로드 실패: {str(e)}")
         return jsonify({
@@ -1,12 +1,13 @@
 """
 계약 관리 관련 라우트 모듈
 """
-from flask import Blueprint, render_template, redirect, url_for, flash, request
-from flask_login import login_required
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
+from flask_login import login_required, current_user
 
 # Service imports
 from ..services.contract_core_service import ContractCoreService
 from ..services.contract_export_service import ContractExportService
+from ..services.export import export_job_service
 
 contract_bp = Blueprint('contract', __name__)
 
@@ -213,6 +214,19 @@ def export_excel():
     status = request.args.get('status', '')
     include_charts = request.args.get('charts', 'false').lower() == 'true'
     
+    # 비동기 요청(async=1)이면 백그라운드 내보내기 작업으로 등록
+    if request.args.get('async') == '1':
+        try:
+            job = export_job_service.submit_job('contracts', {
+                'search_query': search_query,
+                'contract_type': contract_type,
+                'status': status,
+                'include_charts': include_charts
+            }, owner_id=current_user.id)
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        return jsonify({'success': True, 'job': job}), 202
+    
     # ExportService를 통한 Excel 내보내기
     return export_service.export_to_excel(
         search_query=search_query if search_query else None,
@@ -229,5 +243,13 @@ def export_summary():
     """
     report_type = request.args.get('type', 'monthly')  # monthly, quarterly, yearly
     
+    # 비동기 요청(async=1)이면 백그라운드 내보내기 작업으로 등록
+    if request.args.get('async') == '1':
+        try:
+            job = export_job_service.submit_job('contract_summary', {'report_type': report_type}, owner_id=current_user.id)
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        return jsonify({'success': True, 'job': job}), 202
+    
     # ExportService를 통한 요약 보고서 생성
     return export_service.export_summary_report(report_type=report_type) 
\ No newline at end of file
@@ -1,11 +1,12 @@
 ﻿"""
 자산실사 관련 라우트 모듈 (4-Layer Architecture)
 """
-from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime, timedelta
 from ..services.inventory_core_service import InventoryCoreService
 from ..services.inventory_export_service import inventory_export_service
+from ..services.export import export_job_service
 
 # Repository 인스턴스 생성
 inventory_service = InventoryCoreService()
@@ -212,6 +213,14 @@ def export_csv():
 @login_required
 def export_excel():
     """Excel 내보내기"""
+    # 비동기 요청(async=1)이면 백그라운드 내보내기 작업으로 등록
+    if request.args.get('async') == '1':
+        try:
+            job = export_job_service.submit_job('inventory', {'inventory_id': request.args.get('inventory_id')}, owner_id=current_user.id)
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        return jsonify({'success': True, 'job': job}), 202
+    
     try:
         data = inventory_export_service.export_to_excel()
         flash('Excel 파일이 성공적으로 생성되었습니다.', 'success')
@@ -7,6 +7,8 @@ from datetime import datetime
 from ..services.operations_core_service import OperationsCoreService
 from ..services.operations_statistics_service import OperationsStatisticsService
 from ..services.operations.disposal_service import DisposalService
+from ..services.operations.live_update_service import live_update_hub
+from ..services.export import export_job_service
 
 operations_bp = Blueprint('operations', __name__)
 
@@ -15,6 +17,9 @@ operations_service = OperationsCoreService()
 statistics_service = OperationsStatisticsService()
 disposal_service = DisposalService()
 
+# 실시간 갱신 허브: 저장소 변경 시 대시보드 통계 변경분을 계산할 함수 연결
+live_update_hub.start(stats_provider=operations_service.get_operations_dashboard_data)
+
 @operations_bp.route('/')
 @login_required
 def index():
@@ -214,6 +219,14 @@ def download_report(report_format):
     """
     report_id = request.args.get('report_id')
     
+    # 비동기 요청(async=1)이면 백그라운드 내보내기 작업으로 등록
+    if request.args.get('async') == '1':
+        try:
+            job = export_job_service.submit_job('operations_report', {'report_id': report_id, 'report_format': report_format}, owner_id=current_user.id)
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        return jsonify({'success': True, 'job': job}), 202
+    
     # Service를 통한 보고서 파일 생성 및 다운로드
     file_path = statistics_service.export_report(report_id, report_format)
     
@@ -842,6 +855,38 @@ def get_dashboard_refresh_api():
             'message': f'대시보드 데이터 조회 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@operations_bp.route('/api/live/stream', methods=['GET'])
+@login_required
+def live_update_stream():
+    """
+    실시간 갱신 SSE 스트림 API
+    
+    알림(notification), 대시보드 통계 변경분(stats), 전체 재조회 요청(resync) 이벤트를 전송합니다.
+    브라우저 EventSource가 재연결 시 보내는 Last-Event-ID 이후 이벤트를 이어서 보냅니다.
+    
+    Returns:
+        text/event-stream 응답 또는 동시 연결 상한 초과 시 JSON (503)
+    """
+    response = live_update_hub.create_stream_response(
+        current_user.id,
+        request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    )
+    if response is None:
+        return jsonify({
+            'success': False,
+            'message': '실시간 연결 수가 많아 잠시 후 다시 시도해 주세요.'
+        }), 503
+    return response
+
+@operations_bp.route('/api/live/status', methods=['GET'])
+@login_required
+def live_update_status():
+    """실시간 갱신 허브 상태 조회 API"""
+    return jsonify({
+        'success': True,
+        'data': live_update_hub.get_statistics()
+    })
+
 # ===========================================
 # 새로 추가된 API 엔드포인트들
 # ===========================================
@@ -1243,6 +1288,86 @@ def mark_notification_read_api():
             'message': f'읽음 처리 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@operations_bp.route('/api/operations/notifications/inbox', methods=['GET'])
+@login_required
+def get_notification_inbox_api():
+    """내 알림함 조회 API (최신순 페이지)"""
+    try:
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
+        unread_only = request.args.get('unread_only', 'false').lower() == 'true'
+        
+        # Service를 통한 알림함 조회
+        inbox = operations_service.get_notification_inbox(current_user.id, page, per_page, unread_only)
+        
+        return jsonify({
+            'success': True,
+            'data': inbox
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'알림함 조회 중 오류가 발생했습니다: {str(e)}'
+        }), 500
+
+@operations_bp.route('/api/operations/notifications/unread-count', methods=['GET'])
+@login_required
+def get_unread_notification_count_api():
+    """읽지 않은 알림 수 조회 API (헤더 배지 갱신용)"""
+    return jsonify({
+        'success': True,
+        'data': {
+            'unread_count': operations_service.get_unread_notification_count(current_user.id)
+        }
+    })
+
+@operations_bp.route('/api/operations/notifications/mark-all-read', methods=['POST'])
+@login_required
+def mark_all_notifications_read_api():
+    """내 알림 일괄 읽음 처리 API"""
+    try:
+        result = operations_service.mark_all_notifications_read(current_user.id)
+        
+        if result['success']:
+            return jsonify({
+                'success': True,
+                'data': {
+                    'updated_count': result['updated_count']
+                },
+                'message': result['message']
+            })
+        else:
+            return jsonify({
+                'success': False,
+                'message': result['message']
+            }), 400
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'일괄 읽음 처리 중 오류가 발생했습니다: {str(e)}'
+        }), 500
+
+@operations_bp.route('/api/operations/notifications/scheduler-status', methods=['GET'])
+@login_required
+def get_deadline_scheduler_status_api():
+    """기한 스케줄러 상태 조회 API (대기/발생 기한 수, 다가오는 기한)"""
+    limit = request.args.get('limit', 20, type=int)
+    return jsonify({
+        'success': True,
+        'data': operations_service.get_deadline_scheduler_status(max(1, min(limit, 200)))
+    })
+
+@operations_bp.route('/api/operations/notifications/digest-status', methods=['GET'])
+@login_required
+def get_notification_digest_status_api():
+    """알림 묶음 발송 통계 조회 API (수신/중복 병합/발송 수, 대기 중인 묶음)"""
+    return jsonify({
+        'success': True,
+        'data': operations_service.get_notification_digest_statistics()
+    })
+
 @operations_bp.route('/api/operations/return/notifications/<notification_id>', methods=['DELETE'])
 @login_required
 def delete_notification_api(notification_id):
@@ -6,16 +6,14 @@ Classes:
     - AssetCrudService: 자산 CRUD 관련 비즈니스 로직
 """
 from typing import Dict, Optional, Any, Tuple
-from ...repositories.asset.asset_repository import asset_repository
+from ...repositories.registry import RepositoryProvider
 from ...utils.constants import validate_asset_data
 
 
 class AssetCrudService:
     """자산 CRUD 비즈니스 로직을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = asset_repository
+    repository = RepositoryProvider('asset')
     
     def get_asset_detail(self, asset_id: int) -> Optional[Dict[str, Any]]:
         """
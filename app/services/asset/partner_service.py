@@ -6,15 +6,13 @@ Classes:
     - AssetPartnerService: 협력사 관련 비즈니스 로직
 """
 from typing import List, Dict, Optional, Any
-from ...repositories.asset.asset_repository import asset_repository
+from ...repositories.registry import RepositoryProvider
 
 
 class AssetPartnerService:
     """협력사 관리 비즈니스 로직을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = asset_repository
+    repository = RepositoryProvider('asset')
     
     def get_partners_list(self) -> List[Dict[str, Any]]:
         """협력사 목록을 조회 (계약 건수 포함)"""
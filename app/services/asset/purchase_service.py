@@ -5,18 +5,27 @@ Asset Purchase Service - 구매/견적 관리 비즈니스 로직
 Classes:
     - AssetPurchaseService: 구매/견적 관련 비즈니스 로직
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import date, datetime
 import os
-from ...repositories.asset.asset_repository import asset_repository
+import uuid
+from ...repositories.registry import RepositoryProvider
+from ...utils.constants import BUSINESS_RULES
+from ..document.pdf_service import DocumentPdfService
+from ..document.outbox_service import email_outbox_service
 
 
 class AssetPurchaseService:
     """구매/견적 관리 비즈니스 로직을 담당하는 서비스 클래스"""
     
+    repository = RepositoryProvider('asset')
+    EMAIL_CATEGORY = 'partner_email'
+    
     def __init__(self):
-        """서비스 초기화"""
-        self.repository = asset_repository
+        """서비스 초기화 (협력사 메일은 발송 대기열을 통해 백그라운드에서 발송)"""
+        self.pdf_service = DocumentPdfService()
+        self.outbox = email_outbox_service
+        self.outbox.register_status_handler(self.EMAIL_CATEGORY, self._on_email_status_changed)
     
     def create_purchase_order(self, partner_id: int, order_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -117,6 +126,112 @@ class AssetPurchaseService:
             print(f"견적서 요청 생성 오류: {str(e)}")
             return None
     
+    def create_bulk_quotation_requests(
+        self,
+        partner_ids: List[int],
+        request_data: Dict[str, Any],
+        attachment: Optional[Tuple[str, bytes]] = None
+    ) -> Dict[str, Any]:
+        """
+        하나의 견적서 요청을 여러 협력사에 일괄 생성하고 이메일 발송 대기열에 등록합니다.
+        
+        협력사 조회, ID/요청 번호 할당, 저장, 발송 이력 기록은 각각 한 번에 처리하고,
+        본문은 하나의 컴파일된 템플릿으로 메일 머지하며 공통 첨부 파일은 한 번만 인코딩합니다.
+        
+        Args:
+            partner_ids: 협력사 ID 목록 (중복은 한 번만 처리)
+            request_data: 견적서 요청 데이터 (모든 협력사 공통)
+            attachment: 모든 메일에 첨부할 (파일명, 바이트)
+            
+        Returns:
+            {'success', 'message', 'requests': 생성된 요청 목록, 'failed': [{'partner_id', 'message'}]}
+        """
+        try:
+            unique_ids = list(dict.fromkeys(self._parse_partner_ids(partner_ids)))
+        except ValueError as e:
+            return {'success': False, 'message': str(e), 'requests': [], 'failed': []}
+        if not unique_ids:
+            return {'success': False, 'message': '협력사를 선택해 주세요.', 'requests': [], 'failed': []}
+        if len(unique_ids) > BUSINESS_RULES['BULK_RFQ_MAX_PARTNERS']:
+            return {
+                'success': False,
+                'message': f"한 번에 최대 {BUSINESS_RULES['BULK_RFQ_MAX_PARTNERS']}개 협력사까지 요청할 수 있습니다.",
+                'requests': [],
+                'failed': []
+            }
+        
+        try:
+            validated_data = self._validate_quotation_request_data(request_data)
+        except ValueError as e:
+            return {'success': False, 'message': str(e), 'requests': [], 'failed': []}
+        
+        try:
+            # 협력사 일괄 조회 및 대상 선별
+            partners_by_id = self.repository.get_partners_by_ids(unique_ids)
+            failed = []
+            partners = []
+            for partner_id in unique_ids:
+                partner = partners_by_id.get(partner_id)
+                if not partner:
+                    failed.append({'partner_id': partner_id, 'message': '존재하지 않는 협력사입니다.'})
+                elif not partner.get('contact_email'):
+                    failed.append({'partner_id': partner_id, 'message': '협력사 이메일이 없습니다.'})
+                else:
+                    partners.append(partner)
+            
+            if not partners:
+                return {'success': False, 'message': '요청할 수 있는 협력사가 없습니다.', 'requests': [], 'failed': failed}
+            
+            # 요청 번호 일괄 생성 및 저장 (ID는 Repository에서 연속 블록으로 할당)
+            request_counts = self.repository.get_quotation_request_counts_by_partner()
+            created_at = date.today().isoformat()
+            saved_requests = self.repository.create_quotation_requests([
+                {
+                    'partner_id': partner['id'],
+                    'request_number': f"QR-{partner['id']:03d}-{request_counts.get(partner['id'], 0) + 1:03d}",
+                    'title': validated_data['title'],
+                    'description': validated_data['description'],
+                    'deadline': validated_data['deadline'],
+                    'budget_range': validated_data.get('budget_range', ''),
+                    'contact_name': validated_data.get('contact_name', ''),
+                    'contact_phone': validated_data.get('contact_phone', ''),
+                    'contact_email': validated_data.get('contact_email', ''),
+                    'special_requirements': validated_data.get('special_requirements', ''),
+                    'status': 'pending',
+                    'created_at': created_at,
+                    'created_by': 'current_user'  # 실제로는 current_user.id 사용
+                }
+                for partner in partners
+            ])
+            
+            # 메일 머지 후 발송 대기열에 일괄 등록
+            messages = self.outbox.email_service.build_quotation_request_messages(saved_requests, partners, attachment)
+            email_logs = self._queue_partner_emails([
+                (partner['id'], message, {
+                    'recipient_email': recipient,
+                    'subject': f"견적서 요청 - {saved_request['title']}",
+                    'attachment_path': None,
+                    'attachment_name': attachment[0] if attachment else None
+                })
+                for partner, saved_request, (message, recipient) in zip(partners, saved_requests, messages)
+            ])
+            
+            for saved_request, email_log in zip(saved_requests, email_logs):
+                saved_request['email_status'] = email_log['status']
+                saved_request['email_outbox_id'] = email_log['outbox_id']
+            
+            print(f"견적서 일괄 요청 대기열 등록 - {len(saved_requests)}개 협력사, 실패 {len(failed)}건")
+            return {
+                'success': True,
+                'message': f"{len(saved_requests)}개 협력사에 견적서 요청이 등록되었습니다.",
+                'requests': saved_requests,
+                'failed': failed
+            }
+            
+        except Exception as e:
+            print(f"견적서 일괄 요청 생성 오류: {str(e)}")
+            return {'success': False, 'message': '견적서 일괄 요청 중 오류가 발생했습니다.', 'requests': [], 'failed': []}
+    
     def get_purchase_orders_by_partner(self, partner_id: int) -> List[Dict[str, Any]]:
         """특정 협력사의 발주서 이력 조회"""
         try:
@@ -141,14 +256,42 @@ class AssetPurchaseService:
             order = self.repository.get_purchase_order_by_id(order_id)
             if order:
                 # PDF 파일 경로 생성 (실제 구현에서는 DB에 저장된 경로 사용)
-                pdf_filename = f"PO_{order['order_number'].replace('-', '_')}.pdf"
-                pdf_path = os.path.join('generated_documents', pdf_filename)
+                pdf_path = os.path.join(self.pdf_service.get_pdf_output_directory(), self._get_purchase_order_pdf_filename(order))
                 return pdf_path
             return None
         except Exception as e:
             print(f"발주서 PDF 경로 조회 실패 (order_id: {order_id}): {str(e)}")
             return None
 
+    def render_purchase_order_pdf(self, order_id: int, archive: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        발주서 PDF를 메모리에 렌더링합니다.
+        
+        다운로드/재발송마다 파일을 만들지 않도록 기본적으로 디스크에 쓰지 않으며,
+        보관이 필요한 경우에만 archive=True로 출력 디렉터리에 저장합니다.
+        
+        Args:
+            order_id: 발주서 ID
+            archive: 렌더링 결과를 파일로 보관할지 여부
+            
+        Returns:
+            {'buffer': PDF 버퍼, 'filename': 파일명, 'archived_path': 보관 경로 또는 None} 또는 None
+        """
+        try:
+            order = self.repository.get_purchase_order_by_id(order_id)
+            if not order:
+                return None
+
+            partner = self.repository.get_partner_by_id(order['partner_id']) or {}
+            filename = self._get_purchase_order_pdf_filename(order)
+            buffer = self.pdf_service.render_to_memory('purchase_order', order, partner)
+            archived_path = self.pdf_service.archive_pdf(buffer, filename) if archive else None
+
+            return {'buffer': buffer, 'filename': filename, 'archived_path': archived_path}
+        except Exception as e:
+            print(f"발주서 PDF 렌더링 실패 (order_id: {order_id}): {str(e)}")
+            return None
+
     def resend_purchase_order(self, order_id: int) -> Dict[str, Any]:
         """발주서 재발송"""
         try:
@@ -160,23 +303,37 @@ class AssetPurchaseService:
             if not partner:
                 return {'success': False, 'message': '협력사 정보를 찾을 수 없습니다.'}
 
-            # PDF 파일 경로 확인
+            # 보관된 PDF가 있으면 그대로 첨부하고, 없으면 메모리에서 렌더링하여 첨부
             pdf_path = self.get_purchase_order_pdf_path(order_id)
-            if not pdf_path or not os.path.exists(pdf_path):
-                return {'success': False, 'message': 'PDF 파일을 찾을 수 없습니다.'}
+            pdf_data = None
+            if pdf_path and os.path.exists(pdf_path):
+                attachment_name = os.path.basename(pdf_path)
+            else:
+                pdf_path = None
+                rendered = self.render_purchase_order_pdf(order_id)
+                if not rendered:
+                    return {'success': False, 'message': 'PDF 파일을 생성할 수 없습니다.'}
+                attachment_name = rendered['filename']
+                pdf_data = rendered['buffer'].getvalue()
 
-            # 이메일 발송 (시뮬레이션)
-            email_data = {
+            subject = f"[재발송] 발주서 ({order['order_number']})"
+            message = self.outbox.email_service.build_purchase_order_message(
+                order, partner, pdf_path, pdf_data=pdf_data, pdf_filename=attachment_name
+            )
+            email_log = self._queue_partner_email(order['partner_id'], message, {
                 'recipient_email': partner['contact_email'],
-                'subject': f"[재발송] 발주서 ({order['order_number']})",
-                'attachment_path': pdf_path
-            }
-
-            # 이메일 발송 이력 기록
-            self.repository.log_sent_email(order['partner_id'], email_data)
+                'subject': subject,
+                'attachment_path': pdf_path,
+                'attachment_name': attachment_name
+            })
 
-            print(f"발주서 재발송 완료 - Order ID: {order_id}, Email: {partner['contact_email']}")
-            return {'success': True, 'message': '발주서가 성공적으로 재발송되었습니다.'}
+            print(f"발주서 재발송 대기열 등록 - Order ID: {order_id}, Email: {partner['contact_email']}")
+            return {
+                'success': True,
+                'message': '발주서 재발송이 요청되었습니다.',
+                'email_status': email_log['status'],
+                'outbox_id': email_log['outbox_id']
+            }
 
         except Exception as e:
             print(f"발주서 재발송 실패 (order_id: {order_id}): {str(e)}")
@@ -193,18 +350,20 @@ class AssetPurchaseService:
             if not partner:
                 return {'success': False, 'message': '협력사 정보를 찾을 수 없습니다.'}
 
-            # 이메일 발송 (시뮬레이션)
-            email_data = {
+            message = self.outbox.email_service.build_quotation_request_message(request, partner)
+            email_log = self._queue_partner_email(request['partner_id'], message, {
                 'recipient_email': partner['contact_email'],
                 'subject': f"[재발송] 견적서 요청 ({request['request_number']})",
                 'attachment_path': None
-            }
+            })
 
-            # 이메일 발송 이력 기록
-            self.repository.log_sent_email(request['partner_id'], email_data)
-
-            print(f"견적서 요청 재발송 완료 - Request ID: {request_id}, Email: {partner['contact_email']}")
-            return {'success': True, 'message': '견적서 요청이 성공적으로 재발송되었습니다.'}
+            print(f"견적서 요청 재발송 대기열 등록 - Request ID: {request_id}, Email: {partner['contact_email']}")
+            return {
+                'success': True,
+                'message': '견적서 요청 재발송이 요청되었습니다.',
+                'email_status': email_log['status'],
+                'outbox_id': email_log['outbox_id']
+            }
 
         except Exception as e:
             print(f"견적서 요청 재발송 실패 (request_id: {request_id}): {str(e)}")
@@ -253,38 +412,26 @@ class AssetPurchaseService:
             if not partner:
                 return None
             
-            # PDF 생성 시뮬레이션 (reportlab 없이)
-            pdf_filename = f"purchase_order_{purchase_order['order_number']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            pdf_path = os.path.join(os.getcwd(), 'generated_documents', pdf_filename)
-            
-            # 디렉터리 생성
-            os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
-            
-            # 간단한 텍스트 파일로 PDF 시뮬레이션
-            with open(pdf_path, 'w', encoding='utf-8') as f:
-                f.write(f"발주서\n")
-                f.write(f"발주서 번호: {purchase_order['order_number']}\n")
-                f.write(f"발주일자: {purchase_order['order_date']}\n")
-                f.write(f"납기일자: {purchase_order['delivery_date']}\n")
-                f.write(f"공급업체: {partner['name']}\n")
-                f.write(f"담당자: {partner['contact_person']}\n")
-                f.write(f"연락처: {partner['contact_phone']}\n")
-                f.write(f"납품주소: {purchase_order['delivery_address']}\n\n")
-                f.write("품목 목록:\n")
-                for item in purchase_order['items']:
-                    f.write(f"- {item['name']}: {item['quantity']}개 x {item['unit_price']:,}원 = {item['amount']:,}원\n")
-                f.write(f"\n총 금액: {purchase_order['total_amount']:,}원\n")
-                if purchase_order.get('notes'):
-                    f.write(f"\n비고: {purchase_order['notes']}\n")
-            
-            # 이메일 발송 시뮬레이션
-            print(f"발주서 이메일 발송 시뮬레이션:")
-            print(f"수신자: {partner['contact_email']}")
-            print(f"제목: 발주서 발송 - {purchase_order['order_number']}")
-            print(f"첨부파일: {pdf_path}")
-            
-            # 발주서에 PDF 경로 추가
+            # PDF를 메모리에 렌더링하고 문서 저장소에 보관 (첨부는 렌더링한 바이트를 그대로 사용)
+            pdf_filename = self._get_purchase_order_pdf_filename(purchase_order)
+            buffer = self.pdf_service.render_to_memory('purchase_order', purchase_order, partner)
+            pdf_path = self.pdf_service.archive_pdf(buffer, pdf_filename)
+            
+            # 이메일 발송 대기열 등록 (발송은 백그라운드에서 처리)
+            message = self.outbox.email_service.build_purchase_order_message(
+                purchase_order, partner, pdf_path, pdf_data=buffer.getvalue(), pdf_filename=pdf_filename
+            )
+            email_log = self._queue_partner_email(partner_id, message, {
+                'recipient_email': partner['contact_email'],
+                'subject': f"발주서 발송 - {purchase_order['order_number']}",
+                'attachment_path': pdf_path,
+                'attachment_name': pdf_filename
+            })
+            
+            # 발주서에 PDF 경로 및 메일 상태 추가
             purchase_order['pdf_path'] = pdf_path
+            purchase_order['email_status'] = email_log['status']
+            purchase_order['email_outbox_id'] = email_log['outbox_id']
             
             return purchase_order
             
@@ -314,16 +461,19 @@ class AssetPurchaseService:
             if not partner:
                 return None
             
-            # 이메일 발송 시뮬레이션
-            print(f"견적서 요청 이메일 발송 시뮬레이션:")
-            print(f"수신자: {partner['contact_email']}")
-            print(f"제목: 견적서 요청 - {quotation_request['title']}")
-            print(f"내용: {quotation_request['description']}")
-            print(f"마감일: {quotation_request['deadline']}")
+            # 이메일 발송 대기열 등록 (요청 처리는 메일 서버 응답을 기다리지 않음)
+            message = self.outbox.email_service.build_quotation_request_message(quotation_request, partner)
+            email_log = self._queue_partner_email(partner_id, message, {
+                'recipient_email': partner['contact_email'],
+                'subject': f"견적서 요청 - {quotation_request['title']}",
+                'attachment_path': None
+            })
             
-            # 이메일 발송 상태 추가
+            # 이메일 발송 상태 추가 (email_sent는 대기열 등록 여부, 실제 발송 결과는 email_status로 조회)
             quotation_request['email_sent'] = True
             quotation_request['email_sent_at'] = datetime.now().isoformat()
+            quotation_request['email_status'] = email_log['status']
+            quotation_request['email_outbox_id'] = email_log['outbox_id']
             
             return quotation_request
             
@@ -376,6 +526,84 @@ class AssetPurchaseService:
             print(f"견적서 요청 통계 조회 중 오류: {str(e)}")
             return {}
     
+    def get_email_status(self, outbox_id: str) -> Optional[Dict[str, Any]]:
+        """발송 대기열 메시지 상태 조회 (상태, 시도 횟수, 마지막 오류)"""
+        return self.outbox.get_message(outbox_id)
+    
+    def _queue_partner_email(self, partner_id: int, message: Any, email_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        협력사 메일을 발송 이력에 'queued'로 기록한 뒤 발송 대기열에 등록합니다.
+        
+        이력을 먼저 기록해 두어 백그라운드 발송 결과가 항상 이력에 반영되도록 합니다.
+        
+        Args:
+            partner_id: 협력사 ID
+            message: 발송할 메시지
+            email_data: 발송 이력 데이터 (recipient_email, subject, attachment_path, attachment_name)
+            
+        Returns:
+            outbox_id가 포함된 발송 이력
+        """
+        return self._queue_partner_emails([(partner_id, message, email_data)])[0]
+    
+    def _queue_partner_emails(self, entries: List[Tuple[int, Any, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        여러 협력사 메일을 발송 이력 기록과 대기열 등록 각각 한 번으로 처리합니다.
+        
+        Args:
+            entries: (협력사 ID, 메시지, 발송 이력 데이터) 목록
+            
+        Returns:
+            outbox_id가 포함된 발송 이력 목록 (입력 순서)
+        """
+        # 이력과 대기열 메시지를 잇는 토큰 (재시작 후 이력 ID가 다른 이력을 가리키면 토큰이 달라 갱신하지 않음)
+        email_logs = self.repository.log_sent_emails([
+            (partner_id, dict(email_data, status='queued', outbox_token=uuid.uuid4().hex))
+            for partner_id, _, email_data in entries
+        ])
+        records = self.outbox.enqueue_many(
+            [
+                (message, email_data['recipient_email'], {
+                    'email_log_id': email_log['id'],
+                    'email_log_token': email_log['outbox_token']
+                })
+                for (_, message, email_data), email_log in zip(entries, email_logs)
+            ],
+            category=self.EMAIL_CATEGORY
+        )
+        self.repository.update_sent_emails({
+            email_log['id']: {'outbox_id': record['id']} for email_log, record in zip(email_logs, records)
+        })
+        for email_log, record in zip(email_logs, records):
+            email_log['outbox_id'] = record['id']
+        return email_logs
+    
+    def _on_email_status_changed(self, record: Dict[str, Any]) -> None:
+        """
+        발송 대기열 상태 변경을 메일 발송 이력에 반영 (발송 스레드에서 호출)
+        
+        발송 이력은 메모리에만 있으므로 재시작 전에 등록된 메시지의 이력 ID는 다른 이력을 가리킬 수 있습니다.
+        등록 시 이력에 남긴 토큰이 같은 경우에만 갱신합니다.
+        """
+        token = record['metadata'].get('email_log_token')
+        if not token:
+            return
+        
+        update_data = {
+            'status': record['status'],
+            'attempts': record['attempts'],
+            'last_error': record['last_error']
+        }
+        if record['status'] == 'sent':
+            update_data['sent_at'] = datetime.now()
+        self.repository.update_sent_email(
+            record['metadata']['email_log_id'], update_data, expected={'outbox_token': token}
+        )
+    
+    def _get_purchase_order_pdf_filename(self, order: Dict[str, Any]) -> str:
+        """발주서 PDF 파일명 생성"""
+        return f"PO_{order['order_number'].replace('-', '_')}.pdf"
+    
     def _validate_purchase_order_data(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
         """발주서 데이터 검증 및 정제"""
         validated_data = order_data.copy()
@@ -404,6 +632,29 @@ class AssetPurchaseService:
         
         return validated_data
     
+    @staticmethod
+    def _parse_partner_ids(partner_ids: Any) -> List[int]:
+        """
+        협력사 ID 목록 검증 (정수 또는 정수 문자열만 허용)
+        
+        Raises:
+            ValueError: 목록이 아니거나 정수로 변환할 수 없는 항목이 있는 경우
+        """
+        if partner_ids is None:
+            return []
+        if not isinstance(partner_ids, (list, tuple)):
+            raise ValueError('협력사 ID 목록 형식이 올바르지 않습니다.')
+        
+        parsed = []
+        for partner_id in partner_ids:
+            if isinstance(partner_id, bool) or not isinstance(partner_id, (int, str)):
+                raise ValueError(f'협력사 ID 형식이 올바르지 않습니다: {partner_id!r}')
+            try:
+                parsed.append(int(partner_id))
+            except ValueError:
+                raise ValueError(f'협력사 ID 형식이 올바르지 않습니다: {partner_id!r}')
+        return parsed
+    
     def _validate_quotation_request_data(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """견적서 요청 데이터 검증 및 정제"""
         validated_data = request_data.copy()
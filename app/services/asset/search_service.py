@@ -7,15 +7,13 @@ Classes:
 """
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import date, datetime, timedelta
-from ...repositories.asset.asset_repository import asset_repository
+from ...repositories.registry import RepositoryProvider
 
 
 class AssetSearchService:
     """자산 검색/필터링/통계 비즈니스 로직을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = asset_repository
+    repository = RepositoryProvider('asset')
     
     def get_filtered_assets(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
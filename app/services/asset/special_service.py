@@ -6,15 +6,13 @@ Classes:
     - AssetSpecialService: PC/IP/Software 특수 자산 관련 비즈니스 로직
 """
 from typing import Dict, Optional, Any, List
-from ...repositories.asset.asset_repository import asset_repository
+from ...repositories.registry import RepositoryProvider
 
 
 class AssetSpecialService:
     """PC/IP/Software 특수 자산 관리 비즈니스 로직을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = asset_repository
+    repository = RepositoryProvider('asset')
     
     def get_pc_asset_details(self, asset_id: int) -> Optional[Dict[str, Any]]:
         """PC 자산의 모든 상세 정보를 조회"""
@@ -4,7 +4,7 @@ Repository 계층과 Controller 계층 사이의 비즈니스 로직을 담당
 분리된 도메인 서비스들을 통합하는 Facade 역할 수행
 """
 from typing import List, Dict, Optional, Any, Tuple
-from ..repositories.asset.asset_repository import asset_repository
+from ..repositories.registry import RepositoryProvider
 from ..utils.constants import validate_asset_data
 from .asset import (
     AssetCrudService, AssetSearchService, AssetSpecialService,
@@ -15,10 +15,10 @@ from .asset import (
 class AssetCoreService:
     """자산 관리 핵심 비즈니스 로직을 담당하는 서비스 클래스 (Facade 패턴)"""
     
+    repository = RepositoryProvider('asset')
+    
     def __init__(self):
         """서비스 초기화 및 도메인 서비스 인스턴스 생성"""
-        self.repository = asset_repository
-        
         # 도메인별 서비스 인스턴스 생성
         self.crud_service = AssetCrudService()
         self.search_service = AssetSearchService()
@@ -38,6 +38,10 @@ class AssetCoreService:
         """자산 목록 페이지네이션 (SearchService로 delegate)"""
         return self.search_service.get_paginated_assets(assets, page, per_page)
     
+    def get_data_version(self) -> int:
+        """자산 데이터 버전 조회 (내보내기 캐시 키용)"""
+        return self.repository.get_data_version()
+    
     def get_asset_detail(self, asset_id: int) -> Optional[Dict[str, Any]]:
         """자산 상세 정보 조회 (CrudService로 delegate)"""
         return self.crud_service.get_asset_detail(asset_id)
@@ -177,6 +181,10 @@ class AssetCoreService:
         """발주서 PDF 파일 경로 조회 (PurchaseService로 delegate)"""
         return self.purchase_service.get_purchase_order_pdf_path(order_id)
 
+    def render_purchase_order_pdf(self, order_id: int, archive: bool = False) -> Optional[Dict[str, Any]]:
+        """발주서 PDF 메모리 렌더링 (PurchaseService로 delegate)"""
+        return self.purchase_service.render_purchase_order_pdf(order_id, archive)
+
     def resend_purchase_order(self, order_id: int) -> Dict[str, Any]:
         """발주서 재발송 (PurchaseService로 delegate)"""
         return self.purchase_service.resend_purchase_order(order_id)
@@ -221,6 +229,10 @@ class AssetCoreService:
     def create_quotation_request_with_email(self, partner_id: int, request_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """견적서 요청을 생성하고 이메일로 발송 (PurchaseService로 delegate)"""
         return self.purchase_service.create_quotation_request_with_email(partner_id, request_data)
+    
+    def create_bulk_quotation_requests(self, partner_ids: List[int], request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """하나의 견적서 요청을 여러 협력사에 일괄 생성 및 발송 (PurchaseService로 delegate)"""
+        return self.purchase_service.create_bulk_quotation_requests(partner_ids, request_data)
 
     # ==================== 운영 관련 자산 조회 메서드 (신규 추가) ====================
     
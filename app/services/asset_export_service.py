@@ -12,13 +12,41 @@ import io
 import csv
 import xlsxwriter
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional, Callable
 
 # 전역 상수 import
 from ..utils.constants import (
     ASSET_CATEGORIES, ASSET_STATUS, EXPORT_HEADERS,
     format_date_string, format_number_with_commas, get_filename_timestamp
 )
+from ..utils.row_encoder import compile_row_encoder, extend_columns
+
+
+# 자산 행 컬럼 사양 (EXPORT_HEADERS 순서)
+ASSET_ROW_COLUMNS = [
+    {'key': 'asset_number', 'required': True},
+    {'key': 'name', 'required': True},
+    {'key': ('type', 'name'), 'default': '하드웨어'},
+    {'key': 'category_id', 'required': True, 'lookup': ASSET_CATEGORIES},
+    {'key': 'status', 'required': True, 'lookup': ASSET_STATUS},
+    {'key': ('department', 'name'), 'default': '-'},
+    {'key': 'location_name', 'default': '-'},
+    {'key': 'user_name', 'default': '-'},
+    {'key': 'purchase_date', 'default': None, 'blank': '-'},
+    {'key': 'purchase_price', 'default': 0},
+    {'key': 'serial_number', 'default': '-'},
+    {'key': 'manufacturer', 'default': '-'},
+    {'key': 'model', 'default': '-'},
+    {'key': 'warranty_expiry', 'default': '-'},
+    {'key': 'current_value', 'default': 0}
+]
+
+# CSV용 컬럼 사양 (날짜/금액 문자열 포맷)
+ASSET_CSV_COLUMNS = extend_columns(ASSET_ROW_COLUMNS, {
+    'purchase_date': {'format': 'date'},
+    'purchase_price': {'format': 'thousands'},
+    'current_value': {'format': 'thousands'}
+})
 
 
 class AssetExportService:
@@ -29,7 +57,9 @@ class AssetExportService:
     
     def __init__(self):
         """AssetExportService 초기화"""
-        pass
+        # 행 인코더는 컬럼 사양으로 한 번만 컴파일
+        self._row_encoder = compile_row_encoder(ASSET_ROW_COLUMNS, 'encode_asset_row')
+        self._csv_row_encoder = compile_row_encoder(ASSET_CSV_COLUMNS, 'encode_asset_csv_row')
     
     def export_to_csv(self, assets: List[Dict[str, Any]]) -> Tuple[io.StringIO, str]:
         """
@@ -49,21 +79,24 @@ class AssetExportService:
         writer.writerow(EXPORT_HEADERS)
         
         # 데이터 작성
-        for asset in assets:
-            row_data = self._prepare_row_data(asset, format_for_csv=True)
-            writer.writerow(row_data)
+        writer.writerows(map(self._csv_row_encoder, assets))
         
         # 파일 포인터를 처음으로 되돌림
         output.seek(0)
         
         return output, "assets_export.csv"
     
-    def export_to_excel(self, assets: List[Dict[str, Any]]) -> Tuple[io.BytesIO, str]:
+    def export_to_excel(
+        self,
+        assets: List[Dict[str, Any]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[io.BytesIO, str]:
         """
         자산 데이터를 Excel 형식으로 내보내기
         
         Args:
             assets: 내보낼 자산 데이터 리스트
+            progress_callback: 진행률 콜백 (작성된 행 수, 전체 행 수)
             
         Returns:
             Tuple[io.BytesIO, str]: (Excel 데이터 스트림, 파일명)
@@ -77,7 +110,8 @@ class AssetExportService:
             sheet_name='자산 목록',
             filename_prefix='assets',
             row_data_processor=ExcelRowProcessor.create_asset_row_processor(),
-            column_widths=[15, 25, 12, 12, 12, 15, 15, 15, 12, 15, 20, 15, 15, 12, 15]
+            column_widths=[15, 25, 12, 12, 12, 15, 15, 15, 12, 15, 20, 15, 15, 12, 15],
+            progress_callback=progress_callback
         )
     
     def _prepare_row_data(self, asset: Dict[str, Any], format_for_csv: bool = False) -> List[str]:
@@ -91,48 +125,8 @@ class AssetExportService:
         Returns:
             List[str]: 행 데이터 리스트
         """
-        # 카테고리명 변환 (전역 상수 사용)
-        category_name = ASSET_CATEGORIES.get(asset['category_id'], '기타')
-        
-        # 상태명 변환 (전역 상수 사용)
-        status_name = ASSET_STATUS.get(asset['status'], '기타')
-        
-        # 부서명 및 사용자명
-        department_name = asset.get('department', {}).get('name', '-')
-        user_name = asset.get('user_name', '-')
-        
-        # 날짜 형식 처리
-        purchase_date = '-'
-        if asset.get('purchase_date'):
-            if format_for_csv:
-                purchase_date = asset['purchase_date'].strftime('%Y-%m-%d')
-            else:
-                purchase_date = asset['purchase_date']
-        
-        # 가격 형식 처리
-        purchase_price = asset.get('purchase_price', 0)
-        current_value = asset.get('current_value', 0)
-        
         if format_for_csv:
-            purchase_price = format(purchase_price, ',')
-            current_value = format(current_value, ',')
-        
-        return [
-            asset['asset_number'],
-            asset['name'],
-            asset.get('type', {}).get('name', '하드웨어'),
-            category_name,
-            status_name,
-            department_name,
-            asset.get('location_name', '-'),
-            user_name,
-            purchase_date,
-            purchase_price,
-            asset.get('serial_number', '-'),
-            asset.get('manufacturer', '-'),
-            asset.get('model', '-'),
-            asset.get('warranty_expiry', '-'),
-            current_value
-        ]
+            return self._csv_row_encoder(asset)
+        return self._row_encoder(asset)
     
     # Excel 관련 중복 메서드들은 ExcelExportUtils로 통합되어 제거됨
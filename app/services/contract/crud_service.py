@@ -7,7 +7,7 @@ Classes:
 """
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, date
-from ...repositories.contract.contract_repository import ContractRepository
+from ...repositories.registry import RepositoryProvider
 from ...utils.constants import (
     CONTRACT_TYPES, CONTRACT_STATUS, 
     get_contract_type_name, get_contract_status_name
@@ -18,9 +18,7 @@ from ...utils.formatters import format_date
 class ContractCrudService:
     """계약 CRUD 작업을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """Service 초기화"""
-        self.repository = ContractRepository()
+    repository = RepositoryProvider('contract')
     
     def get_contract_list(
         self,
@@ -65,6 +63,15 @@ class ContractCrudService:
         
         return enriched_contracts, pagination_info
     
+    def get_data_version(self) -> int:
+        """
+        계약 데이터 버전 조회
+        
+        Returns:
+            계약 데이터가 변경될 때마다 증가하는 버전 번호
+        """
+        return self.repository.get_data_version()
+    
     def get_contract_detail(self, contract_id: int) -> Optional[Dict[str, Any]]:
         """
         계약 상세 정보 조회
@@ -7,15 +7,13 @@ Classes:
 """
 from typing import List, Dict, Optional, Any
 from datetime import datetime, date
-from ...repositories.contract.contract_repository import ContractRepository
+from ...repositories.registry import RepositoryProvider
 
 
 class ContractStatisticsService:
     """계약 통계 및 분석을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """Service 초기화"""
-        self.repository = ContractRepository()
+    repository = RepositoryProvider('contract')
     
     def get_contract_statistics(self) -> Dict[str, Any]:
         """
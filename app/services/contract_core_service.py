@@ -37,6 +37,10 @@ class ContractCoreService:
             per_page=per_page
         )
     
+    def get_data_version(self) -> int:
+        """계약 데이터 버전 조회 (내보내기 캐시 키용) - Delegation to CrudService"""
+        return self.crud_service.get_data_version()
+    
     def get_contract_detail(self, contract_id: int) -> Optional[Dict[str, Any]]:
         """계약 상세 정보 조회 - Delegation to CrudService + StatisticsService"""
         contract = self.crud_service.get_contract_detail(contract_id)
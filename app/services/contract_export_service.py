@@ -3,7 +3,7 @@ Contract Export Service - 계약 내보내기 서비스
 
 계약 데이터를 다양한 형식(CSV, Excel)으로 내보내는 기능을 담당하는 Service 클래스
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, IO
 from datetime import datetime
 import csv
 import io
@@ -11,8 +11,14 @@ import xlsxwriter
 from flask import Response
 
 from .contract_core_service import ContractCoreService
+from .export.cache_service import export_cache_service
+from ..utils.constants import EXPORT_SETTINGS
+from ..utils.excel_export_utils import ExcelExportUtils
 from ..utils.formatters import format_date, format_number, get_filename_timestamp
 
+# 시트 페이로드 셀: (행, 열, 값, 스타일 키)
+SheetCell = Tuple[int, int, Any, Optional[str]]
+
 class ContractExportService:
     """계약 데이터 내보내기를 담당하는 Service 클래스"""
     
@@ -97,6 +103,48 @@ class ContractExportService:
         Returns:
             Excel 파일 Response
         """
+        # 동일 조건·데이터 버전의 결과가 캐시에 있으면 재생성 없이 파일만 전송 (ETag 지원)
+        cache_params = {
+            'search_query': search_query,
+            'contract_type': contract_type,
+            'status': status,
+            'filename': filename,
+            'include_charts': include_charts
+        }
+        entry = export_cache_service.get_or_create(
+            'contracts',
+            cache_params,
+            self.core_service.get_data_version(),
+            lambda: self.build_excel_file(**cache_params)
+        )
+        
+        return export_cache_service.create_cached_response(entry, EXPORT_SETTINGS['XLSX_MIMETYPE'])
+    
+    def build_excel_file(
+        self,
+        search_query: Optional[str] = None,
+        contract_type: Optional[str] = None,
+        status: Optional[str] = None,
+        filename: Optional[str] = None,
+        include_charts: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[IO[bytes], str]:
+        """
+        계약 Excel 파일 생성 (Response 없이 스트림 반환, 백그라운드 작업용)
+        
+        Args:
+            search_query: 검색어
+            contract_type: 계약 유형 필터
+            status: 상태 필터
+            filename: 파일명
+            include_charts: 차트 포함 여부
+            progress_callback: 진행률 콜백 (완료 단계 수, 전체 단계 수)
+            
+        Returns:
+            Tuple[IO[bytes], str]: (Excel 데이터 스트림, 파일명)
+        """
+        total_steps = 3 if include_charts else 1
+        
         # 모든 계약 데이터 조회
         contracts, _ = self.core_service.get_contract_list(
             search_query=search_query,
@@ -106,17 +154,34 @@ class ContractExportService:
             per_page=10000
         )
         
-        # Excel 파일 생성
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'remove_timezone': True})
+        # Excel 파일 생성 (대용량이면 constant_memory + 임시 파일)
+        large_export = ExcelExportUtils.is_large_export(len(contracts))
+        workbook, output = ExcelExportUtils.open_workbook(large_export, {'remove_timezone': True})
+        
+        # 통계/차트 시트 페이로드는 메인 시트 작성과 별도로 미리 구성
+        payloads = {}
+        if include_charts:
+            stats = self.core_service.get_contract_statistics()
+            aggregates = build_contract_aggregates(contracts)
+            payloads = self._build_sheet_payloads({
+                'statistics': (build_statistics_payload, (stats, aggregates)),
+                'charts': (build_charts_payload, (aggregates,))
+            })
         
         # 메인 데이터 시트 생성
-        self._create_main_data_sheet(workbook, contracts)
+        self._create_main_data_sheet(workbook, contracts, large_export)
+        if progress_callback:
+            progress_callback(1, total_steps)
         
         # 통계 시트 생성
         if include_charts:
-            self._create_statistics_sheet(workbook, contracts)
-            self._create_charts_sheet(workbook, contracts)
+            styles = self._define_excel_styles(workbook)
+            self._write_sheet_payload(workbook, '통계', payloads['statistics'], styles)
+            if progress_callback:
+                progress_callback(2, total_steps)
+            self._create_charts_sheet(workbook, payloads['charts'], styles)
+            if progress_callback:
+                progress_callback(3, total_steps)
         
         # 워크북 닫기
         workbook.close()
@@ -129,12 +194,7 @@ class ContractExportService:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"contracts_export_{timestamp}.xlsx"
         
-        # Excel 파일 Response 생성
-        return Response(
-            output.getvalue(),
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment;filename={filename}"}
-        )
+        return output, filename
     
     def export_summary_report(
         self,
@@ -151,22 +211,49 @@ class ContractExportService:
         Returns:
             Excel 보고서 Response
         """
-        # 통계 데이터 조회
+        output, filename = self.build_summary_report(report_type=report_type, filename=filename)
+        return ExcelExportUtils.create_file_response(output, filename)
+    
+    def build_summary_report(
+        self,
+        report_type: str = 'monthly',
+        filename: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[IO[bytes], str]:
+        """
+        계약 요약 보고서 파일 생성 (Response 없이 스트림 반환, 백그라운드 작업용)
+        
+        Args:
+            report_type: 보고서 유형 ('monthly', 'quarterly', 'yearly')
+            filename: 파일명
+            progress_callback: 진행률 콜백 (완료 단계 수, 전체 단계 수)
+            
+        Returns:
+            Tuple[IO[bytes], str]: (Excel 데이터 스트림, 파일명)
+        """
+        # 통계 데이터 조회 및 공통 집계 (시트별로 다시 계산하지 않도록 한 번만 수행)
         stats = self.core_service.get_contract_statistics()
         all_contracts, _ = self.core_service.get_contract_list(page=1, per_page=10000)
+        aggregates = build_contract_aggregates(all_contracts)
+        generated_at = datetime.now().strftime('%Y년 %m월 %d일')
+        
+        # 시트별 셀 페이로드 구성
+        payloads = self._build_sheet_payloads({
+            'summary': (build_summary_payload, (stats, report_type, generated_at)),
+            'risk': (build_risk_payload, (aggregates,)),
+            'department': (build_department_payload, (stats,))
+        })
         
-        # Excel 파일 생성
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'remove_timezone': True})
-        
-        # 요약 보고서 시트 생성
-        self._create_summary_report_sheet(workbook, stats, all_contracts, report_type)
-        
-        # 만료 위험 분석 시트
-        self._create_risk_analysis_sheet(workbook, all_contracts)
+        # 마지막 단계에서만 xlsx로 직렬화
+        large_export = ExcelExportUtils.is_large_export(len(all_contracts))
+        workbook, output = ExcelExportUtils.open_workbook(large_export, {'remove_timezone': True})
+        styles = self._define_excel_styles(workbook)
         
-        # 부서별 분석 시트
-        self._create_department_analysis_sheet(workbook, stats)
+        sheet_order = [('요약 보고서', 'summary'), ('위험 분석', 'risk'), ('부서별 분석', 'department')]
+        for step, (sheet_name, payload_key) in enumerate(sheet_order, 1):
+            self._write_sheet_payload(workbook, sheet_name, payloads[payload_key], styles)
+            if progress_callback:
+                progress_callback(step, len(sheet_order))
         
         workbook.close()
         output.seek(0)
@@ -176,11 +263,7 @@ class ContractExportService:
             timestamp = datetime.now().strftime('%Y%m%d')
             filename = f"contract_summary_report_{report_type}_{timestamp}.xlsx"
         
-        return Response(
-            output.getvalue(),
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment;filename={filename}"}
-        )
+        return output, filename
     
     def _get_csv_headers(self) -> List[str]:
         """CSV 헤더 정의"""
@@ -209,10 +292,13 @@ class ContractExportService:
             str(contract.get('remaining_days', 0))
         ]
     
-    def _create_main_data_sheet(self, workbook: xlsxwriter.Workbook, contracts: List[Dict[str, Any]]) -> None:
+    def _create_main_data_sheet(
+        self,
+        workbook: xlsxwriter.Workbook,
+        contracts: List[Dict[str, Any]],
+        large_export: bool = False
+    ) -> None:
         """메인 데이터 시트 생성"""
-        from ..utils.excel_export_utils import ExcelExportUtils, ExcelRowProcessor
-        
         worksheet = workbook.add_worksheet('계약 목록')
         
         # 헤더 정의
@@ -237,191 +323,75 @@ class ContractExportService:
         
         # 테이블 생성
         if contracts:
-            worksheet.add_table(0, 0, len(contracts), len(headers) - 1, {
-                'name': 'contracts_table',
-                'style': 'Table Style Medium 2',
-                'autofilter': True
-            })
+            ExcelExportUtils._add_table_or_filter(
+                worksheet, len(contracts), headers, 'contracts_table', large_export
+            )
     
-    def _create_statistics_sheet(self, workbook: xlsxwriter.Workbook, contracts: List[Dict[str, Any]]) -> None:
-        """통계 시트 생성"""
-        worksheet = workbook.add_worksheet('통계')
-        styles = self._define_excel_styles(workbook)
-        
-        # 기본 통계
-        stats = self.core_service.get_contract_statistics()
-        
-        # 제목
-        worksheet.write(0, 0, '계약 통계 요약', styles['title'])
-        
-        # 기본 통계 작성
-        row = 2
-        basic_stats = [
-            ('총 계약 수', stats.get('total_contracts', 0)),
-            ('활성 계약 수', len([c for c in contracts if c.get('status') == 'active'])),
-            ('만료 예정 계약', len([c for c in contracts if c.get('status') == 'expiring'])),
-            ('총 계약 금액', f"{stats.get('total_amount', 0):,}원"),
-            ('월간 활성 비용', f"{stats.get('monthly_costs', {}).get('active_monthly', 0):,}원")
-        ]
+    def _build_sheet_payloads(
+        self,
+        tasks: Dict[str, Tuple[Callable[..., List[SheetCell]], tuple]]
+    ) -> Dict[str, List[SheetCell]]:
+        """
+        시트별 셀 페이로드 구성
         
-        for label, value in basic_stats:
-            worksheet.write(row, 0, label, styles['label'])
-            worksheet.write(row, 1, value, styles['data'])
-            row += 1
+        페이로드 빌더는 미리 계산한 집계만 읽으므로 계약 수와 무관하게 작고,
+        프로세스 풀 생성 비용이 더 크므로 현재 스레드에서 순서대로 실행합니다.
         
-        # 상태별 통계
-        row += 2
-        worksheet.write(row, 0, '상태별 통계', styles['subtitle'])
-        row += 1
-        
-        status_stats = stats.get('status_stats', {})
-        for status, count in status_stats.items():
-            worksheet.write(row, 0, f"{status} 계약", styles['label'])
-            worksheet.write(row, 1, count, styles['data'])
-            row += 1
+        Args:
+            tasks: {페이로드 키: (빌더 함수, 인자 튜플)}
+            
+        Returns:
+            Dict[str, List[SheetCell]]: {페이로드 키: 셀 목록}
+        """
+        return {key: builder(*args) for key, (builder, args) in tasks.items()}
+    
+    def _write_sheet_payload(
+        self,
+        workbook: xlsxwriter.Workbook,
+        sheet_name: str,
+        cells: List[SheetCell],
+        styles: Dict[str, Any]
+    ) -> xlsxwriter.worksheet.Worksheet:
+        """
+        셀 페이로드를 워크시트로 직렬화
         
-        # 유형별 통계
-        row += 2
-        worksheet.write(row, 0, '유형별 통계', styles['subtitle'])
-        row += 1
+        페이로드는 행 순서로 정렬되어 있으므로 constant_memory 모드에서도 그대로 기록됩니다.
         
-        type_stats = stats.get('type_stats', {})
-        for contract_type, count in type_stats.items():
-            worksheet.write(row, 0, f"{contract_type} 계약", styles['label'])
-            worksheet.write(row, 1, count, styles['data'])
-            row += 1
+        Args:
+            workbook: xlsxwriter 워크북 객체
+            sheet_name: 워크시트 이름
+            cells: (행, 열, 값, 스타일 키) 목록
+            styles: 스타일 딕셔너리
+            
+        Returns:
+            생성된 워크시트
+        """
+        worksheet = workbook.add_worksheet(sheet_name)
+        for row, col, value, style_key in cells:
+            worksheet.write(row, col, value, styles[style_key] if style_key else None)
+        return worksheet
     
-    def _create_charts_sheet(self, workbook: xlsxwriter.Workbook, contracts: List[Dict[str, Any]]) -> None:
+    def _create_charts_sheet(
+        self,
+        workbook: xlsxwriter.Workbook,
+        cells: List[SheetCell],
+        styles: Dict[str, Any]
+    ) -> None:
         """차트 시트 생성"""
-        worksheet = workbook.add_worksheet('차트')
+        worksheet = self._write_sheet_payload(workbook, '차트', cells, styles)
+        status_count = len(cells) // 2
         
         # 상태별 파이 차트
         chart = workbook.add_chart({'type': 'pie'})
-        
-        # 차트 데이터 준비
-        status_data = {}
-        for contract in contracts:
-            status = contract.get('status_name', '기타')
-            status_data[status] = status_data.get(status, 0) + 1
-        
-        # 차트 데이터 시트에 작성
-        row = 1
-        for status, count in status_data.items():
-            worksheet.write(row, 0, status)
-            worksheet.write(row, 1, count)
-            row += 1
-        
-        # 차트 설정
         chart.add_series({
-            'categories': ['차트', 1, 0, len(status_data), 0],
-            'values': ['차트', 1, 1, len(status_data), 1],
+            'categories': ['차트', 1, 0, status_count, 0],
+            'values': ['차트', 1, 1, status_count, 1],
             'name': '계약 상태별 분포'
         })
         
         chart.set_title({'name': '계약 상태별 분포'})
         worksheet.insert_chart('D2', chart)
     
-    def _create_summary_report_sheet(
-        self, 
-        workbook: xlsxwriter.Workbook, 
-        stats: Dict[str, Any], 
-        contracts: List[Dict[str, Any]], 
-        report_type: str
-    ) -> None:
-        """요약 보고서 시트 생성"""
-        worksheet = workbook.add_worksheet('요약 보고서')
-        styles = self._define_excel_styles(workbook)
-        
-        # 보고서 제목
-        title = f"계약 관리 {report_type.upper()} 보고서"
-        worksheet.write(0, 0, title, styles['title'])
-        worksheet.write(1, 0, f"생성일: {datetime.now().strftime('%Y년 %m월 %d일')}", styles['subtitle'])
-        
-        # 핵심 지표
-        row = 3
-        worksheet.write(row, 0, '핵심 지표', styles['subtitle'])
-        row += 1
-        
-        key_metrics = [
-            ('총 계약 수', stats.get('total_contracts', 0)),
-            ('활성 계약 비율', f"{stats.get('performance_metrics', {}).get('active_rate', 0)}%"),
-            ('평균 계약 금액', f"{stats.get('performance_metrics', {}).get('average_contract_value', 0):,}원"),
-            ('월간 총 비용', f"{stats.get('monthly_costs', {}).get('active_monthly', 0):,}원"),
-            ('연간 예상 비용', f"{stats.get('monthly_costs', {}).get('projected_yearly', 0):,}원")
-        ]
-        
-        for label, value in key_metrics:
-            worksheet.write(row, 0, label, styles['label'])
-            worksheet.write(row, 2, value, styles['data'])
-            row += 1
-        
-        # 위험 분석
-        row += 2
-        worksheet.write(row, 0, '위험 분석', styles['subtitle'])
-        row += 1
-        
-        risk_analysis = stats.get('expiry_analysis', {})
-        risk_items = [
-            ('긴급 (7일 이내)', risk_analysis.get('critical_risk', 0)),
-            ('높음 (30일 이내)', risk_analysis.get('high_risk', 0)),
-            ('보통 (90일 이내)', risk_analysis.get('medium_risk', 0)),
-            ('총 위험 계약', risk_analysis.get('total_at_risk', 0))
-        ]
-        
-        for label, value in risk_items:
-            worksheet.write(row, 0, label, styles['label'])
-            worksheet.write(row, 2, value, styles['data'])
-            row += 1
-    
-    def _create_risk_analysis_sheet(self, workbook: xlsxwriter.Workbook, contracts: List[Dict[str, Any]]) -> None:
-        """위험 분석 시트 생성"""
-        worksheet = workbook.add_worksheet('위험 분석')
-        styles = self._define_excel_styles(workbook)
-        
-        # 만료 예정 계약 필터링
-        expiring_contracts = [c for c in contracts if c.get('remaining_days', 999) <= 90]
-        expiring_contracts.sort(key=lambda x: x.get('remaining_days', 999))
-        
-        # 헤더
-        worksheet.write(0, 0, '만료 위험 계약 분석', styles['title'])
-        
-        headers = ['계약명', '공급업체', '종료일', '남은일수', '위험도', '계약금액', '담당부서']
-        for col, header in enumerate(headers):
-            worksheet.write(2, col, header, styles['header'])
-        
-        # 데이터 작성
-        for row, contract in enumerate(expiring_contracts, 3):
-            worksheet.write(row, 0, contract.get('name', '-'))
-            worksheet.write(row, 1, contract.get('vendor', '-'))
-            worksheet.write(row, 2, contract.get('end_date', '-'))
-            worksheet.write(row, 3, contract.get('remaining_days', 0))
-            worksheet.write(row, 4, contract.get('risk_level', 'unknown'))
-            worksheet.write(row, 5, contract.get('amount', 0))
-            worksheet.write(row, 6, contract.get('department', '-'))
-    
-    def _create_department_analysis_sheet(self, workbook: xlsxwriter.Workbook, stats: Dict[str, Any]) -> None:
-        """부서별 분석 시트 생성"""
-        worksheet = workbook.add_worksheet('부서별 분석')
-        styles = self._define_excel_styles(workbook)
-        
-        # 제목
-        worksheet.write(0, 0, '부서별 계약 분석', styles['title'])
-        
-        # 헤더
-        headers = ['부서명', '총 계약 수', '활성 계약 수', '총 계약 금액', '평균 계약 금액']
-        for col, header in enumerate(headers):
-            worksheet.write(2, col, header, styles['header'])
-        
-        # 부서별 데이터
-        dept_stats = stats.get('department_stats', {})
-        for row, (dept, data) in enumerate(dept_stats.items(), 3):
-            worksheet.write(row, 0, dept)
-            worksheet.write(row, 1, data.get('count', 0))
-            worksheet.write(row, 2, data.get('active_count', 0))
-            worksheet.write(row, 3, data.get('total_amount', 0))
-            avg_amount = data.get('total_amount', 0) / max(data.get('count', 1), 1)
-            worksheet.write(row, 4, round(avg_amount, 0))
-    
     def _write_contract_row(
         self, 
         worksheet: xlsxwriter.worksheet.Worksheet, 
@@ -458,7 +428,7 @@ class ContractExportService:
         worksheet.write(row, 9, contract.get('department', '-'), styles['cell'])
         worksheet.write(row, 10, contract.get('manager', '-'), styles['cell'])
         worksheet.write(row, 11, contract.get('payment_term', '-'), styles['cell'])
-        worksheet.write_number(row, 12, contract.get('progress_percent', 0), styles['percent'])
+        worksheet.write_number(row, 12, contract.get('progress_percent', 0), styles['percentage'])
         worksheet.write_number(row, 13, contract.get('remaining_days', 0), styles['number'])
     
     def _define_excel_styles(self, workbook: xlsxwriter.Workbook) -> Dict[str, Any]:
@@ -516,3 +486,186 @@ class ContractExportService:
                 'align': 'right'
             })
         } 
+
+
+# ==================== 시트 페이로드 빌더 (순수 함수) ====================
+
+def build_contract_aggregates(contracts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    여러 시트에서 공통으로 사용하는 계약 집계를 한 번에 계산
+    
+    Args:
+        contracts: 계약 목록
+        
+    Returns:
+        Dict[str, Any]: 상태별 건수, 상태명별 건수, 만료 위험 계약 목록
+    """
+    status_counts: Dict[str, int] = {}
+    status_name_counts: Dict[str, int] = {}
+    expiring_contracts = []
+    
+    for contract in contracts:
+        status = contract.get('status')
+        status_counts[status] = status_counts.get(status, 0) + 1
+        
+        status_name = contract.get('status_name', '기타')
+        status_name_counts[status_name] = status_name_counts.get(status_name, 0) + 1
+        
+        if contract.get('remaining_days', 999) <= 90:
+            # 시트에서 사용하는 필드만 유지
+            expiring_contracts.append({
+                'name': contract.get('name', '-'),
+                'vendor': contract.get('vendor', '-'),
+                'end_date': contract.get('end_date', '-'),
+                'remaining_days': contract.get('remaining_days', 0),
+                'risk_level': contract.get('risk_level', 'unknown'),
+                'amount': contract.get('amount', 0),
+                'department': contract.get('department', '-')
+            })
+    
+    expiring_contracts.sort(key=lambda x: x['remaining_days'])
+    
+    return {
+        'active_count': status_counts.get('active', 0),
+        'expiring_count': status_counts.get('expiring', 0),
+        'status_name_counts': status_name_counts,
+        'expiring_contracts': expiring_contracts
+    }
+
+
+def build_statistics_payload(stats: Dict[str, Any], aggregates: Dict[str, Any]) -> List[SheetCell]:
+    """통계 시트 셀 페이로드 구성"""
+    cells: List[SheetCell] = [(0, 0, '계약 통계 요약', 'title')]
+    
+    # 기본 통계
+    row = 2
+    basic_stats = [
+        ('총 계약 수', stats.get('total_contracts', 0)),
+        ('활성 계약 수', aggregates['active_count']),
+        ('만료 예정 계약', aggregates['expiring_count']),
+        ('총 계약 금액', f"{stats.get('total_amount', 0):,}원"),
+        ('월간 활성 비용', f"{stats.get('monthly_costs', {}).get('active_monthly', 0):,}원")
+    ]
+    for label, value in basic_stats:
+        cells.append((row, 0, label, 'label'))
+        cells.append((row, 1, value, 'data'))
+        row += 1
+    
+    # 상태별 통계
+    row += 2
+    cells.append((row, 0, '상태별 통계', 'subtitle'))
+    row += 1
+    for status, count in stats.get('status_stats', {}).items():
+        cells.append((row, 0, f"{status} 계약", 'label'))
+        cells.append((row, 1, count, 'data'))
+        row += 1
+    
+    # 유형별 통계
+    row += 2
+    cells.append((row, 0, '유형별 통계', 'subtitle'))
+    row += 1
+    for contract_type, count in stats.get('type_stats', {}).items():
+        cells.append((row, 0, f"{contract_type} 계약", 'label'))
+        cells.append((row, 1, count, 'data'))
+        row += 1
+    
+    return cells
+
+
+def build_charts_payload(aggregates: Dict[str, Any]) -> List[SheetCell]:
+    """차트 시트 데이터 영역 셀 페이로드 구성 (상태명, 건수)"""
+    cells: List[SheetCell] = []
+    for row, (status, count) in enumerate(aggregates['status_name_counts'].items(), 1):
+        cells.append((row, 0, status, None))
+        cells.append((row, 1, count, None))
+    return cells
+
+
+def build_summary_payload(stats: Dict[str, Any], report_type: str, generated_at: str) -> List[SheetCell]:
+    """요약 보고서 시트 셀 페이로드 구성"""
+    cells: List[SheetCell] = [
+        (0, 0, f"계약 관리 {report_type.upper()} 보고서", 'title'),
+        (1, 0, f"생성일: {generated_at}", 'subtitle')
+    ]
+    
+    # 핵심 지표
+    row = 3
+    cells.append((row, 0, '핵심 지표', 'subtitle'))
+    row += 1
+    
+    performance = stats.get('performance_metrics', {})
+    monthly_costs = stats.get('monthly_costs', {})
+    key_metrics = [
+        ('총 계약 수', stats.get('total_contracts', 0)),
+        ('활성 계약 비율', f"{performance.get('active_rate', 0)}%"),
+        ('평균 계약 금액', f"{performance.get('average_contract_value', 0):,}원"),
+        ('월간 총 비용', f"{monthly_costs.get('active_monthly', 0):,}원"),
+        ('연간 예상 비용', f"{monthly_costs.get('projected_yearly', 0):,}원")
+    ]
+    for label, value in key_metrics:
+        cells.append((row, 0, label, 'label'))
+        cells.append((row, 2, value, 'data'))
+        row += 1
+    
+    # 위험 분석
+    row += 2
+    cells.append((row, 0, '위험 분석', 'subtitle'))
+    row += 1
+    
+    risk_analysis = stats.get('expiry_analysis', {})
+    risk_items = [
+        ('긴급 (7일 이내)', risk_analysis.get('critical_risk', 0)),
+        ('높음 (30일 이내)', risk_analysis.get('high_risk', 0)),
+        ('보통 (90일 이내)', risk_analysis.get('medium_risk', 0)),
+        ('총 위험 계약', risk_analysis.get('total_at_risk', 0))
+    ]
+    for label, value in risk_items:
+        cells.append((row, 0, label, 'label'))
+        cells.append((row, 2, value, 'data'))
+        row += 1
+    
+    return cells
+
+
+def build_risk_payload(aggregates: Dict[str, Any]) -> List[SheetCell]:
+    """만료 위험 분석 시트 셀 페이로드 구성"""
+    cells: List[SheetCell] = [(0, 0, '만료 위험 계약 분석', 'title')]
+    
+    headers = ['계약명', '공급업체', '종료일', '남은일수', '위험도', '계약금액', '담당부서']
+    for col, header in enumerate(headers):
+        cells.append((2, col, header, 'header'))
+    
+    for row, contract in enumerate(aggregates['expiring_contracts'], 3):
+        cells.extend([
+            (row, 0, contract['name'], None),
+            (row, 1, contract['vendor'], None),
+            (row, 2, contract['end_date'], None),
+            (row, 3, contract['remaining_days'], None),
+            (row, 4, contract['risk_level'], None),
+            (row, 5, contract['amount'], None),
+            (row, 6, contract['department'], None)
+        ])
+    
+    return cells
+
+
+def build_department_payload(stats: Dict[str, Any]) -> List[SheetCell]:
+    """부서별 분석 시트 셀 페이로드 구성"""
+    cells: List[SheetCell] = [(0, 0, '부서별 계약 분석', 'title')]
+    
+    headers = ['부서명', '총 계약 수', '활성 계약 수', '총 계약 금액', '평균 계약 금액']
+    for col, header in enumerate(headers):
+        cells.append((2, col, header, 'header'))
+    
+    for row, (dept, data) in enumerate(stats.get('department_stats', {}).items(), 3):
+        avg_amount = data.get('total_amount', 0) / max(data.get('count', 1), 1)
+        cells.extend([
+            (row, 0, dept, None),
+            (row, 1, data.get('count', 0), None),
+            (row, 2, data.get('active_count', 0), None),
+            (row, 3, data.get('total_amount', 0), None),
+            (row, 4, round(avg_amount, 0), None)
+        ])
+    
+    return cells
+
@@ -6,14 +6,45 @@ Services:
     - DocumentPdfService: PDF 문서 생성
     - DocumentEmailService: 이메일 발송 처리
     - DocumentManagementService: 문서 관리 및 목록 조회
+    - PdfResourceCache: PDF 폰트/스타일/표 스타일 캐시
+    - DocumentBatchPdfService: 프로세스 풀 기반 일괄 PDF 생성
+    - DocumentIndex: 생성 문서 메타데이터 인덱스
+    - DocumentStore: 내용 주소 기반 중복 제거 문서 저장소
+    - DocumentBackupService: 증분 병렬 문서 백업
+    - SmtpConnectionPool: keep-alive SMTP 연결 풀
+    - EmailOutboxService: 재시도/배치/발송 속도 제어를 갖춘 영속 메일 발송 대기열
+    - EmailTemplateRenderer: 컴파일된 메일 본문 템플릿 캐시 및 메일 머지 렌더링
 """
 
 from .pdf_service import DocumentPdfService
 from .email_service import DocumentEmailService
 from .management_service import DocumentManagementService
+from .pdf_resources import PdfResourceCache, pdf_resource_cache
+from .batch_pdf_service import DocumentBatchPdfService, document_batch_pdf_service
+from .document_index import DocumentIndex, get_document_index
+from .document_store import DocumentStore, get_document_store
+from .backup_service import DocumentBackupService, document_backup_service
+from .smtp_pool import SmtpConnectionPool
+from .outbox_service import EmailOutboxService, email_outbox_service
+from .email_templates import EmailTemplateRenderer, email_template_renderer
 
 __all__ = [
     'DocumentPdfService',
     'DocumentEmailService', 
-    'DocumentManagementService'
+    'DocumentManagementService',
+    'PdfResourceCache',
+    'pdf_resource_cache',
+    'DocumentBatchPdfService',
+    'document_batch_pdf_service',
+    'DocumentIndex',
+    'get_document_index',
+    'DocumentStore',
+    'get_document_store',
+    'DocumentBackupService',
+    'document_backup_service',
+    'SmtpConnectionPool',
+    'EmailOutboxService',
+    'email_outbox_service',
+    'EmailTemplateRenderer',
+    'email_template_renderer'
 ] 
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+Document Backup Service
+생성 문서를 백업 디렉터리로 증분 복사하는 서비스
+
+Classes:
+    - DocumentBackupService: 크기/mtime/해시 상태 매니페스트 기반 증분 병렬 백업
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .document_index import get_document_index
+from .document_store import DocumentStore, get_document_store
+from ...utils.constants import PDF_SETTINGS
+
+
+class DocumentBackupService:
+    """
+    문서 증분 백업 서비스 클래스
+    
+    백업 디렉터리에 파일별 (크기, mtime, 내용 해시) 상태를 기록해 두고, 다음 실행 때는
+    상태가 달라진 파일만 처리합니다. 백업 디렉터리도 내용 주소 기반 저장소이므로 실제 복사는
+    백업 쪽에 아직 없는 고유 blob에 대해서만 일어나며, 복사는 I/O 위주이므로 스레드 풀에서 병렬로 수행합니다.
+    """
+    
+    STATE_DIRNAME = '.backup'
+    STATE_FILENAME = 'state.json'
+    MAX_ERRORS_REPORTED = 20
+    
+    def backup(self, source_dir: str, backup_dir: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        증분 백업 실행
+        
+        Args:
+            source_dir: 문서 출력 디렉터리
+            backup_dir: 백업 디렉터리
+            max_workers: 복사 스레드 수 (None이면 PDF_SETTINGS['BACKUP_MAX_WORKERS'])
+        
+        Returns:
+            Dict[str, Any]: 백업 지표 (검사/복사/건너뜀/실패 수, 복사 바이트, 소요 시간, 처리량)
+        """
+        started = time.perf_counter()
+        os.makedirs(backup_dir, exist_ok=True)
+        
+        source_store = get_document_store(source_dir)
+        backup_store = get_document_store(backup_dir)
+        source_manifest = source_store.get_manifest()
+        state = self._load_state(backup_dir)
+        files: Dict[str, Dict[str, Any]] = state.get('files', {})
+        
+        # 1. 변경 파일 선별 (상태 매니페스트와 크기/mtime/해시 비교)
+        documents = get_document_index(source_dir).list_documents()
+        pending: List[Tuple[Dict[str, Any], Optional[str]]] = []
+        for document in documents:
+            filename = document['filename']
+            content_hash = source_manifest.get(filename)
+            if self._is_unchanged(files.get(filename), document, content_hash) \
+                    and os.path.exists(os.path.join(backup_store.directory, filename)):
+                continue
+            pending.append((document, content_hash))
+        
+        # 2. 백업 쪽에 없는 고유 blob 및 해시가 없는 파일 복사 (스레드 풀)
+        copy_tasks: Dict[str, Tuple[str, Optional[str]]] = {}
+        for document, content_hash in pending:
+            if content_hash is None:
+                copy_tasks[document['filename']] = (document['filepath'], None)
+            elif content_hash not in copy_tasks and not os.path.exists(backup_store.get_blob_path(content_hash)):
+                copy_tasks[content_hash] = (source_store.get_blob_path(content_hash), content_hash)
+        
+        workers = max(1, min(len(copy_tasks), max_workers or PDF_SETTINGS['BACKUP_MAX_WORKERS'])) if copy_tasks else 0
+        results: Dict[str, Tuple[Optional[str], int, Optional[str]]] = {}
+        if copy_tasks:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='document-backup') as executor:
+                futures = {
+                    key: executor.submit(self._copy_to_blob, source_path, content_hash, backup_store)
+                    for key, (source_path, content_hash) in copy_tasks.items()
+                }
+                results = {key: future.result() for key, future in futures.items()}
+        
+        # 3. 파일명 연결 및 상태 갱신 (매니페스트는 한 번만 저장)
+        copied_files = 0
+        errors: List[str] = []
+        with backup_store.deferred_save():
+            for document, content_hash in pending:
+                filename = document['filename']
+                if content_hash is None:
+                    content_hash, _, error = results[filename]
+                elif content_hash in results:
+                    error = results[content_hash][2]
+                else:
+                    error = None
+                
+                if error:
+                    errors.append(f"{filename}: {error}")
+                    continue
+                
+                try:
+                    backup_store.put_blob(content_hash, backup_store.get_blob_path(content_hash), filename)
+                except OSError as e:
+                    errors.append(f"{filename}: {str(e)}")
+                    continue
+                
+                files[filename] = {
+                    'size': document['size'],
+                    'mtime_ns': document.get('mtime_ns'),
+                    'hash': content_hash
+                }
+                copied_files += 1
+        
+        elapsed = time.perf_counter() - started
+        bytes_copied = sum(size for _, size, error in results.values() if not error)
+        metrics = {
+            'completed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'scanned': len(documents),
+            'copied_files': copied_files,
+            'copied_blobs': sum(1 for _, _, error in results.values() if not error),
+            'skipped': len(documents) - len(pending),
+            'failed': len(errors),
+            'errors': errors[:self.MAX_ERRORS_REPORTED],
+            'bytes_copied': bytes_copied,
+            'workers': workers,
+            'elapsed_seconds': round(elapsed, 3),
+            'throughput_mb_per_sec': round(bytes_copied / (1024 * 1024) / elapsed, 2) if elapsed > 0 else 0.0,
+            'files_per_sec': round(len(documents) / elapsed, 1) if elapsed > 0 else 0.0
+        }
+        
+        self._save_state(backup_dir, {'files': files, 'last_run': metrics})
+        return metrics
+    
+    def get_last_metrics(self, backup_dir: str) -> Optional[Dict[str, Any]]:
+        """
+        마지막 백업 지표 조회
+        
+        Args:
+            backup_dir: 백업 디렉터리
+        
+        Returns:
+            Optional[Dict[str, Any]]: 마지막 실행 지표 또는 None
+        """
+        return self._load_state(backup_dir).get('last_run')
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    @staticmethod
+    def _is_unchanged(previous: Optional[Dict[str, Any]], document: Dict[str, Any], content_hash: Optional[str]) -> bool:
+        """이전 백업 상태와 비교하여 변경 여부 판단 (해시가 있으면 해시, 없으면 크기/mtime)"""
+        if not previous:
+            return False
+        if content_hash:
+            return previous.get('hash') == content_hash
+        return previous.get('size') == document['size'] and previous.get('mtime_ns') == document.get('mtime_ns')
+    
+    @staticmethod
+    def _copy_to_blob(
+        source_path: str,
+        content_hash: Optional[str],
+        backup_store: DocumentStore
+    ) -> Tuple[Optional[str], int, Optional[str]]:
+        """
+        파일을 백업 저장소 blob으로 복사 (스레드 풀 작업)
+        
+        해시를 모르는 파일은 읽으면서 해시를 계산하고, 같은 blob이 이미 있으면 쓰지 않습니다.
+        
+        Returns:
+            Tuple: (내용 해시, 복사한 바이트 수, 오류 메시지 또는 None)
+        """
+        try:
+            if content_hash is None:
+                with open(source_path, 'rb') as source:
+                    data = source.read()
+                content_hash = hashlib.sha256(data).hexdigest()
+                blob_path = backup_store.get_blob_path(content_hash)
+                if os.path.exists(blob_path):
+                    return content_hash, 0, None
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                temp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+                with open(temp_path, 'wb') as blob_file:
+                    blob_file.write(data)
+                os.replace(temp_path, blob_path)
+                return content_hash, len(data), None
+            
+            blob_path = backup_store.get_blob_path(content_hash)
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            temp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+            shutil.copy2(source_path, temp_path)
+            os.replace(temp_path, blob_path)
+            return content_hash, os.path.getsize(blob_path), None
+        except OSError as e:
+            return content_hash, 0, str(e)
+    
+    def _state_path(self, backup_dir: str) -> str:
+        """백업 상태 파일 경로"""
+        return os.path.join(backup_dir, self.STATE_DIRNAME, self.STATE_FILENAME)
+    
+    def _load_state(self, backup_dir: str) -> Dict[str, Any]:
+        """백업 상태 로드 (없거나 손상되면 빈 상태 = 전체 백업)"""
+        try:
+            with open(self._state_path(backup_dir), 'r', encoding='utf-8') as state_file:
+                state = json.load(state_file)
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_state(self, backup_dir: str, state: Dict[str, Any]) -> None:
+        """백업 상태 저장 (임시 파일 교체 방식)"""
+        state_path = self._state_path(backup_dir)
+        os.makedirs(os.path.dirname(state_path), exist_ok=True)
+        temp_path = f"{state_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as state_file:
+            json.dump(state, state_file, ensure_ascii=False)
+        os.replace(temp_path, state_path)
+
+
+# 싱글톤 인스턴스 생성
+document_backup_service = DocumentBackupService()
@@ -0,0 +1,302 @@
+"""
+Document Batch PDF Service
+발주서, 견적서, 자산 라벨 PDF를 한 번에 여러 건 생성하는 서비스
+
+Classes:
+    - DocumentBatchPdfService: 문서 명세 목록을 프로세스 풀로 분산 렌더링하고 매니페스트/zip으로 반환
+"""
+import multiprocessing
+import os
+import shutil
+import time
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from .pdf_service import DocumentPdfService, REPORTLAB_AVAILABLE
+from ...repositories.registry import RepositoryProvider
+from ...utils.constants import PDF_SETTINGS
+
+
+# 워커 프로세스마다 한 번만 생성되는 렌더러 (폰트/스타일 캐시도 프로세스당 한 번 준비됨)
+_worker_renderer: Optional[DocumentPdfService] = None
+
+
+def render_document_job(job: Tuple[str, Dict[str, Any], Dict[str, Any], str]) -> Dict[str, Any]:
+    """
+    문서 한 건 렌더링 (프로세스 풀 워커에서 실행되는 모듈 수준 함수)
+    
+    Args:
+        job: (문서 유형, 문서 데이터, 협력사 데이터, 출력 파일 경로)
+    
+    Returns:
+        Dict[str, Any]: {'success', 'size', 'error'} - 예외를 올리지 않고 결과로 반환
+    """
+    global _worker_renderer
+    doc_type, data, partner, path = job
+    try:
+        if _worker_renderer is None:
+            _worker_renderer = DocumentPdfService()
+        
+        _worker_renderer.render(doc_type, data, partner, path)
+        return {'success': True, 'size': os.path.getsize(path), 'error': None}
+    except Exception as e:
+        return {'success': False, 'size': 0, 'error': str(e)}
+
+
+class DocumentBatchPdfService:
+    """
+    일괄 PDF 생성 서비스 클래스
+    
+    reportlab 렌더링은 CPU 바운드이고 GIL에 묶이므로 문서 단위로 프로세스 풀에 분산합니다.
+    저장소 조회는 부모 프로세스에서 끝내고 워커에는 렌더링에 필요한 데이터만 전달합니다.
+    """
+    
+    DOCUMENT_TYPES = tuple(DocumentPdfService.RENDERERS)
+    OUTPUT_MODES = ('manifest', 'zip')
+    
+    repository = RepositoryProvider('asset')
+    
+    BATCH_DIRNAME = 'batches'
+    
+    def __init__(self):
+        """서비스 초기화"""
+        self.output_root = os.path.join(os.getcwd(), PDF_SETTINGS['OUTPUT_DIR'])
+        self.batch_root = os.path.join(self.output_root, self.BATCH_DIRNAME)
+    
+    def generate_batch(
+        self,
+        specs: List[Dict[str, Any]],
+        output: str = 'manifest',
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        문서 명세 목록으로 PDF를 일괄 생성
+        
+        명세 형식:
+            - {'type': 'purchase_order', 'order_id': 1}
+            - {'type': 'purchase_order' | 'quotation', 'data': {...}, 'partner_id': 1 또는 'partner': {...}}
+            - {'type': 'asset_label', 'asset_id': 1} 또는 {'type': 'asset_label', 'data': {...}}
+        
+        Args:
+            specs: 문서 명세 목록
+            output: 'manifest'(생성 파일 목록) 또는 'zip'(매니페스트 + zip 파일 경로)
+            max_workers: 워커 프로세스 수 (None이면 PDF_SETTINGS 또는 CPU 코어 수)
+        
+        Returns:
+            Dict[str, Any]: 배치 매니페스트 (경로는 PDF 출력 디렉터리 기준 상대 경로)
+        
+        Raises:
+            ValueError: 명세 목록이나 출력 형식이 잘못된 경우
+        """
+        if not REPORTLAB_AVAILABLE:
+            raise ValueError('reportlab 라이브러리가 설치되지 않았습니다.')
+        if output not in self.OUTPUT_MODES:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {output}")
+        if not isinstance(specs, list) or not specs:
+            raise ValueError('생성할 문서 명세가 없습니다.')
+        if len(specs) > PDF_SETTINGS['BATCH_MAX_DOCS']:
+            raise ValueError(f"한 번에 생성할 수 있는 문서는 최대 {PDF_SETTINGS['BATCH_MAX_DOCS']}건입니다.")
+        
+        self.cleanup_expired_batches()
+        
+        started = time.perf_counter()
+        batch_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        batch_dir = os.path.join(self.batch_root, batch_id)
+        os.makedirs(batch_dir, exist_ok=True)
+        
+        # 명세 해석 (저장소 조회는 부모 프로세스에서 수행)
+        documents: List[Dict[str, Any]] = []
+        jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any], str]] = []
+        for index, spec in enumerate(specs):
+            entry = {'index': index, 'type': spec.get('type') if isinstance(spec, dict) else None}
+            try:
+                doc_type, data, partner, label = self._resolve_spec(spec)
+                filename = f"{index + 1:04d}_{doc_type}_{self._safe_filename(label)}.pdf"
+                entry.update({'filename': filename, 'path': self._relative_path(os.path.join(batch_dir, filename))})
+                jobs.append((doc_type, data, partner, os.path.join(batch_dir, filename)))
+            except ValueError as e:
+                entry.update({'filename': None, 'path': None, 'success': False, 'size': 0, 'error': str(e)})
+            documents.append(entry)
+        
+        # 렌더링
+        workers = self._resolve_worker_count(len(jobs), max_workers)
+        results, workers = self._render_jobs(jobs, workers)
+        pending = iter(results)
+        for entry in documents:
+            if entry.get('path'):
+                entry.update(next(pending))
+        
+        manifest = {
+            'batch_id': batch_id,
+            'output_dir': self._relative_path(batch_dir),
+            'total': len(documents),
+            'success_count': sum(1 for entry in documents if entry['success']),
+            'failure_count': sum(1 for entry in documents if not entry['success']),
+            'workers': workers,
+            'documents': documents,
+            'zip_path': None
+        }
+        
+        if output == 'zip':
+            manifest['zip_path'] = self._relative_path(self._write_zip(batch_dir, batch_id, documents))
+        
+        manifest['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+        return manifest
+    
+    def resolve_path(self, relative_path: str) -> str:
+        """
+        매니페스트의 상대 경로를 서버 절대 경로로 변환
+        
+        Args:
+            relative_path: PDF 출력 디렉터리 기준 상대 경로
+        
+        Returns:
+            str: 절대 경로
+        
+        Raises:
+            ValueError: 출력 디렉터리 밖을 가리키는 경로인 경우
+        """
+        path = os.path.abspath(os.path.join(self.output_root, relative_path))
+        if os.path.commonpath([path, os.path.abspath(self.output_root)]) != os.path.abspath(self.output_root):
+            raise ValueError('잘못된 파일 경로입니다.')
+        return path
+    
+    def cleanup_expired_batches(self) -> int:
+        """
+        보관 시간이 지난 배치 디렉터리 정리
+        
+        Returns:
+            int: 삭제한 배치 디렉터리 수
+        """
+        if not os.path.isdir(self.batch_root):
+            return 0
+        
+        cutoff = time.time() - PDF_SETTINGS['BATCH_RESULT_TTL_SECONDS']
+        removed = 0
+        for name in os.listdir(self.batch_root):
+            batch_dir = os.path.join(self.batch_root, name)
+            try:
+                if not os.path.isdir(batch_dir) or os.path.getmtime(batch_dir) >= cutoff:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(batch_dir, ignore_errors=True)
+            removed += 1
+        return removed
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    def _relative_path(self, path: str) -> str:
+        """서버 절대 경로를 PDF 출력 디렉터리 기준 상대 경로로 변환 (구분자는 '/')"""
+        return os.path.relpath(path, self.output_root).replace(os.sep, '/')
+    
+    def _resolve_spec(self, spec: Any) -> Tuple[str, Dict[str, Any], Dict[str, Any], str]:
+        """
+        문서 명세를 렌더링 입력으로 변환
+        
+        Args:
+            spec: 문서 명세
+        
+        Returns:
+            Tuple: (문서 유형, 문서 데이터, 협력사 데이터, 파일명 라벨)
+        
+        Raises:
+            ValueError: 명세가 잘못되었거나 대상 데이터를 찾을 수 없는 경우
+        """
+        if not isinstance(spec, dict):
+            raise ValueError('문서 명세는 객체여야 합니다.')
+        
+        doc_type = spec.get('type')
+        if doc_type not in self.DOCUMENT_TYPES:
+            raise ValueError(f"지원하지 않는 문서 유형입니다: {doc_type}")
+        
+        if doc_type == 'asset_label':
+            data = spec.get('data')
+            if data is None:
+                data = self.repository.get_asset_by_id(spec.get('asset_id'))
+                if not data:
+                    raise ValueError(f"자산을 찾을 수 없습니다: {spec.get('asset_id')}")
+            elif not isinstance(data, dict):
+                raise ValueError('data 항목은 객체여야 합니다.')
+            return doc_type, data, {}, str(data.get('asset_number') or data.get('id', ''))
+        
+        data = spec.get('data')
+        if data is None:
+            if doc_type != 'purchase_order':
+                raise ValueError('견적서는 data 항목이 필요합니다.')
+            data = self.repository.get_purchase_order_by_id(spec.get('order_id'))
+            if not data:
+                raise ValueError(f"발주서를 찾을 수 없습니다: {spec.get('order_id')}")
+        elif not isinstance(data, dict):
+            raise ValueError('data 항목은 객체여야 합니다.')
+        
+        partner = spec.get('partner')
+        if partner is None:
+            partner_id = spec.get('partner_id', data.get('partner_id'))
+            partner = self.repository.get_partner_by_id(partner_id) if partner_id is not None else None
+            if not partner:
+                raise ValueError(f"협력사 정보를 찾을 수 없습니다: {partner_id}")
+        elif not isinstance(partner, dict):
+            raise ValueError('partner 항목은 객체여야 합니다.')
+        
+        number_key = 'order_number' if doc_type == 'purchase_order' else 'quotation_number'
+        return doc_type, data, partner, str(data.get(number_key, ''))
+    
+    @staticmethod
+    def _resolve_worker_count(job_count: int, max_workers: Optional[int]) -> int:
+        """작업 수와 설정에 맞춘 워커 프로세스 수 계산 (1이면 순차 실행)"""
+        if job_count < PDF_SETTINGS['BATCH_PARALLEL_MIN_DOCS']:
+            return 1
+        limit = max_workers or PDF_SETTINGS['BATCH_MAX_WORKERS'] or os.cpu_count() or 1
+        return max(1, min(job_count, limit))
+    
+    @staticmethod
+    def _render_jobs(
+        jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any], str]],
+        workers: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        렌더링 작업 실행
+        
+        Args:
+            jobs: 렌더링 작업 목록
+            workers: 워커 프로세스 수
+        
+        Returns:
+            Tuple: (작업 순서대로 정렬된 결과 목록, 실제 사용한 워커 수)
+        """
+        if workers > 1:
+            try:
+                # 여러 백그라운드 스레드가 도는 서버 프로세스를 fork하지 않도록 새 프로세스에서 워커 시작
+                start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method)) as executor:
+                    chunksize = max(1, min(PDF_SETTINGS['BATCH_CHUNK_SIZE'], len(jobs) // workers))
+                    return list(executor.map(render_document_job, jobs, chunksize=chunksize)), workers
+            except (BrokenProcessPool, OSError):
+                # 프로세스 풀을 사용할 수 없는 환경에서는 순차 실행으로 대체
+                pass
+        
+        return [render_document_job(job) for job in jobs], 1
+    
+    @staticmethod
+    def _write_zip(batch_dir: str, batch_id: str, documents: List[Dict[str, Any]]) -> str:
+        """생성된 PDF를 zip으로 묶기 (PDF는 이미 압축되어 있으므로 무압축 저장)"""
+        zip_path = os.path.join(batch_dir, f"documents_{batch_id}.zip")
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as archive:
+            for entry in documents:
+                if entry['success']:
+                    archive.write(os.path.join(batch_dir, entry['filename']), arcname=entry['filename'])
+        return zip_path
+    
+    @staticmethod
+    def _safe_filename(label: str) -> str:
+        """파일명에 쓸 수 없는 문자 치환"""
+        cleaned = ''.join(ch if ch.isalnum() or ch in '-_' else '_' for ch in label)
+        return cleaned[:60] or 'document'
+
+
+# 싱글톤 인스턴스 생성
+document_batch_pdf_service = DocumentBatchPdfService()
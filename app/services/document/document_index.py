@@ -0,0 +1,271 @@
+"""
+Document Metadata Index
+생성된 문서 파일의 메타데이터를 사이드카 파일로 보관하는 인덱스
+
+Classes:
+    - DocumentIndex: 출력 디렉터리별 문서 메타데이터 인덱스 (디렉터리 mtime 기반 지연 동기화)
+
+Functions:
+    - get_document_index: 디렉터리 경로에 해당하는 인덱스 인스턴스 조회
+    - classify_document: 파일명으로부터 문서 유형 추정
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+def classify_document(filename: str) -> str:
+    """
+    파일명으로부터 문서 유형을 추정합니다.
+    
+    Args:
+        filename: 파일명
+    
+    Returns:
+        문서 유형
+    """
+    filename_lower = filename.lower()
+    
+    if 'purchase_order' in filename_lower or 'po_' in filename_lower:
+        return 'purchase_order'
+    elif 'quotation' in filename_lower or 'quote_' in filename_lower:
+        return 'quotation'
+    elif 'asset_label' in filename_lower:
+        return 'asset_label'
+    elif 'invoice' in filename_lower:
+        return 'invoice'
+    elif 'contract' in filename_lower:
+        return 'contract'
+    else:
+        return 'other'
+
+
+class DocumentIndex:
+    """
+    문서 메타데이터 인덱스 클래스
+    
+    목록/검색/통계 조회마다 디렉터리 전체를 listdir + stat 하지 않도록 문서별 메타데이터를 메모리와
+    사이드카 파일(<출력 디렉터리>/.index/documents.json)에 보관합니다.
+    서비스를 통한 생성/삭제는 즉시 반영하고, 외부에서 파일이 바뀐 경우는 디렉터리 mtime이
+    마지막 동기화 시점과 다를 때만 한 번 재스캔하여 맞춥니다.
+    인덱스 파일은 하위 디렉터리에 두므로 인덱스 저장이 출력 디렉터리의 mtime을 바꾸지 않습니다.
+    """
+    
+    INDEX_DIRNAME = '.index'
+    INDEX_FILENAME = 'documents.json'
+    INDEX_VERSION = 1
+    
+    def __init__(self, directory: str):
+        """
+        인덱스 초기화 (사이드카 파일은 최초 조회 시 로드)
+        
+        Args:
+            directory: 문서 출력 디렉터리
+        """
+        self.directory = os.path.abspath(directory)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._sorted: Optional[List[Dict[str, Any]]] = None
+        self._dir_mtime_ns: Optional[int] = None
+        self._lock = threading.RLock()
+        self._loaded = False
+    
+    # ==================== 조회 ====================
+    
+    def list_documents(self) -> List[Dict[str, Any]]:
+        """
+        문서 목록 조회 (생성일시 내림차순)
+        
+        Returns:
+            List[Dict[str, Any]]: 문서 메타데이터 목록 (복사본)
+        """
+        with self._lock:
+            self._ensure_fresh()
+            if self._sorted is None:
+                self._sorted = sorted(self._entries.values(), key=lambda doc: doc['created_at'], reverse=True)
+            return [doc.copy() for doc in self._sorted]
+    
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        문서 메타데이터 조회
+        
+        Args:
+            filename: 파일명
+        
+        Returns:
+            Optional[Dict[str, Any]]: 메타데이터 복사본 또는 None
+        """
+        with self._lock:
+            self._ensure_fresh()
+            entry = self._entries.get(filename)
+            return entry.copy() if entry else None
+    
+    # ==================== 갱신 ====================
+    
+    def record(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """
+        생성/갱신된 문서를 인덱스에 반영
+        
+        Args:
+            filepath: 문서 파일 경로 (출력 디렉터리 바로 아래 파일만 색인)
+        
+        Returns:
+            Optional[Dict[str, Any]]: 반영된 메타데이터 또는 None
+        """
+        filepath = os.path.abspath(filepath)
+        if os.path.dirname(filepath) != self.directory:
+            return None
+        
+        with self._lock:
+            # 방금 쓴 파일 때문에 디렉터리 mtime이 바뀌었으므로 재스캔 없이 직접 반영
+            self._ensure_loaded()
+            try:
+                entry = self._build_entry(os.path.basename(filepath), os.stat(filepath))
+            except OSError:
+                return None
+            self._entries[entry['filename']] = entry
+            self._mark_synced()
+            return entry.copy()
+    
+    def remove(self, filename: str) -> None:
+        """
+        삭제된 문서를 인덱스에서 제거
+        
+        Args:
+            filename: 파일명
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(filename, None) is not None:
+                self._mark_synced()
+    
+    def rebuild(self) -> int:
+        """
+        디렉터리를 다시 스캔하여 인덱스 재구성
+        
+        Returns:
+            int: 색인된 문서 수
+        """
+        with self._lock:
+            self._loaded = True
+            self._reconcile()
+            return len(self._entries)
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    def _ensure_loaded(self) -> None:
+        """사이드카 최초 로드, 사이드카가 없으면 전체 스캔 (lock 보유 상태에서 호출)"""
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+            if self._dir_mtime_ns is None:
+                self._reconcile()
+    
+    def _ensure_fresh(self) -> None:
+        """사이드카 로드 및 디렉터리 mtime 변경 시 재스캔 (lock 보유 상태에서 호출)"""
+        self._ensure_loaded()
+        if self._current_dir_mtime_ns() != self._dir_mtime_ns:
+            self._reconcile()
+    
+    def _reconcile(self) -> None:
+        """디렉터리 스캔 결과로 인덱스 동기화 (변경되지 않은 항목은 재사용)"""
+        entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.isdir(self.directory):
+            with os.scandir(self.directory) as scanner:
+                for dir_entry in scanner:
+                    if not dir_entry.name.endswith('.pdf') or not dir_entry.is_file():
+                        continue
+                    stat = dir_entry.stat()
+                    cached = self._entries.get(dir_entry.name)
+                    if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+                        entries[dir_entry.name] = cached
+                    else:
+                        entries[dir_entry.name] = self._build_entry(dir_entry.name, stat)
+        
+        self._entries = entries
+        self._mark_synced()
+    
+    def _mark_synced(self) -> None:
+        """현재 디렉터리 mtime을 동기화 시점으로 기록하고 사이드카 저장 (lock 보유 상태에서 호출)"""
+        self._sorted = None
+        self._dir_mtime_ns = self._current_dir_mtime_ns()
+        if self._dir_mtime_ns is not None:
+            self._save()
+    
+    def _build_entry(self, filename: str, stat: os.stat_result) -> Dict[str, Any]:
+        """파일 stat 결과로 메타데이터 생성"""
+        return {
+            'filename': filename,
+            'filepath': os.path.join(self.directory, filename),
+            'size': stat.st_size,
+            'size_mb': round(stat.st_size / (1024 * 1024), 2),
+            'created_at': datetime.fromtimestamp(stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
+            'modified_at': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+            'file_type': classify_document(filename),
+            'mtime_ns': stat.st_mtime_ns  # 재스캔 시 변경 여부 판단용
+        }
+    
+    def _current_dir_mtime_ns(self) -> Optional[int]:
+        """출력 디렉터리 mtime (디렉터리가 없으면 None)"""
+        try:
+            return os.stat(self.directory).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _index_path(self) -> str:
+        """사이드카 파일 경로"""
+        return os.path.join(self.directory, self.INDEX_DIRNAME, self.INDEX_FILENAME)
+    
+    def _load(self) -> None:
+        """사이드카 파일 로드 (없거나 손상되면 다음 동기화에서 재스캔)"""
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as index_file:
+                saved = json.load(index_file)
+        except (OSError, ValueError):
+            return
+        
+        if not isinstance(saved, dict) or saved.get('version') != self.INDEX_VERSION:
+            return
+        
+        self._entries = {doc['filename']: doc for doc in saved.get('documents', [])}
+        self._dir_mtime_ns = saved.get('dir_mtime_ns')
+    
+    def _save(self) -> None:
+        """사이드카 파일 저장 (임시 파일 교체 방식)"""
+        index_path = self._index_path()
+        temp_path = f"{index_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            # .index 디렉터리를 처음 만들면 출력 디렉터리 mtime이 바뀌므로 다시 기록
+            self._dir_mtime_ns = self._current_dir_mtime_ns()
+            with open(temp_path, 'w', encoding='utf-8') as index_file:
+                json.dump({
+                    'version': self.INDEX_VERSION,
+                    'dir_mtime_ns': self._dir_mtime_ns,
+                    'documents': list(self._entries.values())
+                }, index_file, ensure_ascii=False)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            print(f"문서 인덱스 저장 중 오류 발생: {str(e)}")
+
+
+_indexes: Dict[str, DocumentIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_document_index(directory: str) -> DocumentIndex:
+    """
+    출력 디렉터리에 해당하는 인덱스 조회 (디렉터리당 하나의 인스턴스 공유)
+    
+    Args:
+        directory: 문서 출력 디렉터리
+    
+    Returns:
+        DocumentIndex: 인덱스 인스턴스
+    """
+    key = os.path.abspath(directory)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = DocumentIndex(key)
+        return _indexes[key]
@@ -0,0 +1,291 @@
+"""
+Document Content Store
+생성된 PDF를 내용 해시 기준으로 한 번만 저장하는 내용 주소 기반 저장소
+
+Classes:
+    - DocumentStore: 해시명 blob + 파일명→해시 매니페스트 기반 중복 제거 저장소
+
+Functions:
+    - get_document_store: 출력 디렉터리에 해당하는 저장소 인스턴스 조회
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from ...utils.constants import PDF_SETTINGS
+
+
+class DocumentStore:
+    """
+    내용 주소 기반 문서 저장소 클래스
+    
+    PDF 본문은 <출력 디렉터리>/.blobs/<해시 앞 2자리>/<sha256>.pdf 에 한 번만 저장하고,
+    출력 디렉터리의 파일명은 blob에 대한 하드 링크로 만들어 기존 경로 기반 코드(send_file, 목록 조회)를
+    그대로 사용할 수 있게 합니다. 하드 링크를 만들 수 없는 파일 시스템에서는 복사로 대체합니다.
+    blob의 참조 수는 매니페스트에서 해당 해시를 가리키는 파일명 수이며, 0이 되면 blob을 삭제합니다.
+    """
+    
+    MANIFEST_FILENAME = 'manifest.json'
+    
+    def __init__(self, directory: str):
+        """
+        저장소 초기화 (매니페스트는 최초 사용 시 로드)
+        
+        Args:
+            directory: 문서 출력 디렉터리
+        """
+        self.directory = os.path.abspath(directory)
+        self.blob_dir = os.path.join(self.directory, PDF_SETTINGS['BLOB_DIRNAME'])
+        self._manifest: Dict[str, str] = {}
+        self._ref_counts: Counter = Counter()
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._defer_depth = 0
+        self._dirty = False
+    
+    # ==================== 저장/해제 ====================
+    
+    def put(self, data: bytes, filename: str) -> str:
+        """
+        문서 저장 (같은 내용의 blob이 있으면 재사용)
+        
+        Args:
+            data: PDF 바이트
+            filename: 출력 디렉터리에 노출할 파일명
+        
+        Returns:
+            str: 출력 디렉터리의 파일 경로
+        """
+        def write_blob(temp_path: str) -> None:
+            with open(temp_path, 'wb') as blob_file:
+                blob_file.write(data)
+        
+        return self._attach(hashlib.sha256(data).hexdigest(), filename, write_blob)
+    
+    def put_blob(self, content_hash: str, source_path: str, filename: str) -> str:
+        """
+        다른 저장소의 blob을 가져와 저장 (같은 해시의 blob이 이미 있으면 복사 생략)
+        
+        Args:
+            content_hash: 내용 해시
+            source_path: 원본 blob 경로
+            filename: 출력 디렉터리에 노출할 파일명
+        
+        Returns:
+            str: 출력 디렉터리의 파일 경로
+        """
+        return self._attach(content_hash, filename, lambda temp_path: shutil.copy2(source_path, temp_path))
+    
+    def release(self, filename: str) -> bool:
+        """
+        파일명 삭제 및 참조가 없어진 blob 정리
+        
+        Args:
+            filename: 출력 디렉터리의 파일명
+        
+        Returns:
+            bool: 파일명이 존재하여 삭제되었는지 여부
+        """
+        filepath = os.path.join(self.directory, filename)
+        with self._lock:
+            self._ensure_loaded()
+            removed = os.path.exists(filepath)
+            if removed:
+                os.remove(filepath)
+            
+            content_hash = self._manifest.pop(filename, None)
+            if content_hash:
+                self._release_blob(content_hash)
+                self._save()
+            return removed
+    
+    def collect_garbage(self) -> int:
+        """
+        외부에서 삭제된 파일명을 매니페스트에서 제거하고 참조 없는 blob 삭제
+        
+        Returns:
+            int: 삭제된 blob 수
+        """
+        with self._lock:
+            self._ensure_loaded()
+            for filename in [name for name in self._manifest if not os.path.exists(os.path.join(self.directory, name))]:
+                self._ref_counts[self._manifest.pop(filename)] -= 1
+            
+            removed = 0
+            if os.path.isdir(self.blob_dir):
+                for shard in os.listdir(self.blob_dir):
+                    shard_dir = os.path.join(self.blob_dir, shard)
+                    if not os.path.isdir(shard_dir):
+                        continue
+                    for blob_name in os.listdir(shard_dir):
+                        content_hash = blob_name.split('.', 1)[0]
+                        if self._ref_counts.get(content_hash, 0) <= 0:
+                            os.remove(os.path.join(shard_dir, blob_name))
+                            removed += 1
+            
+            self._ref_counts = +self._ref_counts
+            self._save()
+            return removed
+    
+    @contextmanager
+    def deferred_save(self) -> Iterator['DocumentStore']:
+        """
+        블록 안의 변경을 모아 종료 시 매니페스트를 한 번만 저장
+        
+        대량 저장 시 파일명마다 매니페스트 전체를 다시 쓰지 않도록 합니다.
+        """
+        with self._lock:
+            self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._defer_depth -= 1
+                if self._defer_depth == 0 and self._dirty:
+                    self._save()
+    
+    # ==================== 조회 ====================
+    
+    def get_hash(self, filename: str) -> Optional[str]:
+        """파일명이 가리키는 내용 해시 조회"""
+        with self._lock:
+            self._ensure_loaded()
+            return self._manifest.get(filename)
+    
+    def get_manifest(self) -> Dict[str, str]:
+        """파일명→해시 매니페스트 복사본 조회"""
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._manifest)
+    
+    def get_blob_path(self, content_hash: str) -> str:
+        """내용 해시에 해당하는 blob 경로"""
+        return self._blob_path(content_hash)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        저장소 통계 조회
+        
+        Returns:
+            Dict[str, Any]: 파일명 수, 고유 blob 수, 실제 저장 용량
+        """
+        with self._lock:
+            self._ensure_loaded()
+            stored_bytes = 0
+            for content_hash in self._ref_counts:
+                try:
+                    stored_bytes += os.path.getsize(self._blob_path(content_hash))
+                except OSError:
+                    continue
+            return {
+                'documents': len(self._manifest),
+                'unique_blobs': len(self._ref_counts),
+                'stored_bytes': stored_bytes,
+                'stored_size_mb': round(stored_bytes / (1024 * 1024), 2)
+            }
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    def _attach(self, content_hash: str, filename: str, write_blob: Callable[[str], None]) -> str:
+        """blob이 없으면 기록하고 파일명을 연결 (put/put_blob 공통 처리)"""
+        filepath = os.path.join(self.directory, filename)
+        
+        with self._lock:
+            self._ensure_loaded()
+            blob_path = self._blob_path(content_hash)
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                temp_path = f"{blob_path}.tmp"
+                write_blob(temp_path)
+                os.replace(temp_path, blob_path)
+            
+            previous_hash = self._manifest.get(filename)
+            if previous_hash != content_hash:
+                self._link(blob_path, filepath)
+                self._manifest[filename] = content_hash
+                self._ref_counts[content_hash] += 1
+                if previous_hash:
+                    self._release_blob(previous_hash)
+                self._save()
+            elif not os.path.exists(filepath):
+                self._link(blob_path, filepath)
+        
+        return filepath
+    
+    def _blob_path(self, content_hash: str) -> str:
+        """blob 경로 (해시 앞 2자리로 하위 디렉터리 분산)"""
+        return os.path.join(self.blob_dir, content_hash[:2], f"{content_hash}.pdf")
+    
+    def _link(self, blob_path: str, filepath: str) -> None:
+        """blob을 출력 파일명으로 연결 (하드 링크 우선, 불가하면 복사)"""
+        temp_path = f"{filepath}.tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        try:
+            os.link(blob_path, temp_path)
+        except OSError:
+            shutil.copyfile(blob_path, temp_path)
+        os.replace(temp_path, filepath)
+    
+    def _release_blob(self, content_hash: str) -> None:
+        """blob 참조 수 감소 및 0이면 삭제 (lock 보유 상태에서 호출)"""
+        self._ref_counts[content_hash] -= 1
+        if self._ref_counts[content_hash] <= 0:
+            del self._ref_counts[content_hash]
+            try:
+                os.remove(self._blob_path(content_hash))
+            except FileNotFoundError:
+                pass
+    
+    def _ensure_loaded(self) -> None:
+        """매니페스트 최초 로드 (lock 보유 상태에서 호출)"""
+        if self._loaded:
+            return
+        try:
+            with open(os.path.join(self.blob_dir, self.MANIFEST_FILENAME), 'r', encoding='utf-8') as manifest_file:
+                saved = json.load(manifest_file)
+            if isinstance(saved, dict):
+                self._manifest = {str(name): str(content_hash) for name, content_hash in saved.items()}
+        except (OSError, ValueError):
+            self._manifest = {}
+        self._ref_counts = Counter(self._manifest.values())
+        self._loaded = True
+    
+    def _save(self) -> None:
+        """매니페스트 저장 (임시 파일 교체 방식, deferred_save 블록 안에서는 종료 시로 미룸)"""
+        if self._defer_depth:
+            self._dirty = True
+            return
+        self._dirty = False
+        os.makedirs(self.blob_dir, exist_ok=True)
+        manifest_path = os.path.join(self.blob_dir, self.MANIFEST_FILENAME)
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as manifest_file:
+            json.dump(self._manifest, manifest_file, ensure_ascii=False)
+        os.replace(temp_path, manifest_path)
+
+
+_stores: Dict[str, DocumentStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_document_store(directory: str) -> DocumentStore:
+    """
+    출력 디렉터리에 해당하는 저장소 조회 (디렉터리당 하나의 인스턴스 공유)
+    
+    Args:
+        directory: 문서 출력 디렉터리
+    
+    Returns:
+        DocumentStore: 저장소 인스턴스
+    """
+    key = os.path.abspath(directory)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = DocumentStore(key)
+        return _stores[key]
@@ -6,23 +6,40 @@ Classes:
     - DocumentEmailService: 문서 이메일 발송 서비스
 """
 import os
-import smtplib
+import threading
+import uuid
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+
+from .email_templates import email_template_renderer
+from .smtp_pool import SmtpConnectionPool
+from ...utils.constants import SMTP_SETTINGS
 
 
 class DocumentEmailService:
     """문서 이메일 발송을 담당하는 서비스 클래스"""
     
+    # 메일 종류별 본문 템플릿 (app/templates/emails)
+    QUOTATION_REQUEST_TEMPLATE = 'quotation_request.html'
+    PURCHASE_ORDER_TEMPLATE = 'purchase_order.html'
+    QUOTATION_TEMPLATE = 'quotation.html'
+    NOTIFICATION_DIGEST_TEMPLATE = 'notification_digest.html'
+    
     def __init__(self):
         """서비스 초기화"""
-        self.smtp_server = "smtp.gmail.com"  # 기본 SMTP 서버
-        self.smtp_port = 587
+        self.smtp_server = SMTP_SETTINGS['SERVER']  # 기본 SMTP 서버
+        self.smtp_port = SMTP_SETTINGS['PORT']
+        self.use_tls = SMTP_SETTINGS['USE_TLS']
+        self.use_auth = SMTP_SETTINGS['USE_AUTH']
         self.email_user = os.getenv('EMAIL_USER', '')
         self.email_password = os.getenv('EMAIL_PASSWORD', '')
+        
+        # 로그인된 SMTP 세션을 재사용하는 연결 풀 (최초 발송 시 생성, 설정 변경 시 재생성)
+        self._smtp_pool: Optional[SmtpConnectionPool] = None
+        self._smtp_pool_lock = threading.Lock()
     
     def send_quotation_request_email(self, request_data: Dict[str, Any], partner_data: Dict[str, Any]) -> bool:
         """
@@ -37,7 +54,7 @@ class DocumentEmailService:
         """
         try:
             # 이메일 설정이 없는 경우 로그만 출력
-            if not self.email_user or not self.email_password:
+            if not self.validate_email_settings():
                 print("이메일 설정이 없어 실제 발송을 건너뜁니다.")
                 print(f"견적서 요청 이메일 발송 시뮬레이션:")
                 print(f"수신자: {partner_data.get('contact_email')}")
@@ -45,24 +62,9 @@ class DocumentEmailService:
                 print(f"내용: {request_data.get('description')}")
                 return True
             
-            # 이메일 메시지 구성
-            msg = MIMEMultipart()
-            msg['From'] = self.email_user
-            msg['To'] = partner_data.get('contact_email', '')
-            msg['Subject'] = f"견적서 요청: {request_data.get('title', '')}"
-            
-            # 이메일 본문 작성
-            body = self._create_quotation_request_email_body(request_data, partner_data)
-            msg.attach(MIMEText(body, 'html', 'utf-8'))
-            
-            # SMTP 서버 연결 및 이메일 발송
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email_user, self.email_password)
-            
-            text = msg.as_string()
-            server.sendmail(self.email_user, partner_data.get('contact_email', ''), text)
-            server.quit()
+            # 연결 풀을 통해 발송
+            msg = self.build_quotation_request_message(request_data, partner_data)
+            self.get_smtp_pool().send(msg, self.email_user, partner_data.get('contact_email', ''))
             
             return True
             
@@ -84,7 +86,7 @@ class DocumentEmailService:
         """
         try:
             # 이메일 설정이 없는 경우 로그만 출력
-            if not self.email_user or not self.email_password:
+            if not self.validate_email_settings():
                 print("이메일 설정이 없어 실제 발송을 건너뜁니다.")
                 print(f"발주서 이메일 발송 시뮬레이션:")
                 print(f"수신자: {partner_data.get('contact_email')}")
@@ -92,37 +94,9 @@ class DocumentEmailService:
                 print(f"첨부파일: {pdf_path}")
                 return True
             
-            # 이메일 메시지 구성
-            msg = MIMEMultipart()
-            msg['From'] = self.email_user
-            msg['To'] = partner_data.get('contact_email', '')
-            msg['Subject'] = f"발주서 발송 - {order_data.get('order_number', '')}"
-            
-            # 이메일 본문 작성
-            body = self._create_purchase_order_email_body(order_data, partner_data)
-            msg.attach(MIMEText(body, 'html', 'utf-8'))
-            
-            # PDF 파일 첨부
-            if os.path.exists(pdf_path):
-                with open(pdf_path, "rb") as attachment:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment.read())
-                
-                encoders.encode_base64(part)
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename= {os.path.basename(pdf_path)}'
-                )
-                msg.attach(part)
-            
-            # SMTP 서버 연결 및 이메일 발송
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email_user, self.email_password)
-            
-            text = msg.as_string()
-            server.sendmail(self.email_user, partner_data.get('contact_email', ''), text)
-            server.quit()
+            # 연결 풀을 통해 발송
+            msg = self.build_purchase_order_message(order_data, partner_data, pdf_path)
+            self.get_smtp_pool().send(msg, self.email_user, partner_data.get('contact_email', ''))
             
             return True
             
@@ -144,7 +118,7 @@ class DocumentEmailService:
         """
         try:
             # 이메일 설정이 없는 경우 로그만 출력
-            if not self.email_user or not self.email_password:
+            if not self.validate_email_settings():
                 print("이메일 설정이 없어 실제 발송을 건너뜁니다.")
                 print(f"견적서 이메일 발송 시뮬레이션:")
                 print(f"수신자: {partner_data.get('contact_email')}")
@@ -153,37 +127,9 @@ class DocumentEmailService:
                     print(f"첨부파일: {pdf_path}")
                 return True
             
-            # 이메일 메시지 구성
-            msg = MIMEMultipart()
-            msg['From'] = self.email_user
-            msg['To'] = partner_data.get('contact_email', '')
-            msg['Subject'] = f"견적서 발송 - {quotation_data.get('quotation_number', '')}"
-            
-            # 이메일 본문 작성
-            body = self._create_quotation_email_body(quotation_data, partner_data)
-            msg.attach(MIMEText(body, 'html', 'utf-8'))
-            
-            # PDF 파일 첨부 (있는 경우)
-            if pdf_path and os.path.exists(pdf_path):
-                with open(pdf_path, "rb") as attachment:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment.read())
-                
-                encoders.encode_base64(part)
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename= {os.path.basename(pdf_path)}'
-                )
-                msg.attach(part)
-            
-            # SMTP 서버 연결 및 이메일 발송
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email_user, self.email_password)
-            
-            text = msg.as_string()
-            server.sendmail(self.email_user, partner_data.get('contact_email', ''), text)
-            server.quit()
+            # 연결 풀을 통해 발송
+            msg = self.build_quotation_message(quotation_data, partner_data, pdf_path)
+            self.get_smtp_pool().send(msg, self.email_user, partner_data.get('contact_email', ''))
             
             return True
             
@@ -191,136 +137,202 @@ class DocumentEmailService:
             print(f"견적서 이메일 발송 중 오류 발생: {str(e)}")
             return False
     
-    def _create_quotation_request_email_body(self, request_data: Dict[str, Any], partner_data: Dict[str, Any]) -> str:
-        """견적서 요청 이메일 본문을 생성합니다."""
-        return f"""
-        <html>
-        <body>
-            <h2>견적서 요청</h2>
-            <p>안녕하세요, {partner_data.get('contact_person', '')}님</p>
+    def send_messages(self, messages: List[Tuple[MIMEMultipart, str]]) -> List[bool]:
+        """
+        여러 메일을 연결 풀의 한 세션에서 연속 발송합니다.
+        
+        Args:
+            messages: (메시지, 수신 주소) 목록 - 메시지는 build_*_message로 생성
             
-            <h3>요청 내용</h3>
-            <table border="1" style="border-collapse: collapse; width: 100%;">
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>요청 번호</strong></td>
-                    <td style="padding: 8px;">{request_data.get('request_number', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>제목</strong></td>
-                    <td style="padding: 8px;">{request_data.get('title', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>상세 내용</strong></td>
-                    <td style="padding: 8px;">{request_data.get('description', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>마감일</strong></td>
-                    <td style="padding: 8px;">{request_data.get('deadline', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>예산 범위</strong></td>
-                    <td style="padding: 8px;">{request_data.get('budget_range', '')}</td>
-                </tr>
-            </table>
+        Returns:
+            메시지별 발송 성공 여부
+        """
+        if not messages:
+            return []
+        
+        if not self.validate_email_settings():
+            print(f"이메일 설정이 없어 실제 발송을 건너뜁니다. (시뮬레이션 {len(messages)}건)")
+            return [True] * len(messages)
+        
+        try:
+            errors = self.get_smtp_pool().send_many([(msg, self.email_user, recipient) for msg, recipient in messages])
+        except Exception as e:
+            print(f"이메일 일괄 발송 중 오류 발생: {str(e)}")
+            return [False] * len(messages)
+        
+        for (msg, recipient), error in zip(messages, errors):
+            if error:
+                print(f"이메일 발송 실패 ({recipient}): {error}")
+        return [error is None for error in errors]
+    
+    def build_quotation_request_message(self, request_data: Dict[str, Any], partner_data: Dict[str, Any]) -> MIMEMultipart:
+        """견적서 요청 이메일 메시지를 생성합니다."""
+        body = self._create_quotation_request_email_body(request_data, partner_data)
+        return self._new_message(partner_data, f"견적서 요청: {request_data.get('title', '')}", body)
+    
+    def build_quotation_request_messages(self, requests: List[Dict[str, Any]], partners: List[Dict[str, Any]],
+                                         attachment: Optional[Tuple[str, bytes]] = None) -> List[Tuple[MIMEMultipart, str]]:
+        """
+        견적서 요청 메시지를 협력사별로 메일 머지하여 생성합니다.
+        
+        Args:
+            requests: 협력사별 견적서 요청 데이터 (partners와 같은 순서)
+            partners: 수신 협력사 목록
+            attachment: 모든 메시지에 공통으로 첨부할 (파일명, 바이트) - 인코딩은 한 번만 수행
             
-            {f'<h3>특별 요구사항</h3><p>{request_data.get("special_requirements", "")}</p>' if request_data.get('special_requirements') else ''}
+        Returns:
+            (메시지, 수신 주소) 목록 - send_messages 또는 발송 대기열에 그대로 전달 가능
+        """
+        bodies = self.render_mail_merge(
+            self.QUOTATION_REQUEST_TEMPLATE,
+            [{'request': request_data, 'partner': partner} for request_data, partner in zip(requests, partners)]
+        )
+        
+        # 같은 첨부 파트를 모든 메시지가 공유 (메시지는 직렬화 용도로만 사용)
+        part = self._build_attachment(*attachment) if attachment else None
+        messages = []
+        for request_data, partner, body in zip(requests, partners, bodies):
+            msg = self._new_message(partner, f"견적서 요청: {request_data.get('title', '')}", body)
+            if part is not None:
+                msg.attach(part)
+            messages.append((msg, partner.get('contact_email', '')))
+        return messages
+    
+    def render_mail_merge(self, template_name: str, contexts: List[Dict[str, Any]],
+                          common: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        하나의 컴파일된 템플릿으로 여러 수신자의 본문을 렌더링합니다.
+        
+        Args:
+            template_name: 본문 템플릿 파일명
+            contexts: 수신자별 템플릿 변수 목록 (예: {'partner': 협력사 데이터})
+            common: 모든 수신자에게 공통인 템플릿 변수
             
-            <h3>담당자 정보</h3>
-            <p>
-                담당자: {request_data.get('contact_name', '')}<br/>
-                연락처: {request_data.get('contact_phone', '')}<br/>
-                이메일: {request_data.get('contact_email', '')}
-            </p>
+        Returns:
+            수신자 순서대로 렌더링된 본문 목록
+        """
+        return email_template_renderer.render_many(template_name, contexts, common)
+    
+    def build_notification_digest_messages(self, digests: List[Dict[str, Any]]) -> List[Tuple[MIMEMultipart, str]]:
+        """
+        수신자별 알림 묶음 메일을 메일 머지하여 생성합니다.
+        
+        Args:
+            digests: [{'recipient': {'name', 'email'}, 'notifications': [...]}, ...]
             
-            <p>빠른 시일 내에 견적서를 보내주시기 바랍니다.</p>
-            <p>감사합니다.</p>
-        </body>
-        </html>
+        Returns:
+            (메시지, 수신 주소) 목록 - 발송 대기열에 그대로 전달 가능
         """
+        bodies = self.render_mail_merge(self.NOTIFICATION_DIGEST_TEMPLATE, digests)
+        messages = []
+        for digest, body in zip(digests, bodies):
+            notifications = digest['notifications']
+            if len(notifications) == 1:
+                subject = f"[자산관리 알림] {notifications[0].get('title', '')}"
+            else:
+                subject = f"[자산관리 알림] 새 알림 {len(notifications)}건"
+            email = digest['recipient'].get('email', '')
+            messages.append((self._new_message({'contact_email': email}, subject, body), email))
+        return messages
+    
+    def build_purchase_order_message(self, order_data: Dict[str, Any], partner_data: Dict[str, Any], pdf_path: Optional[str] = None,
+                                     pdf_data: Optional[bytes] = None, pdf_filename: Optional[str] = None) -> MIMEMultipart:
+        """발주서 이메일 메시지를 생성합니다. (PDF 첨부, 보관 파일이 없으면 메모리의 PDF 바이트 첨부)"""
+        body = self._create_purchase_order_email_body(order_data, partner_data)
+        msg = self._new_message(partner_data, f"발주서 발송 - {order_data.get('order_number', '')}", body)
+        
+        # PDF 파일 첨부
+        if pdf_data is not None:
+            self._attach_bytes(msg, pdf_data, pdf_filename or 'purchase_order.pdf')
+        else:
+            self._attach_file(msg, pdf_path)
+        return msg
+    
+    def build_quotation_message(self, quotation_data: Dict[str, Any], partner_data: Dict[str, Any], pdf_path: Optional[str] = None) -> MIMEMultipart:
+        """견적서 이메일 메시지를 생성합니다. (PDF 첨부, 선택사항)"""
+        body = self._create_quotation_email_body(quotation_data, partner_data)
+        msg = self._new_message(partner_data, f"견적서 발송 - {quotation_data.get('quotation_number', '')}", body)
+        
+        # PDF 파일 첨부 (있는 경우)
+        self._attach_file(msg, pdf_path)
+        return msg
+    
+    def get_smtp_pool(self) -> SmtpConnectionPool:
+        """현재 설정의 SMTP 연결 풀 반환 (없으면 생성)"""
+        with self._smtp_pool_lock:
+            if self._smtp_pool is None:
+                self._smtp_pool = SmtpConnectionPool(
+                    self.smtp_server,
+                    self.smtp_port,
+                    username=self.email_user if self.use_auth else None,
+                    password=self.email_password if self.use_auth else None,
+                    use_tls=self.use_tls
+                )
+            return self._smtp_pool
+    
+    def close_connections(self) -> None:
+        """보관 중인 SMTP 연결 종료"""
+        with self._smtp_pool_lock:
+            pool, self._smtp_pool = self._smtp_pool, None
+        if pool is not None:
+            pool.close_all()
+    
+    def _attach_file(self, msg: MIMEMultipart, file_path: Optional[str]) -> None:
+        """파일이 있으면 메시지에 첨부합니다."""
+        if not file_path or not os.path.exists(file_path):
+            return
+        
+        with open(file_path, "rb") as attachment:
+            self._attach_bytes(msg, attachment.read(), os.path.basename(file_path))
+    
+    def _attach_bytes(self, msg: MIMEMultipart, data: bytes, filename: str) -> None:
+        """바이트 데이터를 파일명으로 메시지에 첨부합니다."""
+        msg.attach(self._build_attachment(filename, data))
+    
+    def _build_attachment(self, filename: str, data: bytes) -> MIMEBase:
+        """base64로 인코딩된 첨부 파트를 생성합니다."""
+        part = MIMEBase('application', 'octet-stream')
+        part.set_payload(data)
+        
+        encoders.encode_base64(part)
+        part.add_header(
+            'Content-Disposition',
+            f'attachment; filename= {filename}'
+        )
+        return part
+    
+    def _new_message(self, partner_data: Dict[str, Any], subject: str, body: str) -> MIMEMultipart:
+        """HTML 본문을 담은 메시지를 생성합니다."""
+        # 경계 문자열을 미리 지정하면 직렬화 시 본문 전체를 검사하여 경계를 고르는 과정을 생략
+        msg = MIMEMultipart(boundary=f"==============={uuid.uuid4().hex}==")
+        msg['From'] = self.email_user
+        msg['To'] = partner_data.get('contact_email', '')
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'html', 'utf-8'))
+        return msg
+    
+    def _create_quotation_request_email_body(self, request_data: Dict[str, Any], partner_data: Dict[str, Any]) -> str:
+        """견적서 요청 이메일 본문을 생성합니다."""
+        return email_template_renderer.render(
+            self.QUOTATION_REQUEST_TEMPLATE, {'request': request_data, 'partner': partner_data}
+        )
     
     def _create_purchase_order_email_body(self, order_data: Dict[str, Any], partner_data: Dict[str, Any]) -> str:
         """발주서 이메일 본문을 생성합니다."""
-        return f"""
-        <html>
-        <body>
-            <h2>발주서 발송</h2>
-            <p>안녕하세요, {partner_data.get('contact_person', '')}님</p>
-            
-            <p>첨부된 발주서를 확인하시고, 납기일에 맞춰 납품해 주시기 바랍니다.</p>
-            
-            <h3>발주 정보</h3>
-            <table border="1" style="border-collapse: collapse; width: 100%;">
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>발주서 번호</strong></td>
-                    <td style="padding: 8px;">{order_data.get('order_number', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>발주일자</strong></td>
-                    <td style="padding: 8px;">{order_data.get('order_date', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>납기일자</strong></td>
-                    <td style="padding: 8px;">{order_data.get('delivery_date', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>납품주소</strong></td>
-                    <td style="padding: 8px;">{order_data.get('delivery_address', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>총 금액</strong></td>
-                    <td style="padding: 8px;">{order_data.get('total_amount', 0):,}원</td>
-                </tr>
-            </table>
-            
-            {f'<h3>비고</h3><p>{order_data.get("notes", "")}</p>' if order_data.get('notes') else ''}
-            
-            <p>문의사항이 있으시면 언제든지 연락주시기 바랍니다.</p>
-            <p>감사합니다.</p>
-        </body>
-        </html>
-        """
+        return email_template_renderer.render(
+            self.PURCHASE_ORDER_TEMPLATE, {'order': order_data, 'partner': partner_data}
+        )
     
     def _create_quotation_email_body(self, quotation_data: Dict[str, Any], partner_data: Dict[str, Any]) -> str:
         """견적서 이메일 본문을 생성합니다."""
-        return f"""
-        <html>
-        <body>
-            <h2>견적서 발송</h2>
-            <p>안녕하세요, {partner_data.get('contact_person', '')}님</p>
-            
-            <p>요청하신 견적서를 첨부하여 발송드립니다.</p>
-            
-            <h3>견적 정보</h3>
-            <table border="1" style="border-collapse: collapse; width: 100%;">
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>견적서 번호</strong></td>
-                    <td style="padding: 8px;">{quotation_data.get('quotation_number', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>견적일자</strong></td>
-                    <td style="padding: 8px;">{quotation_data.get('quotation_date', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>유효기간</strong></td>
-                    <td style="padding: 8px;">{quotation_data.get('valid_until', '')}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #f0f0f0; padding: 8px;"><strong>총 견적금액</strong></td>
-                    <td style="padding: 8px;">{quotation_data.get('total_amount', 0):,}원</td>
-                </tr>
-            </table>
-            
-            {f'<h3>조건</h3><p>{quotation_data.get("terms", "")}</p>' if quotation_data.get('terms') else ''}
-            {f'<h3>비고</h3><p>{quotation_data.get("notes", "")}</p>' if quotation_data.get('notes') else ''}
-            
-            <p>견적 내용을 검토해 주시고, 문의사항이 있으시면 언제든지 연락주시기 바랍니다.</p>
-            <p>감사합니다.</p>
-        </body>
-        </html>
-        """
+        return email_template_renderer.render(
+            self.QUOTATION_TEMPLATE, {'quotation': quotation_data, 'partner': partner_data}
+        )
     
     def validate_email_settings(self) -> bool:
-        """이메일 설정 유효성 검증"""
+        """이메일 설정 유효성 검증 (로그인을 쓰지 않는 서버는 서버 주소만 확인)"""
+        if not self.use_auth:
+            return bool(self.smtp_server)
         return bool(self.email_user and self.email_password)
     
     def validate_recipient_data(self, partner_data: Dict[str, Any]) -> bool:
@@ -328,8 +340,9 @@ class DocumentEmailService:
         return bool(partner_data.get('contact_email') and partner_data.get('contact_person'))
     
     def update_email_settings(self, email_user: str = None, email_password: str = None, 
-                             smtp_server: str = None, smtp_port: int = None):
-        """이메일 설정 업데이트"""
+                             smtp_server: str = None, smtp_port: int = None,
+                             use_tls: bool = None, use_auth: bool = None):
+        """이메일 설정 업데이트 (기존 SMTP 연결은 닫고 다음 발송 시 새 설정으로 연결)"""
         if email_user:
             self.email_user = email_user
         if email_password:
@@ -337,4 +350,9 @@ class DocumentEmailService:
         if smtp_server:
             self.smtp_server = smtp_server
         if smtp_port:
-            self.smtp_port = smtp_port 
\ No newline at end of file
+            self.smtp_port = smtp_port
+        if use_tls is not None:
+            self.use_tls = use_tls
+        if use_auth is not None:
+            self.use_auth = use_auth
+        self.close_connections() 
\ No newline at end of file
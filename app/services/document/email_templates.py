@@ -0,0 +1,114 @@
+"""
+Email Template Renderer
+메일 본문 Jinja 템플릿을 한 번 컴파일하여 재사용하는 렌더러
+
+Classes:
+    - EmailTemplateRenderer: 컴파일된 메일 템플릿 캐시 및 단건/일괄(메일 머지) 렌더링
+"""
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
+
+# 메일 본문 템플릿 디렉터리 (app/templates/emails)
+EMAIL_TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'templates', 'emails')
+
+
+def format_amount(value: Any) -> str:
+    """금액 천 단위 구분 표시 (값이 없으면 0)"""
+    return f"{value or 0:,}"
+
+
+class EmailTemplateRenderer:
+    """
+    메일 템플릿 렌더러 클래스
+    
+    메일 본문은 요청 처리 흐름 밖(발송 대기열 스레드 등)에서도 만들어지므로 Flask 앱 컨텍스트와
+    무관한 전용 Environment를 사용합니다. 템플릿은 최초 사용 시 한 번만 컴파일하여 보관하고,
+    auto_reload를 끄므로 이후 렌더링마다 파일 변경 확인도 하지 않습니다.
+    """
+    
+    def __init__(self, template_dir: Optional[str] = None):
+        """
+        렌더러 초기화
+        
+        Args:
+            template_dir: 템플릿 디렉터리 (기본값: app/templates/emails)
+        """
+        self.environment = Environment(
+            loader=FileSystemLoader(os.path.abspath(template_dir or EMAIL_TEMPLATE_DIR)),
+            autoescape=select_autoescape(['html']),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False
+        )
+        self.environment.filters['amount'] = format_amount
+        self._templates: Dict[str, Template] = {}
+        self._lock = threading.Lock()
+    
+    def get_template(self, name: str) -> Template:
+        """
+        컴파일된 템플릿 조회 (최초 조회 시 컴파일)
+        
+        Args:
+            name: 템플릿 파일명 (예: 'quotation_request.html')
+        
+        Returns:
+            Template: 컴파일된 템플릿
+        """
+        template = self._templates.get(name)
+        if template is None:
+            with self._lock:
+                template = self._templates.get(name)
+                if template is None:
+                    template = self.environment.get_template(name)
+                    self._templates[name] = template
+        return template
+    
+    def render(self, name: str, context: Dict[str, Any]) -> str:
+        """
+        템플릿 단건 렌더링
+        
+        Args:
+            name: 템플릿 파일명
+            context: 템플릿 변수
+        
+        Returns:
+            str: 렌더링된 본문
+        """
+        return self.get_template(name).render(context)
+    
+    def render_many(
+        self,
+        name: str,
+        contexts: Iterable[Dict[str, Any]],
+        common: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        메일 머지: 하나의 컴파일된 템플릿으로 여러 수신자 본문을 렌더링
+        
+        Args:
+            name: 템플릿 파일명
+            contexts: 수신자별 템플릿 변수 목록
+            common: 모든 수신자에게 공통인 템플릿 변수 (수신자별 변수가 우선)
+        
+        Returns:
+            List[str]: 수신자 순서대로 렌더링된 본문
+        """
+        template = self.get_template(name)
+        if not common:
+            return [template.render(context) for context in contexts]
+        return [template.render({**common, **context}) for context in contexts]
+    
+    def clear(self) -> None:
+        """컴파일된 템플릿 캐시 비우기 (템플릿 파일 수정 후 다시 읽을 때 사용)"""
+        with self._lock:
+            self._templates.clear()
+            if self.environment.cache is not None:
+                self.environment.cache.clear()
+
+
+# 싱글톤 인스턴스 생성
+email_template_renderer = EmailTemplateRenderer()
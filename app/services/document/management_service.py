@@ -6,8 +6,13 @@ Classes:
     - DocumentManagementService: 문서 관리 서비스
 """
 import os
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+
+from .document_index import DocumentIndex, classify_document, get_document_index
+from .document_store import DocumentStore, get_document_store
+from .backup_service import document_backup_service
+from ...utils.constants import PDF_SETTINGS
 
 
 class DocumentManagementService:
@@ -16,8 +21,19 @@ class DocumentManagementService:
     def __init__(self):
         """서비스 초기화"""
         # PDF 저장 디렉터리 설정
-        self.pdf_output_dir = os.path.join(os.getcwd(), 'generated_documents')
+        self.pdf_output_dir = os.path.join(os.getcwd(), PDF_SETTINGS['OUTPUT_DIR'])
         os.makedirs(self.pdf_output_dir, exist_ok=True)
+        self.last_backup_metrics: Optional[Dict[str, Any]] = None
+    
+    @property
+    def document_index(self) -> DocumentIndex:
+        """현재 출력 디렉터리의 문서 메타데이터 인덱스"""
+        return get_document_index(self.pdf_output_dir)
+    
+    @property
+    def document_store(self) -> DocumentStore:
+        """현재 출력 디렉터리의 내용 주소 기반 저장소"""
+        return get_document_store(self.pdf_output_dir)
     
     def get_generated_documents_list(self) -> List[Dict[str, Any]]:
         """
@@ -27,22 +43,8 @@ class DocumentManagementService:
             문서 목록
         """
         try:
-            files = []
-            if os.path.exists(self.pdf_output_dir):
-                for filename in os.listdir(self.pdf_output_dir):
-                    if filename.endswith('.pdf'):
-                        filepath = os.path.join(self.pdf_output_dir, filename)
-                        stat = os.stat(filepath)
-                        files.append({
-                            'filename': filename,
-                            'filepath': filepath,
-                            'size': stat.st_size,
-                            'size_mb': round(stat.st_size / (1024 * 1024), 2),
-                            'created_at': datetime.fromtimestamp(stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                            'modified_at': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                            'file_type': self._get_document_type_from_filename(filename)
-                        })
-            return sorted(files, key=lambda x: x['created_at'], reverse=True)
+            # 메타데이터 인덱스 사용 (디렉터리가 바뀐 경우에만 재스캔)
+            return self.document_index.list_documents()
         except Exception as e:
             print(f"문서 목록 조회 중 오류 발생: {str(e)}")
             return []
@@ -58,19 +60,10 @@ class DocumentManagementService:
             문서 상세 정보
         """
         try:
-            filepath = os.path.join(self.pdf_output_dir, filename)
-            if os.path.exists(filepath):
-                stat = os.stat(filepath)
-                return {
-                    'filename': filename,
-                    'filepath': filepath,
-                    'size': stat.st_size,
-                    'size_mb': round(stat.st_size / (1024 * 1024), 2),
-                    'created_at': datetime.fromtimestamp(stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                    'modified_at': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                    'file_type': self._get_document_type_from_filename(filename),
-                    'exists': True
-                }
+            document = self.document_index.get(filename)
+            if document:
+                document['exists'] = True
+                return document
             else:
                 return {'exists': False, 'filename': filename}
         except Exception as e:
@@ -88,11 +81,11 @@ class DocumentManagementService:
             삭제 성공 여부
         """
         try:
-            filepath = os.path.join(self.pdf_output_dir, filename)
-            if os.path.exists(filepath):
-                os.remove(filepath)
-                return True
-            return False
+            # 파일명 삭제 후 더 이상 참조되지 않는 blob까지 정리
+            removed = self.document_store.release(filename)
+            if removed:
+                self.document_index.remove(filename)
+            return removed
         except Exception as e:
             print(f"문서 삭제 중 오류 발생: {str(e)}")
             return False
@@ -101,6 +94,8 @@ class DocumentManagementService:
         """
         지정된 일수보다 오래된 문서들을 삭제합니다.
         
+        같은 내용을 공유하는 다른 문서가 남아 있으면 blob은 유지하고, 참조가 모두 사라진 blob만 삭제합니다.
+        
         Args:
             days_old: 삭제할 문서의 기준 일수 (기본값: 30일)
             
@@ -111,17 +106,17 @@ class DocumentManagementService:
             deleted_count = 0
             current_time = datetime.now()
             
-            if os.path.exists(self.pdf_output_dir):
-                for filename in os.listdir(self.pdf_output_dir):
-                    if filename.endswith('.pdf'):
-                        filepath = os.path.join(self.pdf_output_dir, filename)
-                        file_time = datetime.fromtimestamp(os.path.getctime(filepath))
-                        days_diff = (current_time - file_time).days
-                        
-                        if days_diff > days_old:
-                            os.remove(filepath)
-                            deleted_count += 1
-                            
+            for document in self.document_index.list_documents():
+                file_time = datetime.strptime(document['created_at'], '%Y-%m-%d %H:%M:%S')
+                days_diff = (current_time - file_time).days
+                
+                if days_diff > days_old:
+                    self.document_store.release(document['filename'])
+                    self.document_index.remove(document['filename'])
+                    deleted_count += 1
+            
+            # 외부에서 삭제된 파일명이 남긴 참조 정리
+            self.document_store.collect_garbage()
             return deleted_count
         except Exception as e:
             print(f"오래된 문서 정리 중 오류 발생: {str(e)}")
@@ -132,7 +127,7 @@ class DocumentManagementService:
         문서 유형별 목록을 반환합니다.
         
         Args:
-            document_type: 문서 유형 ('purchase_order', 'quotation', 'other')
+            document_type: 문서 유형 ('purchase_order', 'quotation', 'asset_label', 'other')
             
         Returns:
             해당 유형의 문서 목록
@@ -163,18 +158,18 @@ class DocumentManagementService:
                 type_stats[doc_type]['count'] += 1
                 type_stats[doc_type]['size'] += doc['size']
             
-            # 날짜별 통계 (최근 30일)
-            recent_docs = []
-            current_time = datetime.now()
-            for doc in documents:
-                doc_time = datetime.strptime(doc['created_at'], '%Y-%m-%d %H:%M:%S')
-                days_diff = (current_time - doc_time).days
-                if days_diff <= 30:
-                    recent_docs.append(doc)
+            # 날짜별 통계 (최근 30일, 경과 일수 30일 이하)
+            # created_at은 고정 형식 문자열이므로 파싱 없이 기준 시각 문자열과 비교
+            cutoff = (datetime.now() - timedelta(days=31)).strftime('%Y-%m-%d %H:%M:%S')
+            recent_docs = [doc for doc in documents if doc['created_at'] > cutoff]
+            
+            store_stats = self.document_store.get_statistics()
             
             return {
                 'total_documents': total_count,
                 'total_size_mb': total_size_mb,
+                'unique_documents': store_stats['unique_blobs'],
+                'stored_size_mb': store_stats['stored_size_mb'],
                 'recent_documents': len(recent_docs),
                 'type_statistics': type_stats,
                 'oldest_document': documents[-1] if documents else None,
@@ -186,6 +181,8 @@ class DocumentManagementService:
             return {
                 'total_documents': 0,
                 'total_size_mb': 0,
+                'unique_documents': 0,
+                'stored_size_mb': 0,
                 'recent_documents': 0,
                 'type_statistics': {},
                 'oldest_document': None,
@@ -214,6 +211,9 @@ class DocumentManagementService:
         """
         문서들을 백업 디렉터리로 복사합니다.
         
+        이전 백업 이후 새로 생겼거나 바뀐 문서만 복사하는 증분 백업이며,
+        실행 지표는 last_backup_metrics 및 백업 디렉터리의 상태 파일에 기록됩니다.
+        
         Args:
             backup_dir: 백업 디렉터리 경로
             
@@ -221,20 +221,8 @@ class DocumentManagementService:
             백업 성공 여부
         """
         try:
-            import shutil
-            
-            # 백업 디렉터리 생성
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            # 모든 PDF 파일 복사
-            if os.path.exists(self.pdf_output_dir):
-                for filename in os.listdir(self.pdf_output_dir):
-                    if filename.endswith('.pdf'):
-                        src = os.path.join(self.pdf_output_dir, filename)
-                        dst = os.path.join(backup_dir, filename)
-                        shutil.copy2(src, dst)
-            
-            return True
+            self.last_backup_metrics = document_backup_service.backup(self.pdf_output_dir, backup_dir)
+            return self.last_backup_metrics['failed'] == 0
         except Exception as e:
             print(f"문서 백업 중 오류 발생: {str(e)}")
             return False
@@ -249,18 +237,7 @@ class DocumentManagementService:
         Returns:
             문서 유형
         """
-        filename_lower = filename.lower()
-        
-        if 'purchase_order' in filename_lower or 'po_' in filename_lower:
-            return 'purchase_order'
-        elif 'quotation' in filename_lower or 'quote_' in filename_lower:
-            return 'quotation'
-        elif 'invoice' in filename_lower:
-            return 'invoice'
-        elif 'contract' in filename_lower:
-            return 'contract'
-        else:
-            return 'other'
+        return classify_document(filename)
     
     def get_output_directory(self) -> str:
         """문서 출력 디렉터리 경로 반환"""
@@ -0,0 +1,505 @@
+"""
+Email Outbox Service
+메일을 요청 처리 흐름에서 분리하여 백그라운드에서 발송하는 영속 발송 대기열
+
+Classes:
+    - EmailOutboxService: 파일 기반 발송 대기열, 배치 발송, 지수 백오프 재시도, dead letter 관리
+"""
+import io
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+from email.generator import Generator
+from email.message import Message
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .email_service import DocumentEmailService
+from ...utils.constants import SMTP_SETTINGS
+
+
+# 메시지 상태
+OUTBOX_STATUS_QUEUED = 'queued'
+OUTBOX_STATUS_RETRYING = 'retrying'
+OUTBOX_STATUS_SENT = 'sent'
+OUTBOX_STATUS_DEAD = 'dead'
+
+# 상태 변경 처리 함수 시그니처: (메시지 기록) -> None
+StatusHandler = Callable[[Dict[str, Any]], None]
+
+# CR 없이 쓰인 줄바꿈 (SMTP DATA는 CRLF만 허용 - RFC 5321)
+_BARE_LF = re.compile(rb'(?<!\r)\n')
+
+
+class _SharedPartGenerator(Generator):
+    """
+    첨부 파트의 직렬화 결과를 재사용하는 Generator
+    
+    일괄 발송에서 여러 메시지가 같은 첨부 파트 객체를 공유하면, 해당 파트의 base64 본문은
+    처음 한 번만 직렬화하고 이후 메시지에서는 결과 문자열을 그대로 씁니다.
+    """
+    
+    def __init__(self, outfp, cache: Dict[int, Tuple[Message, str]], **kwargs):
+        super().__init__(outfp, **kwargs)
+        self._cache = cache
+    
+    def clone(self, fp):
+        return self.__class__(fp, self._cache, mangle_from_=self._mangle_from_, maxheaderlen=None, policy=self.policy)
+    
+    def flatten(self, msg, unixfrom=False, linesep=None):
+        if msg.is_multipart() or msg.get_content_disposition() != 'attachment':
+            return super().flatten(msg, unixfrom=unixfrom, linesep=linesep)
+        
+        # 파트 객체를 캐시에 함께 보관하여 id 재사용을 막음
+        cached = self._cache.get(id(msg))
+        if cached is None:
+            buffer = io.StringIO()
+            Generator(buffer, mangle_from_=self._mangle_from_, maxheaderlen=None, policy=self.policy).flatten(
+                msg, unixfrom=unixfrom, linesep=linesep
+            )
+            cached = (msg, buffer.getvalue())
+            self._cache[id(msg)] = cached
+        self._fp.write(cached[1])
+
+
+def serialize_messages(messages: List[Message]) -> List[str]:
+    """
+    메시지 목록을 원문 문자열로 직렬화 (공유 첨부 파트는 한 번만 직렬화)
+    
+    Args:
+        messages: 메시지 목록
+    
+    Returns:
+        List[str]: 메시지 순서대로의 원문 (SMTP 발송용 CRLF 줄바꿈)
+    """
+    cache: Dict[int, Tuple[Message, str]] = {}
+    raws = []
+    for message in messages:
+        buffer = io.StringIO()
+        # 메시지 정책은 유지하고 줄바꿈만 CRLF로 (sendmail은 bytes 원문의 줄바꿈을 고치지 않음)
+        policy = message.policy.clone(linesep='\r\n')
+        _SharedPartGenerator(buffer, cache, mangle_from_=False, maxheaderlen=0, policy=policy).flatten(message)
+        raws.append(buffer.getvalue())
+    return raws
+
+
+class EmailOutboxService:
+    """
+    메일 발송 대기열 서비스 클래스
+    
+    enqueue는 메시지를 디스크에 기록한 뒤 즉시 반환하므로 요청 지연 시간이 메일 서버와 무관해집니다.
+    백그라운드 발송 스레드는 발송 시각이 된 메시지를 모아 연결 풀의 한 세션에서 연속 발송하고,
+    실패한 메시지는 지수 백오프(지터 포함)로 재시도하다가 최대 시도 횟수를 넘으면 dead letter로 옮깁니다.
+    메시지마다 category를 지정하면 상태가 바뀔 때 해당 category의 처리 함수가 호출됩니다.
+    """
+    
+    MESSAGE_DIRNAME = 'messages'
+    
+    def __init__(self, outbox_dir: Optional[str] = None, email_service: Optional[DocumentEmailService] = None):
+        """
+        서비스 초기화 (발송 스레드는 처음 메시지가 들어올 때 시작)
+        
+        Args:
+            outbox_dir: 대기열 디렉터리 (기본값: SMTP_SETTINGS['OUTBOX_DIR'])
+            email_service: 발송에 사용할 이메일 서비스 (SMTP 설정 및 연결 풀)
+        """
+        self.outbox_dir = os.path.abspath(outbox_dir or SMTP_SETTINGS['OUTBOX_DIR'])
+        self.email_service = email_service or DocumentEmailService()
+        
+        self.messages: Dict[str, Dict[str, Any]] = {}
+        self.status_handlers: Dict[str, StatusHandler] = {}
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._loaded = False
+        self._stopping = False
+    
+    # ==================== 등록/조회 ====================
+    
+    def register_status_handler(self, category: str, handler: StatusHandler) -> None:
+        """
+        category별 상태 변경 처리 함수 등록 (같은 category는 덮어씀)
+        
+        Args:
+            category: 메시지 분류 키
+            handler: 메시지 기록을 받는 함수
+        """
+        self.status_handlers[category] = handler
+    
+    def enqueue(
+        self,
+        message: Message,
+        recipient: str,
+        category: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        메일을 발송 대기열에 등록
+        
+        Args:
+            message: 발송할 메시지 (DocumentEmailService.build_*_message 결과)
+            recipient: 수신 주소
+            category: 상태 변경 처리 함수 분류 키
+            metadata: 처리 함수에 전달할 부가 정보 (JSON 직렬화 가능해야 함)
+        
+        Returns:
+            Dict[str, Any]: 등록된 메시지 상태 (원문 제외)
+        """
+        return self.enqueue_many([(message, recipient, metadata)], category=category)[0]
+    
+    def enqueue_many(
+        self,
+        messages: List[Tuple[Message, str, Optional[Dict[str, Any]]]],
+        category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 메일을 한 번에 발송 대기열에 등록 (lock 획득과 발송 스레드 알림은 한 번만 수행)
+        
+        Args:
+            messages: (메시지, 수신 주소, 부가 정보) 목록
+            category: 상태 변경 처리 함수 분류 키
+        
+        Returns:
+            List[Dict[str, Any]]: 등록된 메시지 상태 목록 (원문 제외, 입력 순서)
+        """
+        now = time.time()
+        created_at = datetime.now().isoformat()
+        raws = serialize_messages([message for message, _, _ in messages])
+        records = [{
+            'id': uuid.uuid4().hex,
+            'recipient': recipient,
+            'subject': str(message.get('Subject', '')),
+            'category': category,
+            'metadata': dict(metadata or {}),
+            'status': OUTBOX_STATUS_QUEUED,
+            'attempts': 0,
+            'last_error': None,
+            'created_at': created_at,
+            'sent_at': None,
+            'next_attempt_at': now
+        } for message, recipient, metadata in messages]
+        
+        with self._condition:
+            self._ensure_loaded()
+            for record, raw in zip(records, raws):
+                # 원문을 먼저 기록하여 상태 파일이 있으면 원문도 있도록 보장
+                self._write_raw(record['id'], raw)
+                self.messages[record['id']] = record
+                self._persist(record)
+            self._ensure_worker()
+            self._condition.notify()
+        
+        return [self._public(record) for record in records]
+    
+    def get_message(self, message_id: str) -> Optional[Dict[str, Any]]:
+        """메시지 상태 조회 (원문 제외)"""
+        with self._condition:
+            self._ensure_loaded()
+            record = self.messages.get(message_id)
+            return self._public(record) if record else None
+    
+    def get_messages(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        메시지 상태 목록 조회 (최근 등록순)
+        
+        Args:
+            status: 상태 필터 (queued, retrying, sent, dead)
+        """
+        with self._condition:
+            self._ensure_loaded()
+            records = [record for record in self.messages.values() if status is None or record['status'] == status]
+        records.sort(key=lambda record: record['created_at'], reverse=True)
+        return [self._public(record) for record in records]
+    
+    def get_statistics(self) -> Dict[str, int]:
+        """상태별 메시지 수 조회"""
+        with self._condition:
+            self._ensure_loaded()
+            stats = {OUTBOX_STATUS_QUEUED: 0, OUTBOX_STATUS_RETRYING: 0, OUTBOX_STATUS_SENT: 0, OUTBOX_STATUS_DEAD: 0}
+            for record in self.messages.values():
+                stats[record['status']] += 1
+            return stats
+    
+    def requeue_dead_letter(self, message_id: str) -> bool:
+        """
+        dead letter 메시지를 다시 발송 대기 상태로 되돌림
+        
+        Args:
+            message_id: 메시지 ID
+        
+        Returns:
+            bool: 되돌렸는지 여부
+        """
+        with self._condition:
+            self._ensure_loaded()
+            record = self.messages.get(message_id)
+            if not record or record['status'] != OUTBOX_STATUS_DEAD:
+                return False
+            record.update({'status': OUTBOX_STATUS_QUEUED, 'attempts': 0, 'next_attempt_at': time.time()})
+            self._persist(record)
+            self._ensure_worker()
+            self._condition.notify()
+        self._notify_handler(record)
+        return True
+    
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        발송 시각이 된 메시지가 모두 처리될 때까지 대기 (종료 처리/관리 작업용)
+        
+        Args:
+            timeout: 최대 대기 시간(초)
+        
+        Returns:
+            bool: 시간 안에 모두 처리되었는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self._ensure_loaded()
+            self._ensure_worker()
+            self._condition.notify()
+            while self._due_messages(limit=1):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(min(remaining, 0.1))
+        return True
+    
+    def stop(self, timeout: float = 5.0) -> bool:
+        """
+        발송 스레드 종료 (보내지 못한 메시지는 디스크에 남아 다음 시작 때 발송)
+        
+        진행 중인 배치는 끝까지 처리한 뒤 종료하며, 이후 메시지가 들어오면 발송 스레드를 다시 시작합니다.
+        
+        Args:
+            timeout: 스레드 종료 최대 대기 시간(초)
+        
+        Returns:
+            bool: 시간 안에 종료되었는지 여부
+        """
+        with self._condition:
+            worker = self._worker
+            self._stopping = True
+            self._condition.notify_all()
+        if worker is None or worker is threading.current_thread():
+            return True
+        worker.join(timeout)
+        return not worker.is_alive()
+    
+    # ==================== 백그라운드 발송 ====================
+    
+    def _run(self) -> None:
+        """발송 스레드 본체: 발송 시각이 된 메시지를 배치로 꺼내 발송"""
+        min_interval = 1.0 / SMTP_SETTINGS['OUTBOX_RATE_PER_SECOND']
+        while True:
+            with self._condition:
+                batch = self._due_messages(limit=SMTP_SETTINGS['OUTBOX_BATCH_SIZE'])
+                while not batch and not self._stopping:
+                    self._condition.wait(self._seconds_until_next_due())
+                    batch = self._due_messages(limit=SMTP_SETTINGS['OUTBOX_BATCH_SIZE'])
+                if self._stopping:
+                    return
+            
+            started = time.monotonic()
+            self._send_batch(batch)
+            
+            # 발송 속도 제한 (배치 크기 x 메일당 최소 간격)
+            remaining = len(batch) * min_interval - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+    
+    def _send_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """배치를 한 SMTP 세션에서 발송하고 메시지별 결과 반영"""
+        errors: Dict[str, Optional[str]] = {}
+        sendable = []
+        for record in batch:
+            raw = self._read_raw(record['id'])
+            if raw is None:
+                errors[record['id']] = '메일 원문을 찾을 수 없습니다.'
+            else:
+                sendable.append((record, raw))
+        
+        if sendable and not self.email_service.validate_email_settings():
+            # 메일 설정이 없으면 기존 동작과 같이 발송을 시뮬레이션
+            print(f"이메일 설정이 없어 실제 발송을 건너뜁니다. (대기열 시뮬레이션 {len(sendable)}건)")
+            errors.update((record['id'], None) for record, _ in sendable)
+        elif sendable:
+            from_addr = self.email_service.email_user
+            try:
+                results = self.email_service.get_smtp_pool().send_many([
+                    (raw, from_addr, record['recipient']) for record, raw in sendable
+                ])
+            except Exception as e:
+                results = [str(e)] * len(sendable)
+            errors.update((record['id'], error) for (record, _), error in zip(sendable, results))
+        
+        for record in batch:
+            error = errors[record['id']]
+            with self._condition:
+                record['attempts'] += 1
+                if error is None:
+                    record.update({
+                        'status': OUTBOX_STATUS_SENT,
+                        'sent_at': datetime.now().isoformat(),
+                        'last_error': None
+                    })
+                    self._remove_raw(record['id'])  # 발송 완료된 원문은 보관하지 않음
+                elif record['attempts'] >= SMTP_SETTINGS['OUTBOX_MAX_ATTEMPTS'] or not os.path.exists(self._raw_path(record['id'])):
+                    record.update({'status': OUTBOX_STATUS_DEAD, 'last_error': error})
+                else:
+                    record.update({
+                        'status': OUTBOX_STATUS_RETRYING,
+                        'last_error': error,
+                        'next_attempt_at': time.time() + self._backoff_seconds(record['attempts'])
+                    })
+                self._persist(record)
+                self._condition.notify_all()
+            self._notify_handler(record)
+        
+        self._purge_expired_sent()
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    @staticmethod
+    def _backoff_seconds(attempts: int) -> float:
+        """재시도 대기 시간 (지수 증가 + 상한 + 동시 재시도 분산용 지터)"""
+        delay = min(
+            SMTP_SETTINGS['OUTBOX_BACKOFF_MAX_SECONDS'],
+            SMTP_SETTINGS['OUTBOX_BACKOFF_BASE_SECONDS'] * (2 ** (attempts - 1))
+        )
+        return delay * random.uniform(0.5, 1.0)
+    
+    def _due_messages(self, limit: int) -> List[Dict[str, Any]]:
+        """발송 시각이 된 메시지 목록 (lock 보유 상태에서 호출)"""
+        now = time.time()
+        due = [
+            record for record in self.messages.values()
+            if record['status'] in (OUTBOX_STATUS_QUEUED, OUTBOX_STATUS_RETRYING) and record['next_attempt_at'] <= now
+        ]
+        due.sort(key=lambda record: record['next_attempt_at'])
+        return due[:limit]
+    
+    def _seconds_until_next_due(self) -> Optional[float]:
+        """다음 재시도까지 남은 시간 (대기 메시지가 없으면 None = 알림까지 대기, lock 보유 상태에서 호출)"""
+        pending = [
+            record['next_attempt_at'] for record in self.messages.values()
+            if record['status'] in (OUTBOX_STATUS_QUEUED, OUTBOX_STATUS_RETRYING)
+        ]
+        if not pending:
+            return None
+        return max(0.0, min(pending) - time.time())
+    
+    def _ensure_worker(self) -> None:
+        """발송 스레드 시작 (lock 보유 상태에서 호출)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._stopping = False
+            worker = threading.Thread(target=self._run, name='email-outbox', daemon=True)
+            try:
+                worker.start()
+            except RuntimeError:
+                # 인터프리터 종료 중(atexit 등)에는 스레드를 시작할 수 없음 - 메시지는 이미 디스크에 있으므로 다음 시작 때 발송
+                return
+            self._worker = worker
+    
+    def _notify_handler(self, record: Dict[str, Any]) -> None:
+        """category 처리 함수 호출 (처리 함수 오류는 발송에 영향을 주지 않음)"""
+        handler = self.status_handlers.get(record.get('category'))
+        if handler is None:
+            return
+        try:
+            handler(self._public(record))
+        except Exception as e:
+            print(f"메일 상태 처리 중 오류 발생 (message_id: {record['id']}): {str(e)}")
+    
+    def _purge_expired_sent(self) -> None:
+        """보관 기간이 지난 발송 완료 기록 삭제"""
+        cutoff = datetime.fromtimestamp(time.time() - SMTP_SETTINGS['OUTBOX_SENT_RETENTION_SECONDS']).isoformat()
+        with self._condition:
+            expired = [
+                message_id for message_id, record in self.messages.items()
+                if record['status'] == OUTBOX_STATUS_SENT and record['sent_at'] < cutoff
+            ]
+            for message_id in expired:
+                del self.messages[message_id]
+                try:
+                    os.remove(self._message_path(message_id))
+                except FileNotFoundError:
+                    pass
+                self._remove_raw(message_id)
+    
+    def _ensure_loaded(self) -> None:
+        """디스크의 대기열 복원 (재시작 전 미발송 메시지 포함, lock 보유 상태에서 호출)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        message_dir = os.path.join(self.outbox_dir, self.MESSAGE_DIRNAME)
+        if not os.path.isdir(message_dir):
+            return
+        for filename in os.listdir(message_dir):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(message_dir, filename), 'r', encoding='utf-8') as message_file:
+                    record = json.load(message_file)
+                self.messages[record['id']] = record
+            except (OSError, ValueError, KeyError):
+                continue
+        
+        if any(record['status'] in (OUTBOX_STATUS_QUEUED, OUTBOX_STATUS_RETRYING) for record in self.messages.values()):
+            self._ensure_worker()
+    
+    def _message_path(self, message_id: str) -> str:
+        """메시지 파일 경로"""
+        return os.path.join(self.outbox_dir, self.MESSAGE_DIRNAME, f"{message_id}.json")
+    
+    def _raw_path(self, message_id: str) -> str:
+        """메시지 원문 파일 경로"""
+        return os.path.join(self.outbox_dir, self.MESSAGE_DIRNAME, f"{message_id}.eml")
+    
+    def _persist(self, record: Dict[str, Any]) -> None:
+        """메시지 상태 저장 (임시 파일 교체 방식, lock 보유 상태에서 호출)"""
+        path = self._message_path(record['id'])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as message_file:
+            message_file.write(json.dumps(record, ensure_ascii=False))
+            message_file.flush()
+            os.fsync(message_file.fileno())
+        os.replace(temp_path, path)
+    
+    def _write_raw(self, message_id: str, raw: str) -> None:
+        """메시지 원문 저장 (등록 시 한 번만 기록, 상태 변경 시에는 다시 쓰지 않음)"""
+        path = self._raw_path(message_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as raw_file:
+            raw_file.write(raw.encode('utf-8'))
+            raw_file.flush()
+            os.fsync(raw_file.fileno())
+    
+    def _read_raw(self, message_id: str) -> Optional[bytes]:
+        """메시지 원문 읽기 (없으면 None, LF 줄바꿈으로 저장된 이전 원문은 CRLF로 변환)"""
+        try:
+            with open(self._raw_path(message_id), 'rb') as raw_file:
+                raw = raw_file.read()
+        except OSError:
+            return None
+        return _BARE_LF.sub(b'\r\n', raw)
+    
+    def _remove_raw(self, message_id: str) -> None:
+        """메시지 원문 삭제"""
+        try:
+            os.remove(self._raw_path(message_id))
+        except FileNotFoundError:
+            pass
+    
+    @staticmethod
+    def _public(record: Dict[str, Any]) -> Dict[str, Any]:
+        """메시지 상태 복사본"""
+        return dict(record)
+
+
+# 싱글톤 인스턴스 생성
+email_outbox_service = EmailOutboxService()
@@ -0,0 +1,176 @@
+"""
+PDF Resource Cache
+PDF 생성에 공통으로 쓰이는 폰트, 문단 스타일, 표 스타일을 프로세스당 한 번만 준비하는 캐시
+
+Classes:
+    - PdfResourceCache: 한글 폰트 등록 및 스타일/표 스타일 템플릿 캐시
+"""
+import os
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    from reportlab.pdfbase.ttfonts import TTFont
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+from ...utils.constants import PDF_SETTINGS
+
+
+class PdfResourceCache:
+    """
+    PDF 리소스 캐시 클래스
+    
+    폰트 등록과 스타일 생성은 문서마다 반복할 필요가 없으므로 최초 사용 시 한 번만 수행합니다.
+    한글 TTF 폰트를 찾지 못하면 reportlab 내장 CID 폰트로 대체합니다.
+    캐시된 스타일 객체는 읽기 전용으로 공유되므로 호출 측에서 수정하지 않아야 합니다.
+    """
+    
+    def __init__(self):
+        """캐시 초기화 (리소스는 최초 사용 시 생성)"""
+        self._lock = threading.Lock()
+        self._fonts: Optional[Dict[str, str]] = None
+        self._styles: Optional[Dict[str, Any]] = None
+        self._table_styles: Optional[Dict[str, Any]] = None
+    
+    # ==================== 조회 ====================
+    
+    def get_fonts(self) -> Dict[str, str]:
+        """
+        등록된 폰트명 조회
+        
+        Returns:
+            Dict[str, str]: {'regular': 본문 폰트명, 'bold': 굵은 폰트명}
+        """
+        self._ensure_loaded()
+        return self._fonts
+    
+    def get_style(self, name: str) -> Any:
+        """
+        문단 스타일 조회
+        
+        Args:
+            name: 스타일명 ('title', 'normal' 또는 샘플 스타일시트 이름)
+        
+        Returns:
+            ParagraphStyle: 캐시된 스타일
+        """
+        self._ensure_loaded()
+        return self._styles[name]
+    
+    def get_table_style(self, name: str) -> Any:
+        """
+        표 스타일 템플릿 조회
+        
+        Args:
+            name: 템플릿명 ('info': 항목/값 2열 정보 표, 'items': 헤더/합계 행이 있는 품목 표)
+        
+        Returns:
+            TableStyle: 캐시된 표 스타일
+        """
+        self._ensure_loaded()
+        return self._table_styles[name]
+    
+    # ==================== 초기화 ====================
+    
+    def _ensure_loaded(self) -> None:
+        """리소스 최초 생성 (스레드 안전)"""
+        if self._table_styles is not None:
+            return
+        
+        with self._lock:
+            if self._table_styles is not None:
+                return
+            fonts = self._register_fonts()
+            styles = self._build_styles(fonts)
+            table_styles = self._build_table_styles(fonts)
+            self._fonts = fonts
+            self._styles = styles
+            self._table_styles = table_styles
+    
+    @staticmethod
+    def _register_fonts() -> Dict[str, str]:
+        """한글 폰트 등록 (TTF 우선, 없으면 내장 CID 폰트)"""
+        regular_name = PDF_SETTINGS['KOREAN_FONT_NAME']
+        bold_name = f"{regular_name}-Bold"
+        registered = pdfmetrics.getRegisteredFontNames()
+        
+        regular_path = next((path for path in PDF_SETTINGS['KOREAN_FONT_PATHS'] if os.path.exists(path)), None)
+        if regular_path:
+            if regular_name not in registered:
+                pdfmetrics.registerFont(TTFont(regular_name, regular_path))
+            
+            bold_path = next((path for path in PDF_SETTINGS['KOREAN_BOLD_FONT_PATHS'] if os.path.exists(path)), None)
+            if bold_path:
+                if bold_name not in registered:
+                    pdfmetrics.registerFont(TTFont(bold_name, bold_path))
+            else:
+                bold_name = regular_name
+        else:
+            regular_name = bold_name = PDF_SETTINGS['KOREAN_CID_FONT']
+            if regular_name not in registered:
+                pdfmetrics.registerFont(UnicodeCIDFont(regular_name))
+        
+        # 문단의 <b> 태그가 굵은 폰트로 연결되도록 패밀리 등록
+        pdfmetrics.registerFontFamily(regular_name, normal=regular_name, bold=bold_name, italic=regular_name, boldItalic=bold_name)
+        return {'regular': regular_name, 'bold': bold_name}
+    
+    @staticmethod
+    def _build_styles(fonts: Dict[str, str]) -> Dict[str, Any]:
+        """문단 스타일 생성"""
+        sample = getSampleStyleSheet()
+        styles = {name: sample[name] for name in sample.byName}
+        styles['title'] = ParagraphStyle(
+            'CustomTitle',
+            parent=sample['Heading1'],
+            fontName=fonts['bold'],
+            fontSize=18,
+            spaceAfter=30,
+            alignment=1  # 중앙 정렬
+        )
+        styles['normal'] = ParagraphStyle(
+            'KoreanNormal',
+            parent=sample['Normal'],
+            fontName=fonts['regular'],
+            leading=14
+        )
+        return styles
+    
+    @staticmethod
+    def _build_table_styles(fonts: Dict[str, str]) -> Dict[str, Any]:
+        """표 스타일 템플릿 생성"""
+        return {
+            'info': TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, -1), fonts['regular']),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+                ('BACKGROUND', (1, 0), (1, -1), colors.white),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]),
+            'items': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, -1), fonts['regular']),
+                ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -2), colors.beige),
+                ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
+                ('FONTNAME', (0, -1), (-1, -1), fonts['bold']),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ])
+        }
+
+
+# 싱글톤 인스턴스 생성 (프로세스 전역 캐시)
+pdf_resource_cache = PdfResourceCache()
@@ -3,33 +3,183 @@ Document PDF Service
 PDF 문서 생성을 담당하는 서비스
 
 Classes:
-    - DocumentPdfService: 발주서, 견적서 등 PDF 생성 서비스
+    - DocumentPdfService: 발주서, 견적서, 자산 라벨 등 PDF 생성 서비스
 """
+import io
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, IO, Optional, Union
 
 try:
     from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib import colors
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.lib.units import inch, mm
+    from reportlab.graphics.barcode.code128 import Code128
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
     REPORTLAB_AVAILABLE = True
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
+from .pdf_resources import pdf_resource_cache
+from .document_index import get_document_index
+from .document_store import get_document_store
+from ...utils.constants import PDF_SETTINGS
+
 
 class DocumentPdfService:
     """PDF 문서 생성을 담당하는 서비스 클래스"""
     
+    # 문서 유형별 렌더링 메서드명
+    RENDERERS = {
+        'purchase_order': 'render_purchase_order',
+        'quotation': 'render_quotation',
+        'asset_label': 'render_asset_label'
+    }
+    
     def __init__(self):
         """서비스 초기화"""
-        # PDF 저장 디렉터리 설정
-        self.pdf_output_dir = os.path.join(os.getcwd(), 'generated_documents')
+        # PDF 저장 디렉터리 설정 (디렉터리는 파일로 보관할 때 생성)
+        self.pdf_output_dir = os.path.join(os.getcwd(), PDF_SETTINGS['OUTPUT_DIR'])
+    
+    def render(self, doc_type: str, data: Dict[str, Any], partner_data: Optional[Dict[str, Any]], target: Union[str, IO[bytes]]) -> None:
+        """
+        문서 유형에 맞는 렌더러로 PDF를 렌더링합니다.
+        
+        Args:
+            doc_type: 문서 유형 ('purchase_order', 'quotation', 'asset_label')
+            data: 문서 데이터
+            partner_data: 협력사 데이터 (자산 라벨은 사용하지 않음)
+            target: 파일 경로 또는 바이너리 스트림
+            
+        Raises:
+            ValueError: 지원하지 않는 문서 유형인 경우
+        """
+        if doc_type not in self.RENDERERS:
+            raise ValueError(f"지원하지 않는 문서 유형입니다: {doc_type}")
+        
+        renderer = getattr(self, self.RENDERERS[doc_type])
+        if doc_type == 'asset_label':
+            renderer(data, target)
+        else:
+            renderer(data, partner_data or {}, target)
+    
+    def render_to_memory(self, doc_type: str, data: Dict[str, Any], partner_data: Optional[Dict[str, Any]] = None) -> io.BytesIO:
+        """
+        PDF를 디스크를 거치지 않고 메모리 버퍼에 렌더링합니다.
+        
+        Args:
+            doc_type: 문서 유형
+            data: 문서 데이터
+            partner_data: 협력사 데이터
+            
+        Returns:
+            io.BytesIO: 처음 위치로 되감긴 PDF 버퍼
+        """
+        buffer = io.BytesIO()
+        self.render(doc_type, data, partner_data, buffer)
+        buffer.seek(0)
+        return buffer
+    
+    def archive_pdf(self, buffer: io.BytesIO, filename: str) -> str:
+        """
+        메모리에 렌더링한 PDF를 출력 디렉터리에 보관합니다.
+        
+        내용이 같은 PDF는 내용 주소 기반 저장소에 한 번만 저장되고 파일명은 이를 가리킵니다.
+        
+        Args:
+            buffer: PDF 버퍼
+            filename: 저장할 파일명
+            
+        Returns:
+            str: 저장된 파일 경로
+        """
         os.makedirs(self.pdf_output_dir, exist_ok=True)
+        filepath = get_document_store(self.pdf_output_dir).put(buffer.getvalue(), filename)
+        get_document_index(self.pdf_output_dir).record(filepath)
+        return filepath
+    
+    def render_purchase_order(self, order_data: Dict[str, Any], partner_data: Dict[str, Any], target: Union[str, IO[bytes]]) -> None:
+        """
+        발주서 PDF를 지정한 대상에 렌더링합니다.
+        
+        Args:
+            order_data: 발주서 데이터
+            partner_data: 협력사 데이터
+            target: 파일 경로 또는 바이너리 스트림
+            
+        Raises:
+            Exception: 렌더링 실패 시
+        """
+        # PDF 문서 생성
+        doc = SimpleDocTemplate(target, pagesize=A4, invariant=PDF_SETTINGS['INVARIANT_OUTPUT'])
+        story = []
+        
+        # 스타일 설정 (프로세스 전역 캐시 재사용)
+        title_style = pdf_resource_cache.get_style('title')
+        normal_style = pdf_resource_cache.get_style('normal')
+        
+        # 제목
+        title = Paragraph("발 주 서", title_style)
+        story.append(title)
+        story.append(Spacer(1, 20))
+        
+        # 발주서 정보 테이블
+        order_info_data = [
+            ['발주서 번호', order_data.get('order_number', '')],
+            ['발주일자', order_data.get('order_date', '')],
+            ['납기일자', order_data.get('delivery_date', '')],
+            ['납품주소', order_data.get('delivery_address', '')]
+        ]
+        
+        order_info_table = Table(order_info_data, colWidths=[2*inch, 4*inch])
+        order_info_table.setStyle(pdf_resource_cache.get_table_style('info'))
+        
+        story.append(order_info_table)
+        story.append(Spacer(1, 20))
+        
+        # 협력사 정보
+        partner_info = Paragraph(f"<b>공급업체:</b> {partner_data.get('name', '')}<br/>"
+                               f"<b>담당자:</b> {partner_data.get('contact_person', '')}<br/>"
+                               f"<b>연락처:</b> {partner_data.get('contact_phone', '')}", 
+                               normal_style)
+        story.append(partner_info)
+        story.append(Spacer(1, 20))
+        
+        # 품목 테이블 헤더
+        items_header = [['품목명', '수량', '단가', '금액', '비고']]
+        
+        # 품목 데이터
+        items_data = items_header.copy()
+        total_amount = 0
+        
+        for item in order_data.get('items', []):
+            amount = item.get('amount', item.get('quantity', 0) * item.get('unit_price', 0))
+            total_amount += amount
+            
+            items_data.append([
+                item.get('name', ''),
+                str(item.get('quantity', '')),
+                f"{item.get('unit_price', 0):,}원",
+                f"{amount:,}원",
+                item.get('description', '')
+            ])
+        
+        # 합계 행 추가
+        items_data.append(['', '', '', f"총 금액: {total_amount:,}원", ''])
+        
+        # 품목 테이블 생성
+        items_table = Table(items_data, colWidths=[2*inch, 1*inch, 1.5*inch, 1.5*inch, 2*inch])
+        items_table.setStyle(pdf_resource_cache.get_table_style('items'))
+        
+        story.append(items_table)
+        story.append(Spacer(1, 30))
+        
+        # 비고
+        if order_data.get('notes'):
+            notes = Paragraph(f"<b>비고:</b> {order_data.get('notes')}", normal_style)
+            story.append(notes)
+        
+        # PDF 생성
+        doc.build(story)
     
     def generate_purchase_order_pdf(self, order_data: Dict[str, Any], partner_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -49,112 +199,100 @@ class DocumentPdfService:
         try:
             # PDF 파일명 생성
             filename = f"purchase_order_{order_data['order_number']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            filepath = os.path.join(self.pdf_output_dir, filename)
-            
-            # PDF 문서 생성
-            doc = SimpleDocTemplate(filepath, pagesize=A4)
-            story = []
-            
-            # 스타일 설정
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                spaceAfter=30,
-                alignment=1  # 중앙 정렬
-            )
-            
-            # 제목
-            title = Paragraph("발 주 서", title_style)
-            story.append(title)
-            story.append(Spacer(1, 20))
-            
-            # 발주서 정보 테이블
-            order_info_data = [
-                ['발주서 번호', order_data.get('order_number', '')],
-                ['발주일자', order_data.get('order_date', '')],
-                ['납기일자', order_data.get('delivery_date', '')],
-                ['납품주소', order_data.get('delivery_address', '')]
-            ]
-            
-            order_info_table = Table(order_info_data, colWidths=[2*inch, 4*inch])
-            order_info_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                ('BACKGROUND', (1, 0), (1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            story.append(order_info_table)
-            story.append(Spacer(1, 20))
-            
-            # 협력사 정보
-            partner_info = Paragraph(f"<b>공급업체:</b> {partner_data.get('name', '')}<br/>"
-                                   f"<b>담당자:</b> {partner_data.get('contact_person', '')}<br/>"
-                                   f"<b>연락처:</b> {partner_data.get('contact_phone', '')}", 
-                                   styles['Normal'])
-            story.append(partner_info)
-            story.append(Spacer(1, 20))
-            
-            # 품목 테이블 헤더
-            items_header = [['품목명', '수량', '단가', '금액', '비고']]
-            
-            # 품목 데이터
-            items_data = items_header.copy()
-            total_amount = 0
-            
-            for item in order_data.get('items', []):
-                amount = item.get('amount', item.get('quantity', 0) * item.get('unit_price', 0))
-                total_amount += amount
-                
-                items_data.append([
-                    item.get('name', ''),
-                    str(item.get('quantity', '')),
-                    f"{item.get('unit_price', 0):,}원",
-                    f"{amount:,}원",
-                    item.get('description', '')
-                ])
-            
-            # 합계 행 추가
-            items_data.append(['', '', '', f"총 금액: {total_amount:,}원", ''])
-            
-            # 품목 테이블 생성
-            items_table = Table(items_data, colWidths=[2*inch, 1*inch, 1.5*inch, 1.5*inch, 2*inch])
-            items_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -2), colors.beige),
-                ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            story.append(items_table)
-            story.append(Spacer(1, 30))
             
-            # 비고
-            if order_data.get('notes'):
-                notes = Paragraph(f"<b>비고:</b> {order_data.get('notes')}", styles['Normal'])
-                story.append(notes)
-            
-            # PDF 생성
-            doc.build(story)
-            
-            return filepath
+            return self.archive_pdf(self.render_to_memory('purchase_order', order_data, partner_data), filename)
             
         except Exception as e:
             print(f"PDF 생성 중 오류 발생: {str(e)}")
             return None
     
+    def render_quotation(self, quotation_data: Dict[str, Any], partner_data: Dict[str, Any], target: Union[str, IO[bytes]]) -> None:
+        """
+        견적서 PDF를 지정한 대상에 렌더링합니다.
+        
+        Args:
+            quotation_data: 견적서 데이터
+            partner_data: 협력사 데이터
+            target: 파일 경로 또는 바이너리 스트림
+            
+        Raises:
+            Exception: 렌더링 실패 시
+        """
+        # PDF 문서 생성
+        doc = SimpleDocTemplate(target, pagesize=A4, invariant=PDF_SETTINGS['INVARIANT_OUTPUT'])
+        story = []
+        
+        # 스타일 설정 (프로세스 전역 캐시 재사용)
+        title_style = pdf_resource_cache.get_style('title')
+        normal_style = pdf_resource_cache.get_style('normal')
+        
+        # 제목
+        title = Paragraph("견 적 서", title_style)
+        story.append(title)
+        story.append(Spacer(1, 20))
+        
+        # 견적서 정보 테이블
+        quotation_info_data = [
+            ['견적서 번호', quotation_data.get('quotation_number', '')],
+            ['견적일자', quotation_data.get('quotation_date', '')],
+            ['유효기간', quotation_data.get('valid_until', '')],
+            ['납기예정일', quotation_data.get('delivery_date', '')]
+        ]
+        
+        quotation_info_table = Table(quotation_info_data, colWidths=[2*inch, 4*inch])
+        quotation_info_table.setStyle(pdf_resource_cache.get_table_style('info'))
+        
+        story.append(quotation_info_table)
+        story.append(Spacer(1, 20))
+        
+        # 공급업체 정보
+        partner_info = Paragraph(f"<b>공급업체:</b> {partner_data.get('name', '')}<br/>"
+                               f"<b>담당자:</b> {partner_data.get('contact_person', '')}<br/>"
+                               f"<b>연락처:</b> {partner_data.get('contact_phone', '')}", 
+                               normal_style)
+        story.append(partner_info)
+        story.append(Spacer(1, 20))
+        
+        # 견적 품목 테이블
+        items_header = [['품목명', '수량', '단가', '금액', '비고']]
+        items_data = items_header.copy()
+        total_amount = 0
+        
+        for item in quotation_data.get('items', []):
+            amount = item.get('amount', item.get('quantity', 0) * item.get('unit_price', 0))
+            total_amount += amount
+            
+            items_data.append([
+                item.get('name', ''),
+                str(item.get('quantity', '')),
+                f"{item.get('unit_price', 0):,}원",
+                f"{amount:,}원",
+                item.get('description', '')
+            ])
+        
+        # 합계 행 추가
+        items_data.append(['', '', '', f"총 견적금액: {total_amount:,}원", ''])
+        
+        # 품목 테이블 생성
+        items_table = Table(items_data, colWidths=[2*inch, 1*inch, 1.5*inch, 1.5*inch, 2*inch])
+        items_table.setStyle(pdf_resource_cache.get_table_style('items'))
+        
+        story.append(items_table)
+        story.append(Spacer(1, 30))
+        
+        # 조건 및 비고
+        if quotation_data.get('terms'):
+            terms = Paragraph(f"<b>조건:</b> {quotation_data.get('terms')}", normal_style)
+            story.append(terms)
+            story.append(Spacer(1, 10))
+        
+        if quotation_data.get('notes'):
+            notes = Paragraph(f"<b>비고:</b> {quotation_data.get('notes')}", normal_style)
+            story.append(notes)
+        
+        # PDF 생성
+        doc.build(story)
+    
     def generate_quotation_pdf(self, quotation_data: Dict[str, Any], partner_data: Dict[str, Any]) -> Optional[str]:
         """
         견적서 PDF를 생성합니다.
@@ -173,113 +311,69 @@ class DocumentPdfService:
         try:
             # PDF 파일명 생성
             filename = f"quotation_{quotation_data.get('quotation_number', 'Q001')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            filepath = os.path.join(self.pdf_output_dir, filename)
-            
-            # PDF 문서 생성
-            doc = SimpleDocTemplate(filepath, pagesize=A4)
-            story = []
-            
-            # 스타일 설정
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                spaceAfter=30,
-                alignment=1  # 중앙 정렬
-            )
-            
-            # 제목
-            title = Paragraph("견 적 서", title_style)
-            story.append(title)
-            story.append(Spacer(1, 20))
-            
-            # 견적서 정보 테이블
-            quotation_info_data = [
-                ['견적서 번호', quotation_data.get('quotation_number', '')],
-                ['견적일자', quotation_data.get('quotation_date', '')],
-                ['유효기간', quotation_data.get('valid_until', '')],
-                ['납기예정일', quotation_data.get('delivery_date', '')]
-            ]
-            
-            quotation_info_table = Table(quotation_info_data, colWidths=[2*inch, 4*inch])
-            quotation_info_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                ('BACKGROUND', (1, 0), (1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            story.append(quotation_info_table)
-            story.append(Spacer(1, 20))
             
-            # 공급업체 정보
-            partner_info = Paragraph(f"<b>공급업체:</b> {partner_data.get('name', '')}<br/>"
-                                   f"<b>담당자:</b> {partner_data.get('contact_person', '')}<br/>"
-                                   f"<b>연락처:</b> {partner_data.get('contact_phone', '')}", 
-                                   styles['Normal'])
-            story.append(partner_info)
-            story.append(Spacer(1, 20))
+            return self.archive_pdf(self.render_to_memory('quotation', quotation_data, partner_data), filename)
             
-            # 견적 품목 테이블
-            items_header = [['품목명', '수량', '단가', '금액', '비고']]
-            items_data = items_header.copy()
-            total_amount = 0
-            
-            for item in quotation_data.get('items', []):
-                amount = item.get('amount', item.get('quantity', 0) * item.get('unit_price', 0))
-                total_amount += amount
-                
-                items_data.append([
-                    item.get('name', ''),
-                    str(item.get('quantity', '')),
-                    f"{item.get('unit_price', 0):,}원",
-                    f"{amount:,}원",
-                    item.get('description', '')
-                ])
-            
-            # 합계 행 추가
-            items_data.append(['', '', '', f"총 견적금액: {total_amount:,}원", ''])
-            
-            # 품목 테이블 생성
-            items_table = Table(items_data, colWidths=[2*inch, 1*inch, 1.5*inch, 1.5*inch, 2*inch])
-            items_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -2), colors.beige),
-                ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            story.append(items_table)
-            story.append(Spacer(1, 30))
+        except Exception as e:
+            print(f"견적서 PDF 생성 중 오류 발생: {str(e)}")
+            return None
+    
+    def render_asset_label(self, asset_data: Dict[str, Any], target: Union[str, IO[bytes]]) -> None:
+        """
+        자산 라벨 PDF를 지정한 대상에 렌더링합니다.
+        
+        Args:
+            asset_data: 자산 데이터
+            target: 파일 경로 또는 바이너리 스트림
             
-            # 조건 및 비고
-            if quotation_data.get('terms'):
-                terms = Paragraph(f"<b>조건:</b> {quotation_data.get('terms')}", styles['Normal'])
-                story.append(terms)
-                story.append(Spacer(1, 10))
+        Raises:
+            Exception: 렌더링 실패 시
+        """
+        width_mm, height_mm = PDF_SETTINGS['LABEL_SIZE_MM']
+        margin = 4*mm
+        doc = SimpleDocTemplate(target, pagesize=(width_mm*mm, height_mm*mm),
+                                leftMargin=margin, rightMargin=margin, topMargin=margin, bottomMargin=margin,
+                                invariant=PDF_SETTINGS['INVARIANT_OUTPUT'])
+        normal_style = pdf_resource_cache.get_style('normal')
+        
+        department = asset_data.get('department')
+        if isinstance(department, dict):
+            department = department.get('name', '')
+        
+        asset_number = str(asset_data.get('asset_number', ''))
+        story = [
+            Paragraph(f"<b>{asset_data.get('name', '')}</b>", normal_style),
+            Paragraph(f"자산번호: {asset_number}", normal_style),
+            Paragraph(f"부서: {department or ''} / 위치: {asset_data.get('location_name', '')}", normal_style),
+            Spacer(1, 2*mm)
+        ]
+        if asset_number:
+            story.append(Code128(asset_number, barHeight=10*mm, barWidth=0.3*mm))
+        
+        doc.build(story)
+    
+    def generate_asset_label_pdf(self, asset_data: Dict[str, Any]) -> Optional[str]:
+        """
+        자산 라벨 PDF를 생성합니다.
+        
+        Args:
+            asset_data: 자산 데이터
             
-            if quotation_data.get('notes'):
-                notes = Paragraph(f"<b>비고:</b> {quotation_data.get('notes')}", styles['Normal'])
-                story.append(notes)
+        Returns:
+            생성된 PDF 파일 경로 또는 None
+        """
+        if not REPORTLAB_AVAILABLE:
+            print("reportlab 라이브러리가 설치되지 않았습니다.")
+            return None
             
-            # PDF 생성
-            doc.build(story)
+        try:
+            # PDF 파일명 생성
+            filename = f"asset_label_{asset_data.get('asset_number', asset_data.get('id', ''))}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
             
-            return filepath
+            return self.archive_pdf(self.render_to_memory('asset_label', asset_data), filename)
             
         except Exception as e:
-            print(f"견적서 PDF 생성 중 오류 발생: {str(e)}")
+            print(f"자산 라벨 PDF 생성 중 오류 발생: {str(e)}")
             return None
     
     def get_pdf_output_directory(self) -> str:
@@ -292,7 +386,7 @@ class DocumentPdfService:
         
         Args:
             data: 검증할 데이터
-            pdf_type: PDF 유형 ('purchase_order' 또는 'quotation')
+            pdf_type: PDF 유형 ('purchase_order', 'quotation' 또는 'asset_label')
             
         Returns:
             유효성 검증 결과
@@ -306,5 +400,8 @@ class DocumentPdfService:
         elif pdf_type == 'quotation':
             required_fields = ['quotation_number', 'quotation_date', 'items']
             return all(field in data and data[field] for field in required_fields)
+        elif pdf_type == 'asset_label':
+            required_fields = ['asset_number', 'name']
+            return all(field in data and data[field] for field in required_fields)
         
         return False 
\ No newline at end of file
@@ -0,0 +1,255 @@
+"""
+SMTP Connection Pool
+로그인된 SMTP 세션을 재사용하여 여러 메일을 보내는 연결 풀
+
+Classes:
+    - SmtpConnectionPool: keep-alive SMTP 연결 풀 (상태 확인, 실패 시 재연결)
+"""
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from email.message import Message
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ...utils.constants import SMTP_SETTINGS
+
+
+# 연결이 끊겼거나 재사용할 수 없는 상태를 나타내는 예외 (재연결 후 한 번 재시도)
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+
+class _PooledConnection:
+    """풀에서 관리하는 SMTP 연결과 사용 기록"""
+    
+    def __init__(self, client: smtplib.SMTP):
+        self.client = client
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.sent_count = 0
+
+
+class SmtpConnectionPool:
+    """
+    SMTP 연결 풀 클래스
+    
+    메일마다 연결/STARTTLS/로그인/QUIT을 반복하지 않도록 로그인된 세션을 풀에 보관하고 재사용합니다.
+    - 일정 시간 이상 쉬었던 연결은 NOOP으로 상태를 확인하고, 오래 쉬었거나 발송 수가 상한에 닿은 연결은 새로 엽니다.
+    - 발송 중 연결이 끊기면 해당 연결을 버리고 새 연결로 한 번 재시도합니다.
+    - 동시에 열리는 연결 수는 pool_size로 제한합니다.
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: Optional[bool] = None,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        풀 초기화 (연결은 처음 필요할 때 생성)
+        
+        Args:
+            host: SMTP 서버 주소
+            port: SMTP 서버 포트
+            username: 로그인 계정 (None이면 로그인하지 않음)
+            password: 로그인 비밀번호
+            use_tls: STARTTLS 사용 여부 (기본값: SMTP_SETTINGS['USE_TLS'])
+            pool_size: 최대 연결 수 (기본값: SMTP_SETTINGS['POOL_SIZE'])
+            timeout: 소켓 타임아웃 초 (기본값: SMTP_SETTINGS['TIMEOUT'])
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = SMTP_SETTINGS['USE_TLS'] if use_tls is None else use_tls
+        self.pool_size = pool_size or SMTP_SETTINGS['POOL_SIZE']
+        self.timeout = timeout or SMTP_SETTINGS['TIMEOUT']
+        
+        self._idle: List[_PooledConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._stats = {'connections_opened': 0, 'reconnects': 0, 'messages_sent': 0, 'health_checks': 0}
+    
+    # ==================== 발송 ====================
+    
+    def send(self, message: Union[Message, bytes], from_addr: str, to_addrs: Union[str, Sequence[str]]) -> Dict[str, Any]:
+        """
+        메일 한 건 발송 (연결이 끊겨 있으면 재연결 후 한 번 재시도)
+        
+        Args:
+            message: 발송할 메시지 또는 직렬화된 원문
+            from_addr: 발신 주소
+            to_addrs: 수신 주소 또는 목록
+        
+        Returns:
+            Dict[str, Any]: sendmail이 반환한 거부된 수신자 목록 ({} 이면 전원 수락)
+        """
+        with self.connection() as connection:
+            return self._send_on(connection, message, from_addr, to_addrs)
+    
+    def send_many(self, messages: Sequence[Tuple[Union[Message, bytes], str, Union[str, Sequence[str]]]]) -> List[Optional[str]]:
+        """
+        여러 메일을 하나의 세션에서 연속 발송
+        
+        Args:
+            messages: (메시지 또는 직렬화된 원문, 발신 주소, 수신 주소) 목록
+        
+        Returns:
+            List[Optional[str]]: 메시지별 오류 메시지 (성공이면 None)
+        """
+        results: List[Optional[str]] = []
+        with self.connection() as connection:
+            for message, from_addr, to_addrs in messages:
+                try:
+                    refused = self._send_on(connection, message, from_addr, to_addrs)
+                    results.append(f"수신 거부: {', '.join(refused)}" if refused else None)
+                except (smtplib.SMTPException, OSError) as e:
+                    results.append(str(e))
+        return results
+    
+    @contextmanager
+    def connection(self) -> Iterator[_PooledConnection]:
+        """
+        풀에서 연결을 빌려 사용 후 반납 (연결 오류가 난 연결은 반납하지 않고 닫음)
+        
+        Yields:
+            _PooledConnection: 사용 가능한 연결
+        """
+        self._slots.acquire()
+        connection = None
+        try:
+            connection = self._checkout()
+            yield connection
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            # 서버가 명령을 거절한 경우로 세션 자체는 정상이므로 반납
+            raise
+        except BaseException:
+            if connection is not None:
+                self._quit(connection.client)
+                connection = None
+            raise
+        finally:
+            if connection is not None:
+                self._checkin(connection)
+            self._slots.release()
+    
+    def close_all(self) -> None:
+        """보관 중인 연결을 모두 QUIT 후 닫기"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._quit(connection.client)
+    
+    def get_statistics(self) -> Dict[str, int]:
+        """풀 사용 통계 조회 (연결 생성/재연결/발송/상태 확인 횟수, 유휴 연결 수)"""
+        with self._lock:
+            return dict(self._stats, idle_connections=len(self._idle))
+    
+    # ==================== 내부 헬퍼 ====================
+    
+    def _send_on(
+        self,
+        connection: _PooledConnection,
+        message: Union[Message, bytes],
+        from_addr: str,
+        to_addrs: Union[str, Sequence[str]]
+    ) -> Dict[str, Any]:
+        """빌린 연결로 발송, 연결이 끊겼으면 같은 슬롯에서 재연결 후 재시도"""
+        if connection.sent_count >= SMTP_SETTINGS['MAX_MESSAGES_PER_CONNECTION']:
+            self._replace(connection)
+        
+        try:
+            refused = self._transmit(connection.client, message, from_addr, to_addrs)
+        except RECONNECT_ERRORS:
+            self._replace(connection)
+            with self._lock:
+                self._stats['reconnects'] += 1
+            refused = self._transmit(connection.client, message, from_addr, to_addrs)
+        
+        connection.sent_count += 1
+        connection.last_used = time.monotonic()
+        with self._lock:
+            self._stats['messages_sent'] += 1
+        return refused
+    
+    @staticmethod
+    def _transmit(
+        client: smtplib.SMTP,
+        message: Union[Message, bytes],
+        from_addr: str,
+        to_addrs: Union[str, Sequence[str]]
+    ) -> Dict[str, Any]:
+        """메시지 객체는 send_message, 직렬화된 원문은 다시 파싱하지 않고 sendmail로 발송"""
+        if isinstance(message, Message):
+            return client.send_message(message, from_addr, to_addrs)
+        return client.sendmail(from_addr, to_addrs, message)
+    
+    def _checkout(self) -> _PooledConnection:
+        """유휴 연결 중 사용 가능한 것을 꺼내거나 새로 연결"""
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                return self._open()
+            if self._is_usable(connection):
+                return connection
+            self._quit(connection.client)
+    
+    def _checkin(self, connection: _PooledConnection) -> None:
+        """사용한 연결을 유휴 목록에 반납"""
+        with self._lock:
+            self._idle.append(connection)
+    
+    def _is_usable(self, connection: _PooledConnection) -> bool:
+        """재사용 가능 여부 확인 (오래 쉰 연결은 폐기, 잠시 쉰 연결은 NOOP 확인)"""
+        idle_seconds = time.monotonic() - connection.last_used
+        if idle_seconds >= SMTP_SETTINGS['MAX_IDLE_SECONDS']:
+            return False
+        if connection.sent_count >= SMTP_SETTINGS['MAX_MESSAGES_PER_CONNECTION']:
+            return False
+        if idle_seconds < SMTP_SETTINGS['HEALTH_CHECK_IDLE_SECONDS']:
+            return True
+        
+        with self._lock:
+            self._stats['health_checks'] += 1
+        try:
+            return connection.client.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    def _open(self) -> _PooledConnection:
+        """새 SMTP 연결 생성 (STARTTLS 및 로그인 포함)"""
+        client = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                client.starttls()
+            if self.username and self.password:
+                client.login(self.username, self.password)
+        except BaseException:
+            client.close()
+            raise
+        
+        with self._lock:
+            self._stats['connections_opened'] += 1
+        return _PooledConnection(client)
+    
+    def _replace(self, connection: _PooledConnection) -> None:
+        """연결 객체 내부의 SMTP 세션을 새 세션으로 교체"""
+        self._quit(connection.client)
+        fresh = self._open()
+        connection.client = fresh.client
+        connection.created_at = fresh.created_at
+        connection.last_used = fresh.last_used
+        connection.sent_count = 0
+    
+    @staticmethod
+    def _quit(client: smtplib.SMTP) -> None:
+        """QUIT 시도 후 소켓 닫기 (이미 끊긴 연결은 조용히 닫음)"""
+        try:
+            client.quit()
+        except (smtplib.SMTPException, OSError):
+            client.close()
@@ -0,0 +1,22 @@
+"""
+Export Services Package
+대용량 내보내기 관련 서비스들을 도메인별로 분리하여 관리
+
+Services:
+    - ExportJobService: 백그라운드 내보내기 작업 큐 및 결과 관리
+    - ExportCacheService: 필터/데이터 버전 기반 내보내기 결과 캐시
+    - ExportStreamService: 연동용 gzip CSV/NDJSON 스트리밍 및 증분(since) 내보내기
+"""
+
+from .job_service import ExportJobService, export_job_service
+from .cache_service import ExportCacheService, export_cache_service
+from .stream_service import ExportStreamService, export_stream_service
+
+__all__ = [
+    'ExportJobService',
+    'export_job_service',
+    'ExportCacheService',
+    'export_cache_service',
+    'ExportStreamService',
+    'export_stream_service'
+]
@@ -0,0 +1,303 @@
+"""
+Export Cache Service
+동일 조건의 내보내기 결과 파일을 디스크에 보관하여 재생성을 피하는 캐시 서비스
+
+Classes:
+    - ExportCacheService: (내보내기 유형, 정규화된 필터, 데이터 버전) 키 기반 LRU 파일 캐시
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, IO, Optional, Tuple
+
+from flask import send_file
+
+from ...utils.constants import EXPORT_SETTINGS
+
+
+class ExportCacheService:
+    """
+    내보내기 결과 캐시 서비스 클래스
+    
+    캐시 키는 내보내기 유형, 정규화된 필터 파라미터, Repository 데이터 버전, 기준일, 부팅 ID로 구성되며
+    같은 키의 결과는 내용이 같으므로 키를 그대로 ETag로 사용합니다.
+    데이터 버전은 프로세스 재시작 시 0부터 다시 시작하므로 이전 부팅에서 만든 항목은 시작 시 삭제합니다.
+    전체 용량이 상한을 넘으면 가장 오래 사용하지 않은 파일부터 제거합니다.
+    """
+    
+    INDEX_FILENAME = 'index.json'
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        서비스 초기화
+        
+        Args:
+            cache_dir: 캐시 디렉토리 (기본값: EXPORT_SETTINGS['CACHE_DIR'])
+            max_bytes: 캐시 최대 용량 (기본값: EXPORT_SETTINGS['CACHE_MAX_BYTES'])
+        """
+        self.cache_dir = os.path.abspath(cache_dir or EXPORT_SETTINGS['CACHE_DIR'])
+        self.max_bytes = max_bytes or EXPORT_SETTINGS['CACHE_MAX_BYTES']
+        
+        # 키 -> {'path', 'filename', 'size', 'created_at'} (앞쪽이 가장 오래 사용하지 않은 항목)
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+        
+        # 프로세스마다 새로 발급되는 ID (재시작 후 같은 데이터 버전 번호가 이전 결과를 가리키지 않도록 키에 포함)
+        self.boot_id = uuid.uuid4().hex
+    
+    # ==================== 캐시 키 ====================
+    
+    def make_key(self, export_type: str, params: Optional[Dict[str, Any]], data_version: int) -> str:
+        """
+        캐시 키 생성
+        
+        빈 값은 제거하고 문자열은 공백을 정리하여 같은 조건이 같은 키가 되도록 정규화합니다.
+        남은 일수 등 날짜에 따라 달라지는 값과 파일명을 고려하여 기준일도 키에 포함하고,
+        데이터 버전은 프로세스 안에서만 의미가 있으므로 부팅 ID도 포함합니다.
+        
+        Args:
+            export_type: 내보내기 유형
+            params: 필터 파라미터
+            data_version: Repository 데이터 버전
+        
+        Returns:
+            str: 캐시 키 (sha256 hex)
+        """
+        normalized = {}
+        for name, value in (params or {}).items():
+            if isinstance(value, str):
+                value = value.strip()
+            if value is None or value == '':
+                continue
+            normalized[name] = value
+        
+        payload = json.dumps({
+            'export_type': export_type,
+            'params': normalized,
+            'data_version': data_version,
+            'boot_id': self.boot_id,
+            'as_of': datetime.now().strftime('%Y%m%d')
+        }, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    # ==================== 캐시 조회/저장 ====================
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 조회 (조회 시 최근 사용으로 갱신)
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            Optional[Dict[str, Any]]: 캐시 항목 또는 None
+        """
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            if not os.path.exists(entry['path']):
+                self._remove_entry(key)
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry, etag=key)
+    
+    def put(self, key: str, output: IO, filename: str) -> Dict[str, Any]:
+        """
+        내보내기 결과를 캐시에 저장
+        
+        Args:
+            key: 캐시 키
+            output: 결과 스트림 (바이너리 또는 텍스트)
+            filename: 다운로드 파일명
+        
+        Returns:
+            Dict[str, Any]: 저장된 캐시 항목
+        """
+        self._ensure_loaded()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        extension = os.path.splitext(filename)[1]
+        path = os.path.join(self.cache_dir, f"{key}{extension}")
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        
+        # 임시 파일에 기록 후 교체하여 다른 요청이 쓰다 만 파일을 보지 않도록 함
+        try:
+            output.seek(0)
+            with open(temp_path, 'wb') as cache_file:
+                if isinstance(output.read(0), str):
+                    cache_file.write(output.read().encode('utf-8'))
+                else:
+                    shutil.copyfileobj(output, cache_file)
+            os.replace(temp_path, path)
+        finally:
+            output.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        entry = {
+            'path': path,
+            'filename': filename,
+            'size': os.path.getsize(path),
+            'created_at': datetime.now().isoformat()
+        }
+        
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries[key]['size']
+            self._entries[key] = entry
+            self._total_bytes += entry['size']
+            self._evict_if_needed(keep_key=key)
+            self._save_index()
+        
+        return dict(entry, etag=key)
+    
+    def get_or_create(
+        self,
+        export_type: str,
+        params: Optional[Dict[str, Any]],
+        data_version: int,
+        builder: Callable[[], Tuple[IO, str]]
+    ) -> Dict[str, Any]:
+        """
+        캐시 항목 조회, 없으면 생성하여 저장
+        
+        Args:
+            export_type: 내보내기 유형
+            params: 필터 파라미터
+            data_version: Repository 데이터 버전
+            builder: 캐시 미스 시 호출할 () -> (스트림, 파일명) 함수
+        
+        Returns:
+            Dict[str, Any]: 캐시 항목 ('etag', 'path', 'filename', 'size', 'created_at')
+        """
+        key = self.make_key(export_type, params, data_version)
+        entry = self.get(key)
+        if entry:
+            return entry
+        
+        output, filename = builder()
+        return self.put(key, output, filename)
+    
+    def create_cached_response(self, entry: Dict[str, Any], mimetype: Optional[str] = None):
+        """
+        캐시 항목을 ETag가 포함된 다운로드 Response로 변환
+        
+        요청의 If-None-Match가 ETag와 같으면 send_file이 304 Not Modified를 반환합니다.
+        
+        Args:
+            entry: 캐시 항목
+            mimetype: MIME 타입 (기본값: 파일 확장자 기준)
+        
+        Returns:
+            Response: 파일 다운로드 Response
+        """
+        response = send_file(
+            entry['path'],
+            mimetype=mimetype,
+            as_attachment=True,
+            download_name=entry['filename'],
+            etag=entry['etag'],
+            conditional=True
+        )
+        # 데이터 변경 여부는 서버에서 판단해야 하므로 매번 재검증하도록 지정
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response
+    
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+        
+        Returns:
+            int: 삭제된 항목 수
+        """
+        self._ensure_loaded()
+        with self._lock:
+            keys = list(self._entries.keys())
+            for key in keys:
+                self._remove_entry(key)
+            self._save_index()
+        return len(keys)
+    
+    def get_cache_info(self) -> Dict[str, Any]:
+        """캐시 현황 조회"""
+        self._ensure_loaded()
+        with self._lock:
+            return {
+                'entry_count': len(self._entries),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
+    
+    # ==================== 내부 메서드 ====================
+    
+    def _ensure_loaded(self) -> None:
+        """
+        디스크의 인덱스 파일 정리 (최초 1회)
+        
+        이전 부팅에서 만든 항목은 키의 부팅 ID가 달라 다시 조회되지 않으므로 파일과 함께 삭제합니다.
+        """
+        if self._loaded:
+            return
+        
+        with self._lock:
+            if self._loaded:
+                return
+            
+            index_path = os.path.join(self.cache_dir, self.INDEX_FILENAME)
+            try:
+                with open(index_path, 'r', encoding='utf-8') as index_file:
+                    saved_entries = json.load(index_file)
+            except (OSError, ValueError):
+                saved_entries = []
+            
+            for _key, entry in saved_entries:
+                try:
+                    os.remove(entry.get('path', ''))
+                except OSError:
+                    pass
+            
+            if saved_entries:
+                self._save_index()
+            self._loaded = True
+    
+    def _evict_if_needed(self, keep_key: Optional[str] = None) -> None:
+        """용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (lock 보유 상태에서 호출)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            if oldest_key == keep_key:
+                break
+            self._remove_entry(oldest_key)
+    
+    def _remove_entry(self, key: str) -> None:
+        """캐시 항목과 파일 삭제 (lock 보유 상태에서 호출)"""
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return
+        self._total_bytes -= entry['size']
+        try:
+            os.remove(entry['path'])
+        except OSError:
+            pass
+    
+    def _save_index(self) -> None:
+        """LRU 순서를 유지한 인덱스 파일 저장 (lock 보유 상태에서 호출)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILENAME)
+        temp_path = f"{index_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as index_file:
+            json.dump(list(self._entries.items()), index_file, ensure_ascii=False)
+        os.replace(temp_path, index_path)
+
+
+# 싱글톤 인스턴스 생성
+export_cache_service = ExportCacheService()
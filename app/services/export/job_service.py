@@ -0,0 +1,411 @@
+"""
+Export Job Service
+내보내기 작업을 요청 처리 스레드와 분리하여 백그라운드에서 실행하는 서비스
+
+Classes:
+    - ExportJobService: 내보내기 작업 큐, 진행률 추적, 결과 파일 관리
+"""
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple
+
+from ...utils.constants import EXPORT_SETTINGS
+
+
+# 작업 상태
+JOB_STATUS_PENDING = 'pending'
+JOB_STATUS_RUNNING = 'running'
+JOB_STATUS_COMPLETED = 'completed'
+JOB_STATUS_FAILED = 'failed'
+
+# 내보내기 함수 시그니처: (params, progress_callback) -> (스트림, 파일명)
+Exporter = Callable[[Dict[str, Any], Callable[[int, int], None]], Tuple[IO[bytes], str]]
+
+
+class ExportJobService:
+    """
+    백그라운드 내보내기 작업 서비스 클래스
+    
+    내보내기 사양(export_type + params)을 받아 제한된 크기의 스레드 풀에서 실행하고,
+    결과 파일을 작업 디렉토리에 보관합니다. 보관 기간이 지난 결과는 정리됩니다.
+    """
+    
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        artifact_dir: Optional[str] = None,
+        result_ttl: Optional[int] = None
+    ):
+        """
+        서비스 초기화
+        
+        Args:
+            max_workers: 동시 실행 작업 수 (기본값: EXPORT_SETTINGS['JOB_MAX_WORKERS'])
+            artifact_dir: 결과 파일 디렉토리 (기본값: EXPORT_SETTINGS['JOB_ARTIFACT_DIR'])
+            result_ttl: 결과 보관 시간(초) (기본값: EXPORT_SETTINGS['JOB_RESULT_TTL_SECONDS'])
+        """
+        self.max_workers = max_workers or EXPORT_SETTINGS['JOB_MAX_WORKERS']
+        self.max_pending = EXPORT_SETTINGS['JOB_MAX_PENDING']
+        self.artifact_dir = os.path.abspath(artifact_dir or EXPORT_SETTINGS['JOB_ARTIFACT_DIR'])
+        self.result_ttl = result_ttl or EXPORT_SETTINGS['JOB_RESULT_TTL_SECONDS']
+        
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='export-job'
+        )
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        
+        self.exporters: Dict[str, Exporter] = {}
+        self._register_default_exporters()
+    
+    # ==================== 작업 관리 ====================
+    
+    def register_exporter(self, export_type: str, exporter: Exporter) -> None:
+        """
+        내보내기 유형 등록
+        
+        Args:
+            export_type: 내보내기 유형 키
+            exporter: (params, progress_callback) -> (스트림, 파일명) 함수
+        """
+        self.exporters[export_type] = exporter
+    
+    def get_export_types(self) -> List[str]:
+        """등록된 내보내기 유형 목록 반환"""
+        return sorted(self.exporters.keys())
+    
+    def submit_job(
+        self,
+        export_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        owner_id: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        내보내기 작업 등록
+        
+        Args:
+            export_type: 내보내기 유형 ('assets', 'contracts', 'contract_summary', ...)
+            params: 내보내기 파라미터 (필터 조건 등)
+            owner_id: 작업 요청 사용자 ID
+        
+        Returns:
+            Dict[str, Any]: 등록된 작업 정보
+        
+        Raises:
+            ValueError: 지원하지 않는 유형이거나 대기 작업 수가 한도를 넘은 경우
+        """
+        if export_type not in self.exporters:
+            raise ValueError(f"지원하지 않는 내보내기 유형입니다: {export_type}")
+        
+        self.cleanup_expired_jobs()
+        
+        job_id = uuid.uuid4().hex
+        job = {
+            'job_id': job_id,
+            'export_type': export_type,
+            'params': dict(params or {}),
+            'owner_id': owner_id,
+            'status': JOB_STATUS_PENDING,
+            'progress': 0,
+            'processed': 0,
+            'total': 0,
+            'filename': None,
+            'file_size': 0,
+            'error': None,
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'completed_at': None,
+            'expires_at': None,
+            '_artifact_path': None,
+            '_expires_ts': None
+        }
+        
+        with self._lock:
+            active_count = sum(
+                1 for existing in self.jobs.values()
+                if existing['status'] in (JOB_STATUS_PENDING, JOB_STATUS_RUNNING)
+            )
+            if active_count >= self.max_pending:
+                raise ValueError("대기 중인 내보내기 작업이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+            self.jobs[job_id] = job
+        
+        self.executor.submit(self._run_job, job_id)
+        return self._public_view(job)
+    
+    def get_job(self, job_id: str, owner_id: Optional[Any] = None) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태 조회
+        
+        Args:
+            job_id: 작업 ID
+            owner_id: 요청 사용자 ID (지정 시 소유자가 다르면 None 반환)
+        
+        Returns:
+            Optional[Dict[str, Any]]: 작업 정보
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job or not self._is_owner(job, owner_id):
+                return None
+            return self._public_view(job)
+    
+    def get_jobs(self, owner_id: Optional[Any] = None) -> List[Dict[str, Any]]:
+        """
+        작업 목록 조회 (최근 생성순)
+        
+        Args:
+            owner_id: 요청 사용자 ID (지정 시 해당 사용자의 작업만 반환)
+        
+        Returns:
+            List[Dict[str, Any]]: 작업 정보 목록
+        """
+        self.cleanup_expired_jobs()
+        with self._lock:
+            jobs = [
+                self._public_view(job) for job in self.jobs.values()
+                if self._is_owner(job, owner_id)
+            ]
+        return sorted(jobs, key=lambda x: x['created_at'], reverse=True)
+    
+    def get_job_artifact(self, job_id: str, owner_id: Optional[Any] = None) -> Optional[Tuple[str, str]]:
+        """
+        완료된 작업의 결과 파일 조회
+        
+        Args:
+            job_id: 작업 ID
+            owner_id: 요청 사용자 ID
+        
+        Returns:
+            Optional[Tuple[str, str]]: (파일 경로, 다운로드 파일명), 준비되지 않았으면 None
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job or not self._is_owner(job, owner_id):
+                return None
+            if job['status'] != JOB_STATUS_COMPLETED or job['_expires_ts'] < time.time():
+                return None
+            artifact_path = job['_artifact_path']
+            filename = job['filename']
+        
+        if not artifact_path or not os.path.exists(artifact_path):
+            return None
+        return artifact_path, filename
+    
+    def cleanup_expired_jobs(self) -> int:
+        """
+        보관 기간이 지난 작업과 결과 파일 정리
+        
+        Returns:
+            int: 정리된 작업 수
+        """
+        now = time.time()
+        expired_paths = []
+        
+        with self._lock:
+            expired_ids = [
+                job_id for job_id, job in self.jobs.items()
+                if job['_expires_ts'] is not None and job['_expires_ts'] < now
+            ]
+            for job_id in expired_ids:
+                job = self.jobs.pop(job_id)
+                if job['_artifact_path']:
+                    expired_paths.append(job['_artifact_path'])
+            known_paths = {job['_artifact_path'] for job in self.jobs.values()}
+        
+        # 재시작 등으로 추적되지 않는 오래된 결과 파일도 함께 정리
+        if os.path.isdir(self.artifact_dir):
+            for filename in os.listdir(self.artifact_dir):
+                filepath = os.path.join(self.artifact_dir, filename)
+                if filepath in known_paths:
+                    continue
+                try:
+                    if os.path.getmtime(filepath) + self.result_ttl < now:
+                        expired_paths.append(filepath)
+                except OSError:
+                    continue
+        
+        for filepath in expired_paths:
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+        
+        return len(expired_ids)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """스레드 풀 종료"""
+        self.executor.shutdown(wait=wait)
+    
+    # ==================== 작업 실행 ====================
+    
+    def _run_job(self, job_id: str) -> None:
+        """
+        작업 실행 (워커 스레드)
+        
+        Args:
+            job_id: 작업 ID
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return
+            job['status'] = JOB_STATUS_RUNNING
+            job['started_at'] = datetime.now().isoformat()
+            export_type = job['export_type']
+            params = dict(job['params'])
+        
+        def report_progress(processed: int, total: int) -> None:
+            self._update_progress(job_id, processed, total)
+        
+        result = {}
+        try:
+            output, filename = self.exporters[export_type](params, report_progress)
+            artifact_path = self._store_artifact(job_id, output, filename)
+            result = {
+                'status': JOB_STATUS_COMPLETED,
+                'progress': 100,
+                'filename': filename,
+                'file_size': os.path.getsize(artifact_path),
+                '_artifact_path': artifact_path
+            }
+        except Exception as e:
+            result = {'status': JOB_STATUS_FAILED, 'error': str(e)}
+        finally:
+            expires_ts = time.time() + self.result_ttl
+            result.update({
+                'completed_at': datetime.now().isoformat(),
+                'expires_at': datetime.fromtimestamp(expires_ts).isoformat(),
+                '_expires_ts': expires_ts
+            })
+            with self._lock:
+                job.update(result)
+    
+    def _update_progress(self, job_id: str, processed: int, total: int) -> None:
+        """작업 진행률 갱신"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return
+            job['processed'] = processed
+            job['total'] = total
+            # 파일 저장 단계가 남아 있으므로 완료 전까지는 99%로 제한
+            job['progress'] = min(int(processed * 100 / total), 99) if total else 0
+    
+    def _store_artifact(self, job_id: str, output: IO[bytes], filename: str) -> str:
+        """
+        내보내기 결과 스트림을 작업 디렉토리에 저장
+        
+        Args:
+            job_id: 작업 ID
+            output: 결과 스트림
+            filename: 다운로드 파일명
+        
+        Returns:
+            str: 저장된 파일 경로
+        """
+        os.makedirs(self.artifact_dir, exist_ok=True)
+        extension = os.path.splitext(filename)[1]
+        artifact_path = os.path.join(self.artifact_dir, f"{job_id}{extension}")
+        
+        try:
+            output.seek(0)
+            with open(artifact_path, 'wb') as artifact:
+                shutil.copyfileobj(output, artifact)
+        finally:
+            output.close()
+        
+        return artifact_path
+    
+    @staticmethod
+    def _is_owner(job: Dict[str, Any], owner_id: Optional[Any]) -> bool:
+        """작업 소유자 확인 (owner_id 미지정 시 항상 True)"""
+        return owner_id is None or str(job['owner_id']) == str(owner_id)
+    
+    @staticmethod
+    def _public_view(job: Dict[str, Any]) -> Dict[str, Any]:
+        """내부 필드(_로 시작)를 제외한 작업 정보 반환"""
+        return {key: value for key, value in job.items() if not key.startswith('_')}
+    
+    # ==================== 기본 내보내기 유형 ====================
+    
+    def _register_default_exporters(self) -> None:
+        """기존 내보내기 라우트에 대응하는 내보내기 유형 등록"""
+        self.register_exporter('assets', self._export_assets)
+        self.register_exporter('contracts', self._export_contracts)
+        self.register_exporter('contract_summary', self._export_contract_summary)
+        self.register_exporter('inventory', self._export_inventory)
+        self.register_exporter('operations_report', self._export_operations_report)
+    
+    @staticmethod
+    def _export_assets(params: Dict[str, Any], progress: Callable[[int, int], None]) -> Tuple[IO[bytes], str]:
+        """자산 목록 Excel (/assets/export_excel)"""
+        from ..asset_core_service import AssetCoreService
+        from ..asset_export_service import AssetExportService
+        
+        filters = {
+            'search_query': params.get('search_query', ''),
+            'category_id': params.get('category_id', ''),
+            'status': params.get('status', ''),
+            'department_id': params.get('department_id', ''),
+            'expired': params.get('expired', ''),
+            'unused': params.get('unused', ''),
+            'sort_by': 'recent'
+        }
+        assets = AssetCoreService().get_filtered_assets(filters)
+        return AssetExportService().export_to_excel(assets, progress_callback=progress)
+    
+    @staticmethod
+    def _export_contracts(params: Dict[str, Any], progress: Callable[[int, int], None]) -> Tuple[IO[bytes], str]:
+        """계약 목록 Excel (/contract/export_excel)"""
+        from ..contract_export_service import ContractExportService
+        
+        return ContractExportService().build_excel_file(
+            search_query=params.get('search_query') or None,
+            contract_type=params.get('contract_type') or None,
+            status=params.get('status') or None,
+            include_charts=bool(params.get('include_charts', False)),
+            progress_callback=progress
+        )
+    
+    @staticmethod
+    def _export_contract_summary(params: Dict[str, Any], progress: Callable[[int, int], None]) -> Tuple[IO[bytes], str]:
+        """계약 요약 보고서 (/contract/export_summary)"""
+        from ..contract_export_service import ContractExportService
+        
+        return ContractExportService().build_summary_report(
+            report_type=params.get('report_type', 'monthly'),
+            progress_callback=progress
+        )
+    
+    @staticmethod
+    def _export_inventory(params: Dict[str, Any], progress: Callable[[int, int], None]) -> Tuple[IO[bytes], str]:
+        """자산실사 목록 Excel (/inventory/export/excel)"""
+        from ..inventory_export_service import inventory_export_service
+        
+        inventory_id = params.get('inventory_id')
+        return inventory_export_service.export_to_excel(
+            inventory_id=int(inventory_id) if inventory_id else None,
+            progress_callback=progress
+        )
+    
+    @staticmethod
+    def _export_operations_report(params: Dict[str, Any], progress: Callable[[int, int], None]) -> Tuple[IO[bytes], str]:
+        """운영 보고서 (/operations/api/download-report/<fmt>)"""
+        from ..operations.report_service import operations_report_service
+        
+        file_path = operations_report_service.export_report(
+            params.get('report_id'),
+            params.get('report_format', 'excel')
+        )
+        progress(1, 1)
+        return open(file_path, 'rb'), os.path.basename(file_path)
+
+
+# 싱글톤 인스턴스 생성
+export_job_service = ExportJobService()
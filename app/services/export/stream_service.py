@@ -0,0 +1,353 @@
+"""
+Export Stream Service
+연동(BI 등)용 CSV/NDJSON 스트리밍 내보내기 서비스
+
+Classes:
+    - ExportStreamService: 데이터셋별 행을 점진 압축(gzip)하며 청크 단위로 전송하는 스트리밍 내보내기
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from flask import Response, stream_with_context
+
+from ...repositories.registry import repository_registry
+from ...utils.constants import EXPORT_SETTINGS
+from ...utils.row_encoder import compile_row_encoder
+
+
+# ISO 8601 날짜 포맷 (CSV/NDJSON 공통)
+ISO_DATE = '%Y-%m-%d'
+ISO_DATETIME = '%Y-%m-%dT%H:%M:%S'
+
+# 연동용 데이터셋 컬럼 사양 ('name'은 CSV 헤더 및 NDJSON 키)
+ASSET_STREAM_COLUMNS = [
+    {'name': 'id', 'key': 'id', 'default': None},
+    {'name': 'asset_number', 'key': 'asset_number', 'default': None},
+    {'name': 'name', 'key': 'name', 'default': None},
+    {'name': 'type', 'key': ('type', 'name'), 'default': None},
+    {'name': 'category_id', 'key': 'category_id', 'default': None},
+    {'name': 'status', 'key': 'status', 'default': None},
+    {'name': 'department', 'key': ('department', 'name'), 'default': None},
+    {'name': 'location_name', 'key': 'location_name', 'default': None},
+    {'name': 'user_name', 'key': 'user_name', 'default': None},
+    {'name': 'manufacturer', 'key': 'manufacturer', 'default': None},
+    {'name': 'model', 'key': 'model', 'default': None},
+    {'name': 'serial_number', 'key': 'serial_number', 'default': None},
+    {'name': 'purchase_date', 'key': 'purchase_date', 'default': None, 'blank': None, 'format': 'date', 'date_format': ISO_DATE},
+    {'name': 'purchase_price', 'key': 'purchase_price', 'default': None},
+    {'name': 'current_value', 'key': 'current_value', 'default': None},
+    {'name': 'warranty_expiry', 'key': 'warranty_expiry', 'default': None, 'blank': None, 'format': 'date', 'date_format': ISO_DATE},
+    {'name': 'updated_at', 'key': 'updated_at', 'default': None, 'blank': None, 'format': 'date', 'date_format': ISO_DATETIME}
+]
+
+CONTRACT_STREAM_COLUMNS = [
+    {'name': 'id', 'key': 'id', 'default': None},
+    {'name': 'contract_no', 'key': 'contract_no', 'default': None},
+    {'name': 'name', 'key': 'name', 'default': None},
+    {'name': 'vendor', 'key': 'vendor', 'default': None},
+    {'name': 'type', 'key': 'type', 'default': None},
+    {'name': 'status', 'key': 'status', 'default': None},
+    {'name': 'start_date', 'key': 'start_date', 'default': None},
+    {'name': 'end_date', 'key': 'end_date', 'default': None},
+    {'name': 'amount', 'key': 'amount', 'default': None},
+    {'name': 'department', 'key': 'department', 'default': None},
+    {'name': 'manager', 'key': 'manager', 'default': None},
+    {'name': 'payment_term', 'key': 'payment_term', 'default': None},
+    {'name': 'updated_at', 'key': 'updated_at', 'default': None, 'blank': None, 'format': 'date', 'date_format': ISO_DATETIME}
+]
+
+OPERATION_HISTORY_STREAM_COLUMNS = [
+    {'name': 'id', 'key': 'id', 'default': None},
+    {'name': 'asset_id', 'key': 'asset_id', 'default': None},
+    {'name': 'asset_name', 'key': 'asset_name', 'default': None},
+    {'name': 'operation_type', 'key': 'operation_type', 'default': None},
+    {'name': 'user_name', 'key': 'user_name', 'default': None},
+    {'name': 'department', 'key': 'department', 'default': None},
+    {'name': 'status', 'key': 'status', 'default': None},
+    {'name': 'operation_date', 'key': 'operation_date', 'default': None, 'blank': None, 'format': 'date', 'date_format': ISO_DATETIME},
+    {'name': 'completion_date', 'key': 'completion_date', 'default': None, 'blank': None, 'format': 'date', 'date_format': ISO_DATETIME},
+    {'name': 'description', 'key': 'description', 'default': None},
+    {'name': 'created_at', 'key': 'created_at', 'default': None, 'blank': None, 'format': 'date', 'date_format': ISO_DATETIME}
+]
+
+
+class ExportStreamService:
+    """
+    스트리밍 내보내기 서비스 클래스
+    
+    행을 청크 단위로 직렬화하고 zlib 스트림으로 점진 압축하여 전송하므로
+    전체 파일을 메모리에 만들지 않습니다.
+    since가 주어지면 변경 일시(updated_at, 없으면 created_at)가 그 이후인 행만 내보냅니다.
+    """
+    
+    FORMATS = {
+        'csv': ('text/csv', 'csv'),
+        'ndjson': ('application/x-ndjson', 'ndjson')
+    }
+    GZIP_MIMETYPE = 'application/gzip'
+    
+    def __init__(self):
+        """서비스 초기화 및 기본 데이터셋 등록"""
+        # 데이터셋 이름 -> (행 로더, 컬럼 사양, 변경 일시 필드)
+        self._datasets: Dict[str, Tuple[Callable[[], Iterable[Dict[str, Any]]], List[Dict[str, Any]], Tuple[str, ...]]] = {}
+        self._encoders: Dict[str, Callable[[Dict[str, Any]], List[Any]]] = {}
+        self._register_default_datasets()
+    
+    def register_dataset(
+        self,
+        name: str,
+        loader: Callable[[], Iterable[Dict[str, Any]]],
+        columns: List[Dict[str, Any]],
+        timestamp_fields: Tuple[str, ...] = ('updated_at', 'created_at')
+    ) -> None:
+        """
+        스트리밍 데이터셋 등록
+        
+        Args:
+            name: 데이터셋 이름
+            loader: 원본 행 목록을 반환하는 함수
+            columns: 컬럼 사양 (row_encoder 사양 + 'name')
+            timestamp_fields: since 비교에 사용할 변경 일시 필드 (앞쪽 우선)
+        """
+        self._datasets[name] = (loader, columns, timestamp_fields)
+        self._encoders[name] = compile_row_encoder(columns, f'encode_{name}_stream_row')
+    
+    def get_datasets(self) -> List[str]:
+        """등록된 데이터셋 목록 조회"""
+        return sorted(self._datasets.keys())
+    
+    # ==================== 스트리밍 ====================
+    
+    def stream(
+        self,
+        dataset: str,
+        export_format: str = 'csv',
+        since: Optional[datetime] = None,
+        compress: bool = True
+    ) -> Iterator[bytes]:
+        """
+        데이터셋을 CSV/NDJSON 바이트 청크로 스트리밍
+        
+        Args:
+            dataset: 데이터셋 이름
+            export_format: 'csv' 또는 'ndjson'
+            since: 이 일시 이후 변경된 행만 내보내기 (None이면 전체)
+            compress: gzip 압축 여부
+        
+        Yields:
+            bytes: 전송할 청크
+        
+        Raises:
+            ValueError: 지원하지 않는 데이터셋/형식인 경우
+        """
+        if dataset not in self._datasets:
+            raise ValueError(f"지원하지 않는 데이터셋입니다: {dataset}")
+        if export_format not in self.FORMATS:
+            raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
+        
+        loader, columns, timestamp_fields = self._datasets[dataset]
+        rows = loader()
+        if since is not None:
+            rows = self._filter_since(rows, since, timestamp_fields)
+        
+        if export_format == 'csv':
+            chunks = self._iter_csv(rows, columns, self._encoders[dataset])
+        else:
+            chunks = self._iter_ndjson(rows, columns, self._encoders[dataset])
+        return self._iter_gzip(chunks) if compress else chunks
+    
+    def create_stream_response(
+        self,
+        dataset: str,
+        export_format: str = 'csv',
+        since: Optional[datetime] = None,
+        compress: bool = True
+    ) -> Response:
+        """
+        스트리밍 다운로드 Response 생성
+        
+        응답 헤더 X-Export-Watermark에 내보내기 시작 시각을 담아 다음 동기화의 since로 사용할 수 있게 합니다.
+        
+        Args:
+            dataset: 데이터셋 이름
+            export_format: 'csv' 또는 'ndjson'
+            since: 이 일시 이후 변경된 행만 내보내기
+            compress: gzip 압축 여부
+        
+        Returns:
+            Response: 청크 전송(Transfer-Encoding: chunked) Response
+        
+        Raises:
+            ValueError: 지원하지 않는 데이터셋/형식인 경우
+        """
+        # 내보내기 도중 변경된 행을 놓치지 않도록 시작 시각을 기준점으로 사용
+        watermark = datetime.now().strftime(ISO_DATETIME)
+        chunks = self.stream(dataset, export_format, since, compress)
+        
+        mimetype, extension = self.FORMATS[export_format]
+        filename = f"{dataset}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+        if compress:
+            mimetype = self.GZIP_MIMETYPE
+            filename += '.gz'
+        
+        response = Response(stream_with_context(chunks), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response.headers['X-Export-Watermark'] = watermark
+        response.cache_control.no_store = True
+        return response
+    
+    @staticmethod
+    def parse_since(value: Optional[str]) -> Optional[datetime]:
+        """
+        since 파라미터 파싱 (ISO 8601 날짜 또는 일시)
+        
+        Args:
+            value: 파라미터 값
+        
+        Returns:
+            Optional[datetime]: 기준 일시 (값이 없으면 None)
+        
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        if not value:
+            return None
+        try:
+            return ExportStreamService._to_naive(datetime.fromisoformat(value.strip()))
+        except ValueError:
+            raise ValueError(f"since 형식이 올바르지 않습니다 (ISO 8601): {value}")
+    
+    # ==================== 직렬화 ====================
+    
+    @staticmethod
+    def _iter_csv(
+        rows: Iterable[Dict[str, Any]],
+        columns: List[Dict[str, Any]],
+        encoder: Callable[[Dict[str, Any]], List[Any]]
+    ) -> Iterator[bytes]:
+        """CSV 청크 생성 (버퍼를 재사용하며 STREAM_CHUNK_BYTES 단위로 방출)"""
+        chunk_size = EXPORT_SETTINGS['STREAM_CHUNK_BYTES']
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([column['name'] for column in columns])
+        
+        for row in rows:
+            writer.writerow(encoder(row))
+            if buffer.tell() >= chunk_size:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate(0)
+        
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+    
+    @staticmethod
+    def _iter_ndjson(
+        rows: Iterable[Dict[str, Any]],
+        columns: List[Dict[str, Any]],
+        encoder: Callable[[Dict[str, Any]], List[Any]]
+    ) -> Iterator[bytes]:
+        """NDJSON 청크 생성 (한 줄에 JSON 객체 하나)"""
+        chunk_size = EXPORT_SETTINGS['STREAM_CHUNK_BYTES']
+        names = [column['name'] for column in columns]
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str).encode
+        lines: List[str] = []
+        pending = 0
+        
+        for row in rows:
+            line = dumps(dict(zip(names, encoder(row))))
+            lines.append(line)
+            pending += len(line) + 1
+            if pending >= chunk_size:
+                lines.append('')
+                yield '\n'.join(lines).encode('utf-8')
+                lines = []
+                pending = 0
+        
+        if lines:
+            lines.append('')
+            yield '\n'.join(lines).encode('utf-8')
+    
+    @staticmethod
+    def _iter_gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """청크를 gzip 형식으로 점진 압축"""
+        # wbits=31: zlib 스트림 대신 gzip 헤더/트레일러 사용
+        compressor = zlib.compressobj(EXPORT_SETTINGS['STREAM_COMPRESS_LEVEL'], zlib.DEFLATED, 31)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+    
+    # ==================== 증분(since) 필터 ====================
+    
+    @classmethod
+    def _filter_since(
+        cls,
+        rows: Iterable[Dict[str, Any]],
+        since: datetime,
+        timestamp_fields: Tuple[str, ...]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        변경 일시가 since 이후인 행만 반환
+        
+        변경 일시 필드가 모두 없는 행은 변경 여부를 알 수 없으므로 증분 내보내기에서 제외합니다.
+        """
+        for row in rows:
+            for field in timestamp_fields:
+                value = row.get(field)
+                if value:
+                    timestamp = cls._to_datetime(value)
+                    if timestamp is not None and timestamp > since:
+                        yield row
+                    break
+    
+    @classmethod
+    def _to_datetime(cls, value: Any) -> Optional[datetime]:
+        """datetime/date/ISO 문자열을 naive datetime으로 변환"""
+        if isinstance(value, datetime):
+            return cls._to_naive(value)
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+        if isinstance(value, str):
+            try:
+                return cls._to_naive(datetime.fromisoformat(value))
+            except ValueError:
+                return None
+        return None
+    
+    @staticmethod
+    def _to_naive(value: datetime) -> datetime:
+        """시간대 정보가 있으면 로컬 시각으로 변환 후 제거 (저장 데이터는 naive 로컬 시각)"""
+        if value.tzinfo is not None:
+            return value.astimezone().replace(tzinfo=None)
+        return value
+    
+    # ==================== 기본 데이터셋 ====================
+    
+    def _register_default_datasets(self) -> None:
+        """자산, 계약, 운영 이력 데이터셋 등록"""
+        self.register_dataset(
+            'assets',
+            lambda: repository_registry.get('asset').get_all_assets(),
+            ASSET_STREAM_COLUMNS
+        )
+        self.register_dataset(
+            'contracts',
+            lambda: repository_registry.get('contract').get_all(),
+            CONTRACT_STREAM_COLUMNS
+        )
+        self.register_dataset(
+            'operation_history',
+            lambda: repository_registry.get('operations').get_operation_history(),
+            OPERATION_HISTORY_STREAM_COLUMNS,
+            timestamp_fields=('updated_at', 'created_at', 'operation_date')
+        )
+
+
+# 싱글톤 인스턴스 생성
+export_stream_service = ExportStreamService()
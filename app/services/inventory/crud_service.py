@@ -4,15 +4,13 @@ InventoryCrudService - 자산실사 CRUD 서비스
 """
 from typing import Dict, Optional, Any
 from datetime import datetime
-from ...repositories.inventory.inventory_repository import inventory_repository
+from ...repositories.registry import RepositoryProvider
 
 
 class InventoryCrudService:
     """자산실사 CRUD 작업을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = inventory_repository
+    repository = RepositoryProvider('inventory')
     
     def get_inventory_detail(self, inventory_id: int) -> Dict[str, Any]:
         """자산실사 상세 정보 조회"""
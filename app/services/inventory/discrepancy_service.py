@@ -3,15 +3,13 @@ InventoryDiscrepancyService - 자산실사 불일치 관리 서비스
 자산실사 중 발견된 불일치 사항의 관리, 해결, 분석 등을 담당
 """
 from typing import List, Dict, Optional, Any
-from ...repositories.inventory.inventory_repository import inventory_repository
+from ...repositories.registry import RepositoryProvider
 
 
 class InventoryDiscrepancyService:
     """자산실사 불일치 관리를 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = inventory_repository
+    repository = RepositoryProvider('inventory')
     
     def get_discrepancies_summary(self) -> Dict[str, Any]:
         """불일치 요약 정보 조회 (라우트에서 호출하는 메서드)"""
@@ -3,16 +3,14 @@ InventorySearchService - 자산실사 검색 서비스
 자산실사의 검색, 필터링, 페이지네이션 등 조회 관련 작업을 담당
 """
 from typing import List, Dict, Optional, Any, Tuple
-from ...repositories.inventory.inventory_repository import inventory_repository
+from ...repositories.registry import RepositoryProvider
 from ...utils.constants import DEFAULT_PAGE_SIZE
 
 
 class InventorySearchService:
     """자산실사 검색 및 필터링을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = inventory_repository
+    repository = RepositoryProvider('inventory')
     
     def get_inventory_list(self, status_filter: Optional[str] = None) -> Dict[str, Any]:
         """자산실사 목록 조회 (라우트에서 호출하는 메인 메서드)"""
@@ -4,15 +4,13 @@ InventoryStatisticsService - 자산실사 통계 서비스
 """
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-from ...repositories.inventory.inventory_repository import inventory_repository
+from ...repositories.registry import RepositoryProvider
 
 
 class InventoryStatisticsService:
     """자산실사 통계 및 분석을 담당하는 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = inventory_repository
+    repository = RepositoryProvider('inventory')
     
     def get_inventory_statistics(self) -> Dict[str, Any]:
         """자산실사 통계 정보 반환"""
@@ -3,14 +3,13 @@
 """
 import io
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Tuple
-from ..repositories.inventory.inventory_repository import InventoryRepository
+from typing import List, Dict, Optional, Any, Tuple, Callable
+from ..repositories.registry import RepositoryProvider
 
 class InventoryExportService:
     """자산실사 내보내기 서비스"""
     
-    def __init__(self):
-        self.repository = InventoryRepository()
+    repository = RepositoryProvider('inventory')
     
     def export_to_csv(self, inventory_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """CSV 내보내기"""
@@ -22,7 +21,11 @@ class InventoryExportService:
         except Exception as e:
             raise Exception(f"CSV 내보내기 실패: {str(e)}")
     
-    def export_to_excel(self, inventory_id: Optional[int] = None) -> Tuple[io.BytesIO, str]:
+    def export_to_excel(
+        self,
+        inventory_id: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[io.BytesIO, str]:
         """Excel 내보내기"""
         try:
             from ..utils.excel_export_utils import ExcelExportUtils, ExcelRowProcessor
@@ -38,7 +41,8 @@ class InventoryExportService:
                 headers=['ID', '이름', '상태', '생성일', '수정일'],
                 sheet_name='재고 목록',
                 filename_prefix='inventory',
-                row_data_processor=ExcelRowProcessor.create_inventory_row_processor()
+                row_data_processor=ExcelRowProcessor.create_inventory_row_processor(),
+                progress_callback=progress_callback
             )
         except Exception as e:
             raise Exception(f"Excel 내보내기 실패: {str(e)}")
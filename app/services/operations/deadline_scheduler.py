@@ -0,0 +1,563 @@
+"""
+기한 스케줄러 모듈
+대여 반납 예정일, 자산 보증 만료일, 계약 만료일에서 나온 기한을 계층형 타이밍 휠에 등록하고
+기한이 되는 시점에 deadline.reached 이벤트를 발행 (알림 생성은 알림 규칙 엔진이 담당)
+
+Classes:
+    - TimingWheel: 계층형 타이밍 휠 (등록/취소 O(1), 틱당 현재 칸만 처리)
+    - DeadlineScheduler: 기한 등록/갱신, 영속화(스냅샷 + 변경 기록), 백그라운드 발생 처리
+"""
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .notification_rule_engine import TRIGGER_DEFINITIONS
+from ...utils.constants import DEADLINE_SCHEDULER_SETTINGS, DOMAIN_EVENTS
+from ...utils.events import domain_events
+
+
+# 대상 종류별 (전체 조회 함수, ID 조회 함수)
+SourceAccessors = Dict[str, Tuple[Callable[[], List[Dict[str, Any]]], Callable[[int], Optional[Dict[str, Any]]]]]
+
+# 이벤트 유형별 (대상 종류, 기한 재계산 여부) - 재계산하지 않는 이벤트는 대상의 기한을 모두 삭제
+SOURCE_EVENTS: Dict[str, Tuple[str, bool]] = {
+    DOMAIN_EVENTS['LOAN_CREATED']: ('loan', True),
+    DOMAIN_EVENTS['LOAN_UPDATED']: ('loan', True),
+    DOMAIN_EVENTS['LOAN_RETURNED']: ('loan', True),
+    DOMAIN_EVENTS['LOAN_DELETED']: ('loan', False),
+    DOMAIN_EVENTS['ASSET_CREATED']: ('asset', True),
+    DOMAIN_EVENTS['ASSET_UPDATED']: ('asset', True),
+    DOMAIN_EVENTS['ASSET_DELETED']: ('asset', False),
+    DOMAIN_EVENTS['CONTRACT_CREATED']: ('contract', True),
+    DOMAIN_EVENTS['CONTRACT_UPDATED']: ('contract', True),
+    DOMAIN_EVENTS['CONTRACT_DELETED']: ('contract', False)
+}
+
+# 대상 종류별 기한 트리거 목록 (TRIGGER_DEFINITIONS 중 deadline이 있는 트리거)
+DEADLINE_TRIGGERS: Dict[str, List[str]] = {}
+for _trigger, _definition in TRIGGER_DEFINITIONS.items():
+    if _definition.get('deadline'):
+        DEADLINE_TRIGGERS.setdefault(_definition['source'], []).append(_trigger)
+
+
+def _timer_key(trigger: str, entity_id: Any) -> str:
+    """기한 키 ('트리거:대상 ID')"""
+    return f"{trigger}:{entity_id}"
+
+
+def _parse_timer_key(key: str) -> Tuple[str, str]:
+    """기한 키를 (트리거, 대상 ID 문자열)로 분리"""
+    trigger, _, entity_id = key.rpartition(':')
+    return trigger, entity_id
+
+
+class TimingWheel:
+    """
+    계층형 타이밍 휠 클래스
+    
+    단계마다 고정 개수의 칸을 두고, 단계 i의 한 칸은 아래 단계 전체 한 바퀴에 해당합니다.
+    기한은 남은 틱 수에 맞는 가장 낮은 단계의 칸에 넣고, 위 단계의 칸은 그 칸의 시간이 시작될 때
+    아래 단계로 다시 배치합니다(cascade). 등록/취소는 O(1)이며 틱마다 현재 칸만 확인하므로
+    대기 중인 기한 수와 무관하게 진행 비용이 일정합니다.
+    가장 높은 단계의 범위를 넘는 기한은 마지막 단계에 넣어 두었다가 한 바퀴마다 다시 배치합니다.
+    """
+    
+    def __init__(self, sizes: Sequence[int], current_tick: int):
+        """
+        휠 생성
+        
+        Args:
+            sizes: 단계별 칸 수 (낮은 단계부터)
+            current_tick: 현재 틱
+        """
+        self._sizes = tuple(sizes)
+        self._spans = [1]
+        for size in self._sizes[:-1]:
+            self._spans.append(self._spans[-1] * size)
+        self._slots: List[List[set]] = [[set() for _ in range(size)] for size in self._sizes]
+        # 기한 키 → (기한 틱, 단계, 칸), 단계 -1은 발생 대기 목록
+        self._timers: Dict[str, Tuple[int, int, int]] = {}
+        self._expired: Dict[str, None] = {}
+        self._current = current_tick
+    
+    def __len__(self) -> int:
+        return len(self._timers)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._timers
+    
+    @property
+    def current_tick(self) -> int:
+        """현재 틱"""
+        return self._current
+    
+    def deadline_of(self, key: str) -> Optional[int]:
+        """등록된 기한 틱 (없으면 None)"""
+        timer = self._timers.get(key)
+        return timer[0] if timer else None
+    
+    def items(self) -> Iterable[Tuple[str, int]]:
+        """(기한 키, 기한 틱) 목록"""
+        return ((key, timer[0]) for key, timer in self._timers.items())
+    
+    def schedule(self, key: str, tick: int) -> None:
+        """
+        기한 등록 (같은 키가 있으면 교체, 이미 지난 기한은 다음 advance에서 발생)
+        
+        Args:
+            key: 기한 키
+            tick: 기한 틱
+        """
+        self.cancel(key)
+        self._place(key, tick)
+    
+    def cancel(self, key: str) -> bool:
+        """
+        기한 취소
+        
+        Args:
+            key: 기한 키
+        
+        Returns:
+            bool: 등록되어 있었는지 여부
+        """
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        _, level, slot = timer
+        if level < 0:
+            self._expired.pop(key, None)
+        else:
+            self._slots[level][slot].discard(key)
+        return True
+    
+    def advance(self, to_tick: int) -> List[Tuple[str, int]]:
+        """
+        지정 틱까지 휠을 진행하고 발생한 기한을 꺼냄
+        
+        Args:
+            to_tick: 진행할 틱 (현재 틱 이하면 발생 대기 목록만 꺼냄)
+        
+        Returns:
+            List[Tuple[str, int]]: (기한 키, 기한 틱) 목록 (꺼낸 기한은 휠에서 제거됨)
+        """
+        while self._current < to_tick:
+            if len(self._timers) == len(self._expired):
+                # 칸에 남은 기한이 없으면 빈 틱을 건너뜀
+                self._current = to_tick
+                break
+            self._current += 1
+            tick = self._current
+            # 위 단계부터 이번 틱에 시작되는 칸을 아래 단계로 다시 배치
+            for level in range(len(self._sizes) - 1, -1, -1):
+                span = self._spans[level]
+                if tick % span:
+                    continue
+                index = (tick // span) % self._sizes[level]
+                keys = self._slots[level][index]
+                if not keys:
+                    continue
+                self._slots[level][index] = set()
+                for key in keys:
+                    self._place(key, self._timers[key][0])
+        
+        expired = [(key, self._timers.pop(key)[0]) for key in self._expired]
+        self._expired.clear()
+        return expired
+    
+    def level_sizes(self) -> List[int]:
+        """단계별 대기 기한 수 (발생 대기 목록 제외)"""
+        return [sum(len(keys) for keys in slots) for slots in self._slots]
+    
+    def _place(self, key: str, tick: int) -> None:
+        """남은 틱 수에 맞는 단계의 칸에 기한 배치"""
+        delta = tick - self._current
+        if delta <= 0:
+            self._timers[key] = (tick, -1, 0)
+            self._expired[key] = None
+            return
+        last = len(self._sizes) - 1
+        for level, (size, span) in enumerate(zip(self._sizes, self._spans)):
+            if delta < span * size or level == last:
+                index = (tick // span) % size
+                self._slots[level][index].add(key)
+                self._timers[key] = (tick, level, index)
+                return
+
+
+class DeadlineScheduler:
+    """
+    기한 스케줄러 클래스
+    
+    대여/자산/계약의 기한(반납 예정 알림일, 연체 시작일, 장기 연체일, 보증/계약 만료 알림일)을
+    TRIGGER_DEFINITIONS의 deadline 함수로 계산해 타이밍 휠에 등록하고, 대상 변경 이벤트가 오면
+    해당 대상의 기한만 다시 계산합니다. 백그라운드 스레드가 틱마다 휠을 진행하여 기한이 된 항목을
+    deadline.reached 이벤트로 발행하므로, 알림 규칙과 수신자 처리는 규칙 엔진이 그대로 담당합니다.
+    
+    대기 중인 기한과 이미 발생한 기한은 스냅샷 파일과 변경 기록(JSON Lines)에 저장하여,
+    재시작 후에도 같은 기한을 다시 발생시키지 않고 중단 중 지난 기한은 시작 직후 발생시킵니다.
+    """
+    
+    SNAPSHOT_FILENAME = 'deadlines.json'
+    JOURNAL_FILENAME = 'deadlines.journal'
+    
+    def __init__(self, state_dir: Optional[str] = None, sources: Optional[SourceAccessors] = None):
+        """
+        스케줄러 초기화 (기한 등록과 발생 스레드는 start에서 시작)
+        
+        Args:
+            state_dir: 상태 저장 디렉터리 (기본값: DEADLINE_SCHEDULER_SETTINGS['STATE_DIR'])
+            sources: 대상 종류별 (전체 조회, ID 조회) 함수 (기본값: 대여/자산/계약 Repository)
+        """
+        self.state_dir = os.path.abspath(state_dir or DEADLINE_SCHEDULER_SETTINGS['STATE_DIR'])
+        self.tick_seconds = DEADLINE_SCHEDULER_SETTINGS['TICK_SECONDS']
+        self._sources = sources
+        self._wheel: Optional[TimingWheel] = None
+        self._fired: Dict[str, int] = {}
+        self._journal = None
+        self._journal_entries = 0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._started = False
+        self._stopping = False
+        self._stats = {
+            'deadlines_fired': 0,
+            'deadlines_skipped': 0,
+            'reschedules': 0,
+            'compactions': 0
+        }
+    
+    @property
+    def sources(self) -> SourceAccessors:
+        """대상 종류별 조회 함수 (순환 import 방지를 위해 최초 사용 시 연결)"""
+        if self._sources is None:
+            from ...repositories import asset_repository, contract_repository, operations_repository
+            self._sources = {
+                'loan': (operations_repository.get_all_loans, operations_repository.get_loan_by_id),
+                'asset': (asset_repository.get_all_assets, asset_repository.get_asset_by_id),
+                'contract': (contract_repository.get_all, contract_repository.get_by_id)
+            }
+        return self._sources
+    
+    # ==================== 시작/종료 ====================
+    
+    def start(self) -> None:
+        """저장된 상태 복원, 전체 대상 기한 등록, 이벤트 구독 및 발생 스레드 시작 (한 번만 수행)"""
+        if self._started:
+            return
+        with self._condition:
+            if self._started:
+                return
+            self._started = True
+            self._stopping = False
+            self._load_state()
+            self._reconcile()
+            self._compact()
+            self._ensure_worker()
+        for event_type in SOURCE_EVENTS:
+            domain_events.subscribe(event_type, self.handle_event)
+    
+    def stop(self) -> None:
+        """이벤트 구독 해제 및 발생 스레드 종료"""
+        for event_type in SOURCE_EVENTS:
+            domain_events.unsubscribe(event_type, self.handle_event)
+        with self._condition:
+            if not self._started:
+                return
+            self._started = False
+            self._stopping = True
+            self._condition.notify_all()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+    
+    # ==================== 기한 등록 ====================
+    
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """
+        대상 변경 이벤트에 따라 해당 대상의 기한만 다시 계산
+        
+        이미 지난 기한은 발생시키지 않고 발생 완료로 기록합니다.
+        변경으로 조건이 새로 성립한 경우는 규칙 엔진이 같은 이벤트에서 알림을 만들기 때문입니다.
+        
+        Args:
+            event: domain_events가 발행한 이벤트
+        """
+        source, reschedule = SOURCE_EVENTS[event['type']]
+        entity = event['entity']
+        with self._condition:
+            if self._wheel is None:
+                return
+            if reschedule:
+                self._schedule_entity(source, entity, catch_up=False)
+            else:
+                self._forget_entity(source, entity.get('id'))
+            self._condition.notify()
+    
+    def get_pending(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        다가오는 기한 목록 조회 (기한순)
+        
+        Args:
+            limit: 최대 조회 수
+        
+        Returns:
+            List[Dict[str, Any]]: 트리거, 대상 종류/ID, 기한 일시 목록
+        """
+        with self._condition:
+            if self._wheel is None:
+                return []
+            pending = sorted(self._wheel.items(), key=lambda item: item[1])[:limit]
+        results = []
+        for key, tick in pending:
+            trigger, entity_id = _parse_timer_key(key)
+            results.append({
+                'trigger': trigger,
+                'source': TRIGGER_DEFINITIONS[trigger]['source'] if trigger in TRIGGER_DEFINITIONS else None,
+                'entity_id': entity_id,
+                'due_at': datetime.fromtimestamp(tick * self.tick_seconds).isoformat()
+            })
+        return results
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        스케줄러 상태 조회
+        
+        Returns:
+            Dict[str, Any]: 대기/발생 기한 수, 단계별 대기 수, 처리 통계, 변경 기록 수
+        """
+        with self._condition:
+            wheel = self._wheel
+            return dict(
+                self._stats,
+                running=bool(self._worker and self._worker.is_alive()),
+                pending=len(wheel) if wheel is not None else 0,
+                fired=len(self._fired),
+                wheel_levels=wheel.level_sizes() if wheel is not None else [],
+                journal_entries=self._journal_entries
+            )
+    
+    # ==================== 백그라운드 발생 처리 ====================
+    
+    def _run(self) -> None:
+        """발생 스레드 본체: 틱마다 휠을 진행하고 기한이 된 항목을 발행"""
+        while True:
+            with self._condition:
+                if self._stopping:
+                    return
+                expired = self._wheel.advance(self._now_tick())
+                for key, tick in expired:
+                    self._mark_fired(key, tick)
+            
+            for key, _ in expired:
+                self._fire(key)
+            
+            with self._condition:
+                if self._stopping:
+                    return
+                if self._journal_entries > DEADLINE_SCHEDULER_SETTINGS['JOURNAL_COMPACT_ENTRIES']:
+                    self._compact()
+                # 다음 틱 경계까지 대기 (이벤트로 지난 기한이 등록되면 바로 깨어남)
+                self._condition.wait(self.tick_seconds - time.time() % self.tick_seconds)
+    
+    def _fire(self, key: str) -> None:
+        """대상을 다시 조회하여 deadline.reached 이벤트 발행 (대상이 없어졌으면 건너뜀)"""
+        trigger, entity_id = _parse_timer_key(key)
+        definition = TRIGGER_DEFINITIONS.get(trigger)
+        entity = None
+        if definition is not None and entity_id.isdigit():
+            try:
+                entity = self.sources[definition['source']][1](int(entity_id))
+            except Exception as e:
+                print(f"기한 대상 조회 오류 ({key}): {e}")
+        if entity is None:
+            with self._condition:
+                self._stats['deadlines_skipped'] += 1
+            return
+        
+        domain_events.publish(
+            DOMAIN_EVENTS['DEADLINE_REACHED'],
+            entity,
+            trigger=trigger,
+            source=definition['source']
+        )
+        with self._condition:
+            self._stats['deadlines_fired'] += 1
+    
+    def _ensure_worker(self) -> None:
+        """발생 스레드 시작 (lock 보유 상태에서 호출)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='deadline-scheduler', daemon=True)
+            self._worker.start()
+    
+    # ==================== 기한 계산 (lock 보유 상태에서 호출) ====================
+    
+    def _reconcile(self) -> None:
+        """전체 대상의 기한 등록 (중단 중 지난 기한은 발생, 대상이 없어진 기한은 삭제)"""
+        seen = set()
+        for source, (load_all, _) in self.sources.items():
+            if source not in DEADLINE_TRIGGERS:
+                continue
+            try:
+                entities = load_all()
+            except Exception as e:
+                print(f"기한 대상 로드 오류 ({source}): {e}")
+                # 대상을 읽지 못한 종류의 기한은 그대로 유지
+                seen.update(key for key, _ in self._wheel.items() if self._source_of(key) == source)
+                seen.update(key for key in self._fired if self._source_of(key) == source)
+                continue
+            for entity in entities:
+                seen.update(self._schedule_entity(source, entity, catch_up=True))
+        
+        stale = [key for key, _ in self._wheel.items() if key not in seen]
+        stale.extend(key for key in self._fired if key not in seen)
+        for key in stale:
+            self._drop(key)
+    
+    def _schedule_entity(self, source: str, entity: Dict[str, Any], catch_up: bool) -> List[str]:
+        """
+        대상의 기한을 계산하여 휠에 등록 (기한이 같으면 유지, 적용 대상이 아니면 삭제)
+        
+        Args:
+            source: 대상 종류
+            entity: 대상 데이터
+            catch_up: 이미 지난 기한도 발생시킬지 여부 (재시작 시 True)
+        
+        Returns:
+            List[str]: 기한이 있는 키 목록
+        """
+        keys = []
+        for trigger in DEADLINE_TRIGGERS.get(source, []):
+            key = _timer_key(trigger, entity.get('id'))
+            due = TRIGGER_DEFINITIONS[trigger]['deadline'](entity)
+            if due is None:
+                self._drop(key)
+                continue
+            keys.append(key)
+            tick = self._to_tick(due)
+            if self._wheel.deadline_of(key) == tick or self._fired.get(key) == tick:
+                continue
+            if tick <= self._wheel.current_tick and not catch_up:
+                self._wheel.cancel(key)
+                self._mark_fired(key, tick)
+                continue
+            self._wheel.schedule(key, tick)
+            self._fired.pop(key, None)
+            self._append_journal(['set', key, tick])
+            self._stats['reschedules'] += 1
+        return keys
+    
+    def _forget_entity(self, source: str, entity_id: Any) -> None:
+        """대상의 모든 기한 삭제"""
+        for trigger in DEADLINE_TRIGGERS.get(source, []):
+            self._drop(_timer_key(trigger, entity_id))
+    
+    def _mark_fired(self, key: str, tick: int) -> None:
+        """발생 완료 기록"""
+        self._fired[key] = tick
+        self._append_journal(['fire', key, tick])
+    
+    def _drop(self, key: str) -> None:
+        """대기/발생 기록에서 기한 삭제"""
+        cancelled = self._wheel.cancel(key)
+        if self._fired.pop(key, None) is not None or cancelled:
+            self._append_journal(['drop', key])
+    
+    def _to_tick(self, due: date) -> int:
+        """기한 날짜(해당일 0시, 서버 로컬 시간)를 틱으로 변환"""
+        return int(datetime(due.year, due.month, due.day).timestamp()) // self.tick_seconds
+    
+    def _now_tick(self) -> int:
+        """현재 틱"""
+        return int(time.time()) // self.tick_seconds
+    
+    @staticmethod
+    def _source_of(key: str) -> Optional[str]:
+        """기한 키의 대상 종류"""
+        definition = TRIGGER_DEFINITIONS.get(_parse_timer_key(key)[0])
+        return definition['source'] if definition else None
+    
+    # ==================== 영속화 (lock 보유 상태에서 호출) ====================
+    
+    def _load_state(self) -> None:
+        """스냅샷과 변경 기록을 읽어 휠과 발생 기록 복원"""
+        pending: Dict[str, int] = {}
+        fired: Dict[str, int] = {}
+        try:
+            with open(self._path(self.SNAPSHOT_FILENAME), 'r', encoding='utf-8') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            pending.update(snapshot.get('pending', {}))
+            fired.update(snapshot.get('fired', {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"기한 스냅샷 로드 오류: {e}")
+        
+        try:
+            with open(self._path(self.JOURNAL_FILENAME), 'r', encoding='utf-8') as journal_file:
+                for line in journal_file:
+                    try:
+                        op, key, *rest = json.loads(line)
+                    except ValueError:
+                        # 기록 도중 중단된 마지막 줄은 무시
+                        continue
+                    if op == 'set':
+                        pending[key] = rest[0]
+                        fired.pop(key, None)
+                    elif op == 'fire':
+                        pending.pop(key, None)
+                        fired[key] = rest[0]
+                    elif op == 'drop':
+                        pending.pop(key, None)
+                        fired.pop(key, None)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"기한 변경 기록 로드 오류: {e}")
+        
+        self._wheel = TimingWheel(DEADLINE_SCHEDULER_SETTINGS['WHEEL_SIZES'], self._now_tick())
+        for key, tick in pending.items():
+            self._wheel.schedule(key, tick)
+        self._fired = fired
+    
+    def _append_journal(self, entry: List[Any]) -> None:
+        """변경 기록 한 줄 추가"""
+        try:
+            if self._journal is None:
+                os.makedirs(self.state_dir, exist_ok=True)
+                self._journal = open(self._path(self.JOURNAL_FILENAME), 'a', encoding='utf-8')
+            self._journal.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._journal.flush()
+            self._journal_entries += 1
+        except OSError as e:
+            print(f"기한 변경 기록 저장 오류: {e}")
+    
+    def _compact(self) -> None:
+        """현재 상태를 스냅샷으로 저장(임시 파일 교체)하고 변경 기록 비우기"""
+        snapshot = {'pending': dict(self._wheel.items()), 'fired': self._fired}
+        path = self._path(self.SNAPSHOT_FILENAME)
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+            with open(path + '.tmp', 'w', encoding='utf-8') as snapshot_file:
+                json.dump(snapshot, snapshot_file, ensure_ascii=False)
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(path + '.tmp', path)
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self._path(self.JOURNAL_FILENAME), 'w', encoding='utf-8')
+            self._journal_entries = 0
+            self._stats['compactions'] += 1
+        except OSError as e:
+            print(f"기한 스냅샷 저장 오류: {e}")
+    
+    def _path(self, filename: str) -> str:
+        """상태 파일 경로"""
+        return os.path.join(self.state_dir, filename)
+
+
+# 싱글톤 인스턴스 생성
+deadline_scheduler = DeadlineScheduler()
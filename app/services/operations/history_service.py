@@ -43,8 +43,9 @@ class OperationsHistoryService:
             end_date=end_date
         )
         
-        # Repository를 통한 통계 계산
-        stats = self.operations_repo.get_history_statistics(history_records)
+        # Repository를 통한 통계 계산 (필터가 없으면 전체 이력 월별 집계 사용)
+        filtered = any([asset_id, user_name, operation_type, status, start_date, end_date])
+        stats = self.operations_repo.get_history_statistics(history_records if filtered else None)
         
         return {
             'records': history_records,
@@ -98,9 +99,8 @@ class OperationsHistoryService:
         Returns:
             최근 이력 목록
         """
-        all_history = self.operations_repo.get_operation_history()
-        # 최신순으로 정렬하여 제한된 개수만 반환
-        return sorted(all_history, key=lambda x: x.get('date', ''), reverse=True)[:limit]
+        # 최신 파티션부터 limit개만 조회
+        return self.operations_repo.get_recent_operations(limit)
     
     def search_history(self, search_term: str) -> List[Dict]:
         """
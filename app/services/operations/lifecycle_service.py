@@ -41,37 +41,17 @@ class LifecycleService:
             생명주기 이벤트 목록과 통계가 포함된 딕셔너리
         """
         try:
-            # Repository에서 데이터 조회
+            # Repository에서 데이터 조회 (자산/일자 색인으로 기간 필터까지 한 번에 적용)
             events, current_page, total_pages, total_items = self.operations_repo.get_lifecycle_events_with_pagination(
                 page=page,
                 per_page=per_page,
                 asset_id=asset_id,
                 event_type=event_type,
-                department=department
+                department=department,
+                start_date=start_date,
+                end_date=end_date
             )
             
-            # 날짜 필터링이 있는 경우 별도 처리
-            if start_date or end_date:
-                all_events = self.operations_repo.get_all_lifecycle_events(
-                    asset_id=asset_id,
-                    event_type=event_type,
-                    department=department,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                
-                # 페이지네이션 재계산
-                total_items = len(all_events)
-                total_pages = (total_items + per_page - 1) // per_page if total_items > 0 else 1
-                
-                if page > total_pages and total_pages > 0:
-                    page = total_pages
-                
-                start_idx = (page - 1) * per_page
-                end_idx = min(start_idx + per_page, total_items)
-                events = all_events[start_idx:end_idx] if all_events else []
-                current_page = page
-            
             # 비즈니스 로직: 이벤트 정보 enrichment
             for event in events:
                 # 안전한 날짜 처리
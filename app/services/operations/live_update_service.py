@@ -0,0 +1,376 @@
+"""
+실시간 갱신 서비스 모듈
+저장소 변경 이벤트를 Server-Sent Events(SSE)로 대시보드/알림 화면에 전달
+
+Classes:
+    - LiveUpdateChannel: 클라이언트 연결별 전송 대기열 (상한 초과 시 resync로 대체)
+    - LiveUpdateHub: 알림/통계 변경분 발행, 재연결 이어받기, 통계 재계산 병합
+"""
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from flask import Response
+
+from ...utils.constants import DOMAIN_EVENTS, LIVE_UPDATE_SETTINGS
+from ...utils.events import domain_events
+
+
+# 통계 재계산이 필요한 저장소 변경 이벤트
+STATS_EVENT_TYPES = (
+    DOMAIN_EVENTS['LOAN_CREATED'], DOMAIN_EVENTS['LOAN_UPDATED'], DOMAIN_EVENTS['LOAN_DELETED'],
+    DOMAIN_EVENTS['ASSET_CREATED'], DOMAIN_EVENTS['ASSET_UPDATED'], DOMAIN_EVENTS['ASSET_DELETED']
+)
+
+# 수신자에게 전달할 알림 이벤트 (도메인 이벤트 유형 → SSE action)
+NOTIFICATION_ACTIONS = {
+    DOMAIN_EVENTS['NOTIFICATION_CREATED']: 'created',
+    DOMAIN_EVENTS['NOTIFICATION_READ']: 'read',
+    DOMAIN_EVENTS['NOTIFICATION_DELETED']: 'deleted'
+}
+
+# (이벤트 ID, 대상 사용자 ID 또는 None=전체, 이벤트 이름, 데이터)
+LiveEvent = Tuple[int, Optional[int], str, Dict[str, Any]]
+
+
+def _format_event(event_id: int, name: str, data: Dict[str, Any]) -> str:
+    """SSE 전송 형식으로 직렬화"""
+    return f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+class LiveUpdateChannel:
+    """
+    클라이언트 연결 하나의 전송 대기열
+    
+    느린 클라이언트 때문에 메모리가 쌓이지 않도록 대기열 길이를 제한합니다.
+    - 같은 종류의 통계 변경분은 대기열에 하나만 두고 새 변경분을 합칩니다.
+    - 상한을 넘으면 대기열을 비우고 'resync' 이벤트 하나로 대체하여 클라이언트가 전체를 다시 조회하게 합니다.
+    """
+    
+    def __init__(self, client_id: int, user_id: Optional[int], max_size: int):
+        """
+        채널 초기화
+        
+        Args:
+            client_id: 연결 ID
+            user_id: 로그인 사용자 ID (알림 이벤트 대상 판단)
+            max_size: 미전송 이벤트 상한
+        """
+        self.client_id = client_id
+        self.user_id = user_id
+        self.max_size = max_size
+        self.connected_at = time.monotonic()
+        self.dropped = 0
+        self.closed = False
+        self._queue: Deque[Tuple[int, str, Dict[str, Any]]] = deque()
+        self._condition = threading.Condition()
+    
+    def offer(self, event_id: int, name: str, data: Dict[str, Any]) -> None:
+        """이벤트 추가 (통계 변경분 병합, 상한 초과 시 resync로 대체)"""
+        with self._condition:
+            if self.closed:
+                return
+            if name == 'stats':
+                for index, (_, queued_name, queued_data) in enumerate(self._queue):
+                    if queued_name == 'stats':
+                        merged = {**queued_data, **data}
+                        del self._queue[index]
+                        self._queue.append((event_id, name, merged))
+                        self._condition.notify()
+                        return
+            if len(self._queue) >= self.max_size:
+                self.dropped += len(self._queue)
+                self._queue.clear()
+                name, data = 'resync', {'reason': 'backlog'}
+            self._queue.append((event_id, name, data))
+            self._condition.notify()
+    
+    def take(self, timeout: float) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """대기 중인 이벤트를 모두 꺼냄 (없으면 timeout 동안 대기)"""
+        with self._condition:
+            if not self._queue and not self.closed:
+                self._condition.wait(timeout)
+            items = list(self._queue)
+            self._queue.clear()
+            return items
+    
+    def close(self) -> None:
+        """채널 종료 (대기 중인 스트림을 깨움)"""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+    
+    @property
+    def pending(self) -> int:
+        """미전송 이벤트 수"""
+        return len(self._queue)
+
+
+class LiveUpdateHub:
+    """
+    실시간 갱신 허브 클래스
+    
+    폴링 대신 변경이 있을 때만 변경분을 보냅니다.
+    - 알림: 생성/읽음/삭제 이벤트를 수신자 연결에만 전달 (읽지 않은 알림 수 포함)
+    - 통계: 대여/자산 변경 시 표시만 해 두고, 연결된 클라이언트가 있을 때 백그라운드 스레드가
+      STATS_MIN_INTERVAL_SECONDS 간격으로 한 번만 재계산하여 값이 바뀐 항목만 전체 연결에 전달
+    - 재연결: 최근 이벤트를 REPLAY_BUFFER_SIZE만큼 보관하여 Last-Event-ID 이후 이벤트를 이어 보냄
+    """
+    
+    def __init__(self, stats_provider: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        허브 초기화
+        
+        Args:
+            stats_provider: 대시보드 통계를 계산하는 함수
+        """
+        self._stats_provider = stats_provider
+        self._channels: Dict[int, LiveUpdateChannel] = {}
+        self._replay: Deque[LiveEvent] = deque(maxlen=LIVE_UPDATE_SETTINGS['REPLAY_BUFFER_SIZE'])
+        self._sequence = 0
+        self._client_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stats_dirty = threading.Event()
+        self._stats_snapshot: Optional[Dict[str, Any]] = None
+        self._last_stats_at = 0.0
+        self._worker: Optional[threading.Thread] = None
+        self._started = False
+        self._counters = {'events_published': 0, 'stats_computations': 0, 'resyncs': 0, 'connections': 0}
+    
+    # ==================== 구독 ====================
+    
+    def start(self, stats_provider: Optional[Callable[[], Dict[str, Any]]] = None) -> None:
+        """
+        저장소 변경 이벤트 구독 (여러 번 호출해도 한 번만 구독)
+        
+        Args:
+            stats_provider: 대시보드 통계를 계산하는 함수 (지정 시 교체)
+        """
+        if stats_provider is not None:
+            self._stats_provider = stats_provider
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for event_type in STATS_EVENT_TYPES:
+            domain_events.subscribe(event_type, self._on_data_changed)
+        for event_type in NOTIFICATION_ACTIONS:
+            domain_events.subscribe(event_type, self._on_notification_event)
+    
+    # ==================== 연결 ====================
+    
+    def connect(self, user_id: Optional[int], last_event_id: Optional[str] = None) -> Optional[LiveUpdateChannel]:
+        """
+        클라이언트 연결 등록
+        
+        Args:
+            user_id: 로그인 사용자 ID
+            last_event_id: 브라우저가 재연결 시 보내는 마지막 수신 이벤트 ID
+        
+        Returns:
+            Optional[LiveUpdateChannel]: 연결 채널 (동시 연결 상한 초과 시 None)
+        """
+        with self._lock:
+            if len(self._channels) >= LIVE_UPDATE_SETTINGS['MAX_CLIENTS']:
+                return None
+            channel = LiveUpdateChannel(next(self._client_ids), user_id, LIVE_UPDATE_SETTINGS['CLIENT_QUEUE_SIZE'])
+            self._channels[channel.client_id] = channel
+            self._counters['connections'] += 1
+            missed = self._missed_events(user_id, last_event_id)
+        
+        # 놓친 이벤트 이어 보내기 (보관 범위를 벗어났으면 전체 재조회 요청)
+        if missed is None:
+            channel.offer(self._sequence, 'resync', {'reason': 'expired'})
+        else:
+            for event_id, _, name, data in missed:
+                channel.offer(event_id, name, data)
+        
+        # 첫 연결이면 통계 기준값을 계산해 두어야 이후 변경분을 비교할 수 있음
+        if self._stats_snapshot is None:
+            self._stats_dirty.set()
+        self._ensure_worker()
+        return channel
+    
+    def create_stream_response(self, user_id: Optional[int], last_event_id: Optional[str] = None) -> Optional[Response]:
+        """
+        SSE 스트리밍 Response 생성
+        
+        Args:
+            user_id: 로그인 사용자 ID
+            last_event_id: Last-Event-ID 헤더 값
+        
+        Returns:
+            Optional[Response]: text/event-stream Response (동시 연결 상한 초과 시 None)
+        """
+        channel = self.connect(user_id, last_event_id)
+        if channel is None:
+            return None
+        response = Response(self.stream(channel), mimetype='text/event-stream')
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 비활성화
+        return response
+    
+    def disconnect(self, channel: LiveUpdateChannel) -> None:
+        """클라이언트 연결 해제"""
+        channel.close()
+        with self._lock:
+            self._channels.pop(channel.client_id, None)
+    
+    def stream(self, channel: LiveUpdateChannel) -> Iterator[str]:
+        """
+        SSE 응답 본문 생성 (heartbeat 포함, 최대 유지 시간 후 종료)
+        
+        Args:
+            channel: connect로 등록한 채널
+        
+        Yields:
+            str: SSE 형식 문자열
+        """
+        heartbeat = LIVE_UPDATE_SETTINGS['HEARTBEAT_SECONDS']
+        deadline = time.monotonic() + LIVE_UPDATE_SETTINGS['STREAM_MAX_SECONDS']
+        try:
+            yield f"retry: {LIVE_UPDATE_SETTINGS['RETRY_MILLISECONDS']}\n\n"
+            while not channel.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                items = channel.take(min(heartbeat, remaining))
+                if not items:
+                    yield f": heartbeat {datetime.now().strftime('%H:%M:%S')}\n\n"
+                    continue
+                yield ''.join(_format_event(event_id, name, data) for event_id, name, data in items)
+        finally:
+            self.disconnect(channel)
+    
+    # ==================== 발행 ====================
+    
+    def publish(self, name: str, data: Dict[str, Any], user_id: Optional[int] = None) -> int:
+        """
+        이벤트 발행
+        
+        Args:
+            name: SSE 이벤트 이름 ('notification', 'stats' 등)
+            data: 전달할 데이터
+            user_id: 대상 사용자 ID (None이면 전체 연결)
+        
+        Returns:
+            int: 이벤트 ID
+        """
+        with self._lock:
+            self._sequence += 1
+            event_id = self._sequence
+            self._replay.append((event_id, user_id, name, data))
+            self._counters['events_published'] += 1
+            channels = [c for c in self._channels.values() if user_id is None or c.user_id == user_id]
+        for channel in channels:
+            channel.offer(event_id, name, data)
+        return event_id
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        허브 상태 조회
+        
+        Returns:
+            Dict[str, Any]: 연결 수, 발행/통계 계산/resync 횟수, 연결별 대기 이벤트 수
+        """
+        with self._lock:
+            channels = list(self._channels.values())
+            counters = dict(self._counters)
+        return {
+            **counters,
+            'active_clients': len(channels),
+            'pending_events': sum(channel.pending for channel in channels),
+            'dropped_events': sum(channel.dropped for channel in channels),
+            'last_event_id': self._sequence
+        }
+    
+    # ==================== 이벤트 처리 ====================
+    
+    def _on_data_changed(self, event: Dict[str, Any]) -> None:
+        """대여/자산 변경: 통계 재계산 표시만 하고 계산은 작업 스레드에서 병합 처리"""
+        if self._channels:
+            self._stats_dirty.set()
+        else:
+            # 연결이 없으면 기준값이 낡으므로 다음 연결 때 새로 계산
+            self._stats_snapshot = None
+    
+    def _on_notification_event(self, event: Dict[str, Any]) -> None:
+        """알림 생성/읽음/삭제: 수신자 연결에만 변경분 전달"""
+        entity = event['entity']
+        recipient_id = event.get('recipient_id', entity.get('recipient_id'))
+        if recipient_id is None or not any(c.user_id == recipient_id for c in list(self._channels.values())):
+            return
+        
+        from ...repositories import notification_repository
+        action = NOTIFICATION_ACTIONS[event['type']]
+        data: Dict[str, Any] = {
+            'action': action,
+            'unread_count': notification_repository.get_unread_count(recipient_id)
+        }
+        if action == 'created':
+            data['notification'] = entity
+        else:
+            data['notification_ids'] = event.get('notification_ids') or [entity.get('id')]
+        self.publish('notification', data, user_id=recipient_id)
+    
+    def _missed_events(self, user_id: Optional[int], last_event_id: Optional[str]) -> Optional[List[LiveEvent]]:
+        """Last-Event-ID 이후 놓친 이벤트 (보관 범위를 벗어났으면 None, lock 보유 상태에서 호출)"""
+        if not last_event_id:
+            return []
+        try:
+            last_id = int(last_event_id)
+        except ValueError:
+            return None
+        if last_id >= self._sequence:
+            return []
+        if not self._replay or self._replay[0][0] > last_id + 1:
+            self._counters['resyncs'] += 1
+            return None
+        return [event for event in self._replay if event[0] > last_id and (event[1] is None or event[1] == user_id)]
+    
+    # ==================== 통계 작업 스레드 ====================
+    
+    def _ensure_worker(self) -> None:
+        """통계 재계산 작업 스레드 시작 (한 번만)"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name='live-update-stats', daemon=True)
+            self._worker.start()
+    
+    def _run(self) -> None:
+        """변경 표시가 있으면 최소 간격을 지켜 통계를 재계산하고 바뀐 항목만 발행"""
+        while True:
+            self._stats_dirty.wait()
+            wait = self._last_stats_at + LIVE_UPDATE_SETTINGS['STATS_MIN_INTERVAL_SECONDS'] - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._stats_dirty.clear()
+            if not self._channels or self._stats_provider is None:
+                continue
+            
+            try:
+                current = self._stats_provider()
+            except Exception as e:
+                print(f"실시간 통계 계산 오류: {e}")
+                continue
+            finally:
+                self._last_stats_at = time.monotonic()
+            
+            previous = self._stats_snapshot
+            self._stats_snapshot = current
+            with self._lock:
+                self._counters['stats_computations'] += 1
+            if previous is None:
+                continue
+            changes = {key: value for key, value in current.items() if previous.get(key) != value}
+            if changes:
+                self.publish('stats', changes)
+
+
+# 싱글톤 인스턴스 생성
+live_update_hub = LiveUpdateHub()
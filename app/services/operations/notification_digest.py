@@ -0,0 +1,264 @@
+"""
+알림 묶음(digest) 발송 모듈
+규칙 알림을 수신자/채널별로 일정 시간 모아 중복을 제거한 뒤 한 통의 메일로 발송
+
+Classes:
+    - NotificationDigestService: 수신자/채널별 알림 묶음, 우선순위별 발송 기한, 발송 대기열 일괄 등록
+"""
+import atexit
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...utils.constants import DOMAIN_EVENTS, NOTIFICATION_DIGEST_SETTINGS
+from ...utils.events import domain_events
+
+
+# 묶음 키: (수신자 ID, 발송 채널)
+DigestKey = Tuple[int, str]
+
+
+class NotificationDigestService:
+    """
+    알림 묶음 발송 서비스 클래스
+    
+    채널이 메일을 포함하는 규칙 알림(notification.created 이벤트)을 수신자/채널별 묶음에 모읍니다.
+    같은 유형/대상/내용의 알림은 한 항목으로 합치고 횟수만 늘립니다.
+    묶음은 첫 알림 후 WINDOW_SECONDS가 지나면 발송하되, 높은 우선순위 알림이 들어오면
+    HIGH_PRIORITY_MAX_DELAY_SECONDS 안에 발송하고, MAX_ITEMS에 이르면 바로 발송합니다.
+    발송 시각이 된 묶음은 채널별로 한 번에 렌더링하여 발송 대기열에 일괄 등록하므로
+    여러 수신자의 메일이 한 SMTP 세션에서 연속 발송됩니다.
+    """
+    
+    EMAIL_CATEGORY = 'notification_digest'
+    
+    def __init__(self, outbox=None, user_repo=None):
+        """
+        서비스 초기화 (발송 스레드는 처음 알림이 들어올 때 시작)
+        
+        Args:
+            outbox: 메일 발송 대기열 (기본값: email_outbox_service)
+            user_repo: 사용자 Repository (기본값: user_repository, 수신 주소 조회용)
+        """
+        self._outbox = outbox
+        self._user_repo = user_repo
+        self._digests: Dict[DigestKey, Dict[str, Any]] = {}
+        self._senders: Dict[str, Callable[[List[Dict[str, Any]]], int]] = {'email': self._send_email_digests}
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._started = False
+        self._stopping = False
+        self._exit_flush_registered = False
+        self._stats = {
+            'notifications_received': 0,
+            'duplicates_merged': 0,
+            'digests_sent': 0,
+            'items_sent': 0,
+            'skipped_no_address': 0,
+            'send_batches': 0
+        }
+    
+    @property
+    def outbox(self):
+        """메일 발송 대기열 (최초 사용 시 연결)"""
+        if self._outbox is None:
+            from ..document.outbox_service import email_outbox_service
+            self._outbox = email_outbox_service
+        return self._outbox
+    
+    @property
+    def user_repo(self):
+        """사용자 Repository (최초 사용 시 연결)"""
+        if self._user_repo is None:
+            from ...repositories.user.user_repository import user_repository
+            self._user_repo = user_repository
+        return self._user_repo
+    
+    # ==================== 시작/종료 ====================
+    
+    def start(self) -> None:
+        """알림 생성 이벤트 구독 (여러 번 호출해도 한 번만 구독)"""
+        with self._condition:
+            if self._started:
+                return
+            self._started = True
+            self._stopping = False
+            # 프로세스 종료 시 메모리에 모아 둔 묶음을 발송 대기열(디스크)로 넘김
+            if not self._exit_flush_registered:
+                atexit.register(self.flush)
+                self._exit_flush_registered = True
+        domain_events.subscribe(DOMAIN_EVENTS['NOTIFICATION_CREATED'], self.handle_event)
+    
+    def stop(self) -> None:
+        """이벤트 구독 해제 후 모아 둔 묶음을 모두 발송하고 발송 스레드 종료"""
+        domain_events.unsubscribe(DOMAIN_EVENTS['NOTIFICATION_CREATED'], self.handle_event)
+        self.flush()
+        with self._condition:
+            self._started = False
+            self._stopping = True
+            self._condition.notify_all()
+    
+    # ==================== 수집 ====================
+    
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """
+        메일 채널 규칙 알림을 수신자/채널별 묶음에 추가
+        
+        Args:
+            event: notification.created 이벤트
+        """
+        notification = event['entity']
+        channels = NOTIFICATION_DIGEST_SETTINGS['CHANNELS'].get(notification.get('channel'), ())
+        if not channels or not notification.get('recipient_id'):
+            return
+        
+        now = time.time()
+        with self._condition:
+            for channel in channels:
+                self._add(notification, channel, now)
+            self._ensure_worker()
+            self._condition.notify()
+    
+    def flush(self) -> int:
+        """
+        발송 시각과 관계없이 모아 둔 묶음을 모두 발송
+        
+        Returns:
+            int: 발송 대기열에 등록한 묶음 수
+        """
+        with self._condition:
+            digests = list(self._digests.values())
+            self._digests.clear()
+        return self._send(digests)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        묶음 발송 통계 조회
+        
+        Returns:
+            Dict[str, Any]: 수신/중복 병합/발송 수, 대기 중인 묶음과 항목 수
+        """
+        with self._condition:
+            return dict(
+                self._stats,
+                pending_digests=len(self._digests),
+                pending_items=sum(len(digest['items']) for digest in self._digests.values())
+            )
+    
+    # ==================== 백그라운드 발송 ====================
+    
+    def _run(self) -> None:
+        """발송 스레드 본체: 발송 시각이 된 묶음을 모아 채널별로 일괄 발송"""
+        while True:
+            with self._condition:
+                due = self._take_due(time.time())
+                while not due and not self._stopping:
+                    self._condition.wait(self._seconds_until_next_due())
+                    due = self._take_due(time.time())
+                if self._stopping:
+                    return
+            self._send(due)
+    
+    def _send(self, digests: List[Dict[str, Any]]) -> int:
+        """묶음을 채널별로 나누어 발송 함수에 전달 (발송 오류는 기록만 함)"""
+        by_channel: Dict[str, List[Dict[str, Any]]] = {}
+        for digest in digests:
+            by_channel.setdefault(digest['channel'], []).append(digest)
+        
+        sent = 0
+        for channel, channel_digests in by_channel.items():
+            try:
+                sent += self._senders[channel](channel_digests)
+            except Exception as e:
+                print(f"알림 묶음 발송 오류 ({channel}): {e}")
+        return sent
+    
+    def _send_email_digests(self, digests: List[Dict[str, Any]]) -> int:
+        """메일 묶음을 한 번에 렌더링하여 발송 대기열에 일괄 등록"""
+        entries = []
+        for digest in digests:
+            user = self.user_repo.get_user_by_id(digest['recipient_id']) or {}
+            if not user.get('email'):
+                with self._condition:
+                    self._stats['skipped_no_address'] += 1
+                continue
+            entries.append((digest, {
+                'recipient': {'name': user.get('name') or digest['recipient_name'], 'email': user['email']},
+                'notifications': list(digest['items'].values())
+            }))
+        if not entries:
+            return 0
+        
+        messages = self.outbox.email_service.build_notification_digest_messages([context for _, context in entries])
+        self.outbox.enqueue_many(
+            [
+                (message, recipient, {'recipient_id': digest['recipient_id'], 'notification_ids': digest['notification_ids']})
+                for (digest, _), (message, recipient) in zip(entries, messages)
+            ],
+            category=self.EMAIL_CATEGORY
+        )
+        with self._condition:
+            self._stats['digests_sent'] += len(entries)
+            self._stats['items_sent'] += sum(len(context['notifications']) for _, context in entries)
+            self._stats['send_batches'] += 1
+        return len(entries)
+    
+    # ==================== 내부 헬퍼 (lock 보유 상태에서 호출) ====================
+    
+    def _add(self, notification: Dict[str, Any], channel: str, now: float) -> None:
+        """묶음에 알림 추가 (같은 알림은 횟수만 증가) 및 발송 시각 갱신"""
+        key = (notification['recipient_id'], channel)
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = {
+                'recipient_id': notification['recipient_id'],
+                'recipient_name': notification.get('recipient_name', ''),
+                'channel': channel,
+                'items': {},
+                'notification_ids': [],
+                'due_at': now + NOTIFICATION_DIGEST_SETTINGS['WINDOW_SECONDS']
+            }
+            self._digests[key] = digest
+        
+        self._stats['notifications_received'] += 1
+        digest['notification_ids'].append(notification.get('id'))
+        item_key = (notification.get('type'), notification.get('asset_id'), notification.get('message'))
+        item = digest['items'].get(item_key)
+        if item is not None:
+            item['count'] += 1
+            self._stats['duplicates_merged'] += 1
+        else:
+            digest['items'][item_key] = {
+                'type': notification.get('type'),
+                'title': notification.get('title', ''),
+                'message': notification.get('message', ''),
+                'priority': notification.get('priority', 'medium'),
+                'created_at': str(notification.get('created_at') or ''),
+                'count': 1
+            }
+        
+        if notification.get('priority') == 'high':
+            digest['due_at'] = min(digest['due_at'], now + NOTIFICATION_DIGEST_SETTINGS['HIGH_PRIORITY_MAX_DELAY_SECONDS'])
+        if len(digest['items']) >= NOTIFICATION_DIGEST_SETTINGS['MAX_ITEMS']:
+            digest['due_at'] = now
+    
+    def _take_due(self, now: float) -> List[Dict[str, Any]]:
+        """발송 시각이 된 묶음을 꺼냄"""
+        due_keys = [key for key, digest in self._digests.items() if digest['due_at'] <= now]
+        return [self._digests.pop(key) for key in due_keys]
+    
+    def _seconds_until_next_due(self) -> Optional[float]:
+        """다음 묶음 발송까지 남은 시간 (대기 묶음이 없으면 None = 알림까지 대기)"""
+        if not self._digests:
+            return None
+        return max(0.0, min(digest['due_at'] for digest in self._digests.values()) - time.time())
+    
+    def _ensure_worker(self) -> None:
+        """발송 스레드 시작"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='notification-digest', daemon=True)
+            self._worker.start()
+
+
+# 싱글톤 인스턴스 생성
+notification_digest_service = NotificationDigestService()
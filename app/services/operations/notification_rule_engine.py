@@ -0,0 +1,551 @@
+"""
+알림 규칙 엔진 모듈
+활성 알림 규칙을 트리거별 판정 함수로 컴파일하여 대여/반납/자산 변경 이벤트에 적용
+
+Classes:
+    - CompiledRule: 컴파일된 알림 규칙 (추가 조건 판정 함수 포함)
+    - NotificationRuleEngine: 이벤트 유형별 규칙 색인 기반 알림 생성 엔진
+"""
+import operator
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...utils.constants import (
+    CONTRACT_ALERT_DAYS, DOMAIN_EVENTS, NOTIFICATION_RULE_SETTINGS, WARRANTY_ALERT_DAYS
+)
+from ...utils.events import domain_events
+
+
+# ==================== 트리거 판정 함수 ====================
+
+def _to_date(value: Any) -> Optional[date]:
+    """date/datetime/'YYYY-MM-DD' 문자열을 date로 변환 (변환 불가 시 None)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.strptime(value[:10], '%Y-%m-%d').date()
+        except ValueError:
+            return None
+    return None
+
+
+def _days_until(value: Any) -> Optional[int]:
+    """오늘부터 지정일까지 남은 일수 (지난 날짜는 음수)"""
+    target = _to_date(value)
+    return (target - date.today()).days if target else None
+
+
+def _is_open_loan(loan: Optional[Dict[str, Any]]) -> bool:
+    """반납되지 않은 대여 여부"""
+    return bool(loan) and not loan.get('actual_return_date') and loan.get('status') != '반납 완료' \
+        and loan.get('status_id') != 4
+
+
+def _is_overdue(loan: Optional[Dict[str, Any]]) -> bool:
+    """반납 예정일이 지난 미반납 대여 여부"""
+    days = _days_until(loan.get('expected_return_date')) if loan else None
+    return _is_open_loan(loan) and days is not None and days < 0
+
+
+def _is_due_soon(loan: Optional[Dict[str, Any]]) -> bool:
+    """반납 예정일이 알림 기준일(기본 1일 전)에 해당하는 미반납 대여 여부"""
+    days = _days_until(loan.get('expected_return_date')) if loan else None
+    return _is_open_loan(loan) and days is not None and 0 <= days <= NOTIFICATION_RULE_SETTINGS['RETURN_REMINDER_DAYS']
+
+
+def _is_escalated(loan: Optional[Dict[str, Any]]) -> bool:
+    """반납 예정일이 에스컬레이션 기준일(기본 7일) 이상 지난 미반납 대여 여부"""
+    days = _days_until(loan.get('expected_return_date')) if loan else None
+    return _is_open_loan(loan) and days is not None and days <= -NOTIFICATION_RULE_SETTINGS['OVERDUE_ESCALATION_DAYS']
+
+
+def _is_warranty_expiring(asset: Optional[Dict[str, Any]]) -> bool:
+    """보증 만료가 알림 기간(WARRANTY_ALERT_DAYS) 안에 든 자산 여부"""
+    days = _days_until(asset.get('warranty_expiry')) if asset else None
+    return days is not None and 0 <= days <= WARRANTY_ALERT_DAYS
+
+
+def _is_contract_expiring(contract: Optional[Dict[str, Any]]) -> bool:
+    """만료가 알림 기간(CONTRACT_ALERT_DAYS) 안에 든 유효 계약 여부"""
+    days = _days_until(contract.get('end_date')) if contract else None
+    return contract is not None and contract.get('status') in ('active', 'expiring') \
+        and days is not None and 0 <= days <= CONTRACT_ALERT_DAYS
+
+
+def _became(check: Callable[[Optional[Dict[str, Any]]], bool]) -> Callable[[Dict[str, Any]], bool]:
+    """변경 전에는 거짓이고 변경 후에 참이 된 경우만 판정 (같은 상태로 알림이 반복되지 않도록)"""
+    return lambda event: check(event['entity']) and not check(event.get('previous'))
+
+
+def _reached(trigger: str, check: Callable[[Optional[Dict[str, Any]]], bool]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    기한 트리거 판정: 기한 스케줄러의 deadline.reached 이벤트는 해당 트리거이고 아직 조건을 만족할 때,
+    대상 변경 이벤트는 변경으로 조건이 새로 성립했을 때 참
+    """
+    became = _became(check)
+    
+    def matches(event: Dict[str, Any]) -> bool:
+        if event['type'] == DOMAIN_EVENTS['DEADLINE_REACHED']:
+            return event.get('trigger') == trigger and check(event['entity'])
+        return became(event)
+    
+    return matches
+
+
+def _deadline(
+    field: str,
+    offset_days: Callable[[], int],
+    applies: Callable[[Dict[str, Any]], bool] = lambda entity: True
+) -> Callable[[Dict[str, Any]], Optional[date]]:
+    """
+    기한 계산 함수 생성 (기준 날짜 필드 + 일수, 적용 대상이 아니면 None)
+    
+    Args:
+        field: 기준 날짜 필드
+        offset_days: 기준일에 더할 일수를 반환하는 함수 (설정 변경을 반영하도록 호출 시점에 계산)
+        applies: 기한을 등록할 대상인지 판정하는 함수
+    """
+    def deadline(entity: Dict[str, Any]) -> Optional[date]:
+        base = _to_date(entity.get(field))
+        if base is None or not applies(entity):
+            return None
+        return base + timedelta(days=offset_days())
+    
+    return deadline
+
+
+def _was_transferred(event: Dict[str, Any]) -> bool:
+    """자산 사용자가 다른 사용자로 바뀐 경우"""
+    previous = event.get('previous') or {}
+    return bool(previous.get('user_id')) and event['entity'].get('user_id') != previous.get('user_id')
+
+
+def _entered_repair(event: Dict[str, Any]) -> bool:
+    """자산이 수리중 상태로 바뀐 경우"""
+    previous = event.get('previous') or {}
+    return event['entity'].get('status') == 'in_repair' and previous.get('status') != 'in_repair'
+
+
+# 트리거(규칙의 trigger_condition)별 정의
+# - events: 트리거를 평가할 이벤트 유형 (이 유형의 이벤트에서만 규칙을 평가)
+# - matches: 이벤트가 트리거 조건을 만족하는지 판정 (트리거당 이벤트마다 한 번 평가)
+# - source/deadline: 기한 트리거의 대상 종류와 조건이 성립하는 날짜 계산 함수 (DeadlineScheduler가 등록)
+TRIGGER_DEFINITIONS: Dict[str, Dict[str, Any]] = {
+    'overdue_return': {
+        'events': [DOMAIN_EVENTS['LOAN_CREATED'], DOMAIN_EVENTS['LOAN_UPDATED'], DOMAIN_EVENTS['DEADLINE_REACHED']],
+        'matches': _reached('overdue_return', _is_overdue),
+        'source': 'loan',
+        'deadline': _deadline('expected_return_date', lambda: 1, _is_open_loan),
+        'notification_type': 'return_overdue',
+        'priority': 'high',
+        'title': '반납 연체 알림',
+        'message': lambda e: f"{e['entity'].get('user_name', '')}님의 {e['entity'].get('asset_name', '')} 반납이 "
+                             f"{-(_days_until(e['entity'].get('expected_return_date')) or 0)}일 연체되었습니다."
+    },
+    'overdue_escalation': {
+        'events': [DOMAIN_EVENTS['LOAN_CREATED'], DOMAIN_EVENTS['LOAN_UPDATED'], DOMAIN_EVENTS['DEADLINE_REACHED']],
+        'matches': _reached('overdue_escalation', _is_escalated),
+        'source': 'loan',
+        'deadline': _deadline(
+            'expected_return_date', lambda: NOTIFICATION_RULE_SETTINGS['OVERDUE_ESCALATION_DAYS'], _is_open_loan
+        ),
+        'notification_type': 'return_overdue',
+        'priority': 'high',
+        'title': '반납 장기 연체 알림',
+        'message': lambda e: f"{e['entity'].get('user_name', '')}님의 {e['entity'].get('asset_name', '')} 반납이 "
+                             f"{-(_days_until(e['entity'].get('expected_return_date')) or 0)}일 연체되어 확인이 필요합니다."
+    },
+    'return_reminder': {
+        'events': [DOMAIN_EVENTS['LOAN_CREATED'], DOMAIN_EVENTS['LOAN_UPDATED'], DOMAIN_EVENTS['DEADLINE_REACHED']],
+        'matches': _reached('return_reminder', _is_due_soon),
+        'source': 'loan',
+        'deadline': _deadline(
+            'expected_return_date', lambda: -NOTIFICATION_RULE_SETTINGS['RETURN_REMINDER_DAYS'], _is_open_loan
+        ),
+        'notification_type': 'return_reminder',
+        'priority': 'medium',
+        'title': '반납 예정 알림',
+        'message': lambda e: f"{e['entity'].get('user_name', '')}님의 {e['entity'].get('asset_name', '')} "
+                             f"반납 예정일이 {_to_date(e['entity'].get('expected_return_date'))}입니다."
+    },
+    'approval_request': {
+        'events': [DOMAIN_EVENTS['LOAN_RETURNED']],
+        'matches': lambda event: True,
+        'notification_type': 'approval_pending',
+        'priority': 'medium',
+        'title': '승인 대기 알림',
+        'message': lambda e: f"{e['entity'].get('user_name', '')}님의 {e['entity'].get('asset_name', '')} "
+                             f"반납 승인이 대기중입니다."
+    },
+    'maintenance_required': {
+        'events': [DOMAIN_EVENTS['ASSET_UPDATED']],
+        'matches': _entered_repair,
+        'notification_type': 'maintenance_required',
+        'priority': 'medium',
+        'title': '정기점검 알림',
+        'message': lambda e: f"{e['entity'].get('name', '')} 자산이 점검/수리 상태로 변경되었습니다."
+    },
+    'asset_transfer': {
+        'events': [DOMAIN_EVENTS['ASSET_UPDATED']],
+        'matches': _was_transferred,
+        'notification_type': 'asset_transfer',
+        'priority': 'medium',
+        'title': '자산 이관 알림',
+        'message': lambda e: f"{e['entity'].get('name', '')} 자산이 {(e.get('previous') or {}).get('user_name', '')}님에서 "
+                             f"{e['entity'].get('user_name', '')}님으로 이관되었습니다."
+    },
+    'warranty_expiry': {
+        'events': [DOMAIN_EVENTS['ASSET_CREATED'], DOMAIN_EVENTS['ASSET_UPDATED'], DOMAIN_EVENTS['DEADLINE_REACHED']],
+        'matches': _reached('warranty_expiry', _is_warranty_expiring),
+        'source': 'asset',
+        'deadline': _deadline('warranty_expiry', lambda: -WARRANTY_ALERT_DAYS),
+        'notification_type': 'warranty_expiry',
+        'priority': 'high',
+        'title': '보증 만료 알림',
+        'message': lambda e: f"{e['entity'].get('name', '')} 자산의 보증 기간이 "
+                             f"{e['entity'].get('warranty_expiry')}에 만료됩니다."
+    },
+    'contract_expiry': {
+        'events': [DOMAIN_EVENTS['CONTRACT_CREATED'], DOMAIN_EVENTS['CONTRACT_UPDATED'], DOMAIN_EVENTS['DEADLINE_REACHED']],
+        'matches': _reached('contract_expiry', _is_contract_expiring),
+        'source': 'contract',
+        'deadline': _deadline(
+            'end_date', lambda: -CONTRACT_ALERT_DAYS, lambda c: c.get('status') in ('active', 'expiring')
+        ),
+        'notification_type': 'contract_expiry',
+        'priority': 'high',
+        'title': '계약 만료 알림',
+        'message': lambda e: f"{e['entity'].get('name', '')} 계약({e['entity'].get('vendor', '')})이 "
+                             f"{e['entity'].get('end_date')}에 만료됩니다."
+    }
+}
+
+# 규칙 추가 조건(conditions)에 사용할 수 있는 비교 연산자
+CONDITION_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'in': lambda actual, expected: actual in expected,
+    'not_in': lambda actual, expected: actual not in expected,
+    'contains': lambda actual, expected: actual is not None and expected in actual
+}
+
+# 수신자 역할별로 이벤트에서 (사용자 ID, 이름)을 꺼내는 위치
+RECIPIENT_FIELDS: Dict[str, Tuple[str, str, str]] = {
+    'borrower': ('entity', 'user_id', 'user_name'),
+    'receiver': ('entity', 'user_id', 'user_name'),
+    'transferer': ('previous', 'user_id', 'user_name'),
+    'approver': ('entity', 'approver_id', 'approver_name')
+}
+
+# 관리자 역할 사용자로 해석하는 수신자 역할
+ADMIN_RECIPIENT_ROLES = {'admin', 'manager', 'approver'}
+
+
+class CompiledRule:
+    """컴파일된 알림 규칙 (규칙 정보 + 추가 조건 판정 함수)"""
+    
+    __slots__ = ('rule_id', 'name', 'trigger', 'recipients', 'channel', 'condition')
+    
+    def __init__(
+        self,
+        rule: Dict[str, Any],
+        trigger: str,
+        condition: Optional[Callable[[Dict[str, Any]], bool]]
+    ):
+        self.rule_id = rule.get('id')
+        self.name = rule.get('name', '')
+        self.trigger = trigger
+        self.recipients = list(rule.get('recipients') or [])
+        self.channel = rule.get('notification_type') or NOTIFICATION_RULE_SETTINGS['DEFAULT_CHANNEL']
+        self.condition = condition
+    
+    def matches(self, event: Dict[str, Any]) -> bool:
+        """추가 조건 판정 (조건이 없으면 항상 참)"""
+        return self.condition is None or self.condition(event['entity'])
+
+
+class NotificationRuleEngine:
+    """
+    알림 규칙 엔진 클래스
+    
+    활성 규칙을 트리거별로 묶고 트리거가 반응하는 이벤트 유형으로 색인해 둡니다.
+    이벤트가 오면 해당 유형에 걸린 트리거만 판정하고(트리거당 한 번), 트리거가 성립한 경우에만
+    그 트리거에 속한 규칙의 추가 조건을 평가하므로 비용은 전체 규칙 수가 아니라 관련 규칙 수에 비례합니다.
+    규칙이 생성/수정되면 저장소의 규칙 버전이 바뀌고, 다음 이벤트에서 색인을 다시 컴파일합니다.
+    """
+    
+    def __init__(self, notification_repo=None, user_repo=None):
+        """
+        엔진 초기화 (규칙 컴파일은 첫 이벤트에서 수행)
+        
+        Args:
+            notification_repo: 알림 Repository (기본값: notification_repository)
+            user_repo: 사용자 Repository (기본값: user_repository, 'admin'/'manager' 수신자 조회용)
+        """
+        self._notification_repo = notification_repo
+        self._user_repo = user_repo
+        self._index: Dict[str, List[Tuple[str, List[CompiledRule]]]] = {}
+        self._compiled_version: Optional[int] = None
+        self._lock = threading.Lock()
+        self._started = False
+        self._stats = {
+            'events_received': 0,
+            'trigger_evaluations': 0,
+            'rule_evaluations': 0,
+            'rules_matched': 0,
+            'notifications_created': 0,
+            'compilations': 0
+        }
+    
+    @property
+    def notification_repo(self):
+        """알림 Repository (순환 import 방지를 위해 최초 사용 시 연결)"""
+        if self._notification_repo is None:
+            from ...repositories import notification_repository
+            self._notification_repo = notification_repository
+        return self._notification_repo
+    
+    @property
+    def user_repo(self):
+        """사용자 Repository (최초 사용 시 연결)"""
+        if self._user_repo is None:
+            from ...repositories.user.user_repository import user_repository
+            self._user_repo = user_repository
+        return self._user_repo
+    
+    # ==================== 구독 ====================
+    
+    def start(self) -> None:
+        """트리거가 사용하는 모든 이벤트 유형 구독 (여러 번 호출해도 한 번만 구독)"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for event_type in {event for definition in TRIGGER_DEFINITIONS.values() for event in definition['events']}:
+            domain_events.subscribe(event_type, self.handle_event)
+    
+    def stop(self) -> None:
+        """이벤트 구독 해제"""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+        for event_type in {event for definition in TRIGGER_DEFINITIONS.values() for event in definition['events']}:
+            domain_events.unsubscribe(event_type, self.handle_event)
+    
+    # ==================== 평가 ====================
+    
+    def handle_event(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        이벤트에 관련된 규칙만 평가하여 알림 생성
+        
+        Args:
+            event: domain_events가 발행한 이벤트
+        
+        Returns:
+            List[Dict[str, Any]]: 생성된 알림 목록
+        """
+        index = self._get_index()
+        entries = index.get(event['type'])
+        with self._lock:
+            self._stats['events_received'] += 1
+        if not entries:
+            return []
+        
+        created: List[Dict[str, Any]] = []
+        trigger_evaluations = rule_evaluations = rules_matched = 0
+        for trigger, rules in entries:
+            definition = TRIGGER_DEFINITIONS[trigger]
+            trigger_evaluations += 1
+            if not definition['matches'](event):
+                continue
+            for rule in rules:
+                rule_evaluations += 1
+                if not rule.matches(event):
+                    continue
+                rules_matched += 1
+                created.extend(self._create_notifications(rule, definition, event))
+        
+        with self._lock:
+            self._stats['trigger_evaluations'] += trigger_evaluations
+            self._stats['rule_evaluations'] += rule_evaluations
+            self._stats['rules_matched'] += rules_matched
+            self._stats['notifications_created'] += len(created)
+        return created
+    
+    def validate_rule(self, rule_data: Dict[str, Any]) -> Optional[str]:
+        """
+        규칙의 트리거와 추가 조건이 컴파일 가능한지 검증
+        
+        Args:
+            rule_data: 규칙 데이터
+        
+        Returns:
+            Optional[str]: 오류 메시지 (문제가 없으면 None)
+        """
+        trigger = rule_data.get('trigger_condition')
+        if trigger is not None and trigger not in TRIGGER_DEFINITIONS:
+            return f"지원하지 않는 트리거입니다: {trigger}"
+        try:
+            self._compile_conditions(rule_data.get('conditions'))
+        except ValueError as e:
+            return str(e)
+        return None
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        엔진 처리 통계 조회
+        
+        Returns:
+            Dict[str, Any]: 이벤트/트리거/규칙 평가 수, 생성 알림 수, 컴파일 횟수, 색인된 규칙 수
+        """
+        index = self._get_index()
+        with self._lock:
+            return dict(
+                self._stats,
+                indexed_event_types=len(index),
+                compiled_rules=len({rule.rule_id for entries in index.values() for _, rules in entries for rule in rules})
+            )
+    
+    # ==================== 컴파일 ====================
+    
+    def _get_index(self) -> Dict[str, List[Tuple[str, List[CompiledRule]]]]:
+        """규칙 버전이 바뀌었으면 색인을 다시 컴파일하여 반환"""
+        version = self.notification_repo.get_rules_version()
+        if version == self._compiled_version:
+            return self._index
+        with self._lock:
+            if version != self._compiled_version:
+                self._index = self._compile(self.notification_repo.get_notification_rules())
+                self._compiled_version = version
+                self._stats['compilations'] += 1
+            return self._index
+    
+    def _compile(self, rules: List[Dict[str, Any]]) -> Dict[str, List[Tuple[str, List[CompiledRule]]]]:
+        """활성 규칙을 트리거별로 묶어 이벤트 유형 색인 생성 (컴파일할 수 없는 규칙은 제외)"""
+        by_trigger: Dict[str, List[CompiledRule]] = {}
+        for rule in rules:
+            trigger = rule.get('trigger_condition')
+            if not rule.get('is_active', True) or trigger not in TRIGGER_DEFINITIONS:
+                continue
+            try:
+                condition = self._compile_conditions(rule.get('conditions'))
+            except ValueError as e:
+                print(f"알림 규칙 컴파일 오류 (규칙 {rule.get('id')}): {e}")
+                continue
+            by_trigger.setdefault(trigger, []).append(CompiledRule(rule, trigger, condition))
+        
+        index: Dict[str, List[Tuple[str, List[CompiledRule]]]] = {}
+        for trigger, compiled_rules in by_trigger.items():
+            for event_type in TRIGGER_DEFINITIONS[trigger]['events']:
+                index.setdefault(event_type, []).append((trigger, compiled_rules))
+        return index
+    
+    @staticmethod
+    def _compile_conditions(conditions: Optional[List[Dict[str, Any]]]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+        """
+        추가 조건 목록을 하나의 판정 함수로 컴파일 (모든 조건 AND)
+        
+        Args:
+            conditions: [{'field': 'department', 'operator': 'eq', 'value': 'IT개발팀'}, ...]
+        
+        Returns:
+            Optional[Callable]: 이벤트 대상 데이터를 받는 판정 함수 (조건이 없으면 None)
+        
+        Raises:
+            ValueError: 조건 형식이나 연산자가 잘못된 경우
+        """
+        if not conditions:
+            return None
+        if not isinstance(conditions, list):
+            raise ValueError("conditions는 목록이어야 합니다.")
+        
+        checks: List[Tuple[str, Callable[[Any, Any], bool], Any]] = []
+        for condition in conditions:
+            if not isinstance(condition, dict) or not condition.get('field'):
+                raise ValueError("조건에는 field가 필요합니다.")
+            op_name = condition.get('operator', 'eq')
+            if op_name not in CONDITION_OPERATORS:
+                raise ValueError(f"지원하지 않는 조건 연산자입니다: {op_name}")
+            checks.append((condition['field'], CONDITION_OPERATORS[op_name], condition.get('value')))
+        
+        def predicate(entity: Dict[str, Any]) -> bool:
+            for field, compare, expected in checks:
+                try:
+                    if not compare(entity.get(field), expected):
+                        return False
+                except TypeError:
+                    return False
+            return True
+        
+        return predicate
+    
+    # ==================== 알림 생성 ====================
+    
+    def _create_notifications(
+        self,
+        rule: CompiledRule,
+        definition: Dict[str, Any],
+        event: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """일치한 규칙의 수신자별 알림 생성 (같은 사용자에게는 한 번만)"""
+        entity = event['entity']
+        source = event.get('source') or event['type'].split('.')[0]
+        message = definition['message'](event)
+        created: List[Dict[str, Any]] = []
+        seen = set()
+        for recipient_id, recipient_name in self._resolve_recipients(rule.recipients, event):
+            if recipient_id in seen:
+                continue
+            seen.add(recipient_id)
+            try:
+                created.append(self.notification_repo.create({
+                    'type': definition['notification_type'],
+                    'title': definition['title'],
+                    'message': message,
+                    'recipient_id': recipient_id,
+                    'recipient_name': recipient_name,
+                    'asset_id': entity.get('asset_id') if source == 'loan' else entity.get('id') if source == 'asset' else None,
+                    'asset_name': entity.get('asset_name', entity.get('name', '')),
+                    'is_read': False,
+                    'priority': definition['priority'],
+                    'read_at': None,
+                    'rule_id': rule.rule_id,
+                    'channel': rule.channel,
+                    'event_type': event['type']
+                }))
+            except ValueError as e:
+                print(f"규칙 알림 생성 오류 (규칙 {rule.rule_id}): {e}")
+        return created
+    
+    def _resolve_recipients(self, roles: List[str], event: Dict[str, Any]) -> List[Tuple[int, str]]:
+        """수신자 역할을 (사용자 ID, 이름) 목록으로 해석 ('admin'/'manager'는 관리자 역할 사용자)"""
+        recipients: List[Tuple[int, str]] = []
+        for role in roles:
+            if role in RECIPIENT_FIELDS:
+                source, id_field, name_field = RECIPIENT_FIELDS[role]
+                data = event.get(source) or {}
+                if isinstance(data.get(id_field), int) and data[id_field] > 0:
+                    recipients.append((data[id_field], data.get(name_field) or str(data[id_field])))
+                    continue
+            # 'admin'/'manager' 및 이벤트에 승인자 정보가 없는 'approver'는 관리자 역할 사용자에게 보냄
+            if role not in ADMIN_RECIPIENT_ROLES:
+                continue
+            recipients.extend(
+                (user['id'], user['name'])
+                for user in self.user_repo.get_users_by_role(NOTIFICATION_RULE_SETTINGS['ADMIN_ROLE_ID'])
+                if user.get('is_active', True)
+            )
+        return recipients
+
+
+# 싱글톤 인스턴스 생성
+notification_rule_engine = NotificationRuleEngine()
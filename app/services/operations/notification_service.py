@@ -18,8 +18,23 @@ class NotificationService:
     def __init__(self):
         """Service 초기화 및 Repository 의존성 주입"""
         from ...repositories import notification_repository, operations_repository
+        from .notification_rule_engine import notification_rule_engine
+        from .deadline_scheduler import deadline_scheduler
+        from .notification_digest import notification_digest_service
         self.notification_repo = notification_repository
         self.operations_repo = operations_repository
+        
+        # 활성 규칙을 대여/반납/자산 변경 이벤트에 연결
+        self.rule_engine = notification_rule_engine
+        self.rule_engine.start()
+        
+        # 반납 예정일/보증 만료/계약 만료 기한이 되면 규칙 엔진에 deadline.reached 이벤트 전달
+        # (발생 스레드는 create_app에서 요청을 처리하는 프로세스에서만 시작)
+        self.deadline_scheduler = deadline_scheduler
+        
+        # 메일 채널 규칙 알림은 수신자별로 모아 묶음 메일로 발송
+        self.digest_service = notification_digest_service
+        self.digest_service.start()
     
     def get_return_notifications(self, include_read=True, include_pending=True, limit=100):
         """반납 알림 목록 조회"""
@@ -86,6 +101,30 @@ class NotificationService:
             print(f"알림 삭제 오류: {e}")
             return False
     
+    def get_inbox(self, recipient_id, page=1, per_page=20, unread_only=False):
+        """수신자 알림함 페이지 조회 (최신순)"""
+        try:
+            return self.notification_repo.get_inbox(recipient_id, page, per_page, unread_only)
+        except Exception as e:
+            print(f"알림함 조회 오류: {e}")
+            raise
+    
+    def get_unread_count(self, recipient_id):
+        """수신자의 읽지 않은 알림 수 조회 (헤더 배지용)"""
+        try:
+            return self.notification_repo.get_unread_count(recipient_id)
+        except Exception as e:
+            print(f"읽지 않은 알림 수 조회 오류: {e}")
+            return 0
+    
+    def mark_all_notifications_read(self, recipient_id):
+        """수신자의 알림 일괄 읽음 처리"""
+        try:
+            return self.notification_repo.mark_all_read(recipient_id)
+        except Exception as e:
+            print(f"알림 일괄 읽음 처리 오류: {e}")
+            return {'success': False, 'message': '일괄 읽음 처리 중 오류가 발생했습니다.'}
+    
     def create_notification_rule(self, rule_data):
         """알림 규칙 생성"""
         try:
@@ -134,10 +173,27 @@ class NotificationService:
             print(f"알림 템플릿 수정 오류: {e}")
             return {'success': False, 'message': '템플릿 수정 중 오류가 발생했습니다.'}
     
+    def get_rule_engine_statistics(self):
+        """알림 규칙 엔진 처리 통계 조회"""
+        return self.rule_engine.get_statistics()
+    
+    def get_deadline_scheduler_status(self, limit=20):
+        """기한 스케줄러 상태 및 다가오는 기한 조회"""
+        return {
+            'statistics': self.deadline_scheduler.get_statistics(),
+            'upcoming': self.deadline_scheduler.get_pending(limit)
+        }
+    
+    def get_digest_statistics(self):
+        """알림 묶음 발송 통계 조회"""
+        return self.digest_service.get_statistics()
+    
     def _validate_notification_rule(self, rule_data):
-        """알림 규칙 유효성 검증"""
+        """알림 규칙 유효성 검증 (트리거/추가 조건은 규칙 엔진에서 컴파일 가능한지 확인)"""
         required_fields = ['name', 'condition', 'action']
-        return all(field in rule_data for field in required_fields)
+        if not all(field in rule_data for field in required_fields):
+            return False
+        return self.rule_engine.validate_rule(rule_data) is None
     
     def _validate_notification_template(self, template_data):
         """알림 템플릿 유효성 검증"""
@@ -8,6 +8,8 @@ Classes:
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime, date
 
+from ..repositories.operations.history_rollup import recent_month_keys
+
 
 class OperationsCoreService:
     """
@@ -122,29 +124,27 @@ class OperationsCoreService:
         return dashboard_data
     
     def _calculate_monthly_loan_stats(self) -> List[Dict]:
-        """월별 대여 통계 계산"""
-        # 간단한 월별 집계 (실제로는 더 정교한 로직 필요)
-        monthly_data = []
-        current_month = datetime.now().month
-        
-        for i in range(6):  # 최근 6개월
-            month = (current_month - i - 1) % 12 + 1
-            monthly_data.append({
-                'month': f"{month}월",
-                'loan_count': 10 + i * 2,  # 샘플 데이터
-                'return_count': 8 + i * 2,
-                'overdue_count': 1 if i % 2 == 0 else 0
-            })
+        """월별 대여 통계 계산 (최근 6개월, 이력 월별 집계에서 조회)"""
+        monthly_rows = self.operations_repo.get_history_monthly_rollup(recent_month_keys(6))
         
-        return list(reversed(monthly_data))
+        return [
+            {
+                'month': f"{int(row['month'][5:])}월",
+                'loan_count': row['by_operation_type'].get('대여', 0),
+                'return_count': row['by_operation_type'].get('반납', 0),
+                'overdue_count': row['by_status'].get('지연', 0)
+            }
+            for row in monthly_rows
+        ]
     
     def _calculate_department_loan_stats(self) -> Dict:
-        """부서별 대여 통계 계산"""
+        """부서별 대여 통계 계산 (최근 6개월 대여 이력 집계 기준)"""
+        summary = self.operations_repo.get_history_rollup_summary(recent_month_keys(6), ['대여'])
+        total = summary['count']
+        
         return {
-            'development': {'count': 15, 'percentage': 45},
-            'hr': {'count': 8, 'percentage': 24},
-            'marketing': {'count': 6, 'percentage': 18},
-            'sales': {'count': 4, 'percentage': 13}
+            department: {'count': count, 'percentage': round(count / total * 100) if total else 0}
+            for department, count in sorted(summary['by_department'].items(), key=lambda x: x[1], reverse=True)
         }
     
     # ==================== 유틸리티 메서드 ====================
@@ -176,90 +176,15 @@ class OperationsCoreService:
         Returns:
             이력 레코드와 통계 정보
         """
-        # Mock 데이터 생성 (실제로는 Repository에서 조회)
-        history_records = [
-            {
-                'id': 'H001',
-                'operation_date': '2024-12-28 14:30',
-                'asset_id': 'AST-001',
-                'asset_name': 'Dell 노트북',
-                'operation_type': '대여',
-                'user_name': '홍길동',
-                'user_department': '개발팀',
-                'department': 'IT개발팀',
-                'status': '완료',
-                'notes': '정상 대여 처리'
-            },
-            {
-                'id': 'H002',
-                'operation_date': '2024-12-27 10:15',
-                'asset_id': 'AST-003',
-                'asset_name': 'HP 프린터',
-                'operation_type': '반납',
-                'user_name': '김영수',
-                'user_department': '마케팅팀',
-                'department': '마케팅팀',
-                'status': '완료',
-                'notes': '정상 작동 확인'
-            },
-            {
-                'id': 'H003',
-                'operation_date': '2024-12-26 16:45',
-                'asset_id': 'AST-007',
-                'asset_name': '모니터',
-                'operation_type': '수리',
-                'user_name': '박민수',
-                'user_department': 'IT팀',
-                'department': 'IT지원팀',
-                'status': '진행중',
-                'notes': '화면 깜빡임 문제'
-            },
-            {
-                'id': 'H004',
-                'operation_date': '2024-12-25 09:00',
-                'asset_id': 'AST-010',
-                'asset_name': '구형 PC',
-                'operation_type': '폐기',
-                'user_name': '관리자',
-                'user_department': 'IT팀',
-                'department': 'IT지원팀',
-                'status': '승인대기',
-                'notes': '내용연수 만료'
-            },
-            {
-                'id': 'H005',
-                'operation_date': '2024-12-24 15:20',
-                'asset_id': 'AST-005',
-                'asset_name': 'iPad',
-                'operation_type': '이관',
-                'user_name': '이철수',
-                'user_department': '영업팀',
-                'department': '영업팀',
-                'status': '완료',
-                'notes': '부서 이동에 따른 이관'
-            }
-        ]
-        
-        # 필터링 로직 적용
-        filtered_records = history_records
-        
-        if asset_id:
-            filtered_records = [r for r in filtered_records 
-                              if asset_id.lower() in r['asset_id'].lower() or 
-                                 asset_id.lower() in r['asset_name'].lower()]
-        
-        if user_name:
-            filtered_records = [r for r in filtered_records 
-                              if user_name.lower() in r['user_name'].lower() or 
-                                 user_name.lower() in r['department'].lower()]
-        
-        if operation_type:
-            filtered_records = [r for r in filtered_records 
-                              if r['operation_type'] == operation_type]
-        
-        if status:
-            filtered_records = [r for r in filtered_records 
-                              if r['status'] == status]
+        # 월별 파티션 이력 저장소에서 기간/조건 조회 (최신순)
+        filtered_records = self.operations_repo.get_operation_history(
+            asset_id=asset_id,
+            user_name=user_name,
+            operation_type=operation_type,
+            status=status,
+            start_date=start_date,
+            end_date=end_date
+        )
         
         # 통계 계산
         stats = {
@@ -283,47 +208,8 @@ class OperationsCoreService:
         Returns:
             통계 데이터와 차트 정보
         """
-        # Mock 데이터 생성 (실제로는 Repository에서 조회)
-        return {
-            'summary_stats': {
-                'monthly_loans': 145,
-                'monthly_returns': 132,
-                'overdue_returns': 23,
-                'average_utilization_rate': 78.5,
-                'monthly_loan_growth': 12,
-                'monthly_return_growth': 8,
-                'overdue_change': 5,
-                'utilization_growth': 2.3
-            },
-            'monthly_trends': [
-                {'month': '7월', 'loans': 120, 'returns': 115, 'overdue': 18},
-                {'month': '8월', 'loans': 135, 'returns': 128, 'overdue': 20},
-                {'month': '9월', 'loans': 142, 'returns': 140, 'overdue': 15},
-                {'month': '10월', 'loans': 138, 'returns': 135, 'overdue': 22},
-                {'month': '11월', 'loans': 129, 'returns': 125, 'overdue': 18},
-                {'month': '12월', 'loans': 145, 'returns': 132, 'overdue': 23}
-            ],
-            'department_utilization': [
-                {'department': 'IT개발팀', 'value': 35, 'color': '#007bff'},
-                {'department': '마케팅팀', 'value': 25, 'color': '#28a745'},
-                {'department': '영업팀', 'value': 22, 'color': '#17a2b8'},
-                {'department': '기타', 'value': 18, 'color': '#ffc107'}
-            ],
-            'asset_utilization_top10': [
-                {'asset_name': 'Dell 노트북 (AST-001)', 'loan_count': 24, 'utilization_rate': 92, 'avg_loan_period': 12},
-                {'asset_name': 'iPad Pro (AST-005)', 'loan_count': 18, 'utilization_rate': 85, 'avg_loan_period': 8},
-                {'asset_name': 'HP 프린터 (AST-003)', 'loan_count': 16, 'utilization_rate': 78, 'avg_loan_period': 5},
-                {'asset_name': '삼성 모니터 (AST-007)', 'loan_count': 14, 'utilization_rate': 72, 'avg_loan_period': 15},
-                {'asset_name': '무선 마우스 (AST-012)', 'loan_count': 12, 'utilization_rate': 65, 'avg_loan_period': 3}
-            ],
-            'user_activity_top10': [
-                {'user_name': '홍길동', 'department': 'IT개발팀', 'loan_count': 28, 'reliability': 'A급'},
-                {'user_name': '김영수', 'department': '마케팅팀', 'loan_count': 22, 'reliability': 'A급'},
-                {'user_name': '박민수', 'department': 'IT지원팀', 'loan_count': 19, 'reliability': 'B급'},
-                {'user_name': '이철수', 'department': '영업팀', 'loan_count': 15, 'reliability': 'C급'},
-                {'user_name': '정미경', 'department': '인사팀', 'loan_count': 12, 'reliability': 'A급'}
-            ]
-        }
+        # 월별 사전 집계 기반 상세 통계 (이력 수와 무관하게 조회 개월 수에 비례)
+        return self.operations_repo.get_detailed_statistics()
     
     def generate_operations_report(self, report_type: str, start_date: str = None, 
                                   end_date: str = None, include_sections: List[str] = None) -> Dict:
@@ -1027,6 +913,26 @@ class OperationsCoreService:
         """알림 삭제 (NotificationService로 delegate)"""
         return self.notification_service.delete_notification(notification_id)
 
+    def get_notification_inbox(self, recipient_id, page=1, per_page=20, unread_only=False):
+        """수신자 알림함 조회 (NotificationService로 delegate)"""
+        return self.notification_service.get_inbox(recipient_id, page, per_page, unread_only)
+
+    def get_unread_notification_count(self, recipient_id):
+        """읽지 않은 알림 수 조회 (NotificationService로 delegate)"""
+        return self.notification_service.get_unread_count(recipient_id)
+
+    def mark_all_notifications_read(self, recipient_id):
+        """알림 일괄 읽음 처리 (NotificationService로 delegate)"""
+        return self.notification_service.mark_all_notifications_read(recipient_id)
+
+    def get_deadline_scheduler_status(self, limit=20):
+        """기한 스케줄러 상태 조회 (NotificationService로 delegate)"""
+        return self.notification_service.get_deadline_scheduler_status(limit)
+
+    def get_notification_digest_statistics(self):
+        """알림 묶음 발송 통계 조회 (NotificationService로 delegate)"""
+        return self.notification_service.get_digest_statistics()
+
     def create_notification_rule(self, rule_data):
         """알림 규칙 생성 (NotificationService로 delegate)"""
         return self.notification_service.create_notification_rule(rule_data)
@@ -12,13 +12,44 @@ import io
 import csv
 import xlsxwriter
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional, Callable
 
 # 전역 상수 import
 from ..utils.constants import (
     OPERATION_TYPES, OPERATION_STATUS, 
     format_date_string, format_number_with_commas, get_filename_timestamp
 )
+from ..utils.row_encoder import compile_row_encoder, extend_columns
+
+
+# 운영 행 컬럼 사양 (export_headers 순서)
+OPERATION_ROW_COLUMNS = [
+    {'key': 'id'},
+    {'key': 'operation_type', 'default': 'maintenance', 'lookup': OPERATION_TYPES, 'lookup_default': '유지보수'},
+    {'key': 'title'},
+    {'key': 'description', 'format': 'truncate', 'max_length': 100},
+    {'key': 'status', 'default': 'planned', 'lookup': OPERATION_STATUS, 'lookup_default': '계획됨'},
+    {'key': 'start_date', 'default': None, 'blank': '-'},
+    {'key': 'end_date', 'default': None, 'blank': '-'},
+    {'key': 'progress', 'default': 0, 'format': 'percent'},
+    {'key': 'assignee_name', 'default': '-'},
+    {'key': ('department', 'name'), 'default': '-'},
+    {'key': 'priority', 'default': 'medium'},
+    {'key': 'budget', 'default': 0},
+    {'key': 'actual_cost', 'default': 0},
+    {'key': 'created_at', 'default': None, 'blank': '-'},
+    {'key': 'updated_at', 'default': None, 'blank': '-'}
+]
+
+# CSV용 컬럼 사양 (날짜/비용 문자열 포맷)
+OPERATION_CSV_COLUMNS = extend_columns(OPERATION_ROW_COLUMNS, {
+    'start_date': {'format': 'date'},
+    'end_date': {'format': 'date'},
+    'budget': {'format': 'thousands', 'blank': '-'},
+    'actual_cost': {'format': 'thousands', 'blank': '-'},
+    'created_at': {'format': 'date', 'date_format': '%Y-%m-%d %H:%M'},
+    'updated_at': {'format': 'date', 'date_format': '%Y-%m-%d %H:%M'}
+})
 
 
 class OperationsExportService:
@@ -34,6 +65,10 @@ class OperationsExportService:
             "시작일", "종료일", "진행률", "담당자", "부서",
             "우선순위", "예산", "실제비용", "생성일", "수정일"
         ]
+        
+        # 행 인코더는 컬럼 사양으로 한 번만 컴파일
+        self._row_encoder = compile_row_encoder(OPERATION_ROW_COLUMNS, 'encode_operation_row')
+        self._csv_row_encoder = compile_row_encoder(OPERATION_CSV_COLUMNS, 'encode_operation_csv_row')
     
     def export_to_csv(self, operations: List[Dict[str, Any]]) -> Tuple[io.StringIO, str]:
         """
@@ -53,21 +88,24 @@ class OperationsExportService:
         writer.writerow(self.export_headers)
         
         # 데이터 작성
-        for operation in operations:
-            row_data = self._prepare_row_data(operation, format_for_csv=True)
-            writer.writerow(row_data)
+        writer.writerows(map(self._csv_row_encoder, operations))
         
         # 파일 포인터를 처음으로 되돌림
         output.seek(0)
         
         return output, "operations_export.csv"
     
-    def export_to_excel(self, operations: List[Dict[str, Any]]) -> Tuple[io.BytesIO, str]:
+    def export_to_excel(
+        self,
+        operations: List[Dict[str, Any]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[io.BytesIO, str]:
         """
         운영 데이터를 Excel 형식으로 내보내기
         
         Args:
             operations: 내보낼 운영 데이터 리스트
+            progress_callback: 진행률 콜백 (작성된 행 수, 전체 행 수)
             
         Returns:
             Tuple[io.BytesIO, str]: (Excel 데이터 스트림, 파일명)
@@ -81,7 +119,8 @@ class OperationsExportService:
             sheet_name='운영 목록',
             filename_prefix='operations',
             row_data_processor=ExcelRowProcessor.create_operations_row_processor(),
-            column_widths=[10, 12, 20, 30, 10, 12, 12, 10, 15, 15, 10, 15, 15, 15, 15]
+            column_widths=[10, 12, 20, 30, 10, 12, 12, 10, 15, 15, 10, 15, 15, 15, 15],
+            progress_callback=progress_callback
         )
     
     def _prepare_row_data(self, operation: Dict[str, Any], format_for_csv: bool = False) -> List[str]:
@@ -95,75 +134,9 @@ class OperationsExportService:
         Returns:
             List[str]: 행 데이터 리스트
         """
-        # 운영 유형명 변환
-        operation_type = OPERATION_TYPES.get(operation.get('operation_type', 'maintenance'), '유지보수')
-        
-        # 상태명 변환
-        status_name = OPERATION_STATUS.get(operation.get('status', 'planned'), '계획됨')
-        
-        # 담당자 및 부서명
-        assignee_name = operation.get('assignee_name', '-')
-        department_name = operation.get('department', {}).get('name', '-')
-        
-        # 날짜 형식 처리
-        start_date = '-'
-        end_date = '-'
-        created_at = '-'
-        updated_at = '-'
-        
-        if operation.get('start_date'):
-            if format_for_csv:
-                start_date = operation['start_date'].strftime('%Y-%m-%d') if hasattr(operation['start_date'], 'strftime') else str(operation['start_date'])
-            else:
-                start_date = operation['start_date']
-                
-        if operation.get('end_date'):
-            if format_for_csv:
-                end_date = operation['end_date'].strftime('%Y-%m-%d') if hasattr(operation['end_date'], 'strftime') else str(operation['end_date'])
-            else:
-                end_date = operation['end_date']
-                
-        if operation.get('created_at'):
-            if format_for_csv:
-                created_at = operation['created_at'].strftime('%Y-%m-%d %H:%M') if hasattr(operation['created_at'], 'strftime') else str(operation['created_at'])
-            else:
-                created_at = operation['created_at']
-                
-        if operation.get('updated_at'):
-            if format_for_csv:
-                updated_at = operation['updated_at'].strftime('%Y-%m-%d %H:%M') if hasattr(operation['updated_at'], 'strftime') else str(operation['updated_at'])
-            else:
-                updated_at = operation['updated_at']
-        
-        # 비용 형식 처리
-        budget = operation.get('budget', 0)
-        actual_cost = operation.get('actual_cost', 0)
-        
         if format_for_csv:
-            budget = format(budget, ',') if budget else '-'
-            actual_cost = format(actual_cost, ',') if actual_cost else '-'
-        
-        # 진행률 처리
-        progress = operation.get('progress', 0)
-        progress_str = f"{progress}%" if isinstance(progress, (int, float)) else str(progress)
-        
-        return [
-            operation.get('id', ''),
-            operation_type,
-            operation.get('title', ''),
-            operation.get('description', '')[:100] + '...' if len(operation.get('description', '')) > 100 else operation.get('description', ''),
-            status_name,
-            start_date,
-            end_date,
-            progress_str,
-            assignee_name,
-            department_name,
-            operation.get('priority', 'medium'),
-            budget,
-            actual_cost,
-            created_at,
-            updated_at
-        ]
+            return self._csv_row_encoder(operation)
+        return self._row_encoder(operation)
     
     # Excel 관련 중복 메서드들은 ExcelExportUtils로 통합되어 제거됨
 
@@ -0,0 +1,147 @@
+/**
+ * LiveUpdates - 서버 실시간 갱신(SSE) 공통 모듈
+ *
+ * 하나의 EventSource 연결을 페이지 안에서 공유하며, 서버가 보내는
+ * 알림(notification), 대시보드 통계 변경분(stats), 전체 재조회 요청(resync) 이벤트를
+ * 구독자에게 전달합니다. 연결이 끊기면 브라우저가 Last-Event-ID로 자동 재연결합니다.
+ *
+ * 함수 목록:
+ *   - on: 이벤트 구독 (첫 구독 시 연결, 구독 해제 함수 반환)
+ *   - off: 이벤트 구독 해제 (구독자가 없으면 연결 종료)
+ *   - isSupported: 브라우저 EventSource 지원 여부
+ *   - close: 연결 종료
+ */
+
+const LiveUpdates = (function() {
+    const STREAM_URL = '/operations/api/live/stream';
+    const EVENT_NAMES = ['notification', 'stats', 'resync'];
+
+    let source = null;
+    const listeners = new Map();
+
+    /**
+     * 브라우저 EventSource 지원 여부
+     * @returns {boolean}
+     */
+    function isSupported() {
+        return typeof window.EventSource === 'function';
+    }
+
+    /**
+     * 스트림 연결 (이미 연결되어 있으면 무시)
+     */
+    function connect() {
+        if (source || !isSupported()) return;
+
+        source = new EventSource(STREAM_URL, { withCredentials: true });
+        EVENT_NAMES.forEach(name => {
+            source.addEventListener(name, event => dispatch(name, event.data));
+        });
+    }
+
+    /**
+     * 구독자에게 이벤트 전달
+     * @param {string} name - 이벤트 이름
+     * @param {string} raw - JSON 문자열
+     */
+    function dispatch(name, raw) {
+        let data;
+        try {
+            data = JSON.parse(raw);
+        } catch (error) {
+            console.error('실시간 이벤트 파싱 실패:', error);
+            return;
+        }
+
+        (listeners.get(name) || []).forEach(handler => {
+            try {
+                handler(data);
+            } catch (error) {
+                console.error(`실시간 이벤트 처리 오류 (${name}):`, error);
+            }
+        });
+    }
+
+    /**
+     * 이벤트 구독
+     * @param {string} name - 이벤트 이름 (notification, stats, resync)
+     * @param {Function} handler - 이벤트 데이터를 받는 함수
+     * @returns {Function} 구독 해제 함수
+     */
+    function on(name, handler) {
+        if (!listeners.has(name)) {
+            listeners.set(name, []);
+        }
+        listeners.get(name).push(handler);
+        connect();
+        return () => off(name, handler);
+    }
+
+    /**
+     * 이벤트 구독 해제
+     * @param {string} name - 이벤트 이름
+     * @param {Function} handler - 등록했던 함수
+     */
+    function off(name, handler) {
+        const handlers = (listeners.get(name) || []).filter(h => h !== handler);
+        if (handlers.length) {
+            listeners.set(name, handlers);
+        } else {
+            listeners.delete(name);
+        }
+        if (!listeners.size) {
+            close();
+        }
+    }
+
+    /**
+     * 연결 종료
+     */
+    function close() {
+        if (source) {
+            source.close();
+            source = null;
+        }
+    }
+
+    /**
+     * 헤더 알림 배지 갱신
+     * @param {Object} data - notification 이벤트 데이터
+     */
+    function updateHeaderBadge(data) {
+        const link = document.querySelector('.nav-notifications');
+        if (!link || typeof data.unread_count !== 'number') return;
+
+        let badge = document.getElementById('unreadNotificationBadge');
+        if (!data.unread_count) {
+            if (badge) badge.remove();
+            return;
+        }
+        if (!badge) {
+            badge = document.createElement('span');
+            badge.id = 'unreadNotificationBadge';
+            badge.className = 'badge rounded-pill bg-danger ms-1';
+            link.appendChild(badge);
+        }
+        badge.textContent = data.unread_count < 100 ? String(data.unread_count) : '99+';
+    }
+
+    // 로그인 상태(헤더 알림 아이콘이 있을 때)면 배지를 실시간으로 갱신
+    if (document.querySelector('.nav-notifications')) {
+        on('notification', updateHeaderBadge);
+    }
+
+    // 공개 API
+    return {
+        on,
+        off,
+        isSupported,
+        close
+    };
+})();
+
+// 전역 변수로 설정
+window.LiveUpdates = LiveUpdates;
+
+// 모듈 내보내기
+export default LiveUpdates;
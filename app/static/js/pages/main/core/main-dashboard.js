@@ -9,6 +9,7 @@
 // 공통 모듈 가져오기
 import UIUtils from '../../../../common/ui-utils.js';
 import ApiUtils from '../../../../common/api-utils.js';
+import LiveUpdates from '../../../../common/live-updates.js';
 
 /**
  * MainDashboard 클래스
@@ -17,6 +18,7 @@ import ApiUtils from '../../../../common/api-utils.js';
 class MainDashboard {
     constructor() {
         this.refreshInterval = null;
+        this.liveUnsubscribers = [];
         this.refreshBtn = null;
         this.isRefreshing = false;
         this.lastRefreshTime = null;
@@ -131,6 +133,20 @@ class MainDashboard {
             clearInterval(this.refreshInterval);
         }
 
+        // 실시간 갱신을 지원하면 주기적 폴링 대신 서버가 보내는 변경분만 반영
+        if (LiveUpdates.isSupported()) {
+            this.liveUnsubscribers = [
+                LiveUpdates.on('stats', changes => {
+                    this.lastRefreshTime = new Date();
+                    window.dispatchEvent(new CustomEvent('dashboardRefreshed', {
+                        detail: { timestamp: this.lastRefreshTime, changes }
+                    }));
+                }),
+                LiveUpdates.on('resync', () => this.refreshDashboardData(false))
+            ];
+            return;
+        }
+
         this.refreshInterval = setInterval(this.performAutoRefresh, this.config.autoRefreshInterval);
         
         // 전역 인터벌 관리에 등록
@@ -303,6 +319,10 @@ class MainDashboard {
             }
         }
 
+        // 실시간 갱신 구독 해제
+        this.liveUnsubscribers.forEach(unsubscribe => unsubscribe());
+        this.liveUnsubscribers = [];
+
         // 캐시 정리
         this.clearSearchCache();
         
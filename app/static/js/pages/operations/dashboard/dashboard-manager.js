@@ -12,6 +12,7 @@
 
 import UIUtils from '../../../../common/ui-utils.js';
 import ApiUtils from '../../../../common/api-utils.js';
+import LiveUpdates from '../../../../common/live-updates.js';
 
 class DashboardManager {
     constructor() {
@@ -28,6 +29,7 @@ class DashboardManager {
             lastUpdated: null,
             currentStats: {},
             refreshTimer: null,
+            liveUnsubscribers: [],
             animationQueue: []
         };
         
@@ -532,6 +534,17 @@ class DashboardManager {
     startAutoRefresh() {
         this.stopAutoRefresh(); // 기존 타이머 정리
         
+        // 실시간 갱신을 지원하면 서버가 변경을 알릴 때만 새로고침 (주기적 폴링 생략)
+        if (LiveUpdates.isSupported()) {
+            const refresh = () => this.refreshDashboard();
+            this.state.liveUnsubscribers = [
+                LiveUpdates.on('stats', refresh),
+                LiveUpdates.on('resync', refresh),
+                LiveUpdates.on('notification', () => this.loadNotificationData())
+            ];
+            return;
+        }
+        
         this.state.refreshTimer = setInterval(() => {
             this.refreshDashboard();
         }, this.config.autoRefreshInterval);
@@ -541,6 +554,9 @@ class DashboardManager {
      * 자동 새로고침 중지
      */
     stopAutoRefresh() {
+        this.state.liveUnsubscribers.forEach(unsubscribe => unsubscribe());
+        this.state.liveUnsubscribers = [];
+        
         if (this.state.refreshTimer) {
             clearInterval(this.state.refreshTimer);
             this.state.refreshTimer = null;
@@ -7,13 +7,14 @@ Utils Package
 
 from .constants import (
     # 기존 상수들
-    ASSET_CATEGORIES, ASSET_STATUS, CONTRACT_TYPES, EXPORT_HEADERS,
+    ASSET_CATEGORIES, ASSET_STATUS, CONTRACT_TYPES, EXPORT_HEADERS, EXPORT_SETTINGS, PDF_SETTINGS, SMTP_SETTINGS,
     DATE_FORMAT, DATETIME_FORMAT,
     
     # 새로 추가된 하드코딩 제거 상수들
     BUSINESS_RULES, TIMEOUT_SETTINGS, ALERT_DURATION, INPUT_DELAY,
     UI_SETTINGS, COLUMN_WIDTHS, SAMPLE_DATA_SETTINGS, CHART_SETTINGS,
-    AI_MODEL_SETTINGS, DATE_SETTINGS,
+    AI_MODEL_SETTINGS, DATE_SETTINGS, DOMAIN_EVENTS, NOTIFICATION_RULE_SETTINGS,
+    LIVE_UPDATE_SETTINGS, DEADLINE_SCHEDULER_SETTINGS, NOTIFICATION_DIGEST_SETTINGS,
     
     # 헬퍼 함수
     get_category_name, get_status_name, get_contract_type_name,
@@ -26,15 +27,19 @@ from .constants import (
     validate_asset_data
 )
 
+# 도메인 이벤트 버스
+from .events import DomainEventBus, domain_events
+
 __all__ = [
     # 기존 상수들
-    'ASSET_CATEGORIES', 'ASSET_STATUS', 'CONTRACT_TYPES', 'EXPORT_HEADERS',
+    'ASSET_CATEGORIES', 'ASSET_STATUS', 'CONTRACT_TYPES', 'EXPORT_HEADERS', 'EXPORT_SETTINGS', 'PDF_SETTINGS', 'SMTP_SETTINGS',
     'DATE_FORMAT', 'DATETIME_FORMAT',
     
     # 새로 추가된 하드코딩 제거 상수들
     'BUSINESS_RULES', 'TIMEOUT_SETTINGS', 'ALERT_DURATION', 'INPUT_DELAY',
     'UI_SETTINGS', 'COLUMN_WIDTHS', 'SAMPLE_DATA_SETTINGS', 'CHART_SETTINGS',
-    'AI_MODEL_SETTINGS', 'DATE_SETTINGS',
+    'AI_MODEL_SETTINGS', 'DATE_SETTINGS', 'DOMAIN_EVENTS', 'NOTIFICATION_RULE_SETTINGS',
+    'LIVE_UPDATE_SETTINGS', 'DEADLINE_SCHEDULER_SETTINGS', 'NOTIFICATION_DIGEST_SETTINGS',
     
     # 헬퍼 함수
     'get_category_name', 'get_status_name', 'get_contract_type_name',
@@ -44,5 +49,8 @@ __all__ = [
     'format_date_string', 'format_number_with_commas',
     'get_current_date_string', 'get_filename_timestamp',
     'safe_int_convert', 'safe_float_convert',
-    'validate_asset_data'
+    'validate_asset_data',
+    
+    # 도메인 이벤트 버스
+    'DomainEventBus', 'domain_events'
 ]
\ No newline at end of file
@@ -156,6 +156,69 @@ EXPORT_HEADERS = [
     '취득일', '취득가액', '시리얼번호', '제조사', '모델명', '보증만료일', '현재가치'
 ]
 
+# 대용량 내보내기 설정
+EXPORT_SETTINGS = {
+    'LARGE_EXPORT_ROW_THRESHOLD': 50000,  # 이 행 수 이상이면 constant_memory 모드로 전환
+    'TEMP_DIR': None,  # 임시 파일 디렉토리 (None이면 시스템 기본값)
+    'XLSX_MIMETYPE': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'PROGRESS_INTERVAL': 1000,  # 진행률 보고 간격 (행)
+    'JOB_MAX_WORKERS': 2,  # 백그라운드 내보내기 작업 동시 실행 수
+    'JOB_MAX_PENDING': 20,  # 대기 + 실행 중 작업 최대 수
+    'JOB_ARTIFACT_DIR': 'temp_exports',  # 작업 결과 파일 저장 디렉토리
+    'JOB_RESULT_TTL_SECONDS': 3600,  # 작업 결과 보관 시간 (1시간)
+    'CACHE_DIR': 'export_cache',  # 내보내기 결과 캐시 디렉토리
+    'CACHE_MAX_BYTES': 500 * 1024 * 1024,  # 캐시 최대 용량 (500MB, 초과 시 LRU 제거)
+    'STREAM_CHUNK_BYTES': 64 * 1024,  # 스트리밍 내보내기 전송 단위 (압축 전 기준)
+    'STREAM_COMPRESS_LEVEL': 6,  # 스트리밍 gzip 압축 레벨 (1: 빠름 ~ 9: 작음)
+}
+
+# PDF 문서 생성 설정
+PDF_SETTINGS = {
+    'KOREAN_FONT_NAME': 'NanumGothic',  # 등록할 한글 TTF 폰트명
+    'KOREAN_FONT_PATHS': [  # 한글 TTF 폰트 탐색 경로 (앞쪽 우선)
+        'app/static/fonts/NanumGothic.ttf',
+        '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+        'C:/Windows/Fonts/malgun.ttf',
+        '/Library/Fonts/AppleGothic.ttf',
+    ],
+    'KOREAN_BOLD_FONT_PATHS': [
+        'app/static/fonts/NanumGothicBold.ttf',
+        '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
+        'C:/Windows/Fonts/malgunbd.ttf',
+    ],
+    'KOREAN_CID_FONT': 'HYGothic-Medium',  # TTF가 없을 때 사용하는 reportlab 내장 한글 폰트
+    'OUTPUT_DIR': 'generated_documents',  # PDF 저장 디렉터리 (작업 디렉터리 기준)
+    'INVARIANT_OUTPUT': True,  # 생성일시/문서 ID를 고정하여 같은 내용이면 같은 바이트로 렌더링 (중복 제거용)
+    'BLOB_DIRNAME': '.blobs',  # 내용 주소 기반 PDF 저장소 디렉터리 (출력 디렉터리 하위)
+    'LABEL_SIZE_MM': (90, 50),  # 자산 라벨 크기 (가로, 세로 mm)
+    'BATCH_MAX_DOCS': 1000,  # 일괄 생성 1회 최대 문서 수
+    'BATCH_MAX_WORKERS': None,  # 일괄 생성 워커 프로세스 수 (None이면 CPU 코어 수)
+    'BATCH_PARALLEL_MIN_DOCS': 4,  # 이 수 이상일 때만 프로세스 풀 사용
+    'BATCH_CHUNK_SIZE': 4,  # 워커당 한 번에 전달하는 문서 수
+    'BATCH_RESULT_TTL_SECONDS': 3600,  # 일괄 생성 결과 디렉터리 보관 시간 (1시간)
+    'BACKUP_MAX_WORKERS': 8,  # 문서 백업 복사 스레드 수
+}
+
+# SMTP 발송 설정
+SMTP_SETTINGS = {
+    'SERVER': 'smtp.gmail.com',  # 기본 SMTP 서버
+    'PORT': 587,
+    'USE_TLS': True,  # STARTTLS 사용 여부 (로컬 디버깅 서버는 False)
+    'USE_AUTH': True,  # 로그인 사용 여부 (로컬 디버깅 서버는 False)
+    'TIMEOUT': 30,  # 소켓 타임아웃 (초)
+    'POOL_SIZE': 4,  # 동시에 유지하는 최대 연결 수
+    'MAX_IDLE_SECONDS': 60,  # 이 시간 이상 쉬었던 연결은 닫고 새로 연결
+    'HEALTH_CHECK_IDLE_SECONDS': 10,  # 이 시간 이상 쉬었던 연결은 NOOP으로 상태 확인 후 재사용
+    'MAX_MESSAGES_PER_CONNECTION': 100,  # 연결당 최대 발송 수 (서버 제한 대비)
+    'OUTBOX_DIR': 'email_outbox',  # 발송 대기열 저장 디렉터리 (작업 디렉터리 기준)
+    'OUTBOX_BATCH_SIZE': 20,  # 한 세션에서 연속 발송하는 최대 메일 수
+    'OUTBOX_MAX_ATTEMPTS': 5,  # 이 횟수만큼 실패하면 dead letter로 이동
+    'OUTBOX_BACKOFF_BASE_SECONDS': 5,  # 재시도 대기 시간 기준값 (시도마다 2배)
+    'OUTBOX_BACKOFF_MAX_SECONDS': 900,  # 재시도 대기 시간 상한
+    'OUTBOX_RATE_PER_SECOND': 10,  # 초당 최대 발송 수 (서버 발송 제한 대비)
+    'OUTBOX_SENT_RETENTION_SECONDS': 7 * 24 * 3600,  # 발송 완료 기록 보관 기간
+}
+
 # 페이지네이션 설정
 DEFAULT_PAGE_SIZE = 10
 MAX_PAGE_SIZE = 200
@@ -181,6 +244,7 @@ BUSINESS_RULES = {
     'DESCRIPTION_MAX_LENGTH': 100,  # 설명 최대 길이
     'NOTIFICATION_LIMIT': 100,  # 알림 제한
     'REPORT_HISTORY_LIMIT': 10,  # 보고서 이력 제한
+    'BULK_RFQ_MAX_PARTNERS': 1000,  # 일괄 견적 요청 1회 최대 협력사 수
 }
 
 # 타임아웃 및 지연 시간 설정 (밀리초)
@@ -307,6 +371,62 @@ NOTIFICATION_TRIGGERS = {
     'DAILY_DIGEST': 'daily_digest'
 }
 
+# 도메인 이벤트 유형 (app.utils.events.domain_events로 발행)
+DOMAIN_EVENTS = {
+    'LOAN_CREATED': 'loan.created',
+    'LOAN_UPDATED': 'loan.updated',
+    'LOAN_RETURNED': 'loan.returned',
+    'LOAN_DELETED': 'loan.deleted',
+    'ASSET_CREATED': 'asset.created',
+    'ASSET_UPDATED': 'asset.updated',
+    'ASSET_DELETED': 'asset.deleted',
+    'CONTRACT_CREATED': 'contract.created',
+    'CONTRACT_UPDATED': 'contract.updated',
+    'CONTRACT_DELETED': 'contract.deleted',
+    'DEADLINE_REACHED': 'deadline.reached',
+    'NOTIFICATION_CREATED': 'notification.created',
+    'NOTIFICATION_READ': 'notification.read',
+    'NOTIFICATION_DELETED': 'notification.deleted'
+}
+
+# 실시간 갱신(SSE) 채널 설정
+LIVE_UPDATE_SETTINGS = {
+    'HEARTBEAT_SECONDS': 15,  # 전송할 내용이 없을 때 연결 유지용 주석 전송 간격
+    'RETRY_MILLISECONDS': 3000,  # 연결이 끊겼을 때 브라우저 재연결 대기 시간
+    'STREAM_MAX_SECONDS': 300,  # 연결 최대 유지 시간 (이후 브라우저가 Last-Event-ID로 재연결)
+    'CLIENT_QUEUE_SIZE': 100,  # 클라이언트별 미전송 이벤트 상한 (넘치면 비우고 resync 이벤트 전송)
+    'REPLAY_BUFFER_SIZE': 500,  # 재연결 시 이어 보낼 최근 이벤트 수
+    'MAX_CLIENTS': 200,  # 동시 연결 상한
+    'STATS_MIN_INTERVAL_SECONDS': 2,  # 통계 재계산 최소 간격 (변경이 몰려도 이 간격으로 합쳐서 계산)
+}
+
+# 알림 규칙 엔진 설정
+NOTIFICATION_RULE_SETTINGS = {
+    'RETURN_REMINDER_DAYS': 1,  # 반납 예정일 며칠 전에 알릴지
+    'ADMIN_ROLE_ID': 1,  # 'admin'/'manager' 수신자로 해석할 사용자 역할
+    'DEFAULT_CHANNEL': 'system',
+    'OVERDUE_ESCALATION_DAYS': 7  # 반납 예정일이 이 일수만큼 지나면 관리자에게 다시 알림
+}
+
+# 알림 묶음(digest) 발송 설정
+NOTIFICATION_DIGEST_SETTINGS = {
+    'WINDOW_SECONDS': 900,  # 수신자/채널별로 알림을 모으는 시간 (첫 알림 기준)
+    'HIGH_PRIORITY_MAX_DELAY_SECONDS': 60,  # 높은 우선순위 알림이 모이는 동안 기다릴 수 있는 최대 시간
+    'MAX_ITEMS': 50,  # 묶음에 이 수만큼 모이면 기다리지 않고 발송
+    'CHANNELS': {  # 규칙 알림 채널(notification_type) → 묶음 발송 채널
+        'email': ('email',),
+        'email_and_system': ('email',)
+    }
+}
+
+# 기한 스케줄러(계층형 타이밍 휠) 설정
+DEADLINE_SCHEDULER_SETTINGS = {
+    'TICK_SECONDS': 60,  # 휠 한 칸의 시간 (기한 판정 해상도)
+    'WHEEL_SIZES': (60, 24, 64, 64),  # 단계별 칸 수 (분 → 시간 → 일 → 64일 단위)
+    'STATE_DIR': 'scheduler_state',  # 대기/발생 기한 저장 디렉터리 (작업 디렉터리 기준)
+    'JOURNAL_COMPACT_ENTRIES': 50000,  # 변경 기록이 이 수를 넘으면 스냅샷으로 압축
+}
+
 # 시스템 설정
 DEFAULT_CURRENCY = 'KRW'
 DATE_FORMAT = '%Y-%m-%d'
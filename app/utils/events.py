@@ -0,0 +1,103 @@
+"""
+Domain Event Bus
+대여/반납/자산 변경을 구독자에게 전달하는 프로세스 내 이벤트 버스
+
+Classes:
+    - DomainEventBus: 이벤트 유형별 구독자 목록 기반 동기 발행/구독
+"""
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .constants import DOMAIN_EVENTS
+
+
+EventHandler = Callable[[Dict[str, Any]], None]
+
+
+class DomainEventBus:
+    """
+    도메인 이벤트 버스 클래스
+    
+    구독자는 이벤트 유형별 목록에 보관하므로 발행 시에는 해당 유형의 구독자만 호출합니다.
+    발행은 변경을 일으킨 스레드에서 동기로 처리하며, 구독자 오류는 기록만 하고
+    원래 변경 작업에는 영향을 주지 않습니다.
+    """
+    
+    def __init__(self):
+        """이벤트 버스 초기화"""
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        self._lock = threading.Lock()
+    
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """
+        이벤트 구독
+        
+        Args:
+            event_type: 이벤트 유형 (DOMAIN_EVENTS 값)
+            handler: 이벤트 dict를 받는 처리 함수
+        """
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler not in handlers:
+                # 발행 중인 목록을 바꾸지 않도록 새 목록으로 교체
+                self._handlers[event_type] = handlers + [handler]
+    
+    def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
+        """
+        이벤트 구독 해제
+        
+        Args:
+            event_type: 이벤트 유형
+            handler: 등록했던 처리 함수
+        """
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                self._handlers[event_type] = [h for h in handlers if h != handler]
+    
+    def publish(
+        self,
+        event_type: str,
+        entity: Dict[str, Any],
+        previous: Optional[Dict[str, Any]] = None,
+        **extra: Any
+    ) -> Dict[str, Any]:
+        """
+        이벤트 발행
+        
+        Args:
+            event_type: 이벤트 유형
+            entity: 변경 후 데이터 (삭제 이벤트는 삭제된 데이터)
+            previous: 변경 전 데이터 (생성 이벤트는 None)
+            **extra: 이벤트에 함께 전달할 추가 정보
+        
+        Returns:
+            Dict[str, Any]: 발행한 이벤트
+        """
+        event = {
+            'type': event_type,
+            'entity': entity,
+            'previous': previous,
+            'occurred_at': datetime.now(),
+            **extra
+        }
+        
+        for handler in self._handlers.get(event_type, ()):
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"도메인 이벤트 처리 오류 ({event_type}): {e}")
+        return event
+    
+    def has_subscribers(self, event_type: str) -> bool:
+        """이벤트 유형에 구독자가 있는지 여부 (구독자가 없으면 이벤트 데이터 준비를 생략할 때 사용)"""
+        return bool(self._handlers.get(event_type))
+    
+    def get_event_types(self) -> List[str]:
+        """발행 가능한 이벤트 유형 목록"""
+        return list(DOMAIN_EVENTS.values())
+
+
+# 싱글톤 인스턴스 생성
+domain_events = DomainEventBus()
@@ -3,9 +3,16 @@ Excel 내보내기 공통 유틸리티
 4개 서비스에서 중복되는 Excel 내보내기 기능을 통합한 유틸리티 클래스
 """
 import io
+import tempfile
 import xlsxwriter
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple, Callable
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Callable, IO
+
+from flask import send_file
+
+from .constants import EXPORT_SETTINGS
+from .row_encoder import compile_row_encoder
 
 
 class ExcelExportUtils:
@@ -20,8 +27,10 @@ class ExcelExportUtils:
         row_data_processor: Callable[[Dict[str, Any]], List[Any]],
         column_widths: Optional[List[int]] = None,
         include_table: bool = True,
-        custom_formats: Optional[Dict[str, Any]] = None
-    ) -> Tuple[io.BytesIO, str]:
+        custom_formats: Optional[Dict[str, Any]] = None,
+        large_export: Optional[bool] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[IO[bytes], str]:
         """
         Excel 파일 생성 공통 메서드
         
@@ -34,13 +43,17 @@ class ExcelExportUtils:
             column_widths: 컬럼 너비 리스트 (선택사항)
             include_table: 테이블 생성 여부
             custom_formats: 사용자 정의 포맷 (선택사항)
+            large_export: 대용량 모드 여부 (None이면 행 수 기준 자동 판단)
+            progress_callback: 진행률 콜백 (작성된 행 수, 전체 행 수)
             
         Returns:
-            Tuple[io.BytesIO, str]: (Excel 데이터 스트림, 파일명)
+            Tuple[IO[bytes], str]: (Excel 데이터 스트림, 파일명)
+            대용량 모드에서는 임시 파일 스트림이 반환되며, 닫으면 자동 삭제됩니다.
         """
-        # 메모리에 Excel 파일 생성
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output)
+        large_export = ExcelExportUtils.is_large_export(len(data), large_export)
+        
+        # 대용량 모드는 임시 파일, 일반 모드는 메모리에 Excel 파일 생성
+        workbook, output = ExcelExportUtils.open_workbook(large_export)
         worksheet = workbook.add_worksheet(sheet_name)
         
         # 스타일 정의
@@ -56,17 +69,23 @@ class ExcelExportUtils:
             ExcelExportUtils._auto_set_column_widths(worksheet, headers)
         
         # 데이터 작성
-        for row_idx, item in enumerate(data, 1):
-            row_data = row_data_processor(item)
-            ExcelExportUtils._write_data_row(worksheet, row_idx, row_data, formats)
+        write_row = ExcelExportUtils._write_row_data if large_export else ExcelExportUtils._write_data_row
+        total_rows = len(data)
+        progress_interval = EXPORT_SETTINGS['PROGRESS_INTERVAL']
+        row_count = 0
+        for row_count, item in enumerate(data, 1):
+            write_row(worksheet, row_count, row_data_processor(item), formats)
+            if progress_callback and row_count % progress_interval == 0:
+                progress_callback(row_count, total_rows)
         
-        # 테이블 생성
-        if include_table and data:
-            worksheet.add_table(0, 0, len(data), len(headers) - 1, {
-                'name': f'{filename_prefix}_table',
-                'style': 'Table Style Medium 2',
-                'autofilter': True
-            })
+        if progress_callback:
+            progress_callback(row_count, total_rows)
+        
+        # 테이블 생성 (constant_memory 모드는 테이블 미지원 → 자동 필터로 대체)
+        if include_table and row_count:
+            ExcelExportUtils._add_table_or_filter(
+                worksheet, row_count, headers, f'{filename_prefix}_table', large_export
+            )
         
         # 워크북 닫기
         workbook.close()
@@ -84,8 +103,9 @@ class ExcelExportUtils:
     def create_multi_sheet_excel(
         sheets_data: List[Dict[str, Any]],
         filename_prefix: str,
-        include_charts: bool = False
-    ) -> Tuple[io.BytesIO, str]:
+        include_charts: bool = False,
+        large_export: Optional[bool] = None
+    ) -> Tuple[IO[bytes], str]:
         """
         다중 시트 Excel 파일 생성
         
@@ -102,12 +122,16 @@ class ExcelExportUtils:
                 ]
             filename_prefix: 파일명 접두사
             include_charts: 차트 포함 여부
+            large_export: 대용량 모드 여부 (None이면 전체 행 수 기준 자동 판단)
             
         Returns:
-            Tuple[io.BytesIO, str]: (Excel 데이터 스트림, 파일명)
+            Tuple[IO[bytes], str]: (Excel 데이터 스트림, 파일명)
         """
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output)
+        total_rows = sum(len(sheet_info['data']) for sheet_info in sheets_data)
+        large_export = ExcelExportUtils.is_large_export(total_rows, large_export)
+        
+        workbook, output = ExcelExportUtils.open_workbook(large_export)
+        write_row = ExcelExportUtils._write_row_data if large_export else ExcelExportUtils._write_data_row
         
         # 각 시트 생성
         for sheet_info in sheets_data:
@@ -125,20 +149,16 @@ class ExcelExportUtils:
                 ExcelExportUtils._auto_set_column_widths(worksheet, headers)
             
             # 데이터 작성
-            data = sheet_info['data']
             row_processor = sheet_info['row_processor']
-            
-            for row_idx, item in enumerate(data, 1):
-                row_data = row_processor(item)
-                ExcelExportUtils._write_data_row(worksheet, row_idx, row_data, formats)
+            row_count = 0
+            for row_count, item in enumerate(sheet_info['data'], 1):
+                write_row(worksheet, row_count, row_processor(item), formats)
             
             # 테이블 생성
-            if data:
-                worksheet.add_table(0, 0, len(data), len(headers) - 1, {
-                    'name': f'{sheet_info["name"]}_table',
-                    'style': 'Table Style Medium 2',
-                    'autofilter': True
-                })
+            if row_count:
+                ExcelExportUtils._add_table_or_filter(
+                    worksheet, row_count, headers, f'{sheet_info["name"]}_table', large_export
+                )
         
         workbook.close()
         output.seek(0)
@@ -149,6 +169,76 @@ class ExcelExportUtils:
         
         return output, filename
     
+    @staticmethod
+    def is_large_export(row_count: int, large_export: Optional[bool] = None) -> bool:
+        """
+        대용량 내보내기 모드 사용 여부 판단
+        
+        Args:
+            row_count: 내보낼 전체 행 수
+            large_export: 호출자가 명시한 모드 (None이면 자동 판단)
+            
+        Returns:
+            bool: 대용량 모드 사용 여부
+        """
+        if large_export is not None:
+            return large_export
+        return row_count >= EXPORT_SETTINGS['LARGE_EXPORT_ROW_THRESHOLD']
+    
+    @staticmethod
+    def open_workbook(
+        large_export: bool = False,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[xlsxwriter.Workbook, IO[bytes]]:
+        """
+        출력 스트림과 워크북 생성
+        
+        대용량 모드에서는 xlsxwriter의 constant_memory 옵션으로 행 단위 flush를 하고,
+        결과를 BytesIO 대신 임시 파일에 기록하여 워커 메모리 사용량을 일정하게 유지합니다.
+        constant_memory 모드에서는 행 순서대로만 기록해야 합니다.
+        
+        Args:
+            large_export: 대용량 모드 여부
+            options: xlsxwriter 워크북 옵션
+            
+        Returns:
+            Tuple[xlsxwriter.Workbook, IO[bytes]]: (워크북, 출력 스트림)
+        """
+        workbook_options = dict(options or {})
+        
+        if large_export:
+            temp_dir = EXPORT_SETTINGS['TEMP_DIR']
+            output = tempfile.TemporaryFile(suffix='.xlsx', dir=temp_dir)
+            workbook_options['constant_memory'] = True
+            if temp_dir:
+                workbook_options['tmpdir'] = temp_dir
+        else:
+            output = io.BytesIO()
+        
+        return xlsxwriter.Workbook(output, workbook_options), output
+    
+    @staticmethod
+    def create_file_response(output: IO[bytes], filename: str, mimetype: Optional[str] = None):
+        """
+        Excel 스트림을 다운로드 Response로 변환
+        
+        send_file을 사용하므로 임시 파일은 청크 단위로 전송된 뒤 닫히고 삭제됩니다.
+        
+        Args:
+            output: Excel 데이터 스트림 (BytesIO 또는 임시 파일)
+            filename: 다운로드 파일명
+            mimetype: MIME 타입 (기본값: xlsx)
+            
+        Returns:
+            Response: 파일 다운로드 Response
+        """
+        return send_file(
+            output,
+            mimetype=mimetype or EXPORT_SETTINGS['XLSX_MIMETYPE'],
+            as_attachment=True,
+            download_name=filename
+        )
+    
     @staticmethod
     def _create_standard_formats(
         workbook: xlsxwriter.Workbook, 
@@ -292,6 +382,58 @@ class ExcelExportUtils:
             else:
                 worksheet.write(row_idx, col_idx, value, formats['cell'])
     
+    @staticmethod
+    def _write_row_data(
+        worksheet: xlsxwriter.worksheet.Worksheet,
+        row_idx: int,
+        row_data: List[Any],
+        formats: Dict[str, Any]
+    ) -> None:
+        """
+        데이터 행 일괄 작성 (대용량 모드용)
+        
+        날짜 값이 없는 행은 write_row로 한 번에 기록하고,
+        날짜 값이 있는 행만 셀 단위 포맷을 적용합니다.
+        
+        Args:
+            worksheet: xlsxwriter 워크시트 객체
+            row_idx: 행 인덱스
+            row_data: 행 데이터
+            formats: 포맷 딕셔너리
+        """
+        if any(isinstance(value, datetime) for value in row_data):
+            ExcelExportUtils._write_data_row(worksheet, row_idx, row_data, formats)
+        else:
+            worksheet.write_row(row_idx, 0, row_data, formats['cell'])
+    
+    @staticmethod
+    def _add_table_or_filter(
+        worksheet: xlsxwriter.worksheet.Worksheet,
+        row_count: int,
+        headers: List[str],
+        table_name: str,
+        large_export: bool = False
+    ) -> None:
+        """
+        데이터 영역에 테이블 또는 자동 필터 적용
+        
+        Args:
+            worksheet: xlsxwriter 워크시트 객체
+            row_count: 데이터 행 수
+            headers: 헤더 리스트
+            table_name: 테이블 이름
+            large_export: 대용량 모드 여부 (add_table 미지원)
+        """
+        if large_export:
+            worksheet.autofilter(0, 0, row_count, len(headers) - 1)
+            worksheet.freeze_panes(1, 0)
+        else:
+            worksheet.add_table(0, 0, row_count, len(headers) - 1, {
+                'name': table_name,
+                'style': 'Table Style Medium 2',
+                'autofilter': True
+            })
+    
     @staticmethod
     def format_currency(value: Any) -> str:
         """통화 형식 포맷팅"""
@@ -317,85 +459,93 @@ class ExcelExportUtils:
 
 
 class ExcelRowProcessor:
-    """Excel 행 데이터 처리를 위한 헬퍼 클래스"""
+    """
+    Excel 행 데이터 처리를 위한 헬퍼 클래스
+    
+    각 처리기는 컬럼 사양을 컴파일한 행 인코더이며, 사양별로 한 번만 컴파일하여 재사용합니다.
+    """
+    
+    ASSET_COLUMNS = [
+        {'key': 'asset_number'},
+        {'key': 'name'},
+        {'key': ('type', 'name'), 'default': '하드웨어'},
+        {'key': 'category_name'},
+        {'key': 'status_name'},
+        {'key': ('department', 'name'), 'default': '-'},
+        {'key': 'location_name', 'default': '-'},
+        {'key': 'user_name', 'default': '-'},
+        {'key': 'purchase_date', 'default': '-'},
+        {'key': 'purchase_price', 'default': 0},
+        {'key': 'serial_number', 'default': '-'},
+        {'key': 'manufacturer', 'default': '-'},
+        {'key': 'model', 'default': '-'},
+        {'key': 'warranty_expiry', 'default': '-'},
+        {'key': 'current_value', 'default': 0}
+    ]
+    
+    OPERATIONS_COLUMNS = [
+        {'key': 'id'},
+        {'key': 'operation_type'},
+        {'key': 'title'},
+        {'key': 'description', 'format': 'truncate', 'max_length': 100},
+        {'key': 'status'},
+        {'key': 'start_date', 'default': '-'},
+        {'key': 'end_date', 'default': '-'},
+        {'key': 'progress', 'default': 0, 'format': 'percent'},
+        {'key': 'assignee_name', 'default': '-'},
+        {'key': ('department', 'name'), 'default': '-'},
+        {'key': 'priority', 'default': 'medium'},
+        {'key': 'budget', 'default': 0},
+        {'key': 'actual_cost', 'default': 0},
+        {'key': 'created_at', 'default': '-'},
+        {'key': 'updated_at', 'default': '-'}
+    ]
+    
+    CONTRACT_COLUMNS = [
+        {'key': 'contract_no', 'default': '-'},
+        {'key': 'name', 'default': '-'},
+        {'key': 'vendor', 'default': '-'},
+        {'key': 'type_name', 'default': '-'},
+        {'key': 'status_name', 'default': '-'},
+        {'key': 'start_date', 'default': '-'},
+        {'key': 'end_date', 'default': '-'},
+        {'key': 'amount', 'default': 0},
+        {'key': 'monthly_cost', 'default': 0},
+        {'key': 'department', 'default': '-'},
+        {'key': 'manager', 'default': '-'},
+        {'key': 'payment_term', 'default': '-'},
+        {'key': 'progress_percent', 'default': 0},
+        {'key': 'remaining_days', 'default': 0}
+    ]
+    
+    INVENTORY_COLUMNS = [
+        {'key': 'id'},
+        {'key': 'name'},
+        {'key': 'status'},
+        {'key': 'created_at', 'default': '-'},
+        {'key': 'updated_at', 'default': '-'}
+    ]
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_asset_row_processor():
         """자산 데이터 행 처리기 생성"""
-        def process_row(asset: Dict[str, Any]) -> List[Any]:
-            return [
-                asset.get('asset_number', ''),
-                asset.get('name', ''),
-                asset.get('type', {}).get('name', '하드웨어'),
-                asset.get('category_name', ''),
-                asset.get('status_name', ''),
-                asset.get('department', {}).get('name', '-'),
-                asset.get('location_name', '-'),
-                asset.get('user_name', '-'),
-                asset.get('purchase_date', '-'),
-                asset.get('purchase_price', 0),
-                asset.get('serial_number', '-'),
-                asset.get('manufacturer', '-'),
-                asset.get('model', '-'),
-                asset.get('warranty_expiry', '-'),
-                asset.get('current_value', 0)
-            ]
-        return process_row
+        return compile_row_encoder(ExcelRowProcessor.ASSET_COLUMNS, 'process_asset_row')
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_operations_row_processor():
         """운영 데이터 행 처리기 생성"""
-        def process_row(operation: Dict[str, Any]) -> List[Any]:
-            return [
-                operation.get('id', ''),
-                operation.get('operation_type', ''),
-                operation.get('title', ''),
-                operation.get('description', '')[:100] + '...' if len(operation.get('description', '')) > 100 else operation.get('description', ''),
-                operation.get('status', ''),
-                operation.get('start_date', '-'),
-                operation.get('end_date', '-'),
-                f"{operation.get('progress', 0)}%",
-                operation.get('assignee_name', '-'),
-                operation.get('department', {}).get('name', '-'),
-                operation.get('priority', 'medium'),
-                operation.get('budget', 0),
-                operation.get('actual_cost', 0),
-                operation.get('created_at', '-'),
-                operation.get('updated_at', '-')
-            ]
-        return process_row
+        return compile_row_encoder(ExcelRowProcessor.OPERATIONS_COLUMNS, 'process_operation_row')
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_contract_row_processor():
         """계약 데이터 행 처리기 생성"""
-        def process_row(contract: Dict[str, Any]) -> List[Any]:
-            return [
-                contract.get('contract_no', '-'),
-                contract.get('name', '-'),
-                contract.get('vendor', '-'),
-                contract.get('type_name', '-'),
-                contract.get('status_name', '-'),
-                contract.get('start_date', '-'),
-                contract.get('end_date', '-'),
-                contract.get('amount', 0),
-                contract.get('monthly_cost', 0),
-                contract.get('department', '-'),
-                contract.get('manager', '-'),
-                contract.get('payment_term', '-'),
-                contract.get('progress_percent', 0),
-                contract.get('remaining_days', 0)
-            ]
-        return process_row
+        return compile_row_encoder(ExcelRowProcessor.CONTRACT_COLUMNS, 'process_contract_row')
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_inventory_row_processor():
         """재고 데이터 행 처리기 생성"""
-        def process_row(inventory: Dict[str, Any]) -> List[Any]:
-            return [
-                inventory.get('id', ''),
-                inventory.get('name', ''),
-                inventory.get('status', ''),
-                inventory.get('created_at', '-'),
-                inventory.get('updated_at', '-')
-            ]
-        return process_row
\ No newline at end of file
+        return compile_row_encoder(ExcelRowProcessor.INVENTORY_COLUMNS, 'process_inventory_row')
@@ -0,0 +1,254 @@
+"""
+내보내기 행 처리 벤치마크
+기존 행 처리 함수(행마다 사양 해석)와 컴파일된 행 인코더의 초당 처리 행 수를 비교
+
+사용법:
+    python -m app.utils.export_benchmark --rows 100000 --repeat 3
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from .constants import ASSET_CATEGORIES, ASSET_STATUS, OPERATION_STATUS, OPERATION_TYPES
+
+
+# ==================== 기존 구현 (비교 기준) ====================
+
+def legacy_asset_csv_row(asset: Dict[str, Any]) -> List[Any]:
+    """기존 AssetExportService._prepare_row_data(format_for_csv=True)"""
+    category_name = ASSET_CATEGORIES.get(asset['category_id'], '기타')
+    status_name = ASSET_STATUS.get(asset['status'], '기타')
+    department_name = asset.get('department', {}).get('name', '-')
+    user_name = asset.get('user_name', '-')
+    
+    purchase_date = '-'
+    if asset.get('purchase_date'):
+        purchase_date = asset['purchase_date'].strftime('%Y-%m-%d')
+    
+    purchase_price = format(asset.get('purchase_price', 0), ',')
+    current_value = format(asset.get('current_value', 0), ',')
+    
+    return [
+        asset['asset_number'],
+        asset['name'],
+        asset.get('type', {}).get('name', '하드웨어'),
+        category_name,
+        status_name,
+        department_name,
+        asset.get('location_name', '-'),
+        user_name,
+        purchase_date,
+        purchase_price,
+        asset.get('serial_number', '-'),
+        asset.get('manufacturer', '-'),
+        asset.get('model', '-'),
+        asset.get('warranty_expiry', '-'),
+        current_value
+    ]
+
+
+def legacy_asset_excel_row(asset: Dict[str, Any]) -> List[Any]:
+    """기존 ExcelRowProcessor.create_asset_row_processor()"""
+    return [
+        asset.get('asset_number', ''),
+        asset.get('name', ''),
+        asset.get('type', {}).get('name', '하드웨어'),
+        asset.get('category_name', ''),
+        asset.get('status_name', ''),
+        asset.get('department', {}).get('name', '-'),
+        asset.get('location_name', '-'),
+        asset.get('user_name', '-'),
+        asset.get('purchase_date', '-'),
+        asset.get('purchase_price', 0),
+        asset.get('serial_number', '-'),
+        asset.get('manufacturer', '-'),
+        asset.get('model', '-'),
+        asset.get('warranty_expiry', '-'),
+        asset.get('current_value', 0)
+    ]
+
+
+def legacy_operation_csv_row(operation: Dict[str, Any]) -> List[Any]:
+    """기존 OperationsExportService._prepare_row_data(format_for_csv=True)"""
+    def format_date(value: Any, date_format: str) -> Any:
+        if not value:
+            return '-'
+        return value.strftime(date_format) if hasattr(value, 'strftime') else str(value)
+    
+    budget = operation.get('budget', 0)
+    actual_cost = operation.get('actual_cost', 0)
+    progress = operation.get('progress', 0)
+    description = operation.get('description', '')
+    
+    return [
+        operation.get('id', ''),
+        OPERATION_TYPES.get(operation.get('operation_type', 'maintenance'), '유지보수'),
+        operation.get('title', ''),
+        description[:100] + '...' if len(description) > 100 else description,
+        OPERATION_STATUS.get(operation.get('status', 'planned'), '계획됨'),
+        format_date(operation.get('start_date'), '%Y-%m-%d'),
+        format_date(operation.get('end_date'), '%Y-%m-%d'),
+        f"{progress}%" if isinstance(progress, (int, float)) else str(progress),
+        operation.get('assignee_name', '-'),
+        operation.get('department', {}).get('name', '-'),
+        operation.get('priority', 'medium'),
+        format(budget, ',') if budget else '-',
+        format(actual_cost, ',') if actual_cost else '-',
+        format_date(operation.get('created_at'), '%Y-%m-%d %H:%M'),
+        format_date(operation.get('updated_at'), '%Y-%m-%d %H:%M')
+    ]
+
+
+# ==================== 샘플 데이터 ====================
+
+def generate_assets(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """벤치마크용 자산 샘플 데이터 생성"""
+    rng = random.Random(seed)
+    base_date = datetime(2020, 1, 1)
+    categories = list(ASSET_CATEGORIES.keys())
+    statuses = list(ASSET_STATUS.keys())
+    
+    assets = []
+    for index in range(count):
+        asset = {
+            'asset_number': f"AST-{index:07d}",
+            'name': f"자산 {index}",
+            'category_id': rng.choice(categories),
+            'status': rng.choice(statuses),
+            'purchase_date': base_date + timedelta(days=rng.randint(0, 1500)),
+            'purchase_price': rng.randint(10, 500) * 10000,
+            'current_value': rng.randint(1, 300) * 10000,
+            'serial_number': f"SN{rng.randint(100000, 999999)}",
+            'manufacturer': rng.choice(['삼성', 'LG', 'Dell', 'HP']),
+            'model': f"M-{rng.randint(1, 50)}",
+            'warranty_expiry': '2026-12-31'
+        }
+        # 일부 행은 선택 필드를 생략하여 기본값 경로도 측정
+        if index % 3:
+            asset['department'] = {'name': rng.choice(['IT팀', '총무팀', '재무팀'])}
+            asset['user_name'] = f"사용자{rng.randint(1, 200)}"
+            asset['location_name'] = f"{rng.randint(1, 10)}층"
+            asset['type'] = {'name': '하드웨어'}
+        if index % 7 == 0:
+            asset['purchase_date'] = None
+        asset['category_name'] = ASSET_CATEGORIES.get(asset['category_id'], '기타')
+        asset['status_name'] = ASSET_STATUS.get(asset['status'], '기타')
+        assets.append(asset)
+    return assets
+
+
+def generate_operations(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """벤치마크용 운영 샘플 데이터 생성"""
+    rng = random.Random(seed)
+    base_date = datetime(2024, 1, 1, 9, 0)
+    types = list(OPERATION_TYPES.keys())
+    statuses = list(OPERATION_STATUS.keys())
+    
+    operations = []
+    for index in range(count):
+        start = base_date + timedelta(days=rng.randint(0, 365))
+        operations.append({
+            'id': index,
+            'operation_type': rng.choice(types),
+            'title': f"운영 작업 {index}",
+            'description': '점검 ' * rng.randint(1, 40),
+            'status': rng.choice(statuses),
+            'start_date': start.date(),
+            'end_date': (start + timedelta(days=rng.randint(1, 30))).date() if index % 4 else None,
+            'progress': rng.randint(0, 100),
+            'assignee_name': f"담당자{rng.randint(1, 50)}",
+            'department': {'name': rng.choice(['IT팀', '시설팀'])},
+            'budget': rng.randint(0, 100) * 100000,
+            'actual_cost': rng.randint(0, 100) * 100000,
+            'created_at': start,
+            'updated_at': start + timedelta(hours=rng.randint(0, 48))
+        })
+    return operations
+
+
+# ==================== 측정 ====================
+
+def measure(row_function: Callable[[Dict[str, Any]], List[Any]], rows: List[Dict[str, Any]], repeat: int) -> float:
+    """
+    행 처리 함수의 초당 처리 행 수 측정 (반복 중 최고값)
+    
+    Args:
+        row_function: 행 처리 함수
+        rows: 입력 데이터
+        repeat: 반복 횟수
+    
+    Returns:
+        float: 초당 처리 행 수
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            row_function(row)
+        best = min(best, time.perf_counter() - started)
+    return len(rows) / best if best > 0 else float('inf')
+
+
+def run_benchmark(row_count: int = 100000, repeat: int = 3) -> List[Dict[str, Any]]:
+    """
+    기존 구현과 컴파일된 행 인코더 비교 실행
+    
+    측정 전 두 구현의 출력이 모든 행에서 같은지 검증합니다.
+    
+    Args:
+        row_count: 측정 행 수
+        repeat: 반복 횟수
+    
+    Returns:
+        List[Dict[str, Any]]: 처리기별 결과 ('name', 'before', 'after', 'speedup')
+    """
+    from ..services.asset_export_service import AssetExportService
+    from ..services.operations_export_service import OperationsExportService
+    from .excel_export_utils import ExcelRowProcessor
+    
+    assets = generate_assets(row_count)
+    operations = generate_operations(row_count)
+    
+    cases: List[Tuple[str, Callable, Callable, List[Dict[str, Any]]]] = [
+        ('asset_csv', legacy_asset_csv_row, AssetExportService()._csv_row_encoder, assets),
+        ('asset_excel', legacy_asset_excel_row, ExcelRowProcessor.create_asset_row_processor(), assets),
+        ('operation_csv', legacy_operation_csv_row, OperationsExportService()._csv_row_encoder, operations)
+    ]
+    
+    results = []
+    for name, before_function, after_function, rows in cases:
+        for row in rows:
+            if before_function(row) != after_function(row):
+                raise AssertionError(f"{name}: 행 인코더 출력이 기존 구현과 다릅니다: {row}")
+        
+        before = measure(before_function, rows, repeat)
+        after = measure(after_function, rows, repeat)
+        results.append({
+            'name': name,
+            'before': before,
+            'after': after,
+            'speedup': after / before if before else 0
+        })
+    return results
+
+
+def main() -> None:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description='내보내기 행 처리 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000, help='측정 행 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    args = parser.parse_args()
+    
+    print(f"rows={args.rows:,} repeat={args.repeat}")
+    print(f"{'processor':<15}{'before (rows/s)':>18}{'after (rows/s)':>18}{'speedup':>10}")
+    for result in run_benchmark(args.rows, args.repeat):
+        print(
+            f"{result['name']:<15}{result['before']:>18,.0f}"
+            f"{result['after']:>18,.0f}{result['speedup']:>9.2f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+내보내기 행 인코더 컴파일러
+컬럼 사양을 한 번 해석하여 행 변환 전용 함수를 생성하는 유틸리티
+
+컬럼 사양 (dict):
+    key: 필드명 또는 중첩 경로 튜플 (예: ('department', 'name'))
+    default: 필드가 없을 때 값 (기본값: '')
+    required: True이면 row[key]로 직접 접근 (없으면 KeyError)
+    lookup: 코드 → 표시명 매핑 (예: ASSET_CATEGORIES)
+    lookup_default: 매핑에 없는 코드의 표시명 (기본값: '기타')
+    blank: 값이 비어 있을(falsy) 때 포맷 대신 사용할 값
+    format: None | 'date' | 'thousands' | 'percent' | 'truncate'
+    date_format: 'date' 포맷 문자열 (기본값: DATE_FORMAT)
+    max_length: 'truncate' 최대 길이 (기본값: 100)
+"""
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+from .constants import DATE_FORMAT
+
+
+# 포맷 결과 캐시 크기 (날짜/금액은 반복되는 값이 많음)
+FORMAT_CACHE_SIZE = 4096
+
+_EMPTY: Dict[str, Any] = {}
+
+
+def _make_date_formatter(date_format: str) -> Callable[[Any], str]:
+    """strftime 결과를 캐시하는 날짜 포맷터 생성"""
+    @lru_cache(maxsize=FORMAT_CACHE_SIZE)
+    def format_date(value: Any) -> str:
+        if hasattr(value, 'strftime'):
+            return value.strftime(date_format)
+        return str(value)
+    return format_date
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_thousands(value: Any) -> str:
+    """3자리 콤마 포맷 (결과 캐시)"""
+    return format(value, ',')
+
+
+def _format_percent(value: Any) -> str:
+    """퍼센트 포맷"""
+    if isinstance(value, (int, float)):
+        return f"{value}%"
+    return str(value)
+
+
+def extend_columns(columns: List[Dict[str, Any]], overrides: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    기존 컬럼 사양에 필드별 옵션을 덮어쓴 새 사양 생성
+    
+    Args:
+        columns: 기준 컬럼 사양 리스트
+        overrides: 필드명(중첩 경로는 첫 필드명) → 덮어쓸 옵션
+    
+    Returns:
+        List[Dict[str, Any]]: 새 컬럼 사양 리스트
+    """
+    extended = []
+    for column in columns:
+        key = column['key']
+        name = key[0] if isinstance(key, tuple) else key
+        extended.append({**column, **overrides.get(name, {})})
+    return extended
+
+
+def compile_row_encoder(columns: List[Dict[str, Any]], name: str = 'encode_row') -> Callable[[Dict[str, Any]], List[Any]]:
+    """
+    컬럼 사양으로 행 인코더 함수 생성
+    
+    조회 테이블, 기본값, 포맷터를 미리 바인딩한 전용 함수 소스를 만들어 컴파일합니다.
+    생성된 함수는 행마다 사양을 다시 해석하지 않고 단일 리스트만 할당합니다.
+    
+    Args:
+        columns: 컬럼 사양 리스트
+        name: 생성할 함수 이름 (디버깅용)
+    
+    Returns:
+        Callable[[Dict[str, Any]], List[Any]]: 행 데이터 → 셀 값 리스트 변환 함수
+    """
+    namespace: Dict[str, Any] = {'_EMPTY': _EMPTY}
+    statements: List[str] = []
+    values: List[str] = []
+    date_formatters: Dict[str, str] = {}
+    
+    for idx, column in enumerate(columns):
+        key = column['key']
+        path = key if isinstance(key, tuple) else (key,)
+        
+        # 원본 값 접근식
+        default_name = f'_d{idx}'
+        namespace[default_name] = column.get('default', '')
+        if column.get('required'):
+            expr = f'row[{path[0]!r}]'
+        elif len(path) == 1:
+            expr = f'_g({path[0]!r}, {default_name})'
+        else:
+            expr = f'_g({path[0]!r}, _EMPTY)'
+        for depth, part in enumerate(path[1:], 1):
+            fallback = default_name if depth == len(path) - 1 else '_EMPTY'
+            expr = f'{expr}.get({part!r}, {fallback})'
+        
+        # 조회 테이블 (사본을 바인딩하여 전역 상수 변경의 영향을 받지 않음)
+        if column.get('lookup') is not None:
+            namespace[f'_lk{idx}'] = dict(column['lookup'])
+            namespace[f'_ld{idx}'] = column.get('lookup_default', '기타')
+            expr = f'_lk{idx}.get({expr}, _ld{idx})'
+        
+        # 포맷터
+        column_format = column.get('format')
+        formatter = None
+        if column_format == 'date':
+            date_format = column.get('date_format', DATE_FORMAT)
+            if date_format not in date_formatters:
+                date_formatters[date_format] = f'_fd{len(date_formatters)}'
+                namespace[date_formatters[date_format]] = _make_date_formatter(date_format)
+            formatter = f'{date_formatters[date_format]}({{v}})'
+        elif column_format == 'thousands':
+            namespace['_fmt_thousands'] = _format_thousands
+            formatter = '_fmt_thousands({v})'
+        elif column_format == 'percent':
+            namespace['_fmt_percent'] = _format_percent
+            formatter = '_fmt_percent({v})'
+        elif column_format == 'truncate':
+            max_length = int(column.get('max_length', 100))
+            formatter = f"({{v}} if len({{v}}) <= {max_length} else {{v}}[:{max_length}] + '...')"
+        elif column_format is not None:
+            raise ValueError(f"지원하지 않는 컬럼 포맷입니다: {column_format}")
+        
+        if formatter is None and 'blank' not in column:
+            values.append(expr)
+            continue
+        
+        # 임시 변수가 필요한 컬럼은 개별 문장으로 생성
+        var = f'v{idx}'
+        statements.append(f'{var} = {expr}')
+        formatted = formatter.format(v=var) if formatter else var
+        if 'blank' in column:
+            namespace[f'_b{idx}'] = column['blank']
+            formatted = f'({formatted} if {var} else _b{idx})'
+        values.append(formatted)
+    
+    body = ['    _g = row.get']
+    body.extend(f'    {statement}' for statement in statements)
+    body.append('    return [' + ', '.join(values) + ']')
+    source = f'def {name}(row):\n' + '\n'.join(body) + '\n'
+    
+    exec(compile(source, f'<row_encoder:{name}>', 'exec'), namespace)
+    encoder = namespace[name]
+    encoder.__source__ = source
+    return encoder